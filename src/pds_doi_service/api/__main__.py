@@ -6,14 +6,24 @@
 #  California Institute of Technology.
 #
 import logging
+import time
 from urllib.parse import urlparse
 
 import connexion  # type: ignore
+from flask import current_app
+from flask import g
 from flask import jsonify
+from flask import Response
 from flask_cors import CORS  # type: ignore
 from pds_doi_service.api import encoder
+from pds_doi_service.api.jobs import get_job_worker_pool
+from pds_doi_service.core.db.outbox import start_outbox_drainer
 from pds_doi_service.core.util.config_parser import DOIConfigUtil
 from pds_doi_service.core.util.general_util import get_logger
+from pds_doi_service.core.util.metrics import API_REQUEST_DURATION
+from pds_doi_service.core.util.metrics import metrics_enabled
+from pds_doi_service.core.util.metrics import PROMETHEUS_CONTENT_TYPE
+from pds_doi_service.core.util.metrics import render_metrics
 from waitress import serve
 
 logging.basicConfig(level=logging.INFO)
@@ -50,6 +60,43 @@ def handle_invalid_usage(error):
     return response
 
 
+@app.app.before_request
+def _start_request_timer():
+    """Records the start time of the current request when metrics collection is enabled."""
+    if metrics_enabled():
+        g.request_start_time = time.perf_counter()
+
+
+@app.app.after_request
+def _record_request_metrics(response):
+    """
+    Records the duration of the current request, labeled by the name of the
+    controller function that serviced it and the response status code.
+    """
+    start_time = g.get("request_start_time")
+
+    if start_time is not None and connexion.request.endpoint != "metrics":
+        view_function = current_app.view_functions.get(connexion.request.endpoint)
+        operation = view_function.__name__ if view_function else "unknown"
+
+        API_REQUEST_DURATION.observe(time.perf_counter() - start_time, operation=operation, status=response.status_code)
+
+    return response
+
+
+@app.app.route("/metrics")
+def metrics():
+    """
+    Returns the metrics collected by the service in the Prometheus text
+    exposition format, or a 404 if metrics collection is disabled by the
+    OTHER.metrics_enabled field of the INI config.
+    """
+    if not metrics_enabled():
+        return Response("Metrics collection is disabled", status=404, mimetype="text/plain")
+
+    return Response(render_metrics(), status=200, content_type=PROMETHEUS_CONTENT_TYPE)
+
+
 @app.app.before_request
 def _check_referrer():
     """
@@ -72,6 +119,11 @@ def _check_referrer():
     logger = logging.getLogger(__name__)
     config = DOIConfigUtil().get_config()
 
+    # Metrics are scraped directly by the monitoring system, rather than
+    # requested via a referring page
+    if connexion.request.endpoint == "metrics":
+        return None
+
     referrer = connexion.request.referrer
     logger.debug("Referrer: %s", referrer)
 
@@ -122,17 +174,42 @@ def init_app():
         # app how to route URL's to endpoints in dois_controller.py
         app.add_api("swagger.yaml", arguments={"title": "Planetary Data System DOI Service API"}, pythonic_params=True)
 
+        # Start the background job workers now, so any resumable jobs interrupted
+        # by a previous shutdown resume without waiting for a new submission
+        get_job_worker_pool(app.app)
+
+        # Replay submissions queued while the DOI service provider was unavailable
+        start_outbox_drainer()
+
         app.initialized = True
 
     return app
 
 
+def _serve_asgi(host, port, logging_level):
+    """
+    Serves the DOI API from a uvicorn ASGI server (see asgi.py). Requires
+    the "asgi" extra of the package to be installed.
+    """
+    try:
+        import uvicorn  # type: ignore
+    except ImportError as err:
+        raise ImportError(
+            "Serving the API in ASGI mode requires uvicorn, install it with: pip install 'pds-doi-service[asgi]'"
+        ) from err
+
+    from pds_doi_service.api.asgi import create_app
+
+    uvicorn.run(create_app(), host=host, port=int(port), log_level=logging_level.lower())
+
+
 def main():
     """
     Main entry point for the DOI Service API
 
     The API connexion application is created using the swagger definition and
-    fed to a waitress server instance.
+    fed to a waitress server instance, or to a uvicorn (ASGI) server instance
+    when the OTHER.api_server field of the INI config is set to "asgi".
     """
     logger = logging.getLogger(__name__)
 
@@ -146,19 +223,24 @@ def main():
 
     logger.info(f"Logging system configured at level {logging_level}")
 
-    # Initialize the Connexion (Flask) application
-    app = init_app()
-
-    # Set the log level of waitress to match the configured level
-    get_logger("waitress")
-    logger.info(f"Waitress logging configured at level {logging_level}")
+    host = config.get("OTHER", "api_host", fallback="0.0.0.0")
+    port = config.get("OTHER", "api_port", fallback=8080)
+    server = config.get("OTHER", "api_server", fallback="waitress").strip().lower()
 
     try:
-        serve(
-            app,
-            host=config.get("OTHER", "api_host", fallback="0.0.0.0"),
-            port=config.get("OTHER", "api_port", fallback=8080),
-        )
+        if server == "asgi":
+            logger.info("Serving the API from an ASGI server")
+            _serve_asgi(host, port, logging_level)
+            return
+
+        # Initialize the Connexion (Flask) application
+        app = init_app()
+
+        # Set the log level of waitress to match the configured level
+        get_logger("waitress")
+        logger.info(f"Waitress logging configured at level {logging_level}")
+
+        serve(app, host=host, port=port)
     except KeyboardInterrupt:
         logger.info("Stopping PDS DOI Service API")
 
@@ -0,0 +1,51 @@
+#
+#  Copyright 2026, by the California Institute of Technology.  ALL RIGHTS
+#  RESERVED. United States Government Sponsorship acknowledged. Any commercial
+#  use must be negotiated with the Office of Technology Transfer at the
+#  California Institute of Technology.
+#
+"""
+=======
+asgi.py
+=======
+
+ASGI entry point for the DOI Service API.
+
+The Connexion (Flask) application remains a WSGI application, so the routing,
+request validation and responses defined by the swagger specification are
+identical in either serving mode. Here it is adapted to ASGI by a2wsgi, which
+runs each request on a bounded pool of worker threads while the event loop of
+the ASGI server handles the connections themselves, so slow clients and idle
+keep-alive connections no longer tie up a worker.
+
+The application may be served by pds-doi-api (see the OTHER.api_server field
+of the INI config), or by any ASGI server, e.g.::
+
+    uvicorn --factory pds_doi_service.api.asgi:create_app
+"""
+from pds_doi_service.core.util.config_parser import DOIConfigUtil
+
+DEFAULT_ASGI_WORKERS = 16
+"""Default number of worker threads running the requests made to the API when served by an ASGI server"""
+
+
+def create_app():
+    """
+    Creates the ASGI application serving the DOI API. The number of requests
+    run at once is determined by the OTHER.api_asgi_workers field of the INI
+    config.
+
+    Returns
+    -------
+    app : a2wsgi.WSGIMiddleware
+        The initialized Connexion application, wrapped as an ASGI application.
+
+    """
+    from a2wsgi import WSGIMiddleware  # type: ignore
+    from pds_doi_service.api.__main__ import init_app
+
+    config = DOIConfigUtil().get_config()
+
+    return WSGIMiddleware(
+        init_app(), workers=int(config.get("OTHER", "api_asgi_workers", fallback=DEFAULT_ASGI_WORKERS))
+    )
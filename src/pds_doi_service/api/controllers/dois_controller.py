@@ -18,15 +18,26 @@ from tempfile import NamedTemporaryFile
 
 import connexion  # type: ignore
 from flask import current_app
+from pds_doi_service.api.idempotency import idempotent
+from pds_doi_service.api.jobs import report_job_progress
+from pds_doi_service.api.jobs import submit_background_job
 from pds_doi_service.api.models import DoiRecord
 from pds_doi_service.api.models import DoiSummary
+from pds_doi_service.api.response_cache import conditional_response
+from pds_doi_service.api.serializers import dumps
+from pds_doi_service.api.serializers import get_row_serializer
+from pds_doi_service.api.serializers import json_response
 from pds_doi_service.api.util import format_exceptions
+from pds_doi_service.core.actions import DOICoreActionBulkUpdate
 from pds_doi_service.core.actions import DOICoreActionCheck
 from pds_doi_service.core.actions import DOICoreActionList
 from pds_doi_service.core.actions import DOICoreActionRelease
 from pds_doi_service.core.actions import DOICoreActionReserve
 from pds_doi_service.core.actions import DOICoreActionUpdate
+from pds_doi_service.core.db.transaction_label_cache import get_transaction_label_cache
 from pds_doi_service.core.entities.exceptions import InputFormatException
+from pds_doi_service.core.entities.exceptions import ProviderUnavailableException
+from pds_doi_service.core.entities.exceptions import UnknownDoiException
 from pds_doi_service.core.entities.exceptions import UnknownIdentifierException
 from pds_doi_service.core.entities.exceptions import WarningDOIException
 from pds_doi_service.core.entities.exceptions import WebRequestException
@@ -34,10 +45,14 @@ from pds_doi_service.core.input.input_util import DOIInputUtil
 from pds_doi_service.core.outputs.doi_record import CONTENT_TYPE_JSON
 from pds_doi_service.core.outputs.doi_record import CONTENT_TYPE_XML
 from pds_doi_service.core.outputs.service import DOIServiceFactory
+from pds_doi_service.core.util.config_parser import DOIConfigUtil
 from pds_doi_service.core.util.general_util import get_logger
 
 logger = get_logger(__name__)
 
+DOI_SUMMARY_COLUMNS = (("node", "node_id"), ("update_date", "date_updated"))
+"""The transaction database columns of the DoiSummary attributes not named the same as their column"""
+
 
 def _get_db_name():
     """
@@ -61,6 +76,26 @@ def _get_db_name():
     return db_name
 
 
+def _get_db_file():
+    """
+    Returns the path to the transaction database used by the endpoints, either
+    the database substituted in for testing, or the one from the INI config.
+    """
+    return _get_db_name() or DOIConfigUtil().get_config().get("OTHER", "db_file")
+
+
+def _error_code(err):
+    """
+    Returns the HTTP response code for an unexpected error: 503 (Service
+    Unavailable) if the request failed fast as the DOI service provider is
+    unavailable, otherwise 500 (Internal Error).
+    """
+    if isinstance(err, ProviderUnavailableException) or isinstance(err.__context__, ProviderUnavailableException):
+        return 503
+
+    return 500
+
+
 def _write_csv_from_labels(temp_file, labels):
     """
     Writes the provided list of labels in CSV format to the open temporary
@@ -137,7 +172,18 @@ def _records_from_dois(dois, node=None, submitter=None, doi_label=None):
     return records
 
 
-def get_dois(doi=None, submitter=None, node=None, status=None, ids=None, start_date=None, end_date=None):
+def get_dois(
+    doi=None,
+    submitter=None,
+    node=None,
+    status=None,
+    ids=None,
+    start_date=None,
+    end_date=None,
+    q=None,
+    limit=None,
+    offset=None,
+):
     """
     List the DOI requests within the transaction database which match
     the specified criteria. If no criteria are provided, all database entries
@@ -167,17 +213,30 @@ def get_dois(doi=None, submitter=None, node=None, status=None, ids=None, start_d
         An end date to filter resulting DOI records by. Only records with an
         update time prior to this date will be returned. Value must be of the
         form <YYYY>-<mm>-<dd>T<HH>:<SS>.<ms>
+    q : str, optional
+        Free text to search for within the title, description, keywords and
+        authors of each DOI. If provided, only records matching all words of
+        the text are returned, ordered by relevance.
+    limit : int, optional
+        The maximum number of records to return.
+    offset : int, optional
+        The number of matching records to skip before those returned.
+
     Returns
     -------
     records : list of DoiSummary
         The available DOI records from within the transaction database that
         match the requested criteria.
 
+    Notes
+    -----
+    The response carries an ETag derived from the change counter of the
+    transaction database and the request parameters. A request with a
+    matching If-None-Match header receives a 304 (Not Modified) response.
+
     """
     logger.info("GET /dois request received")
 
-    list_action = DOICoreActionList(db_name=_get_db_name())
-
     # List action expects multiple inputs as comma-delimited
     if doi:
         doi = ",".join(doi)
@@ -202,12 +261,22 @@ def get_dois(doi=None, submitter=None, node=None, status=None, ids=None, start_d
         "status": status,
         "start_update": start_date,
         "end_update": end_date,
+        "query": q,
+        "limit": limit,
+        "offset": offset,
     }
 
     logger.debug("GET /dois list action arguments: %s", list_kwargs)
 
+    return json_response(conditional_response(_get_db_file(), "get_dois", list_kwargs, lambda: _list_dois(list_kwargs)))
+
+
+def _list_dois(list_kwargs):
+    """Returns the DoiSummary records, and response code, for a GET /dois request with the provided list arguments."""
+    list_action = DOICoreActionList(db_name=_get_db_name())
+
     try:
-        results = list_action.run(**list_kwargs)
+        columns, rows = list_action.select_rows(**list_kwargs)
     except ValueError as err:
         # Most likely from an malformed start/end date. Report back "Invalid
         # argument" code
@@ -216,27 +285,18 @@ def get_dois(doi=None, submitter=None, node=None, status=None, ids=None, start_d
         # Treat any unexpected Exception as an "Internal Error" and report back
         return format_exceptions(err), 500
 
-    records = []
+    # Serialize the DoiSummary of each row directly to JSON, without
+    # constructing the models, and cache the encoded body
+    serialize_row = get_row_serializer(DoiSummary, tuple(columns), DOI_SUMMARY_COLUMNS)
+    body = dumps([serialize_row(row) for row in rows])
 
-    for result in json.loads(results):
-        records.append(
-            DoiSummary(
-                doi=result["doi"],
-                identifier=result["identifier"],
-                title=result["title"],
-                node=result["node_id"],
-                submitter=result["submitter"],
-                status=result["status"],
-                update_date=result["date_updated"],
-            )
-        )
+    logger.info("GET /dois request returned %d result(s)", len(rows))
 
-    logger.info("GET /dois request returned %d result(s)", len(records))
-
-    return records, 200
+    return body, 200
 
 
-def post_dois(action, submitter, node, url=None, body=None, force=False):
+@idempotent("post_dois", _get_db_file)
+def post_dois(action, submitter, node, url=None, body=None, force=False, background=False):
     """
     Submit a DOI to reserve or update. The input to the action may be
     either a JSON label payload (for reserve or update), or a URL to a PDS4
@@ -264,6 +324,9 @@ def post_dois(action, submitter, node, url=None, body=None, force=False):
     force : bool
         If true, forces a request to completion, ignoring any warnings
         encountered.
+    background : bool
+        If true, the request is queued to run as a background job, and a
+        JobRecord for the queued job is returned instead.
 
     Returns
     -------
@@ -275,8 +338,14 @@ def post_dois(action, submitter, node, url=None, body=None, force=False):
     """
     logger.info("POST /dois request received, action: %s", action)
 
+    if background:
+        return submit_background_job(
+            "post_dois", action=action, submitter=submitter, node=node, url=url, body=body, force=force
+        )
+
     # Get the appropriate parser for the currently configured service
     web_parser = DOIServiceFactory.get_web_parser_service()
+    queued = False
 
     try:
         if action == "reserve":
@@ -299,7 +368,10 @@ def post_dois(action, submitter, node, url=None, body=None, force=False):
             try:
                 reserve_kwargs = {"node": node, "submitter": submitter, "input": csv_file_path, "force": force}
 
+                report_job_progress(0.1, "Running reserve action")
+
                 doi_label = reserve_action.run(**reserve_kwargs)
+                queued = bool(reserve_action.queued_dois)
             finally:
                 # Clean up the temporary file
                 try:
@@ -324,6 +396,8 @@ def post_dois(action, submitter, node, url=None, body=None, force=False):
             if url:
                 update_kwargs = {"node": node, "submitter": submitter, "input": url, "force": force}
 
+                report_job_progress(0.1, "Running update action")
+
                 doi_label = update_action.run(**update_kwargs)
             else:
                 # Swagger def only specified application/xml and application/json
@@ -345,6 +419,8 @@ def post_dois(action, submitter, node, url=None, body=None, force=False):
                 try:
                     update_kwargs = {"node": node, "submitter": submitter, "input": outfile_path, "force": force}
 
+                    report_job_progress(0.1, "Running update action")
+
                     doi_label = update_action.run(**update_kwargs)
                 finally:
                     # Clean up the temporary file
@@ -362,18 +438,139 @@ def post_dois(action, submitter, node, url=None, body=None, force=False):
     # Invalid Argument code
     except (InputFormatException, WarningDOIException, ValueError) as err:
         return format_exceptions(err), 400
-    # For everything else, return the Internal Error code
+    # For everything else, return the Internal Error (or Service Unavailable) code
     except Exception as err:
-        return format_exceptions(err), 500
+        return format_exceptions(err), _error_code(err)
+
+    report_job_progress(0.9, "Formatting results")
 
     records = _records_from_dois(dois, node=node, submitter=submitter, doi_label=doi_label)
 
     logger.info('Posted %d record(s) to status "%s"', len(records), action)
 
+    # Submissions queued in the provider outbox are accepted, but not yet complete
+    return records, 202 if queued else 200
+
+
+BULK_UPDATE_CONTENT_TYPES = {
+    "text/csv": ".csv",
+    "application/x-ndjson": ".ndjson",
+    "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet": ".xlsx",
+}
+"""Maps the content types accepted by the bulk update endpoint to the extension of the temporary input file"""
+
+
+@idempotent("post_bulk_update", _get_db_file)
+def post_bulk_update(submitter, body, node=None, force=False, dry_run=False, background=False):
+    """
+    Apply a spreadsheet or NDJSON file of metadata changes, keyed by DOI, to
+    existing records. All updated records are validated, then committed
+    together.
+
+    Parameters
+    ----------
+    submitter : str
+        Email address of the submission requester.
+    body : bytes
+        requestBody contents. Should contain a CSV, Excel (xlsx) or
+        newline-delimited JSON file of field changes, with a "doi" column (key)
+        identifying the record to update.
+    node : str, optional
+        The PDS node name to cite as contributor of each updated DOI. If not
+        provided, the nodes currently assigned to each record are maintained.
+    force : bool
+        If true, forces a request to completion, ignoring any warnings
+        encountered.
+    dry_run : bool
+        If true, a report of the changes to each record is returned, and
+        nothing is committed.
+    background : bool
+        If true, the request is queued to run as a background job, and a
+        JobRecord for the queued job is returned instead.
+
+    Returns
+    -------
+    records : list of DoiRecord or list of dict
+        Records of the updated DOI's, or for a dry run, the report of the
+        changes to each record.
+    response_code : int
+        The HTTP response code corresponding to the result.
+
+    """
+    logger.info("POST /dois/bulk_update request received, dry_run: %s", dry_run)
+
+    if background:
+        return submit_background_job(
+            "post_bulk_update", submitter=submitter, body=body, node=node, force=force, dry_run=dry_run
+        )
+
+    try:
+        suffix = BULK_UPDATE_CONTENT_TYPES.get(connexion.request.mimetype)
+
+        if not suffix:
+            raise ValueError(
+                f"Unsupported content type {connexion.request.mimetype} for bulk update request, "
+                f"must be one of {', '.join(BULK_UPDATE_CONTENT_TYPES)}"
+            )
+
+        if isinstance(body, str):
+            body = body.encode()
+
+        bulk_update_action = DOICoreActionBulkUpdate(db_name=_get_db_name())
+
+        # Use delete=False for Windows compatibility to avoid permission issues
+        with NamedTemporaryFile("wb", prefix="bulk_update_", suffix=suffix, delete=False) as outfile:
+            logger.debug("Writing temporary field changes to %s", outfile.name)
+
+            outfile.write(body)
+            outfile.flush()
+            outfile_path = outfile.name
+
+        try:
+            bulk_update_kwargs = {
+                "node": node,
+                "submitter": submitter,
+                "input": outfile_path,
+                "force": force,
+                "dry_run": dry_run,
+            }
+
+            report_job_progress(0.1, "Running bulk update action")
+
+            output = bulk_update_action.run(**bulk_update_kwargs)
+        finally:
+            # Clean up the temporary file
+            try:
+                os.unlink(outfile_path)
+            except OSError:
+                # Ignore cleanup errors on Windows
+                pass
+    # These exceptions indicate some kind of input error, so return the
+    # Invalid Argument code
+    except (InputFormatException, UnknownDoiException, WarningDOIException, ValueError) as err:
+        return format_exceptions(err), 400
+    # For everything else, return the Internal Error code
+    except Exception as err:
+        return format_exceptions(err), 500
+
+    if dry_run:
+        return json.loads(output), 200
+
+    report_job_progress(0.9, "Formatting results")
+
+    dois, _ = DOIServiceFactory.get_web_parser_service().parse_dois_from_label(output, content_type=CONTENT_TYPE_JSON)
+
+    # The combined label is not attached to each record, since it would be
+    # repeated once per updated DOI
+    records = _records_from_dois(dois, node=node, submitter=submitter)
+
+    logger.info("Bulk updated %d record(s)", len(records))
+
     return records, 200
 
 
-def post_submit_doi(identifier, force=None):
+@idempotent("post_submit_doi", _get_db_file)
+def post_submit_doi(identifier, force=None, background=False):
     """
     Move a DOI record from draft/reserve status to "review".
 
@@ -384,6 +581,9 @@ def post_submit_doi(identifier, force=None):
     force : bool, optional
         If true, forces a submit request to completion, ignoring any warnings
         encountered.
+    background : bool, optional
+        If true, the request is queued to run as a background job, and a
+        JobRecord for the queued job is returned instead.
 
     Returns
     -------
@@ -393,6 +593,9 @@ def post_submit_doi(identifier, force=None):
     """
     logger.info("POST /dois/submit request received for identifier %s", identifier)
 
+    if background:
+        return submit_background_job("post_submit_doi", identifier=identifier, force=force)
+
     # A submit action is the same as invoking the release endpoint with
     # review set to True
     kwargs = {"identifier": identifier, "force": force, "review": True}
@@ -426,14 +629,14 @@ def post_release_doi(identifier, force=False, **kwargs):
         # Get the latest transaction record for this identifier
         list_record = list_action.transaction_for_identifier(identifier)
 
-        # Get the output label associated with this transaction
-        label_file = list_action.output_label_for_transaction(list_record)
-
         # An output label may contain entries other than the requested
-        # identifier, extract only the appropriate record into its own temporary
-        # file and feed it to the release action
+        # identifier, extract only the appropriate record from the output label
+        # associated with this transaction into its own temporary file and feed
+        # it to the release action
         web_parser = DOIServiceFactory.get_web_parser_service()
-        record, content_type = web_parser.get_record_for_identifier(label_file, identifier)
+        record, content_type, _ = get_transaction_label_cache().get_record_for_identifier(
+            list_record["transaction_key"], identifier, web_parser
+        )
 
         # Use delete=False for Windows compatibility to avoid permission issues
         with NamedTemporaryFile("w", prefix="output_", suffix=f".{content_type}", delete=False) as temp_file:
@@ -457,7 +660,10 @@ def post_release_doi(identifier, force=False, **kwargs):
                 "review": kwargs.get("review", False),
             }
 
+            report_job_progress(0.1, "Running release action")
+
             release_label = release_action.run(**release_kwargs)
+            queued = bool(release_action.queued_dois)
 
             dois, errors = web_parser.parse_dois_from_label(release_label, content_type=CONTENT_TYPE_JSON)
 
@@ -480,8 +686,9 @@ def post_release_doi(identifier, force=False, **kwargs):
         # Could not find an entry for the requested ID
         return format_exceptions(err), 404
     except Exception as err:
-        # Treat any unexpected Exception as an "Internal Error" and report back
-        return format_exceptions(err), 500
+        # Treat any unexpected Exception as an "Internal Error" (or the DOI
+        # service provider being unavailable) and report back
+        return format_exceptions(err), _error_code(err)
 
     records = _records_from_dois(
         dois, node=list_record["node_id"], submitter=list_record["submitter"], doi_label=release_label
@@ -489,7 +696,7 @@ def post_release_doi(identifier, force=False, **kwargs):
 
     logger.info('Posted %d record(s) to status "%s"', len(records), "review" if kwargs.get("review") else "release")
 
-    return records, 200
+    return records, 202 if queued else 200
 
 
 def get_doi_from_id(identifier):  # noqa: E501
@@ -506,9 +713,22 @@ def get_doi_from_id(identifier):  # noqa: E501
     record : DoiRecord
         The record for the requested identifier.
 
+    Notes
+    -----
+    The response carries an ETag derived from the change counter of the
+    transaction database and the identifier. A request with a matching
+    If-None-Match header receives a 304 (Not Modified) response.
+
     """
     logger.info("GET /doi request received for identifier %s", identifier)
 
+    return conditional_response(
+        _get_db_file(), "get_doi_from_id", {"identifier": identifier}, lambda: _get_doi_record(identifier)
+    )
+
+
+def _get_doi_record(identifier):
+    """Returns the DoiRecord, and response code, for a GET /doi request of the provided identifier."""
     # Get the appropriate parser for the currently configured service
     web_parser = DOIServiceFactory.get_web_parser_service()
 
@@ -518,11 +738,13 @@ def get_doi_from_id(identifier):  # noqa: E501
         # Get the latest transaction record for this identifier
         list_record = list_action.transaction_for_identifier(identifier)
 
-        # Get the output label associated with this transaction
-        label_file = list_action.output_label_for_transaction(list_record)
-
-        # Get only the record corresponding to the requested identifier
-        (label_for_id, content_type) = web_parser.get_record_for_identifier(label_file, identifier)
+        # Get only the record corresponding to the requested identifier from
+        # the output label associated with this transaction, along with the
+        # Doi parsed from it so we can return a full DoiRecord. Hot identifiers
+        # are served from memory until their transaction is next written to.
+        label_for_id, _, dois = get_transaction_label_cache().get_record_for_identifier(
+            list_record["transaction_key"], identifier, web_parser
+        )
     except UnknownIdentifierException as err:
         # Return "not found" code
         return format_exceptions(err), 404
@@ -530,9 +752,6 @@ def get_doi_from_id(identifier):  # noqa: E501
         # Treat any unexpected Exception as an "Internal Error" and report back
         return format_exceptions(err), 500
 
-    # Parse the label associated with the lidvid so we can return a full DoiRecord
-    dois, _ = web_parser.parse_dois_from_label(label_for_id, content_type)
-
     records = _records_from_dois(
         dois, node=list_record["node_id"], submitter=list_record["submitter"], doi_label=label_for_id
     )
@@ -541,7 +760,7 @@ def get_doi_from_id(identifier):  # noqa: E501
     return records[0], 200
 
 
-def get_check_dois(submitter, email=False, attachment=False):
+def get_check_dois(submitter, email=False, attachment=False, background=False):
     """
     Check submission status of all records pending release.
 
@@ -556,6 +775,9 @@ def get_check_dois(submitter, email=False, attachment=False):
     attachment : bool
         If true, the check action sends results as an email attachment. Has no
         effect if the email flag is not set to true.
+    background : bool
+        If true, the request is queued to run as a background job, and a
+        JobRecord for the queued job is returned instead.
 
     Returns
     -------
@@ -566,6 +788,9 @@ def get_check_dois(submitter, email=False, attachment=False):
     """
     logger.info("GET /dois/check request received")
 
+    if background:
+        return submit_background_job("get_check_dois", submitter=submitter, email=email, attachment=attachment)
+
     check_action = DOICoreActionCheck(db_name=_get_db_name())
 
     check_kwargs = {"submitter": submitter, "email": email, "attachment": attachment}
@@ -573,6 +798,8 @@ def get_check_dois(submitter, email=False, attachment=False):
     logger.debug("GET /dois/check action arguments: %s", check_kwargs)
 
     try:
+        report_job_progress(0.1, "Running check action")
+
         pending_results = check_action.run(**check_kwargs)
     except WebRequestException as err:
         # Host was unreachable
@@ -0,0 +1,48 @@
+#
+#  Copyright 2026, by the California Institute of Technology.  ALL RIGHTS
+#  RESERVED. United States Government Sponsorship acknowledged. Any commercial
+#  use must be negotiated with the Office of Technology Transfer at the
+#  California Institute of Technology.
+#
+"""
+==================
+jobs_controller.py
+==================
+
+Contains the request handlers for the background job endpoints of the PDS DOI API.
+"""
+from pds_doi_service.api.jobs import get_job_worker_pool
+from pds_doi_service.api.jobs import job_record_from_job
+from pds_doi_service.api.util import format_exceptions
+from pds_doi_service.core.util.general_util import get_logger
+
+logger = get_logger(__name__)
+
+
+def get_job(job_id):
+    """
+    Get the status of a background job, including its result once finished.
+
+    Parameters
+    ----------
+    job_id : str
+        The identifier of the job, as returned when the job was queued.
+
+    Returns
+    -------
+    record : JobRecord
+        The record for the requested job.
+
+    """
+    logger.info("GET /jobs request received for job %s", job_id)
+
+    try:
+        job = get_job_worker_pool().job_queue.get(job_id)
+    except Exception as err:
+        # Treat any unexpected Exception as an "Internal Error" and report back
+        return format_exceptions(err), 500
+
+    if job is None:
+        return format_exceptions(KeyError(f"No job found with identifier {job_id}")), 404
+
+    return job_record_from_job(job), 200
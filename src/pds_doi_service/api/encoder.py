@@ -1,6 +1,6 @@
-import six
 from connexion.apps.flask_app import FlaskJSONEncoder  # type: ignore
 from pds_doi_service.api.models import Model
+from pds_doi_service.api.serializers import get_model_serializer
 
 
 class JSONEncoder(FlaskJSONEncoder):
@@ -8,12 +8,5 @@ class JSONEncoder(FlaskJSONEncoder):
 
     def default(self, o):
         if isinstance(o, Model):
-            dikt = {}
-            for attr, _ in six.iteritems(o.swagger_types):
-                value = getattr(o, attr)
-                if value is None and not self.include_nulls:
-                    continue
-                attr = o.attribute_map[attr]
-                dikt[attr] = value
-            return dikt
+            return get_model_serializer(type(o), self.include_nulls)(o)
         return FlaskJSONEncoder.default(self, o)
@@ -0,0 +1,258 @@
+#
+#  Copyright 2026, by the California Institute of Technology.  ALL RIGHTS
+#  RESERVED. United States Government Sponsorship acknowledged. Any commercial
+#  use must be negotiated with the Office of Technology Transfer at the
+#  California Institute of Technology.
+#
+"""
+==============
+idempotency.py
+==============
+
+Support for the Idempotency-Key header of the POST endpoints of the PDS DOI API.
+
+A client may send a unique key with a POST request, and safely retry the
+request (such as after a timeout) with the same key. The first request made
+with a key runs as normal, and a snapshot of its response is stored within the
+transaction database (see DOIDataBase.create_idempotency_table()). Retries are
+then answered with the stored response, marked with an Idempotent-Replayed
+header, without running the request again.
+
+Retries received while the original request is still running wait for it to
+complete, and are answered with its response. Within a single process this is
+signalled directly, while retries received by other processes sharing the
+database poll the database for the response.
+"""
+import functools
+import hashlib
+import json
+import threading
+import time
+
+import connexion  # type: ignore
+from pds_doi_service.api.encoder import JSONEncoder
+from pds_doi_service.api.util import format_exceptions
+from pds_doi_service.core.db.doi_database import DOIDataBase
+from pds_doi_service.core.entities.exceptions import IdempotencyKeyException
+from pds_doi_service.core.util.config_parser import DOIConfigUtil
+from pds_doi_service.core.util.general_util import get_logger
+
+logger = get_logger(__name__)
+
+IDEMPOTENCY_KEY_HEADER = "Idempotency-Key"
+"""Name of the request header providing the idempotency key of a request"""
+
+IDEMPOTENT_REPLAYED_HEADER = "Idempotent-Replayed"
+"""Name of the response header marking a response as the replay of an earlier request"""
+
+MAX_KEY_LENGTH = 255
+"""Maximum length of an idempotency key"""
+
+DEFAULT_KEY_TTL = 86400
+"""Default number of seconds the response to a request is kept for replay"""
+
+DEFAULT_WAIT_TIMEOUT = 60.0
+"""Default number of seconds a retry waits for the original request to complete"""
+
+DEFAULT_LOCK_TIMEOUT = 3600
+"""Default number of seconds after which a request that never completed no longer holds its key"""
+
+POLL_INTERVAL = 0.25
+"""Interval, in seconds, between polls of the database for the response to a request run by another process"""
+
+
+class _InFlight:
+    """A request running in this process, along with the retries of it waiting on its response."""
+
+    def __init__(self, fingerprint):
+        self.fingerprint = fingerprint
+        self.done = threading.Event()
+        self.response = None
+
+
+_in_flight = {}
+_in_flight_lock = threading.Lock()
+
+
+def request_fingerprint(operation):
+    """
+    Returns a hash of the operation, method, path, query parameters and body of
+    the current request, used to detect the reuse of an idempotency key for a
+    different request.
+    """
+    digest = hashlib.sha256()
+
+    digest.update(
+        json.dumps(
+            [operation, connexion.request.method, connexion.request.path, sorted(connexion.request.args.items(True))]
+        ).encode("utf-8")
+    )
+    digest.update(connexion.request.get_data())
+
+    return digest.hexdigest()
+
+
+def _split_response(response):
+    """Returns the body, status code and headers of a controller response tuple."""
+    body, code, *headers = response
+
+    return body, code, dict(headers[0]) if headers else {}
+
+
+def _replayed(response):
+    """Returns the provided response marked as the replay of an earlier request."""
+    body, code, headers = _split_response(response)
+
+    return body, code, {**headers, IDEMPOTENT_REPLAYED_HEADER: "true"}
+
+
+def _conflict(message, code):
+    """Returns an error response for a request which cannot be run with its idempotency key."""
+    return format_exceptions(IdempotencyKeyException(message)), code
+
+
+def _run_once(database, key, fingerprint, build_response, config):
+    """
+    Runs the request made with the provided key, unless it has already been run
+    (or is being run by another process), in which case the stored response of
+    the original request is returned once available.
+    """
+    max_age = int(config.get("OTHER", "idempotency_key_ttl", fallback=DEFAULT_KEY_TTL))
+    lock_timeout = int(config.get("OTHER", "idempotency_lock_timeout", fallback=DEFAULT_LOCK_TIMEOUT))
+    wait_timeout = float(config.get("OTHER", "idempotency_wait_timeout", fallback=DEFAULT_WAIT_TIMEOUT))
+
+    deadline = time.monotonic() + wait_timeout
+
+    # A key whose original request was abandoned is taken over by the next retry
+    while (existing := database.begin_idempotent_request(key, fingerprint, max_age, lock_timeout)) is not None:
+        if existing["fingerprint"] != fingerprint:
+            return _conflict(f"{IDEMPOTENCY_KEY_HEADER} {key} was already used for a different request", 422)
+
+        if existing["completed"] is not None:
+            logger.info("Replaying the stored response to the request with %s %s", IDEMPOTENCY_KEY_HEADER, key)
+            body, headers = json.loads(existing["response"]), json.loads(existing["headers"])
+
+            return _replayed((body, existing["response_code"], headers))
+
+        if time.monotonic() >= deadline:
+            return _conflict(f"The request with {IDEMPOTENCY_KEY_HEADER} {key} is still in progress", 409)
+
+        time.sleep(POLL_INTERVAL)
+
+    try:
+        response = build_response()
+    except Exception:
+        database.remove_idempotent_request(key)
+        raise
+
+    body, code, headers = _split_response(response)
+
+    # Server errors are not stored, so the request may be retried with the same key
+    if code >= 500:
+        database.remove_idempotent_request(key)
+    else:
+        database.complete_idempotent_request(key, json.dumps(body, cls=JSONEncoder), code, json.dumps(headers))
+
+    return response
+
+
+def idempotent_response(db_file, operation, build_response):
+    """
+    Returns the response to a POST request, honoring any Idempotency-Key header
+    of the request.
+
+    Parameters
+    ----------
+    db_file : str
+        Path to the transaction database storing the responses to requests.
+    operation : str
+        Name of the endpoint operation.
+    build_response : callable
+        Function running the request, and returning its (body, status code)
+        or (body, status code, headers) response. Responses with a 5xx status
+        code are not stored.
+
+    Returns
+    -------
+    response : tuple
+        The response to the request. Replayed responses include an
+        Idempotent-Replayed header. A 400 status code is returned for an invalid
+        key, a 422 status code when the key was used for a different request, and
+        a 409 status code when the original request is still running after the
+        OTHER.idempotency_wait_timeout field of the INI config.
+
+    """
+    key = connexion.request.headers.get(IDEMPOTENCY_KEY_HEADER)
+
+    if key is None:
+        return build_response()
+
+    if not 0 < len(key) <= MAX_KEY_LENGTH or not key.isascii() or not key.isprintable():
+        return (
+            format_exceptions(
+                ValueError(f"{IDEMPOTENCY_KEY_HEADER} must be 1 to {MAX_KEY_LENGTH} printable ASCII characters")
+            ),
+            400,
+        )
+
+    config = DOIConfigUtil().get_config()
+    fingerprint = request_fingerprint(operation)
+    flight_key = (db_file, key)
+
+    with _in_flight_lock:
+        in_flight = _in_flight.get(flight_key)
+        owner = in_flight is None
+
+        if owner:
+            in_flight = _in_flight[flight_key] = _InFlight(fingerprint)
+
+    if not owner:
+        if in_flight.fingerprint != fingerprint:
+            return _conflict(f"{IDEMPOTENCY_KEY_HEADER} {key} was already used for a different request", 422)
+
+        logger.info("Waiting on the running request with %s %s", IDEMPOTENCY_KEY_HEADER, key)
+
+        wait_timeout = float(config.get("OTHER", "idempotency_wait_timeout", fallback=DEFAULT_WAIT_TIMEOUT))
+
+        if not in_flight.done.wait(wait_timeout) or in_flight.response is None:
+            return _conflict(f"The request with {IDEMPOTENCY_KEY_HEADER} {key} is still in progress", 409)
+
+        return _replayed(in_flight.response)
+
+    database = DOIDataBase(db_file)
+
+    try:
+        in_flight.response = _run_once(database, key, fingerprint, build_response, config)
+
+        return in_flight.response
+    finally:
+        database.close_database()
+
+        with _in_flight_lock:
+            del _in_flight[flight_key]
+
+        in_flight.done.set()
+
+
+def idempotent(operation, get_db_file):
+    """
+    Decorator which applies idempotent_response() to a POST endpoint controller.
+
+    Parameters
+    ----------
+    operation : str
+        Name of the endpoint operation.
+    get_db_file : callable
+        Function returning the path to the transaction database used by the
+        endpoint, called within the context of each request.
+
+    """
+
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            return idempotent_response(get_db_file(), operation, lambda: func(*args, **kwargs))
+
+        return wrapper
+
+    return decorator
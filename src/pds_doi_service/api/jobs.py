@@ -0,0 +1,217 @@
+#
+#  Copyright 2026, by the California Institute of Technology.  ALL RIGHTS
+#  RESERVED. United States Government Sponsorship acknowledged. Any commercial
+#  use must be negotiated with the Office of Technology Transfer at the
+#  California Institute of Technology.
+#
+"""
+=======
+jobs.py
+=======
+
+Support for running long-running PDS DOI API requests as background jobs.
+
+When a request opts in to background execution, the details of the request
+(its path, query string, body and the arguments to the controller function)
+are saved to a persistent JobQueue, and a 202 (Accepted) response pointing to
+the job's /jobs/{job_id} status endpoint is returned immediately. A pool of
+worker threads later replays each saved request against the same controller
+function, within a request context equivalent to the original, so the result
+of a background job is exactly what the synchronous request would have returned.
+"""
+import json
+import os
+import threading
+
+import flask
+from pds_doi_service.api import encoder
+from pds_doi_service.api.models import JobRecord
+from pds_doi_service.core.db.job_queue import DEFAULT_NUM_WORKERS
+from pds_doi_service.core.db.job_queue import JobQueue
+from pds_doi_service.core.db.job_queue import JobWorkerPool
+from pds_doi_service.core.util.config_parser import DOIConfigUtil
+from pds_doi_service.core.util.general_util import get_logger
+
+logger = get_logger(__name__)
+
+BACKGROUND_OPERATIONS = ("post_dois", "post_bulk_update", "post_submit_doi", "get_check_dois")
+"""Names of the dois_controller functions which may be run as background jobs"""
+
+RESUMABLE_OPERATIONS = ("post_bulk_update", "get_check_dois")
+"""
+Names of the background operations which may be safely run again when
+interrupted, as they submit no records to the DOI service provider. Reserve
+and release jobs interrupted by a restart are marked as failed rather than
+replayed, as they may already have created or updated DOIs.
+"""
+
+_job_worker_pool = None
+_job_worker_pool_lock = threading.Lock()
+
+
+def get_job_worker_pool(app=None):
+    """
+    Returns the process-wide JobWorkerPool, creating and starting it on first
+    use. The job queue database and number of workers are determined by the
+    OTHER.job_db_file and OTHER.job_workers fields of the INI config. A relative
+    job_db_file is resolved against the directory of OTHER.db_file, so the
+    job queue is kept alongside the transaction database.
+
+    Parameters
+    ----------
+    app : flask.Flask, optional
+        The Flask application that background jobs are run against. Only used
+        when the pool is first created. Defaults to the current application.
+
+    """
+    global _job_worker_pool
+
+    with _job_worker_pool_lock:
+        if _job_worker_pool is None:
+            config = DOIConfigUtil().get_config()
+
+            app = app or flask.current_app._get_current_object()
+
+            db_dir = os.path.dirname(os.path.abspath(config.get("OTHER", "db_file")))
+            job_db_file = os.path.join(db_dir, os.path.expanduser(config.get("OTHER", "job_db_file")))
+
+            job_queue = JobQueue(job_db_file)
+            num_workers = int(config.get("OTHER", "job_workers", fallback=DEFAULT_NUM_WORKERS))
+
+            _job_worker_pool = JobWorkerPool(
+                job_queue,
+                lambda job, report: _run_job(app, job, report),
+                num_workers,
+                resumable_operations=RESUMABLE_OPERATIONS,
+            )
+            _job_worker_pool.start()
+
+    return _job_worker_pool
+
+
+def report_job_progress(progress, message=None):
+    """
+    Reports the progress of the background job currently being run on this
+    thread. Has no effect when called outside a background job, so controller
+    functions may report progress unconditionally.
+
+    Parameters
+    ----------
+    progress : float
+        Fraction of the job completed, from 0 to 1.
+    message : str, optional
+        Description of the current job progress.
+
+    """
+    report = flask.g.get("report_job_progress") if flask.has_app_context() else None
+
+    if report:
+        report(progress, message)
+
+
+def job_record_from_job(job):
+    """Converts a core Job object into the JobRecord model returned by the API."""
+    return JobRecord(
+        job_id=job.job_id,
+        operation=job.operation,
+        status=job.status,
+        progress=job.progress,
+        message=job.message,
+        creation_date=job.date_created,
+        update_date=job.date_updated,
+        result_code=job.result_code,
+        result=json.loads(job.result) if job.result else None,
+    )
+
+
+def submit_background_job(operation, **kwargs):
+    """
+    Saves the current request as a background job to be run by the provided
+    controller operation.
+
+    Parameters
+    ----------
+    operation : str
+        Name of the dois_controller function that services the current request.
+        Must be one of BACKGROUND_OPERATIONS.
+    kwargs : dict
+        The arguments to the controller function. The requestBody (if any) is
+        saved from the current request, so should not be included.
+
+    Returns
+    -------
+    record : JobRecord
+        Record of the queued job.
+    response_code : int
+        The HTTP response code (202).
+    headers : dict
+        Response headers, including the location of the job status endpoint.
+
+    """
+    if operation not in BACKGROUND_OPERATIONS:
+        raise ValueError(f"Operation {operation} cannot be run in the background")
+
+    request = flask.request
+    has_body = kwargs.pop("body", None) is not None
+
+    arguments = {
+        "kwargs": kwargs,
+        "has_body": has_body,
+        "path": request.path,
+        "method": request.method,
+        "query_string": request.query_string.decode(),
+        "content_type": request.content_type,
+    }
+
+    job_worker_pool = get_job_worker_pool()
+    job_id = job_worker_pool.submit(operation, arguments, payload=request.get_data() or None)
+
+    # Jobs are served from the same base path as the endpoint that queued them
+    base_path = flask.current_app.blueprints[request.blueprint].url_prefix if request.blueprint else ""
+
+    record = job_record_from_job(job_worker_pool.job_queue.get(job_id))
+
+    return record, 202, {"Location": f"{base_path}/jobs/{job_id}"}
+
+
+def _run_job(app, job, report_progress):
+    """
+    Runs a background job by replaying its saved request against the
+    appropriate dois_controller function.
+
+    Returns
+    -------
+    result : str
+        The JSON-encoded response body returned by the controller.
+    result_code : int
+        The HTTP response code returned by the controller.
+
+    """
+    # Imported here to avoid a circular import, since the controller module
+    # depends on this one
+    from pds_doi_service.api.controllers import dois_controller
+
+    if job.operation not in BACKGROUND_OPERATIONS:
+        raise ValueError(f"Unsupported background operation {job.operation}")
+
+    arguments = job.arguments
+
+    with app.test_request_context(
+        arguments["path"],
+        method=arguments["method"],
+        query_string=arguments["query_string"],
+        data=job.payload,
+        content_type=arguments["content_type"],
+    ):
+        flask.g.report_job_progress = report_progress
+
+        kwargs = dict(arguments["kwargs"])
+
+        if arguments["has_body"]:
+            kwargs["body"] = flask.request.get_data()
+
+        report_progress(0.0, f"Running {job.operation}")
+
+        result, result_code = getattr(dois_controller, job.operation)(**kwargs)[:2]
+
+        return json.dumps(result, cls=encoder.JSONEncoder), result_code
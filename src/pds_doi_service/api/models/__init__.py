@@ -5,6 +5,7 @@ from __future__ import absolute_import
 from .base_model_ import Model
 from .doi_record import DoiRecord
 from .doi_summary import DoiSummary
+from .job_record import JobRecord
 from .label_payload import LabelPayload
 from .labels_payload import LabelsPayload
 
@@ -0,0 +1,279 @@
+# coding: utf-8
+from __future__ import absolute_import
+
+from datetime import datetime  # noqa: F401
+
+from pds_doi_service.api import util
+from pds_doi_service.api.models import Model
+
+
+class JobRecord(Model):
+    """
+    NOTE: This class was auto generated by the swagger code generator program.
+    """
+
+    def __init__(
+        self,
+        job_id=None,
+        operation=None,
+        status=None,
+        progress=None,
+        message=None,
+        creation_date=None,
+        update_date=None,
+        result_code=None,
+        result=None,
+    ):  # noqa: E501
+        """JobRecord - a model defined in Swagger
+
+        :param job_id: The identifier of this JobRecord.  # noqa: E501
+        :type job_id: str
+        :param operation: The operation run by this JobRecord.  # noqa: E501
+        :type operation: str
+        :param status: The status of this JobRecord.  # noqa: E501
+        :type status: str
+        :param progress: The progress of this JobRecord.  # noqa: E501
+        :type progress: float
+        :param message: The message of this JobRecord.  # noqa: E501
+        :type message: str
+        :param creation_date: The creation_date of this JobRecord.  # noqa: E501
+        :type creation_date: datetime
+        :param update_date: The update_date of this JobRecord.  # noqa: E501
+        :type update_date: datetime
+        :param result_code: The result_code of this JobRecord.  # noqa: E501
+        :type result_code: int
+        :param result: The result of this JobRecord.  # noqa: E501
+        :type result: object
+        """
+        self.swagger_types = {
+            "job_id": str,
+            "operation": str,
+            "status": str,
+            "progress": float,
+            "message": str,
+            "creation_date": datetime,
+            "update_date": datetime,
+            "result_code": int,
+            "result": object,
+        }
+
+        self.attribute_map = {
+            "job_id": "job_id",
+            "operation": "operation",
+            "status": "status",
+            "progress": "progress",
+            "message": "message",
+            "creation_date": "creation_date",
+            "update_date": "update_date",
+            "result_code": "result_code",
+            "result": "result",
+        }
+        self._job_id = job_id
+        self._operation = operation
+        self._status = status
+        self._progress = progress
+        self._message = message
+        self._creation_date = creation_date
+        self._update_date = update_date
+        self._result_code = result_code
+        self._result = result
+
+    @classmethod
+    def from_dict(cls, dikt) -> "JobRecord":
+        """Returns the dict as a model
+
+        :param dikt: A dict.
+        :type: dict
+        :return: The job_record of this JobRecord.  # noqa: E501
+        :rtype: JobRecord
+        """
+        return util.deserialize_model(dikt, cls)
+
+    @property
+    def job_id(self) -> str:
+        """Gets the job_id of this JobRecord.
+
+
+        :return: The identifier of this JobRecord.
+        :rtype: str
+        """
+        return self._job_id
+
+    @job_id.setter
+    def job_id(self, job_id: str):
+        """Sets the job_id of this JobRecord.
+
+
+        :param job_id: The identifier of this JobRecord.
+        :type job_id: str
+        """
+
+        self._job_id = job_id
+
+    @property
+    def operation(self) -> str:
+        """Gets the operation of this JobRecord.
+
+
+        :return: The operation run by this JobRecord.
+        :rtype: str
+        """
+        return self._operation
+
+    @operation.setter
+    def operation(self, operation: str):
+        """Sets the operation of this JobRecord.
+
+
+        :param operation: The operation run by this JobRecord.
+        :type operation: str
+        """
+
+        self._operation = operation
+
+    @property
+    def status(self) -> str:
+        """Gets the status of this JobRecord.
+
+
+        :return: The status of this JobRecord.
+        :rtype: str
+        """
+        return self._status
+
+    @status.setter
+    def status(self, status: str):
+        """Sets the status of this JobRecord.
+
+
+        :param status: The status of this JobRecord.
+        :type status: str
+        """
+
+        self._status = status
+
+    @property
+    def progress(self) -> float:
+        """Gets the progress of this JobRecord.
+
+
+        :return: The progress of this JobRecord.
+        :rtype: float
+        """
+        return self._progress
+
+    @progress.setter
+    def progress(self, progress: float):
+        """Sets the progress of this JobRecord.
+
+
+        :param progress: The progress of this JobRecord.
+        :type progress: float
+        """
+
+        self._progress = progress
+
+    @property
+    def message(self) -> str:
+        """Gets the message of this JobRecord.
+
+
+        :return: The message of this JobRecord.
+        :rtype: str
+        """
+        return self._message
+
+    @message.setter
+    def message(self, message: str):
+        """Sets the message of this JobRecord.
+
+
+        :param message: The message of this JobRecord.
+        :type message: str
+        """
+
+        self._message = message
+
+    @property
+    def creation_date(self) -> datetime:
+        """Gets the creation_date of this JobRecord.
+
+
+        :return: The creation_date of this JobRecord.
+        :rtype: datetime
+        """
+        return self._creation_date
+
+    @creation_date.setter
+    def creation_date(self, creation_date: datetime):
+        """Sets the creation_date of this JobRecord.
+
+
+        :param creation_date: The creation_date of this JobRecord.
+        :type creation_date: datetime
+        """
+
+        self._creation_date = creation_date
+
+    @property
+    def update_date(self) -> datetime:
+        """Gets the update_date of this JobRecord.
+
+
+        :return: The update_date of this JobRecord.
+        :rtype: datetime
+        """
+        return self._update_date
+
+    @update_date.setter
+    def update_date(self, update_date: datetime):
+        """Sets the update_date of this JobRecord.
+
+
+        :param update_date: The update_date of this JobRecord.
+        :type update_date: datetime
+        """
+
+        self._update_date = update_date
+
+    @property
+    def result_code(self) -> int:
+        """Gets the result_code of this JobRecord.
+
+
+        :return: The result_code of this JobRecord.
+        :rtype: int
+        """
+        return self._result_code
+
+    @result_code.setter
+    def result_code(self, result_code: int):
+        """Sets the result_code of this JobRecord.
+
+
+        :param result_code: The result_code of this JobRecord.
+        :type result_code: int
+        """
+
+        self._result_code = result_code
+
+    @property
+    def result(self) -> object:
+        """Gets the result of this JobRecord.
+
+
+        :return: The result of this JobRecord.
+        :rtype: object
+        """
+        return self._result
+
+    @result.setter
+    def result(self, result: object):
+        """Sets the result of this JobRecord.
+
+
+        :param result: The result of this JobRecord.
+        :type result: object
+        """
+
+        self._result = result
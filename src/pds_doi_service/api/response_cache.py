@@ -0,0 +1,183 @@
+#
+#  Copyright 2026, by the California Institute of Technology.  ALL RIGHTS
+#  RESERVED. United States Government Sponsorship acknowledged. Any commercial
+#  use must be negotiated with the Office of Technology Transfer at the
+#  California Institute of Technology.
+#
+"""
+=================
+response_cache.py
+=================
+
+Support for conditional GET requests (ETags) and caching of the responses of
+the read-only PDS DOI API endpoints.
+
+Each write to the transaction database increments its change counter (see
+DOIDataBase.create_changes_table()). The ETag of a response is derived from
+the counter along with the endpoint and its query parameters, so a client
+polling an endpoint receives a 304 (Not Modified) response until the database
+changes. Responses are also held in a bounded, in-process LRU cache, and are
+only rebuilt once the change counter of the database moves on.
+"""
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+
+import connexion  # type: ignore
+from pds_doi_service.core.db.doi_database import DOIDataBase
+from pds_doi_service.core.util.config_parser import DOIConfigUtil
+from pds_doi_service.core.util.general_util import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_CACHE_SIZE = 256
+"""Default maximum number of responses held by the cache"""
+
+
+class ResponseCache:
+    """
+    Bounded, thread-safe LRU cache of API responses, keyed by the database,
+    endpoint and query parameters of each request.
+
+    Each entry records the version (change counter) of the database it was
+    built from, and is treated as a miss once the database version changes.
+    """
+
+    def __init__(self, max_size=DEFAULT_CACHE_SIZE):
+        self._max_size = max_size
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def max_size(self):
+        """Returns the maximum number of responses held by the cache."""
+        return self._max_size
+
+    def stats(self):
+        """Returns the hits, misses, current size and maximum size of the cache."""
+        with self._lock:
+            return {"hits": self._hits, "misses": self._misses, "size": len(self._entries), "max_size": self._max_size}
+
+    def clear(self):
+        """Removes all entries from the cache and resets its metrics."""
+        with self._lock:
+            self._entries.clear()
+            self._hits = self._misses = 0
+
+    def get(self, key, version):
+        """Returns the response cached for the key at the provided database version, or None on a miss."""
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is None or entry[0] != version:
+                self._misses += 1
+                return None
+
+            self._hits += 1
+            self._entries.move_to_end(key)
+
+            return entry[1]
+
+    def put(self, key, version, response):
+        """Caches the response for the key, replacing any response built from a previous database version."""
+        if self._max_size <= 0:
+            return
+
+        with self._lock:
+            self._entries[key] = (version, response)
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+
+
+_response_cache = None
+_response_cache_lock = threading.Lock()
+
+
+def get_response_cache():
+    """
+    Returns the process-wide ResponseCache, creating it on first use. The
+    size of the cache is determined by the OTHER.api_response_cache_size
+    field of the INI config. A size of 0 disables caching, although ETags
+    are still returned and honored.
+    """
+    global _response_cache
+
+    with _response_cache_lock:
+        if _response_cache is None:
+            config = DOIConfigUtil().get_config()
+            max_size = int(config.get("OTHER", "api_response_cache_size", fallback=DEFAULT_CACHE_SIZE))
+
+            logger.debug("Creating API response cache with maximum size %d", max_size)
+
+            _response_cache = ResponseCache(max_size)
+
+    return _response_cache
+
+
+def make_etag(version, operation, params):
+    """
+    Returns the ETag (without quotes) of the response to the provided operation
+    and query parameters, at the provided version of the transaction database.
+    """
+    digest = hashlib.sha256(json.dumps([version, operation, params], sort_keys=True, default=str).encode("utf-8"))
+
+    return digest.hexdigest()[:32]
+
+
+def conditional_response(db_file, operation, params, build_response):
+    """
+    Returns the response to a read-only request, honoring any If-None-Match
+    header of the request and serving the response from the cache when the
+    transaction database is unchanged since it was built.
+
+    Parameters
+    ----------
+    db_file : str
+        Path to the transaction database the response is built from.
+    operation : str
+        Name of the endpoint operation.
+    params : dict
+        The query parameters of the request.
+    build_response : callable
+        Function returning the (body, status code) response to the request.
+        Only responses with a 200 status code are cached.
+
+    Returns
+    -------
+    response : tuple
+        The (body, status code) of the response, along with its ETag and
+        Cache-Control headers when the database has a change counter.
+
+    """
+    version = DOIDataBase.read_change_counter(db_file)
+
+    if version is None:
+        return build_response()
+
+    etag = make_etag([db_file, *version], operation, params)
+    headers = {"ETag": f'"{etag}"', "Cache-Control": "no-cache"}
+
+    if connexion.request.if_none_match.contains_weak(etag):
+        logger.debug("%s request not modified since version %s", operation, version)
+        return "", 304, headers
+
+    cache = get_response_cache()
+    key = (db_file, operation, json.dumps(params, sort_keys=True, default=str))
+
+    response = cache.get(key, version)
+
+    if response is None:
+        response = build_response()
+
+        if response[1] != 200:
+            return response
+
+        cache.put(key, version, response)
+
+    return (*response, headers)
@@ -0,0 +1,209 @@
+#
+#  Copyright 2026, by the California Institute of Technology.  ALL RIGHTS
+#  RESERVED. United States Government Sponsorship acknowledged. Any commercial
+#  use must be negotiated with the Office of Technology Transfer at the
+#  California Institute of Technology.
+#
+"""
+==============
+serializers.py
+==============
+
+Pre-compiled serializers for the response models of the API.
+
+Encoding a model via encoder.JSONEncoder reflects over its swagger_types and
+attribute_map for every attribute of every object. For each model class, the
+functions of this module instead generate (once) a serializer function with
+each attribute read and renamed by a straight-line statement, either from an
+instance of the model, or directly from the database rows a list response is
+built from, bypassing construction of the model objects altogether.
+
+Serialized output is identical to that of JSONEncoder: attributes with a None
+value are omitted, and keys are named according to the attribute_map of the
+model.
+"""
+import datetime
+import functools
+import json
+
+from flask import Response
+
+try:
+    import orjson  # type: ignore
+except ImportError:
+    orjson = None
+
+JSON_MIMETYPE = "application/json"
+"""Mimetype of the responses returned by json_response()"""
+
+
+def _model_fields(model_class):
+    """
+    Returns the (attribute, json_key, swagger_type) tuple of each attribute of
+    the provided model class, in the order defined by its swagger_types.
+    """
+    # The generated models only assign swagger_types and attribute_map in
+    # __init__, where every argument is optional
+    model = model_class()
+
+    return [(attr, model.attribute_map[attr], swagger_type) for attr, swagger_type in model.swagger_types.items()]
+
+
+def _encode_datetime(value):
+    """Encodes a datetime value as connexion's FlaskJSONEncoder does."""
+    if isinstance(value, datetime.datetime) and not value.tzinfo:
+        return value.isoformat("T") + "Z"
+
+    return value.isoformat()
+
+
+def _compile(function_name, fields, value_expression, include_nulls):
+    """
+    Generates the source of a serializer function taking a single "source"
+    argument, which returns a dict with one entry per field, then compiles it.
+
+    Parameters
+    ----------
+    function_name : str
+        Name of the generated function, shown in tracebacks and profiles.
+    fields : list of tuple
+        The (json_key, source_key, is_date) tuple of each field, where
+        source_key is substituted into value_expression to read the value of
+        the field from the source, and is_date indicates values of the field
+        may need to be encoded from a date or datetime object.
+    value_expression : str
+        Format string of the expression which reads a field from the source.
+    include_nulls : bool
+        If True, fields with a None value are included in the result.
+
+    """
+    lines = [f"def {function_name}(source):", "    result = {}"]
+
+    for json_key, source_key, is_date in fields:
+        lines.append(f"    value = {value_expression.format(source_key)}")
+
+        if is_date:
+            lines.append("    if isinstance(value, date):")
+            lines.append("        value = _encode_datetime(value)")
+
+        if include_nulls:
+            lines.append(f"    result[{json_key!r}] = value")
+        else:
+            lines.append("    if value is not None:")
+            lines.append(f"        result[{json_key!r}] = value")
+
+    lines.append("    return result")
+
+    namespace = {"date": datetime.date, "_encode_datetime": _encode_datetime}
+    exec(compile("\n".join(lines), f"<serializer {function_name}>", "exec"), namespace)
+
+    return namespace[function_name]
+
+
+@functools.lru_cache(maxsize=None)
+def get_model_serializer(model_class, include_nulls=False):
+    """
+    Returns the serializer of instances of the provided model class, which
+    returns the dict JSONEncoder would encode an instance as.
+
+    Parameters
+    ----------
+    model_class : type
+        The model class to serialize, a subclass of models.Model.
+    include_nulls : bool, optional
+        If True, attributes with a None value are included in the result.
+
+    Returns
+    -------
+    serializer : callable
+        Function taking a model instance and returning its JSON object.
+
+    """
+    # Values which are themselves models are left to the JSON encoder, as by
+    # JSONEncoder, so dates are the only values needing conversion here
+    fields = [(json_key, attr, False) for attr, json_key, _ in _model_fields(model_class)]
+
+    return _compile(f"serialize_{model_class.__name__}", fields, "source.{}", include_nulls)
+
+
+@functools.lru_cache(maxsize=None)
+def get_row_serializer(model_class, columns, sources=(), include_nulls=False):
+    """
+    Returns a serializer which builds the JSON object of the provided model
+    class directly from a database row, rather than from an instance of the
+    model.
+
+    Parameters
+    ----------
+    model_class : type
+        The model class whose JSON objects are built, a subclass of models.Model.
+    columns : tuple of str
+        The names of the columns of each row, as returned by the database.
+    sources : tuple of tuple, optional
+        (attribute, column) pairs naming the column each attribute of the
+        model is read from, for attributes not named the same as their column.
+    include_nulls : bool, optional
+        If True, attributes with a None value are included in the result.
+
+    Returns
+    -------
+    serializer : callable
+        Function taking a row (a sequence of column values) and returning the
+        JSON object of the model. Dates are encoded as ISO 8601 strings.
+
+    Raises
+    ------
+    ValueError
+        If no column is found for an attribute of the model.
+
+    """
+    column_indices = {column: index for index, column in enumerate(columns)}
+    sources = dict(sources)
+    fields = []
+
+    for attr, json_key, swagger_type in _model_fields(model_class):
+        column = sources.get(attr, attr)
+
+        if column not in column_indices:
+            raise ValueError(f"No column found for attribute {attr} of {model_class.__name__} (expected {column})")
+
+        is_date = swagger_type in (datetime.datetime, datetime.date)
+
+        fields.append((json_key, column_indices[column], is_date))
+
+    return _compile(f"serialize_{model_class.__name__}_row", fields, "source[{}]", include_nulls)
+
+
+def dumps(objects):
+    """
+    Encodes the provided JSON objects (such as those returned by a serializer)
+    to compact JSON, using orjson when it is installed.
+
+    Returns
+    -------
+    body : bytes
+        The UTF-8 encoded JSON text.
+
+    """
+    if orjson is not None:
+        return orjson.dumps(objects)
+
+    return json.dumps(objects, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def json_response(response):
+    """
+    Converts a (body, status code[, headers]) response tuple whose body is
+    pre-serialized JSON (bytes, as returned by dumps()) into a Flask Response,
+    which Connexion returns as is rather than encoding the body again. Other
+    responses are returned unchanged.
+    """
+    body, *rest = response
+
+    if not isinstance(body, bytes):
+        return response
+
+    status = rest[0] if rest else 200
+    headers = rest[1] if len(rest) > 1 else None
+
+    return Response(body, status=status, headers=headers, mimetype=JSON_MIMETYPE)
@@ -4,10 +4,14 @@ Planetary Data System's Digital Object Identifier service — tests for API
 """
 import unittest
 
+from . import test_asgi
 from . import test_dois_controller
+from . import test_serializers
 
 
 def suite():
     suite = unittest.TestSuite()
+    suite.addTests(unittest.defaultTestLoader.loadTestsFromModule(test_asgi))
     suite.addTests(unittest.defaultTestLoader.loadTestsFromModule(test_dois_controller))
+    suite.addTests(unittest.defaultTestLoader.loadTestsFromModule(test_serializers))
     return suite
@@ -0,0 +1,96 @@
+# coding: utf-8
+import asyncio
+import json
+import logging
+import shutil
+import tempfile
+import unittest
+from importlib import resources
+from importlib.util import find_spec
+from os.path import abspath
+from os.path import join
+from urllib.parse import urlencode
+
+
+@unittest.skipIf(find_spec("a2wsgi") is None, "a2wsgi is not installed")
+class AsgiTestCase(unittest.TestCase):
+    """Tests for serving the DOI API as an ASGI application"""
+
+    @classmethod
+    def setUpClass(cls):
+        from pds_doi_service.api.__main__ import init_app
+        from pds_doi_service.api.asgi import create_app
+
+        logging.getLogger("connexion.operation").setLevel("ERROR")
+
+        # Allows the test database to be substituted in with the db_name argument
+        init_app().app.config["TESTING"] = True
+
+        cls.test_data_dir = abspath(resources.files(__name__).joinpath("data"))
+        cls.temp_dir = tempfile.mkdtemp()
+        cls.app = create_app()
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.temp_dir, ignore_errors=True)
+
+    def _request(self, method, path, query=None, headers=None):
+        """Sends a single request to the ASGI application, returning the status, headers and body of its response."""
+        scope = {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": method,
+            "scheme": "http",
+            "path": path,
+            "raw_path": path.encode(),
+            "query_string": urlencode(query or {}).encode(),
+            "root_path": "",
+            "headers": [(name.lower().encode(), value.encode()) for name, value in (headers or {}).items()],
+            "client": ("127.0.0.1", 12345),
+            "server": ("127.0.0.1", 8080),
+        }
+
+        messages = []
+
+        async def receive():
+            return {"type": "http.request", "body": b"", "more_body": False}
+
+        async def send(message):
+            messages.append(message)
+
+        asyncio.run(self.app(scope, receive, send))
+
+        start = next(message for message in messages if message["type"] == "http.response.start")
+        body = b"".join(message.get("body", b"") for message in messages if message["type"] == "http.response.body")
+        headers = {name.decode().lower(): value.decode() for name, value in start["headers"]}
+
+        return start["status"], headers, body
+
+    def test_get_dois(self):
+        """Test that requests are routed and answered as defined by the swagger specification"""
+        status, headers, body = self._request(
+            "GET",
+            "/PDS_APIs/pds_doi_api/0.2/dois",
+            query={"db_name": shutil.copy(join(self.test_data_dir, "test.db"), self.temp_dir)},
+            headers={"Referer": "http://localhost"},
+        )
+
+        self.assertEqual(status, 200, body)
+        self.assertIn("application/json", headers["content-type"])
+        self.assertEqual(len(json.loads(body)), 3)
+
+    def test_invalid_request(self):
+        """Test that request validation behaves as when served by waitress"""
+        status, _, body = self._request(
+            "GET",
+            "/PDS_APIs/pds_doi_api/0.2/dois",
+            query={"start_date": "not a date"},
+            headers={"Referer": "http://localhost"},
+        )
+
+        self.assertEqual(status, 400, body)
+
+
+if __name__ == "__main__":
+    unittest.main()
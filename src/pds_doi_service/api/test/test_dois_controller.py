@@ -3,6 +3,10 @@ from __future__ import absolute_import
 
 import json
 import os
+import shutil
+import tempfile
+import threading
+import time
 import unittest
 from datetime import datetime
 from importlib import resources
@@ -17,15 +21,20 @@ import pds_doi_service.core.outputs.osti.osti_web_client
 from pds_doi_service.api.encoder import JSONEncoder
 from pds_doi_service.api.models import DoiRecord
 from pds_doi_service.api.models import DoiSummary
+from pds_doi_service.api.models import JobRecord
 from pds_doi_service.api.models import LabelPayload
 from pds_doi_service.api.models import LabelsPayload
+from pds_doi_service.api.response_cache import get_response_cache
+from pds_doi_service.core.db.doi_database import DOIDataBase
 from pds_doi_service.core.entities.doi import DoiStatus
+from pds_doi_service.core.entities.job import JobStatus
 from pds_doi_service.core.outputs.doi_record import CONTENT_TYPE_XML
 from pds_doi_service.core.outputs.service import DOIServiceFactory
 from pds_doi_service.core.outputs.service import SERVICE_TYPE_DATACITE
 from pds_doi_service.core.test_utils import close_all_database_connections
 from pds_doi_service.core.test_utils import safe_remove_file
 from pds_doi_service.core.util.config_parser import DOIConfigUtil
+from pds_doi_service.core.util.metrics import metrics_enabled
 
 from ._base import BaseTestCase
 
@@ -53,8 +62,14 @@ class TestDoisController(BaseTestCase):
         cls.input_dir = abspath(join(cls.test_dir, os.pardir, os.pardir, os.pardir, os.pardir, "input"))
         cls.service_type = DOIServiceFactory.get_service_type()
 
-        # Path to a temporary database to re-instantiate for every test
-        cls.temp_db = join(cls.test_data_dir, "temp.db")
+        # Path to a temporary database to re-instantiate for every test, kept
+        # outside the source tree so the canned databases are never modified
+        cls.temp_dir = tempfile.mkdtemp()
+        cls.temp_db = join(cls.temp_dir, "temp.db")
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.temp_dir, ignore_errors=True)
 
     def setUp(self):
         # Set testing mode to True so endpoints know to look for a custom
@@ -65,6 +80,9 @@ class TestDoisController(BaseTestCase):
         config = DOIConfigUtil.get_config()
         config.set("OTHER", "api_valid_referrers", "localhost,0.0.0.0")
 
+        # Responses cached by one test must not be served to another
+        get_response_cache().clear()
+
     def tearDown(self):
         # Close all database connections before cleanup
         close_all_database_connections(self)
@@ -118,6 +136,25 @@ class TestDoisController(BaseTestCase):
         with open(update_record_file, "r") as infile:
             return infile.read()
 
+    def bulk_update_action_run_patch(self, **kwargs):
+        """
+        Patch for DOICoreActionBulkUpdate.run()
+
+        Returns a report corresponding to a successful dry run of a bulk update
+        request.
+        """
+        return json.dumps(
+            [
+                {
+                    "doi": "10.17189/28957",
+                    "identifier": "urn:nasa:pds:insight_cameras::1.1",
+                    "previous_status": DoiStatus.Draft.value,
+                    "status": DoiStatus.Draft.value,
+                    "changes": {"title": {"old": "InSight Cameras Bundle 1.1", "new": "InSight Cameras Bundle"}},
+                }
+            ]
+        )
+
     def reserve_action_run_patch(self, **kwargs):
         """
         Patch for DOICoreActionReserve.run()
@@ -181,8 +218,8 @@ class TestDoisController(BaseTestCase):
     def test_get_dois(self):
         """Test case for get_dois"""
         # For these tests, use a pre-existing database with some canned
-        # entries to query for
-        test_db = join(self.test_data_dir, "test.db")
+        # entries to query for, copied as connecting may migrate its schema
+        test_db = shutil.copy(join(self.test_data_dir, "test.db"), self.temp_db)
 
         # Start with a empty query to fetch all available records
         query_string = [("db_name", test_db)]
@@ -318,6 +355,66 @@ class TestDoisController(BaseTestCase):
 
         self.assert400(response, "Response body is : " + response.data.decode("utf-8"))
 
+    def test_get_dois_conditional(self):
+        """Test ETags and caching of GET /dois responses"""
+        shutil.copy(join(self.test_data_dir, "test.db"), self.temp_db)
+
+        # Migrate the canned database, so it has the change counter ETags are derived from
+        database = DOIDataBase(self.temp_db)
+        database.get_connection()
+        database.close_database()
+
+        query_string = [("node", "eng"), ("db_name", self.temp_db)]
+        headers = {"Referer": "http://localhost"}
+
+        response = self.client.open("/PDS_APIs/pds_doi_api/0.2/dois", query_string=query_string, headers=headers)
+
+        self.assert200(response, "Response body is : " + response.data.decode("utf-8"))
+
+        etag = response.headers["ETag"]
+        records = response.json
+
+        # An unchanged database should result in a Not Modified response
+        response = self.client.open(
+            "/PDS_APIs/pds_doi_api/0.2/dois", query_string=query_string, headers={**headers, "If-None-Match": etag}
+        )
+
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.headers["ETag"], etag)
+        self.assertEqual(response.data, b"")
+
+        # Without If-None-Match, the cached response should be returned
+        response = self.client.open("/PDS_APIs/pds_doi_api/0.2/dois", query_string=query_string, headers=headers)
+
+        self.assert200(response, "Response body is : " + response.data.decode("utf-8"))
+        self.assertEqual(response.json, records)
+        self.assertEqual(get_response_cache().stats()["hits"], 1)
+
+        # Other query parameters should have their own ETag
+        response = self.client.open(
+            "/PDS_APIs/pds_doi_api/0.2/dois",
+            query_string=[("node", "img"), ("db_name", self.temp_db)],
+            headers={**headers, "If-None-Match": etag},
+        )
+
+        self.assert200(response, "Response body is : " + response.data.decode("utf-8"))
+        self.assertNotEqual(response.headers["ETag"], etag)
+
+        # Any write to the database should change the ETag
+        database = DOIDataBase(self.temp_db)
+        doi_record = database.select_latest_records({"node": ["eng"]})[0]
+        doi_record.title = "InSight Cameras Bundle 1.2"
+        database.write_doi_info_to_database(doi_record)
+        database.close_database()
+
+        response = self.client.open(
+            "/PDS_APIs/pds_doi_api/0.2/dois", query_string=query_string, headers={**headers, "If-None-Match": etag}
+        )
+
+        self.assert200(response, "Response body is : " + response.data.decode("utf-8"))
+        self.assertNotEqual(response.headers["ETag"], etag)
+        self.assertIn("InSight Cameras Bundle 1.2", [record["title"] for record in response.json])
+
     @patch.object(pds_doi_service.api.controllers.dois_controller.DOICoreActionList, "run", list_action_run_patch)
     @patch.object(pds_doi_service.api.controllers.dois_controller.DOICoreActionUpdate, "run", update_action_run_patch)
     @patch.object(pds_doi_service.api.controllers.authentication.jwt, "decode", decode_patch)
@@ -398,6 +495,266 @@ class TestDoisController(BaseTestCase):
         self.assertEqual(update_record.update_date, datetime.fromisoformat("2020-10-20T14:04:12.560568-07:00"))
         self.assertEqual(update_record.status, DoiStatus.Draft)
 
+    @patch.object(pds_doi_service.api.controllers.dois_controller.DOICoreActionList, "run", list_action_run_patch)
+    @patch.object(pds_doi_service.api.controllers.authentication.jwt, "decode", decode_patch)
+    def test_post_dois_idempotency_key(self):
+        """Test that a retried POST with an Idempotency-Key is answered with the stored response"""
+        run_count = 0
+
+        def counting_update_action_run_patch(update_action, **kwargs):
+            nonlocal run_count
+            run_count += 1
+            return self.update_action_run_patch(**kwargs)
+
+        input_bundle = join(self.test_data_dir, "bundle_in.xml")
+
+        with open(input_bundle, "rb") as infile:
+            body = infile.read()
+
+        query_string = [
+            ("action", "update"),
+            ("submitter", "eng-submitter@jpl.nasa.gov"),
+            ("node", "eng"),
+            ("db_name", self.temp_db),
+        ]
+        headers = {"Referer": "http://localhost", "Authorization": "Bearer test-token", "Idempotency-Key": "update-1"}
+
+        def post(data=body, request_headers=headers):
+            return self.client.open(
+                "/PDS_APIs/pds_doi_api/0.2/dois",
+                method="POST",
+                data=data,
+                content_type="application/xml",
+                query_string=query_string,
+                headers=request_headers,
+            )
+
+        with patch.object(
+            pds_doi_service.api.controllers.dois_controller.DOICoreActionUpdate, "run", counting_update_action_run_patch
+        ):
+            first_response = post()
+
+            self.assert200(first_response, "Response body is : " + first_response.data.decode("utf-8"))
+            self.assertNotIn("Idempotent-Replayed", first_response.headers)
+
+            replayed_response = post()
+
+            self.assert200(replayed_response)
+            self.assertEqual(replayed_response.headers["Idempotent-Replayed"], "true")
+            self.assertEqual(replayed_response.json, first_response.json)
+            self.assertEqual(run_count, 1)
+
+            # The key may not be reused for a different request
+            conflict_response = post(data=body.replace(b"1.1", b"1.2"))
+
+            self.assertEqual(conflict_response.status_code, 422)
+            self.assertEqual(conflict_response.json["errors"][0]["name"], "IdempotencyKeyException")
+
+            # Invalid keys are rejected
+            invalid_response = post(request_headers={**headers, "Idempotency-Key": "k" * 256})
+
+            self.assert400(invalid_response)
+
+            # Requests without a key always run
+            self.assert200(post(request_headers={**headers, "Idempotency-Key": "update-2"}))
+            self.assert200(post(request_headers={"Referer": "http://localhost", "Authorization": "Bearer test-token"}))
+
+            self.assertEqual(run_count, 3)
+
+    @patch.object(pds_doi_service.api.controllers.dois_controller.DOICoreActionList, "run", list_action_run_patch)
+    @patch.object(pds_doi_service.api.controllers.authentication.jwt, "decode", decode_patch)
+    def test_post_dois_idempotency_key_concurrent(self):
+        """Test that concurrent POSTs with the same Idempotency-Key are coalesced onto a single run"""
+        run_count = 0
+        running = threading.Event()
+        release = threading.Event()
+
+        def blocking_update_action_run_patch(update_action, **kwargs):
+            nonlocal run_count
+            run_count += 1
+            running.set()
+            release.wait(10)
+            return self.update_action_run_patch(**kwargs)
+
+        query_string = [
+            ("action", "update"),
+            ("submitter", "eng-submitter@jpl.nasa.gov"),
+            ("node", "eng"),
+            ("url", "http://fake.url.net"),
+            ("db_name", self.temp_db),
+        ]
+        headers = {"Referer": "http://localhost", "Authorization": "Bearer test-token", "Idempotency-Key": "update-1"}
+        responses = []
+
+        def post():
+            response = self.app.test_client().open(
+                "/PDS_APIs/pds_doi_api/0.2/dois", method="POST", query_string=query_string, headers=headers
+            )
+            responses.append(response)
+
+        with patch.object(
+            pds_doi_service.api.controllers.dois_controller.DOICoreActionUpdate, "run", blocking_update_action_run_patch
+        ):
+            threads = [threading.Thread(target=post) for _ in range(3)]
+
+            threads[0].start()
+            self.assertTrue(running.wait(10))
+
+            for thread in threads[1:]:
+                thread.start()
+
+            # Give the duplicates time to begin waiting on the running request
+            time.sleep(0.5)
+            release.set()
+
+            for thread in threads:
+                thread.join(10)
+
+        self.assertEqual(run_count, 1)
+        self.assertEqual(len(responses), 3)
+        self.assertListEqual([response.status_code for response in responses], [200] * 3)
+        self.assertEqual(sum(1 for response in responses if "Idempotent-Replayed" in response.headers), 2)
+        self.assertTrue(all(response.json == responses[0].json for response in responses))
+
+    @patch.object(
+        pds_doi_service.api.controllers.dois_controller.DOICoreActionBulkUpdate, "run", bulk_update_action_run_patch
+    )
+    @patch.object(pds_doi_service.api.controllers.authentication.jwt, "decode", decode_patch)
+    def test_post_bulk_update_dry_run(self):
+        """Test a dry run of a bulk update POST with a CSV requestBody"""
+        query_string = [
+            ("submitter", "eng-submitter@jpl.nasa.gov"),
+            ("dry_run", True),
+            ("db_name", self.temp_db),
+        ]
+
+        bulk_update_response = self.client.open(
+            "/PDS_APIs/pds_doi_api/0.2/dois/bulk_update",
+            method="POST",
+            data="doi,title\n10.17189/28957,InSight Cameras Bundle\n",
+            content_type="text/csv",
+            query_string=query_string,
+            headers={"Referer": "http://localhost", "Authorization": "Bearer test-token"},
+        )
+
+        self.assert200(bulk_update_response, "Response body is : " + bulk_update_response.data.decode("utf-8"))
+
+        report = bulk_update_response.json
+
+        self.assertEqual(len(report), 1)
+        self.assertEqual(report[0]["doi"], "10.17189/28957")
+        self.assertDictEqual(
+            report[0]["changes"], {"title": {"old": "InSight Cameras Bundle 1.1", "new": "InSight Cameras Bundle"}}
+        )
+
+    def _wait_for_job(self, location, timeout=10.0):
+        """Polls the provided job status endpoint until the job finishes, returning the final job record."""
+        deadline = time.monotonic() + timeout
+
+        while True:
+            response = self.client.open(location, method="GET", headers={"Referer": "http://localhost"})
+
+            self.assert200(response, "Response body is : " + response.data.decode("utf-8"))
+
+            job_record = JobRecord.from_dict(response.json)
+
+            if job_record.status in (JobStatus.Succeeded, JobStatus.Failed) or time.monotonic() > deadline:
+                return job_record
+
+            time.sleep(0.1)
+
+    @patch.object(pds_doi_service.api.controllers.dois_controller.DOICoreActionList, "run", list_action_run_patch)
+    @patch.object(pds_doi_service.api.controllers.dois_controller.DOICoreActionUpdate, "run", update_action_run_patch)
+    @patch.object(pds_doi_service.api.controllers.authentication.jwt, "decode", decode_patch)
+    def test_post_dois_background(self):
+        """Test an update POST run as a background job"""
+        input_bundle = join(self.test_data_dir, "bundle_in.xml")
+
+        with open(input_bundle, "rb") as infile:
+            body = infile.read()
+
+        query_string = [
+            ("action", "update"),
+            ("submitter", "eng-submitter@jpl.nasa.gov"),
+            ("node", "eng"),
+            ("background", True),
+            ("db_name", self.temp_db),
+        ]
+
+        update_response = self.client.open(
+            "/PDS_APIs/pds_doi_api/0.2/dois",
+            method="POST",
+            data=body,
+            content_type="application/xml",
+            query_string=query_string,
+            headers={"Referer": "http://localhost", "Authorization": "Bearer test-token"},
+        )
+
+        # Request should be accepted immediately, pointing us to the job status
+        self.assertStatus(update_response, 202, "Response body is : " + update_response.data.decode("utf-8"))
+
+        queued_record = JobRecord.from_dict(update_response.json)
+        location = update_response.headers["Location"]
+
+        self.assertEqual(queued_record.operation, "post_dois")
+        self.assertEqual(location, f"/PDS_APIs/pds_doi_api/0.2/jobs/{queued_record.job_id}")
+
+        job_record = self._wait_for_job(location)
+
+        self.assertEqual(job_record.status, JobStatus.Succeeded, job_record.message)
+        self.assertEqual(job_record.progress, 1.0)
+        self.assertEqual(job_record.result_code, 200)
+
+        # The job result should match what the synchronous request returns
+        update_record = DoiRecord.from_dict(job_record.result[0])
+
+        self.assertEqual(update_record.node, "eng")
+        self.assertEqual(update_record.title, "InSight Cameras Bundle 1.1")
+        self.assertEqual(update_record.identifier, "urn:nasa:pds:insight_cameras::1.1")
+        self.assertEqual(update_record.doi, "10.17189/28957")
+        self.assertEqual(update_record.status, DoiStatus.Draft)
+
+    def test_get_missing_job(self):
+        """Test request for the status of a job that does not exist"""
+        response = self.client.open(
+            "/PDS_APIs/pds_doi_api/0.2/jobs/not-a-real-job", method="GET", headers={"Referer": "http://localhost"}
+        )
+
+        self.assert404(response, "Response body is : " + response.data.decode("utf-8"))
+
+    def test_get_metrics(self):
+        """Test retrieval of service metrics from the /metrics endpoint"""
+        # Metrics endpoint should not be available while collection is disabled
+        with patch.dict(os.environ, {"OTHER_METRICS_ENABLED": "false"}):
+            metrics_enabled.cache_clear()
+
+            response = self.client.open("/metrics", method="GET")
+
+            self.assert404(response, "Response body is : " + response.data.decode("utf-8"))
+
+        try:
+            with patch.dict(os.environ, {"OTHER_METRICS_ENABLED": "true", "OTHER_API_VALID_REFERRERS": "localhost"}):
+                metrics_enabled.cache_clear()
+
+                self.client.open(
+                    "/PDS_APIs/pds_doi_api/0.2/jobs/not-a-real-job",
+                    method="GET",
+                    headers={"Referer": "http://localhost"},
+                )
+
+                # Metrics requests should not require a valid referrer
+                response = self.client.open("/metrics", method="GET")
+
+                self.assert200(response, "Response body is : " + response.data.decode("utf-8"))
+                self.assertTrue(response.content_type.startswith("text/plain; version=0.0.4"))
+
+                metrics = response.data.decode("utf-8")
+
+                self.assertIn("# TYPE pds_doi_api_request_duration_seconds histogram", metrics)
+                self.assertIn('pds_doi_api_request_duration_seconds_count{operation="get_job",status="404"}', metrics)
+        finally:
+            metrics_enabled.cache_clear()
+
     @unittest.skipIf(os.environ.get("CI") == "true", "Test is currently broken in Github Actions workflow. See #364")
     @patch.object(pds_doi_service.api.controllers.dois_controller.DOICoreActionList, "run", list_action_run_patch)
     @patch.object(pds_doi_service.api.controllers.dois_controller.DOICoreActionReserve, "run", reserve_action_run_patch)
@@ -848,7 +1205,7 @@ class TestDoisController(BaseTestCase):
     @patch.object(pds_doi_service.core.db.transaction.Transaction, "log", transaction_log_patch)
     def test_get_check_dois(self):
         """Test case for get_check_dois"""
-        test_db = join(self.test_data_dir, "pending_dois.db")
+        test_db = shutil.copy(join(self.test_data_dir, "pending_dois.db"), self.temp_db)
 
         query_string = [
             ("submitter", "doi-checker@jpl.nasa.gov"),
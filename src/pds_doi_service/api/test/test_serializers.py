@@ -0,0 +1,102 @@
+# coding: utf-8
+import json
+import unittest
+from datetime import datetime
+from datetime import timezone
+
+from flask import Response
+from pds_doi_service.api.encoder import JSONEncoder
+from pds_doi_service.api.models import DoiRecord
+from pds_doi_service.api.models import DoiSummary
+from pds_doi_service.api.serializers import dumps
+from pds_doi_service.api.serializers import get_model_serializer
+from pds_doi_service.api.serializers import get_row_serializer
+from pds_doi_service.api.serializers import json_response
+
+
+class SerializersTestCase(unittest.TestCase):
+    """Unit tests for the serializers.py module"""
+
+    def setUp(self):
+        self.record = DoiRecord(
+            doi="10.17189/21940",
+            identifier="urn:nasa:pds:lab_shocked_feldspars::1.0",
+            title="Laboratory Shocked Feldspars Bundle",
+            node="img",
+            submitter="img-submitter@jpl.nasa.gov",
+            status="draft",
+            creation_date=datetime(2026, 1, 1, 12, 30, tzinfo=timezone.utc),
+            update_date=datetime(2026, 1, 2),
+            record=None,
+            message=None,
+        )
+
+    def test_model_serializer(self):
+        """Test that models are serialized as by reflecting over their swagger_types and attribute_map"""
+        expected = {
+            self.record.attribute_map[attr]: getattr(self.record, attr)
+            for attr in self.record.swagger_types
+            if getattr(self.record, attr) is not None
+        }
+
+        self.assertDictEqual(get_model_serializer(DoiRecord)(self.record), expected)
+        self.assertNotIn("record", get_model_serializer(DoiRecord)(self.record))
+        self.assertIsNone(get_model_serializer(DoiRecord, include_nulls=True)(self.record)["record"])
+
+        # Serializers are only compiled once per model
+        self.assertIs(get_model_serializer(DoiRecord), get_model_serializer(DoiRecord))
+
+        # Dates are left to the JSON encoder
+        encoded = json.loads(json.dumps(self.record, cls=JSONEncoder))
+
+        self.assertEqual(encoded["creation_date"], "2026-01-01T12:30:00+00:00")
+        self.assertEqual(encoded["update_date"], "2026-01-02T00:00:00Z")
+
+    def test_row_serializer(self):
+        """Test that rows are serialized as the JSON encoding of the equivalent model"""
+        columns = ("identifier", "status", "date_added", "date_updated", "submitter", "title", "doi", "node_id")
+        update_date = datetime(2026, 1, 2, tzinfo=timezone.utc)
+        row = [
+            "urn:nasa:pds:lab_shocked_feldspars::1.0",
+            "draft",
+            datetime(2026, 1, 1, tzinfo=timezone.utc),
+            update_date,
+            "img-submitter@jpl.nasa.gov",
+            "Laboratory Shocked Feldspars Bundle",
+            None,
+            "img",
+        ]
+
+        serialize_row = get_row_serializer(DoiSummary, columns, (("node", "node_id"), ("update_date", "date_updated")))
+
+        summary = DoiSummary(
+            identifier=row[0],
+            status=row[1],
+            update_date=update_date,
+            submitter=row[4],
+            title=row[5],
+            node=row[7],
+        )
+
+        self.assertDictEqual(serialize_row(row), json.loads(json.dumps(summary, cls=JSONEncoder)))
+        self.assertDictEqual(json.loads(dumps([serialize_row(row)]))[0], serialize_row(row))
+
+        with self.assertRaises(ValueError):
+            get_row_serializer(DoiSummary, columns)
+
+    def test_json_response(self):
+        """Test that only pre-serialized bodies are wrapped in a response"""
+        response = json_response((b"[]", 200, {"ETag": '"1234"'}))
+
+        self.assertIsInstance(response, Response)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.mimetype, "application/json")
+        self.assertEqual(response.headers["ETag"], '"1234"')
+
+        error_response = ({"errors": []}, 400)
+
+        self.assertIs(json_response(error_response), error_response)
+
+
+if __name__ == "__main__":
+    unittest.main()
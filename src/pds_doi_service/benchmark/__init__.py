@@ -0,0 +1,4 @@
+# encoding: utf-8
+"""
+Planetary Data System's Digital Object Identifier service — performance benchmarks
+"""
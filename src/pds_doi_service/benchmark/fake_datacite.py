@@ -0,0 +1,331 @@
+#
+#  Copyright 2026, by the California Institute of Technology.  ALL RIGHTS
+#  RESERVED. United States Government Sponsorship acknowledged. Any commercial
+#  use must be negotiated with the Office of Technology Transfer at the
+#  California Institute of Technology.
+#
+"""
+================
+fake_datacite.py
+================
+
+A local, in-memory stand-in for the DataCite REST API, used to benchmark the
+DOI service without depending on (or being rate limited by) the real service.
+
+The server implements the subset of the API used by the DOI service:
+
+* POST /dois - create (reserve) a DOI, assigning a DOI value if none is provided
+* PUT /dois/{doi} - update (or release) a DOI
+* GET /dois/{doi} - fetch a single DOI
+* GET /dois?query=... - paginated search by doi or identifier
+
+Any other GET request is answered with a 200 (OK), so the server can also
+stand in for the landing pages checked during release. A fixed latency (plus
+optional random jitter) can be injected before every response to model the
+round trip time to the real service, and an outage of the service can be
+modelled by marking the server unavailable, which answers every request with
+a 503 (Service Unavailable).
+"""
+import json
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer
+from urllib.parse import parse_qs
+from urllib.parse import unquote
+from urllib.parse import urlencode
+from urllib.parse import urlparse
+
+from pds_doi_service.core.util.general_util import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_PAGE_SIZE = 1000
+"""Default number of records returned per page of search results"""
+
+_QUERY_TERM_PATTERN = re.compile(r'([\w.]+):(\([^)]*\)|"[^"]*"|\S+)')
+_QUOTED_VALUE_PATTERN = re.compile(r'"([^"]*)"')
+
+_EVENT_STATES = {"publish": "findable", "register": "registered", "hide": "registered"}
+
+
+class FakeDataCiteServer:
+    """
+    Threaded HTTP server emulating the DataCite REST API.
+
+    May be used as a context manager, which starts the server on entry and
+    stops it on exit.
+
+    Parameters
+    ----------
+    host : str, optional
+        Host address to bind to. Defaults to the loopback address.
+    port : int, optional
+        Port to bind to. Defaults to 0, which selects a free port.
+    latency : float, optional
+        Seconds to wait before sending each response.
+    jitter : float, optional
+        Maximum additional random delay, in seconds, added to the latency.
+    page_size : int, optional
+        Maximum number of records returned per page of search results, unless
+        a smaller page size is requested.
+
+    """
+
+    def __init__(self, host="127.0.0.1", port=0, latency=0.0, jitter=0.0, page_size=DEFAULT_PAGE_SIZE):
+        self.latency = latency
+        self.jitter = jitter
+        self.page_size = page_size
+        self.available = True
+
+        self._records = {}
+        self._lock = threading.Lock()
+        self._counter = 0
+        self._request_counts = {}
+
+        self._server = ThreadingHTTPServer((host, port), self._make_handler())
+        self._server.daemon_threads = True
+        self._thread = None
+
+    @property
+    def url(self):
+        """Returns the base URL of the server."""
+        host, port = self._server.server_address[:2]
+
+        return f"http://{host}:{port}"
+
+    @property
+    def dois_url(self):
+        """Returns the URL of the DOI endpoint, for use as the DATACITE url of the INI config."""
+        return f"{self.url}/dois"
+
+    @property
+    def landing_page_url(self):
+        """Returns the base URL for fake landing pages, which always resolve."""
+        return f"{self.url}/landing"
+
+    @property
+    def request_counts(self):
+        """Returns the number of requests handled so far, keyed by HTTP method."""
+        with self._lock:
+            return dict(self._request_counts)
+
+    def __enter__(self):
+        """Starts the server, returning it for use within a with statement."""
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Stops the server on leaving a with statement."""
+        self.stop()
+
+    def start(self):
+        """Starts serving requests on a background thread."""
+        self._thread = threading.Thread(target=self._server.serve_forever, name="fake-datacite", daemon=True)
+        self._thread.start()
+
+        logger.info("Fake DataCite server listening on %s", self.url)
+
+    def stop(self):
+        """Stops the server and releases its socket."""
+        self._server.shutdown()
+        self._server.server_close()
+
+        if self._thread:
+            self._thread.join()
+            self._thread = None
+
+    def load(self, records):
+        """
+        Pre-loads the server with existing DataCite records (the "data"
+        entries of a DataCite JSON label), so they may be returned by searches.
+        """
+        with self._lock:
+            for record in records:
+                doi = record.get("attributes", {}).get("doi") or record["id"]
+                self._records[doi.lower()] = record
+
+    def records(self):
+        """Returns a list of all records currently held by the server."""
+        with self._lock:
+            return list(self._records.values())
+
+    def _count_request(self, method):
+        with self._lock:
+            self._request_counts[method] = self._request_counts.get(method, 0) + 1
+
+    def _delay(self):
+        delay = self.latency + (random.uniform(0, self.jitter) if self.jitter else 0.0)
+
+        if delay > 0:
+            time.sleep(delay)
+
+    def _save(self, record, doi=None):
+        """Creates or updates a record, assigning a DOI and state as DataCite would."""
+        attributes = record.setdefault("attributes", {})
+
+        with self._lock:
+            doi = doi or attributes.get("doi")
+
+            if not doi:
+                self._counter += 1
+                doi = "{}/{}".format(
+                    attributes.get("prefix", "10.0000"), attributes.get("suffix") or f"fake.{self._counter}"
+                )
+
+            existing = self._records.get(doi.lower(), {})
+            state = existing.get("attributes", {}).get("state", "draft")
+            event = attributes.pop("event", None)
+
+            record["id"] = doi
+            attributes["doi"] = doi
+            attributes["state"] = _EVENT_STATES.get(event, state)
+
+            self._records[doi.lower()] = record
+
+        return record
+
+    def _search(self, query):
+        """Returns the records matching the provided DataCite search query."""
+        terms = _QUERY_TERM_PATTERN.findall(query or "")
+
+        with self._lock:
+            records = list(self._records.values())
+
+        for field, value in terms:
+            values = _QUOTED_VALUE_PATTERN.findall(value) or [value.strip('"')]
+            values = [value.lower() for value in values]
+
+            if field == "doi":
+                records = [record for record in records if _matches(record["id"], values)]
+            elif field.startswith("identifiers"):
+                records = [
+                    record
+                    for record in records
+                    if any(
+                        _matches(identifier.get("identifier", ""), values)
+                        for identifier in record.get("attributes", {}).get("identifiers", [])
+                    )
+                ]
+
+        return records
+
+    def _handle(self, handler, method):
+        """Counts and delays a request, returning False if it was refused as the server is unavailable."""
+        self._count_request(method)
+        self._delay()
+
+        if not self.available:
+            handler._send_json(503, {"errors": [{"status": "503", "title": "Service unavailable"}]})
+            return False
+
+        return True
+
+    def _make_handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, format, *args):
+                logger.debug("%s - %s", self.address_string(), format % args)
+
+            def _send_json(self, status, content):
+                body = json.dumps(content).encode()
+
+                self.send_response(status)
+                self.send_header("Content-Type", "application/vnd.api+json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def _read_json(self):
+                length = int(self.headers.get("Content-Length", 0))
+
+                return json.loads(self.rfile.read(length) or b"{}")
+
+            def _doi_from_path(self, path):
+                return unquote(path[len("/dois/") :]) if path.startswith("/dois/") else None
+
+            def do_GET(self):  # noqa: N802
+                if not server._handle(self, "GET"):
+                    return
+
+                parsed_url = urlparse(self.path)
+                doi = self._doi_from_path(parsed_url.path)
+
+                if parsed_url.path.rstrip("/") == "/dois":
+                    self._search(parse_qs(parsed_url.query))
+                elif doi:
+                    with server._lock:
+                        record = server._records.get(doi.lower())
+
+                    if record:
+                        self._send_json(200, {"data": record})
+                    else:
+                        self._send_json(404, {"errors": [{"status": "404", "title": "The resource was not found"}]})
+                else:
+                    # Anything else is treated as a landing page
+                    body = b"<html><body>Landing page</body></html>"
+
+                    self.send_response(200)
+                    self.send_header("Content-Type", "text/html")
+                    self.send_header("Content-Length", str(len(body)))
+                    self.end_headers()
+                    self.wfile.write(body)
+
+            def _search(self, params):
+                query = params.get("query", [""])[0]
+                page_size = min(int(params.get("page[size]", [server.page_size])[0]), server.page_size)
+                page_number = int(params.get("page[number]", ["1"])[0])
+
+                records = server._search(query)
+                total_pages = max(1, -(-len(records) // page_size))
+                start = (page_number - 1) * page_size
+
+                response = {
+                    "data": records[start : start + page_size],
+                    "meta": {"total": len(records), "totalPages": total_pages, "page": page_number},
+                    "links": {},
+                }
+
+                if page_number < total_pages:
+                    next_params = {"query": query, "page[number]": page_number + 1, "page[size]": page_size}
+                    response["links"]["next"] = f"{server.dois_url}?{urlencode(next_params)}"
+
+                self._send_json(200, response)
+
+            def do_POST(self):  # noqa: N802
+                if not server._handle(self, "POST"):
+                    return
+
+                if urlparse(self.path).path.rstrip("/") != "/dois":
+                    self._send_json(404, {"errors": [{"status": "404", "title": "The resource was not found"}]})
+                    return
+
+                record = server._save(self._read_json()["data"])
+
+                self._send_json(201, {"data": record})
+
+            def do_PUT(self):  # noqa: N802
+                if not server._handle(self, "PUT"):
+                    return
+
+                doi = self._doi_from_path(urlparse(self.path).path)
+
+                if not doi:
+                    self._send_json(404, {"errors": [{"status": "404", "title": "The resource was not found"}]})
+                    return
+
+                record = server._save(self._read_json()["data"], doi=doi)
+
+                self._send_json(200, {"data": record})
+
+        return Handler
+
+
+def _matches(candidate, values):
+    """Returns True if the candidate matches any of the provided (lower-case) values, which may end in a wildcard."""
+    candidate = candidate.lower()
+
+    return any(candidate.startswith(value[:-1]) if value.endswith("*") else candidate == value for value in values)
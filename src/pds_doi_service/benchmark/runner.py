@@ -0,0 +1,716 @@
+#!/usr/bin/env python
+#
+#  Copyright 2026, by the California Institute of Technology.  ALL RIGHTS
+#  RESERVED. United States Government Sponsorship acknowledged. Any commercial
+#  use must be negotiated with the Office of Technology Transfer at the
+#  California Institute of Technology.
+#
+"""
+=========
+runner.py
+=========
+
+Contains the main function for the pds-doi-benchmark script, which times the
+core DOI service workflows against synthetic data and a local fake DataCite
+server, and reports the results in a JSON format that can be compared between
+runs (and releases).
+
+The following benchmarks are available:
+
+* populate - pre-populating a transaction database with synthetic records
+* list - the list action (all records, by node and by identifier)
+* query - transaction database queries by identifier and DOI prefix (and by infix wildcard, for comparison)
+* differ - comparing OSTI XML and DataCite JSON labels of every record against revised, reordered copies
+* parse - parsing a DataCite JSON label of every record, in-process and with a process per core
+* reserve - the reserve action, from a spreadsheet
+* release - the release action, from the labels returned by reserve
+* update - the update action, from the labels returned by release
+* init - pds-doi-init, from a DataCite dump file and from the (fake) provider
+* api - the REST API endpoints (GET /dois, GET /doi and POST /doi/submit)
+"""
+import argparse
+import copy
+import json
+import logging
+import os
+import platform
+import shutil
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+from dataclasses import asdict
+from dataclasses import dataclass
+from dataclasses import field
+from datetime import datetime
+from datetime import timezone
+
+from pds_doi_service import __version__
+from pds_doi_service.benchmark.fake_datacite import FakeDataCiteServer
+from pds_doi_service.benchmark.synthetic import BUNDLE_INTERVAL
+from pds_doi_service.benchmark.synthetic import iter_datacite_records
+from pds_doi_service.benchmark.synthetic import populate_transaction_db
+from pds_doi_service.benchmark.synthetic import synthetic_doi
+from pds_doi_service.benchmark.synthetic import SYNTHETIC_NODES
+from pds_doi_service.benchmark.synthetic import SYNTHETIC_SUBMITTER
+from pds_doi_service.benchmark.synthetic import write_datacite_dump
+from pds_doi_service.benchmark.synthetic import write_reserve_spreadsheet
+from pds_doi_service.core.entities.doi import DoiStatus
+from pds_doi_service.core.outputs.service import SERVICE_TYPE_DATACITE
+from pds_doi_service.core.util.general_util import get_logger
+from pds_doi_service.core.util.profiling import profile
+
+logger = get_logger(__name__)
+
+BENCHMARKS = (
+    "populate",
+    "list",
+    "query",
+    "differ",
+    "parse",
+    "reserve",
+    "release",
+    "update",
+    "init",
+    "api",
+    "serialize",
+)
+"""Names of the available benchmarks, in the order they are run"""
+
+DEFAULT_SCALE = 1000
+"""Default number of records in the pre-populated database and DataCite dump"""
+
+DEFAULT_SUBMIT_COUNT = 100
+"""Default number of records submitted by the reserve, release and update benchmarks"""
+
+DEFAULT_API_REQUESTS = 100
+"""Default number of requests made to each API endpoint"""
+
+
+@dataclass
+class BenchmarkResult:
+    """Timing of a single benchmark."""
+
+    name: str
+    operations: int
+    seconds: float
+    provider_requests: dict = field(default_factory=dict)
+
+    @property
+    def operations_per_second(self):
+        return self.operations / self.seconds if self.seconds else 0.0
+
+    def to_dict(self):
+        result = asdict(self)
+        result["seconds"] = round(self.seconds, 6)
+        result["operations_per_second"] = round(self.operations_per_second, 3)
+
+        return result
+
+
+class BenchmarkSuite:
+    """
+    Runs the benchmarks within an isolated working directory, with the DOI
+    service configured (via environment variables) to use a fake DataCite
+    server and a database and transaction history within that directory.
+
+    Parameters
+    ----------
+    scale : int
+        Number of records in the pre-populated database and DataCite dump.
+    submit_count : int
+        Number of records submitted by the reserve, release and update benchmarks.
+    api_requests : int
+        Number of requests made to each API endpoint.
+    latency : float
+        Latency, in seconds, injected into each response of the fake DataCite server.
+    work_dir : str, optional
+        Directory to create benchmark data within. Defaults to a temporary
+        directory which is removed once the suite completes.
+    trace_dir : str, optional
+        If provided, a span trace (see pds-doi-cmd --trace-spans) of each
+        benchmark is written to this directory.
+
+    """
+
+    def __init__(
+        self,
+        scale=DEFAULT_SCALE,
+        submit_count=DEFAULT_SUBMIT_COUNT,
+        api_requests=DEFAULT_API_REQUESTS,
+        latency=0.0,
+        work_dir=None,
+        trace_dir=None,
+    ):
+        self.scale = scale
+        self.submit_count = submit_count
+        self.api_requests = api_requests
+        self.latency = latency
+        self.trace_dir = trace_dir
+
+        self._work_dir = work_dir
+        self._cleanup_work_dir = work_dir is None
+        self._server = None
+        self._results = []
+
+        # Output labels handed between the reserve, release and update benchmarks
+        self._reserve_label = None
+        self._release_label = None
+
+    @property
+    def db_file(self):
+        return os.path.join(self._work_dir, "benchmark.db")
+
+    @property
+    def parameters(self):
+        return {
+            "scale": self.scale,
+            "submit_count": self.submit_count,
+            "api_requests": self.api_requests,
+            "latency": self.latency,
+        }
+
+    @contextmanager
+    def _environment(self):
+        """Sets up the working directory, fake DataCite server and DOI service configuration."""
+        if self._cleanup_work_dir:
+            self._work_dir = tempfile.mkdtemp(prefix="pds_doi_benchmark_")
+        else:
+            os.makedirs(self._work_dir, exist_ok=True)
+
+        self._server = FakeDataCiteServer(latency=self.latency)
+
+        environment = {
+            "SERVICE_PROVIDER": SERVICE_TYPE_DATACITE,
+            "DATACITE_URL": self._server.dois_url,
+            "DATACITE_USER": "benchmark",
+            "DATACITE_PASSWORD": "benchmark",
+            "OTHER_DB_FILE": self.db_file,
+            "OTHER_TRANSACTION_DIR": os.path.join(self._work_dir, "transaction_history"),
+            "OTHER_JOB_DB_FILE": os.path.join(self._work_dir, "jobs.db"),
+            "OTHER_API_VALID_REFERRERS": "localhost",
+        }
+
+        original_environment = {key: os.environ.get(key) for key in environment}
+        os.environ.update(environment)
+
+        try:
+            with self._server:
+                yield
+        finally:
+            for key, value in original_environment.items():
+                if value is None:
+                    os.environ.pop(key, None)
+                else:
+                    os.environ[key] = value
+
+            if self._cleanup_work_dir:
+                shutil.rmtree(self._work_dir, ignore_errors=True)
+
+    @contextmanager
+    def _timed(self, name, operations):
+        """Times the context as the named benchmark, tracing its spans if requested."""
+        trace_file = os.path.join(self.trace_dir, f"{name}.json") if self.trace_dir else None
+        requests_before = self._server.request_counts
+
+        logger.info("Running benchmark %s (%d operations)", name, operations)
+
+        start = time.perf_counter()
+
+        with profile(name, trace_file=trace_file):
+            yield
+
+        seconds = time.perf_counter() - start
+
+        requests_after = self._server.request_counts
+        provider_requests = {
+            method: count - requests_before.get(method, 0)
+            for method, count in requests_after.items()
+            if count - requests_before.get(method, 0)
+        }
+
+        result = BenchmarkResult(name, operations, seconds, provider_requests)
+        self._results.append(result)
+
+        logger.info("Benchmark %s completed in %.3f seconds (%.1f ops/s)", name, seconds, result.operations_per_second)
+
+    def run(self, benchmarks=BENCHMARKS):
+        """
+        Runs the requested benchmarks, in the order defined by BENCHMARKS.
+
+        Returns
+        -------
+        report : dict
+            The benchmark report.
+
+        """
+        self._results = []
+
+        if self.trace_dir:
+            os.makedirs(self.trace_dir, exist_ok=True)
+
+        with self._environment():
+            # The database is needed by all other benchmarks, so is always populated
+            self.benchmark_populate()
+
+            for name in BENCHMARKS[1:]:
+                if name in benchmarks:
+                    getattr(self, f"benchmark_{name}")()
+
+        return self.report()
+
+    def report(self):
+        """Returns the report of the results gathered by the last run."""
+        return {
+            "version": __version__,
+            "python_version": platform.python_version(),
+            "platform": platform.platform(),
+            "date": datetime.now(tz=timezone.utc).isoformat(),
+            "parameters": self.parameters,
+            "results": [result.to_dict() for result in self._results],
+        }
+
+    def benchmark_populate(self):
+        with self._timed("populate", self.scale):
+            populate_transaction_db(self.db_file, self.scale, site_url=self._server.landing_page_url)
+
+    def benchmark_list(self):
+        # Imported here so the DOI service configuration is only read once the
+        # benchmark environment is in place
+        from pds_doi_service.core.actions.list import DOICoreActionList
+
+        list_action = DOICoreActionList(db_name=self.db_file)
+
+        with self._timed("list_all", self.scale):
+            list_action.run()
+
+        with self._timed("list_node", len(SYNTHETIC_NODES)):
+            for node in SYNTHETIC_NODES:
+                list_action.run(node=node)
+
+        identifiers = [synthetic_doi(index).pds_identifier for index in self._sample_indices()]
+
+        with self._timed("list_identifier", len(identifiers)):
+            for identifier in identifiers:
+                list_action.run(ids=identifier)
+
+    def benchmark_query(self):
+        from pds_doi_service.core.db.doi_database import DOIDataBase
+
+        database = DOIDataBase(self.db_file)
+
+        # Each prefix selects a bundle along with its collections
+        bundle_indices = sorted({index - (index % BUNDLE_INTERVAL) for index in self._sample_indices()})
+        lids = [synthetic_doi(index).pds_identifier.split("::")[0] for index in bundle_indices]
+        dois = [synthetic_doi(index).doi for index in bundle_indices]
+
+        try:
+            with self._timed("query_identifier_prefix", len(lids)):
+                for lid in lids:
+                    database.select_latest_rows({"ids": [f"{lid}*"]})
+
+            with self._timed("query_doi_prefix", len(dois)):
+                for doi in dois:
+                    database.select_latest_rows({"doi": [f"{doi[:-1]}*"]})
+
+            with self._timed("query_identifier_infix", len(lids)):
+                for lid in lids:
+                    database.select_latest_rows({"ids": [f"*:{lid.rsplit(':', 1)[-1]}*"]})
+        finally:
+            database.close_database()
+
+    def benchmark_differ(self):
+        from pds_doi_service.core.outputs.datacite.datacite_record import DOIDataCiteRecord
+        from pds_doi_service.core.outputs.osti.osti_record import DOIOstiRecord
+        from pds_doi_service.core.util.doi_xml_differ import DOIDiffer
+
+        historical_dois = [synthetic_doi(index, site_url=self._server.landing_page_url) for index in range(self.scale)]
+
+        # The new label lists the records in reverse order, with one in every hundred titles revised
+        new_dois = [copy.copy(doi) for doi in reversed(historical_dois)]
+
+        for doi in new_dois[::100]:
+            doi.title = f"{doi.title} (Revised)"
+
+        for name, record_service in (
+            ("differ_osti_xml", DOIOstiRecord()),
+            ("differ_datacite_json", DOIDataCiteRecord()),
+        ):
+            historical_label = self._write_label(
+                f"{name}_historical", record_service.create_doi_record(historical_dois)
+            )
+            new_label = self._write_label(f"{name}_new", record_service.create_doi_record(new_dois))
+
+            with self._timed(name, self.scale):
+                DOIDiffer.doi_label_differ(historical_label, new_label)
+
+    def benchmark_parse(self):
+        from pds_doi_service.core.outputs.datacite.datacite_web_parser import DOIDataCiteWebParser
+
+        label = json.dumps({"data": list(iter_datacite_records(self.scale, site_url=self._server.landing_page_url))})
+
+        for name, processes in (("parse_datacite", 1), ("parse_datacite_parallel", 0)):
+            with self._timed(name, self.scale):
+                DOIDataCiteWebParser.parse_dois_from_label(label, processes=processes)
+
+    def benchmark_reserve(self):
+        from pds_doi_service.core.actions.reserve import DOICoreActionReserve
+
+        # Reserve records beyond those already in the database, so titles and identifiers are new
+        spreadsheet = write_reserve_spreadsheet(
+            os.path.join(self._work_dir, "reserve.csv"),
+            self.submit_count,
+            start=self.scale,
+            site_url=self._server.landing_page_url,
+        )
+
+        reserve_action = DOICoreActionReserve(db_name=self.db_file)
+
+        with self._timed("reserve", self.submit_count):
+            self._reserve_label = reserve_action.run(
+                input=spreadsheet, node="eng", submitter=SYNTHETIC_SUBMITTER, force=True
+            )
+
+    def benchmark_release(self):
+        from pds_doi_service.core.actions.release import DOICoreActionRelease
+
+        label_file = self._write_label("release.json", self._reserve_label or self._draft_label())
+        release_action = DOICoreActionRelease(db_name=self.db_file)
+
+        with self._timed("release", self.submit_count):
+            self._release_label = release_action.run(
+                input=label_file, node="eng", submitter=SYNTHETIC_SUBMITTER, force=True, review=False
+            )
+
+    def benchmark_update(self):
+        from pds_doi_service.core.actions.update import DOICoreActionUpdate
+
+        label_file = self._write_label("update.json", self._release_label or self._draft_label())
+        update_action = DOICoreActionUpdate(db_name=self.db_file)
+
+        with self._timed("update", self.submit_count):
+            update_action.run(input=label_file, node="eng", submitter=SYNTHETIC_SUBMITTER, force=True)
+
+    def benchmark_init(self):
+        from pds_doi_service.core.util.initialize_production_deployment import perform_import_to_database
+
+        dump_file = write_datacite_dump(
+            os.path.join(self._work_dir, "datacite_dump.json"), self.scale, site_url=self._server.landing_page_url
+        )
+        prefix = synthetic_doi(0).doi.split("/")[0]
+
+        with self._timed("init_from_file", self.scale):
+            perform_import_to_database(
+                SERVICE_TYPE_DATACITE,
+                prefix,
+                os.path.join(self._work_dir, "init_from_file.db"),
+                dump_file,
+                False,
+                SYNTHETIC_SUBMITTER,
+                None,
+            )
+
+        self._server.load(iter_datacite_records(self.scale, site_url=self._server.landing_page_url))
+
+        with self._timed("init_from_provider", self.scale):
+            perform_import_to_database(
+                SERVICE_TYPE_DATACITE,
+                prefix,
+                os.path.join(self._work_dir, "init_from_provider.db"),
+                None,
+                False,
+                SYNTHETIC_SUBMITTER,
+                None,
+            )
+
+    def benchmark_api(self):
+        from pds_doi_service.api.__main__ import init_app
+
+        client = init_app().app.test_client()
+        base_path = "/PDS_APIs/pds_doi_api/0.2"
+        headers = {"Referer": "http://localhost"}
+        identifiers = [synthetic_doi(index).pds_identifier for index in self._sample_indices(self.api_requests)]
+
+        with self._timed("api_get_dois", self.api_requests):
+            for index in range(self.api_requests):
+                query_string = {"node": SYNTHETIC_NODES[index % len(SYNTHETIC_NODES)]}
+                self._check_response(client.get(f"{base_path}/dois", query_string=query_string, headers=headers))
+
+        with self._timed("api_get_doi", len(identifiers)):
+            for identifier in identifiers:
+                query_string = {"identifier": identifier}
+                self._check_response(client.get(f"{base_path}/doi", query_string=query_string, headers=headers))
+
+        with self._timed("api_post_submit_doi", len(identifiers)):
+            for identifier in identifiers:
+                query_string = {"identifier": identifier, "force": "true"}
+                self._check_response(client.post(f"{base_path}/doi/submit", query_string=query_string, headers=headers))
+
+    def benchmark_serialize(self):
+        from pds_doi_service.api.__main__ import init_app
+        from pds_doi_service.api.controllers.dois_controller import DOI_SUMMARY_COLUMNS
+        from pds_doi_service.api.encoder import JSONEncoder
+        from pds_doi_service.api.models import DoiSummary
+        from pds_doi_service.api.response_cache import get_response_cache
+        from pds_doi_service.api.serializers import dumps
+        from pds_doi_service.api.serializers import get_row_serializer
+        from pds_doi_service.core.db.doi_database import DOIDataBase
+
+        database = DOIDataBase(self.db_file)
+
+        try:
+            columns, rows = database.select_latest_rows({})
+        finally:
+            database.close_database()
+
+        sources = dict(DOI_SUMMARY_COLUMNS)
+        indices = [(attr, columns.index(sources.get(attr, attr))) for attr in DoiSummary().swagger_types]
+
+        # Encodes a DoiSummary model constructed from each row, as Connexion encodes a list of models
+        with self._timed("serialize_models", len(rows)):
+            records = [DoiSummary(**{attr: row[index] for attr, index in indices}) for row in rows]
+            json.dumps(records, cls=JSONEncoder, indent=2)
+
+        # Serializes each row directly, as the GET /dois endpoint does
+        with self._timed("serialize_rows", len(rows)):
+            serialize_row = get_row_serializer(DoiSummary, tuple(columns), DOI_SUMMARY_COLUMNS)
+            dumps([serialize_row(row) for row in rows])
+
+        client = init_app().app.test_client()
+        headers = {"Referer": "http://localhost"}
+
+        # Lists every record, bypassing the response cache
+        get_response_cache().clear()
+
+        with self._timed("api_list_dois", len(rows)):
+            self._check_response(client.get("/PDS_APIs/pds_doi_api/0.2/dois", headers=headers))
+
+    def _sample_indices(self, count=DEFAULT_API_REQUESTS):
+        """Returns up to count indices of pre-populated records, spread evenly across the database."""
+        count = min(count, self.scale)
+        step = max(self.scale // max(count, 1), 1)
+
+        return list(range(0, step * count, step))
+
+    def _draft_label(self):
+        """
+        Returns a label of newly reserved records, used when the release or
+        update benchmarks run without the preceding benchmark.
+        """
+        from pds_doi_service.core.outputs.datacite.datacite_record import DOIDataCiteRecord
+
+        dois = [
+            synthetic_doi(index, status=DoiStatus.Draft, site_url=self._server.landing_page_url)
+            for index in range(self.scale, self.scale + self.submit_count)
+        ]
+
+        return DOIDataCiteRecord().create_doi_record(dois)
+
+    def _write_label(self, file_name, label):
+        path = os.path.join(self._work_dir, file_name)
+
+        with open(path, "w") as outfile:
+            outfile.write(label)
+
+        return path
+
+    @staticmethod
+    def _check_response(response):
+        if response.status_code >= 400:
+            raise RuntimeError(f"API request failed with status {response.status_code}: {response.get_data(True)}")
+
+
+def compare_reports(baseline, current):
+    """
+    Compares the results of two benchmark reports.
+
+    Returns
+    -------
+    comparison : list of dict
+        For each benchmark present in both reports, the baseline and current
+        timings, and the relative change in throughput (positive is faster).
+
+    """
+    baseline_results = {result["name"]: result for result in baseline["results"]}
+    comparison = []
+
+    for result in current["results"]:
+        baseline_result = baseline_results.get(result["name"])
+
+        if not baseline_result or not baseline_result["operations_per_second"]:
+            continue
+
+        change = result["operations_per_second"] / baseline_result["operations_per_second"] - 1.0
+
+        comparison.append(
+            {
+                "name": result["name"],
+                "baseline_seconds": baseline_result["seconds"],
+                "current_seconds": result["seconds"],
+                "baseline_operations_per_second": baseline_result["operations_per_second"],
+                "current_operations_per_second": result["operations_per_second"],
+                "throughput_change": round(change, 4),
+            }
+        )
+
+    return comparison
+
+
+def check_targets(report, targets):
+    """
+    Checks the results of a benchmark report against minimum throughput targets.
+
+    Parameters
+    ----------
+    report : dict
+        The benchmark report.
+    targets : dict
+        Minimum operations per second, keyed by benchmark name.
+
+    Returns
+    -------
+    failures : list of str
+        Description of each target that was not met.
+
+    """
+    results = {result["name"]: result for result in report["results"]}
+    failures = []
+
+    for name, target in targets.items():
+        if name not in results:
+            failures.append(f"{name}: no result")
+        elif results[name]["operations_per_second"] < target:
+            failures.append(
+                f"{name}: {results[name]['operations_per_second']:.2f} ops/s is below target of {target} ops/s"
+            )
+
+    return failures
+
+
+def format_report(report, comparison=None):
+    """Returns a human-readable table of the results of a benchmark report."""
+    changes = {entry["name"]: entry["throughput_change"] for entry in comparison or []}
+
+    lines = [f"{'benchmark':<24}{'ops':>10}{'seconds':>12}{'ops/s':>12}{'vs baseline':>14}"]
+
+    for result in report["results"]:
+        change = f"{changes[result['name']]:+.1%}" if result["name"] in changes else ""
+        lines.append(
+            f"{result['name']:<24}{result['operations']:>10}{result['seconds']:>12.3f}"
+            f"{result['operations_per_second']:>12.1f}{change:>14}"
+        )
+
+    return "\n".join(lines)
+
+
+def _parse_target(value):
+    name, _, rate = value.partition("=")
+
+    try:
+        return name, float(rate)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Throughput targets must be of the form NAME=OPS_PER_SECOND, got {value}")
+
+
+def create_cmd_parser():
+    parser = argparse.ArgumentParser(
+        description="Benchmarks the PDS DOI service against synthetic data and a local fake DataCite server.",
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+    )
+    parser.add_argument(
+        "-b",
+        "--benchmarks",
+        nargs="+",
+        choices=BENCHMARKS,
+        default=list(BENCHMARKS),
+        help="The benchmarks to run. The populate benchmark is always run.",
+    )
+    parser.add_argument(
+        "-n",
+        "--scale",
+        type=int,
+        default=DEFAULT_SCALE,
+        help="Number of records in the pre-populated database and DataCite dump.",
+    )
+    parser.add_argument(
+        "--submit-count",
+        type=int,
+        default=DEFAULT_SUBMIT_COUNT,
+        help="Number of records submitted by the reserve, release and update benchmarks.",
+    )
+    parser.add_argument(
+        "--api-requests", type=int, default=DEFAULT_API_REQUESTS, help="Number of requests made to each API endpoint."
+    )
+    parser.add_argument(
+        "-l",
+        "--latency",
+        type=float,
+        default=0.0,
+        help="Latency, in seconds, injected into each response of the fake DataCite server.",
+    )
+    parser.add_argument("-o", "--output", required=False, help="Path to write the JSON benchmark report to.")
+    parser.add_argument(
+        "-c", "--compare", required=False, metavar="BASELINE", help="Path to a previous report to compare results to."
+    )
+    parser.add_argument(
+        "-t",
+        "--target",
+        action="append",
+        type=_parse_target,
+        default=[],
+        metavar="NAME=OPS_PER_SECOND",
+        help="Minimum throughput for a benchmark. May be provided multiple times. "
+        "The script exits with a non-zero status if any target is not met.",
+    )
+    parser.add_argument(
+        "--work-dir", required=False, help="Directory to generate benchmark data in. Defaults to a temporary directory."
+    )
+    parser.add_argument("--trace-dir", required=False, help="Directory to write a span trace of each benchmark to.")
+    parser.add_argument("--debug", required=False, action="store_true", help="Flag to print debug statements.")
+
+    return parser
+
+
+def main():
+    """Entry point for the pds-doi-benchmark script."""
+    parser = create_cmd_parser()
+    arguments = parser.parse_args()
+
+    logger.setLevel(logging.DEBUG if arguments.debug else logging.INFO)
+
+    suite = BenchmarkSuite(
+        scale=arguments.scale,
+        submit_count=arguments.submit_count,
+        api_requests=arguments.api_requests,
+        latency=arguments.latency,
+        work_dir=arguments.work_dir,
+        trace_dir=arguments.trace_dir,
+    )
+
+    report = suite.run(arguments.benchmarks)
+
+    comparison = None
+
+    if arguments.compare:
+        with open(arguments.compare, "r") as infile:
+            comparison = compare_reports(json.load(infile), report)
+
+        report["comparison"] = comparison
+
+    if arguments.output:
+        with open(arguments.output, "w") as outfile:
+            json.dump(report, outfile, indent=2)
+
+        logger.info("Wrote benchmark report to %s", arguments.output)
+
+    print(format_report(report, comparison))
+
+    failures = check_targets(report, dict(arguments.target))
+
+    if failures:
+        print("\nThroughput targets not met:\n" + "\n".join(failures), file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,341 @@
+#
+#  Copyright 2026, by the California Institute of Technology.  ALL RIGHTS
+#  RESERVED. United States Government Sponsorship acknowledged. Any commercial
+#  use must be negotiated with the Office of Technology Transfer at the
+#  California Institute of Technology.
+#
+"""
+============
+synthetic.py
+============
+
+Generators for synthetic, but realistic, DOI service inputs at configurable
+scale: PDS4 bundle/collection labels, reserve spreadsheets, DataCite JSON
+dumps (as returned by a DataCite query), and pre-populated transaction
+databases.
+
+All generated records are deterministic functions of their index, so two
+runs at the same scale produce identical inputs.
+"""
+import csv
+import html
+import json
+import os
+from datetime import datetime
+from datetime import timedelta
+from datetime import timezone
+
+from pds_doi_service.core.db.doi_database import DOIDataBase
+from pds_doi_service.core.db.transaction_on_disk import TransactionOnDisk
+from pds_doi_service.core.entities.doi import Doi
+from pds_doi_service.core.entities.doi import DoiRecord
+from pds_doi_service.core.entities.doi import DoiStatus
+from pds_doi_service.core.entities.doi import ProductType
+from pds_doi_service.core.outputs.datacite.datacite_record import DOIDataCiteRecord
+from pds_doi_service.core.outputs.doi_record import CONTENT_TYPE_JSON
+from pds_doi_service.core.util.config_parser import DOIConfigUtil
+from pds_doi_service.core.util.general_util import get_logger
+from pds_doi_service.core.util.node_util import NodeUtil
+
+logger = get_logger(__name__)
+
+BUNDLE_INTERVAL = 10
+"""Every BUNDLE_INTERVAL-th synthetic record is a bundle, the remainder are collections of that bundle"""
+
+SYNTHETIC_NODES = ("eng", "img", "geo", "atm", "ppi", "rms", "sbn")
+"""Nodes that synthetic records are distributed across"""
+
+SYNTHETIC_SUBMITTER = "benchmark@jpl.nasa.gov"
+"""Submitter email associated with synthetic records"""
+
+SYNTHETIC_EPOCH = datetime(2020, 1, 1, tzinfo=timezone.utc)
+"""Base creation date of synthetic records"""
+
+PDS4_LABEL_TEMPLATE = """<?xml version="1.0" encoding="UTF-8"?>
+<{product_class} xmlns="http://pds.nasa.gov/pds4/pds/v1"
+    xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance"
+    xsi:schemaLocation="http://pds.nasa.gov/pds4/pds/v1 https://pds.nasa.gov/pds4/pds/v1/PDS4_PDS_1B10.xsd">
+    <Identification_Area>
+        <logical_identifier>{lid}</logical_identifier>
+        <version_id>{vid}</version_id>
+        <title>{title}</title>
+        <information_model_version>1.11.1.0</information_model_version>
+        <product_class>{product_class}</product_class>
+        <Citation_Information>
+            <author_list>{author_list}</author_list>
+            <publication_year>{publication_year}</publication_year>
+            <keyword>benchmark</keyword>
+            <description>{description}</description>
+        </Citation_Information>
+        <Modification_History>
+            <Modification_Detail>
+                <modification_date>{publication_date}</modification_date>
+                <version_id>{vid}</version_id>
+                <description>Synthetic benchmark record</description>
+            </Modification_Detail>
+        </Modification_History>
+    </Identification_Area>
+    <Context_Area>
+        <Primary_Result_Summary>
+            <purpose>Science</purpose>
+            <processing_level>Raw</processing_level>
+        </Primary_Result_Summary>
+        <Investigation_Area>
+            <name>Benchmark Mission</name>
+            <type>Mission</type>
+            <Internal_Reference>
+                <lid_reference>urn:nasa:pds:context:investigation:mission.benchmark</lid_reference>
+                <reference_type>{product_type_lower}_to_investigation</reference_type>
+            </Internal_Reference>
+        </Investigation_Area>
+        <Target_Identification>
+            <name>Mars</name>
+            <type>Planet</type>
+        </Target_Identification>
+    </Context_Area>
+    {product_area}
+</{product_class}>
+"""
+"""Template for a minimal PDS4 bundle or collection label"""
+
+BUNDLE_AREA = """<Bundle>
+        <bundle_type>Archive</bundle_type>
+    </Bundle>"""
+
+COLLECTION_AREA = """<Collection>
+        <collection_type>Data</collection_type>
+    </Collection>"""
+
+
+def synthetic_doi(index, status=DoiStatus.Draft, assign_doi=True, site_url=None, prefix=None):
+    """
+    Returns the synthetic Doi object for the provided index.
+
+    Parameters
+    ----------
+    index : int
+        Index of the synthetic record.
+    status : DoiStatus, optional
+        Status to assign to the record. Defaults to Draft.
+    assign_doi : bool, optional
+        If True, a DOI value is assigned to the record, as if it had already
+        been reserved with the service provider.
+    site_url : str, optional
+        Base URL of the landing pages for synthetic records. If provided, each
+        record is assigned a landing page URL of the form {site_url}/{index}.
+    prefix : str, optional
+        DOI prefix to use when assigning DOI values. Defaults to the DataCite
+        prefix of the INI config.
+
+    """
+    bundle_index = index - (index % BUNDLE_INTERVAL)
+    is_bundle = index == bundle_index
+    product_type_specific = "PDS4 Refereed Data Bundle" if is_bundle else "PDS4 Refereed Data Collection"
+    type_label = "Bundle" if is_bundle else "Collection"
+
+    if is_bundle:
+        lid = f"urn:nasa:pds:benchmark_{bundle_index:07d}"
+    else:
+        lid = f"urn:nasa:pds:benchmark_{bundle_index:07d}:data_{index:07d}"
+
+    date_added = SYNTHETIC_EPOCH + timedelta(minutes=index)
+    prefix = prefix or DOIConfigUtil().get_config().get("DATACITE", "doi_prefix")
+
+    doi = Doi(
+        title=f"Benchmark {type_label} {index:07d}",
+        publication_date=date_added,
+        product_type=ProductType.Bundle if is_bundle else ProductType.Collection,
+        product_type_specific=product_type_specific,
+        pds_identifier=f"{lid}::1.0",
+        authors=[{"first_name": "A.", "last_name": f"Author{index % 97}", "name_type": "Personal"}],
+        description=f"Synthetic benchmark {type_label.lower()} number {index}",
+        site_url=f"{site_url}/{index}" if site_url else None,
+        node_id=SYNTHETIC_NODES[index % len(SYNTHETIC_NODES)],
+        status=status,
+        date_record_added=date_added,
+        date_record_updated=date_added,
+    )
+
+    doi.publisher = "NASA Planetary Data System"
+    doi.contributor = NodeUtil.get_node_long_name(doi.node_id)
+    doi.identifiers = [{"identifier": doi.pds_identifier, "identifierType": "URN"}]
+
+    if assign_doi:
+        doi.id = f"bm.{index:07d}"
+        doi.doi = f"{prefix}/{doi.id}"
+
+    return doi
+
+
+def write_pds4_labels(output_dir, count, start=0):
+    """
+    Writes synthetic PDS4 bundle and collection labels to the provided directory.
+
+    Returns
+    -------
+    paths : list of str
+        Paths to the written labels.
+
+    """
+    os.makedirs(output_dir, exist_ok=True)
+
+    paths = []
+
+    for index in range(start, start + count):
+        doi = synthetic_doi(index, assign_doi=False)
+        lid, vid = doi.pds_identifier.split("::")
+        is_bundle = doi.product_type == ProductType.Bundle
+
+        label = PDS4_LABEL_TEMPLATE.format(
+            product_class="Product_Bundle" if is_bundle else "Product_Collection",
+            product_type_lower="bundle" if is_bundle else "collection",
+            product_area=BUNDLE_AREA if is_bundle else COLLECTION_AREA,
+            lid=lid,
+            vid=vid,
+            title=html.escape(doi.title),
+            author_list="A. Author, B. Author",
+            publication_year=doi.publication_date.year,
+            publication_date=doi.publication_date.strftime("%Y-%m-%d"),
+            description=html.escape(doi.description),
+        )
+
+        path = os.path.join(output_dir, f"benchmark_{index:07d}.xml")
+
+        with open(path, "w") as outfile:
+            outfile.write(label)
+
+        paths.append(path)
+
+    return paths
+
+
+def write_reserve_spreadsheet(path, count, start=0, site_url=None):
+    """
+    Writes a synthetic reserve request spreadsheet (CSV) containing the provided
+    number of rows.
+    """
+    columns = ["status", "title", "publication_date", "product_type_specific"]
+    columns += ["author_last_name", "author_first_name", "related_resource", "site_url"]
+
+    with open(path, "w", newline="") as outfile:
+        writer = csv.DictWriter(outfile, fieldnames=columns)
+        writer.writeheader()
+
+        for index in range(start, start + count):
+            doi = synthetic_doi(index, assign_doi=False, site_url=site_url)
+
+            writer.writerow(
+                {
+                    "status": "Reserved",
+                    "title": doi.title,
+                    "publication_date": doi.publication_date.strftime("%Y-%m-%d"),
+                    "product_type_specific": doi.product_type_specific,
+                    "author_last_name": doi.authors[0]["last_name"],
+                    "author_first_name": doi.authors[0]["first_name"],
+                    "related_resource": doi.pds_identifier,
+                    "site_url": doi.site_url or "",
+                }
+            )
+
+    return path
+
+
+def iter_datacite_records(count, start=0, status=DoiStatus.Findable, site_url=None):
+    """
+    Yields the DataCite JSON "data" entry for each synthetic record, as it would
+    be returned by a query to the DataCite API.
+    """
+    record_service = DOIDataCiteRecord()
+
+    for index in range(start, start + count):
+        doi = synthetic_doi(index, status=status, site_url=site_url)
+
+        record = record_service.create_doi_payload(doi)["data"]
+
+        # Mirror the fields DataCite adds to its own query results
+        record["attributes"]["state"] = "findable" if status == DoiStatus.Findable else "draft"
+        record["attributes"]["created"] = doi.date_record_added.isoformat()
+        record["attributes"]["updated"] = doi.date_record_updated.isoformat()
+
+        yield record
+
+
+def write_datacite_dump(path, count, start=0, status=DoiStatus.Findable, site_url=None):
+    """
+    Writes a synthetic DataCite JSON dump, in the format returned by a query to
+    the DataCite API (and read by pds-doi-init), to the provided path.
+
+    Records are rendered and written one at a time, so dumps of any scale may be
+    generated without holding the full dump in memory.
+    """
+    with open(path, "w") as outfile:
+        outfile.write('{"data": [\n')
+
+        for position, record in enumerate(iter_datacite_records(count, start, status, site_url)):
+            if position:
+                outfile.write(",\n")
+
+            json.dump(record, outfile)
+
+        outfile.write("\n]}\n")
+
+    return path
+
+
+def populate_transaction_db(db_file, count, start=0, status=DoiStatus.Draft, site_url=None):
+    """
+    Pre-populates a transaction database, along with the corresponding on-disk
+    transaction history, with synthetic records. The transaction history is
+    written to the location configured by the INI config.
+
+    This bypasses the validation and change detection performed by
+    Transaction.log() so that large databases may be generated quickly, but
+    produces the same database rows and output labels.
+
+    Returns
+    -------
+    records : list of DoiRecord
+        The records written to the database.
+
+    """
+    record_service = DOIDataCiteRecord()
+    transaction_on_disk = TransactionOnDisk()
+    database = DOIDataBase(db_file)
+    records = []
+
+    try:
+        with database.batch_writes():
+            for index in range(start, start + count):
+                doi = synthetic_doi(index, status=status, site_url=site_url)
+
+                transaction_key = transaction_on_disk.get_transaction_key(doi.node_id, doi.doi, doi.date_record_updated)
+
+                output_label = record_service.create_doi_record(doi, content_type=CONTENT_TYPE_JSON)
+
+                transaction_on_disk.write(
+                    transaction_key, output_content=output_label, output_content_type=CONTENT_TYPE_JSON
+                )
+
+                doi_record = DoiRecord(
+                    identifier=doi.pds_identifier,
+                    status=doi.status,
+                    date_added=doi.date_record_added,
+                    date_updated=doi.date_record_updated,
+                    submitter=SYNTHETIC_SUBMITTER,
+                    title=doi.title,
+                    type=doi.product_type,
+                    subtype=doi.product_type_specific,
+                    node_id=doi.node_id,
+                    doi=doi.doi,
+                    transaction_key=transaction_key,
+                    is_latest=True,
+                )
+
+                database.write_doi_info_to_database(doi_record, doi=doi)
+                records.append(doi_record)
+    finally:
+        database.close_database()
+
+    logger.info("Populated %s with %d synthetic record(s)", db_file, count)
+
+    return records
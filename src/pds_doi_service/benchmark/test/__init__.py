@@ -0,0 +1,13 @@
+# encoding: utf-8
+"""
+Planetary Data System's Digital Object Identifier service — tests for performance benchmarks
+"""
+import unittest
+
+from . import benchmark_test
+
+
+def suite():
+    suite = unittest.TestSuite()
+    suite.addTests(unittest.defaultTestLoader.loadTestsFromModule(benchmark_test))
+    return suite
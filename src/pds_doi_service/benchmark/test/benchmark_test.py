@@ -0,0 +1,98 @@
+#!/usr/bin/env python
+import json
+import os
+import unittest
+
+from pds_doi_service.benchmark.fake_datacite import FakeDataCiteServer
+from pds_doi_service.benchmark.runner import BenchmarkSuite
+from pds_doi_service.benchmark.runner import check_targets
+from pds_doi_service.benchmark.runner import compare_reports
+from pds_doi_service.benchmark.synthetic import iter_datacite_records
+from pds_doi_service.benchmark.synthetic import synthetic_doi
+from pds_doi_service.core.outputs.datacite.datacite_record import DOIDataCiteRecord
+from pds_doi_service.core.outputs.datacite.datacite_web_client import DOIDataCiteWebClient
+from pds_doi_service.core.outputs.doi_record import CONTENT_TYPE_JSON
+
+
+class FakeDataCiteServerTestCase(unittest.TestCase):
+    def test_reserve_and_query(self):
+        """Test reserving and querying DOIs via the fake DataCite server"""
+        web_client = DOIDataCiteWebClient()
+
+        with FakeDataCiteServer(page_size=5) as server:
+            server.load(iter_datacite_records(12))
+
+            # Reserve a new DOI, which should be assigned a DOI by the server
+            doi = synthetic_doi(100, assign_doi=False)
+            label = DOIDataCiteRecord().create_doi_record(doi, content_type=CONTENT_TYPE_JSON)
+
+            reserved_doi, _ = web_client.submit_content(
+                label, url=server.dois_url, username="user", password="password"
+            )
+
+            self.assertIsNotNone(reserved_doi.doi)
+            self.assertEqual(reserved_doi.pds_identifier, doi.pds_identifier)
+
+            # Query results should be combined across all pages
+            all_results = web_client.query_doi(
+                {"doi": f"{reserved_doi.doi.split('/')[0]}/*"},
+                url=server.dois_url,
+                username="user",
+                password="password",
+            )
+            self.assertEqual(len(json.loads(all_results)["data"]), 13)
+
+            # Queries for several DOIs at once should return only the requested records
+            requested_dois = [synthetic_doi(index).doi for index in (1, 7)]
+
+            filtered_results = web_client.query_doi(
+                f'doi:("{requested_dois[0]}" OR "{requested_dois[1]}")',
+                url=server.dois_url,
+                username="user",
+                password="password",
+            )
+            self.assertListEqual(
+                sorted(record["id"] for record in json.loads(filtered_results)["data"]), sorted(requested_dois)
+            )
+
+
+class BenchmarkSuiteTestCase(unittest.TestCase):
+    def test_run_suite(self):
+        """Test a small-scale run of the full benchmark suite"""
+        suite = BenchmarkSuite(scale=20, submit_count=3, api_requests=3)
+
+        report = suite.run()
+
+        results = {result["name"]: result for result in report["results"]}
+
+        for name in (
+            "populate",
+            "list_all",
+            "differ_osti_xml",
+            "parse_datacite",
+            "reserve",
+            "release",
+            "update",
+            "init_from_file",
+            "api_get_doi",
+            "serialize_rows",
+            "api_list_dois",
+        ):
+            self.assertIn(name, results)
+            self.assertGreater(results[name]["seconds"], 0)
+
+        # Each reserved DOI should have been submitted to the provider
+        self.assertEqual(results["reserve"]["provider_requests"], {"POST": 3})
+
+        # The suite should leave the environment as it found it
+        self.assertNotIn("OTHER_DB_FILE", os.environ)
+
+        comparison = compare_reports(report, report)
+        self.assertTrue(all(entry["throughput_change"] == 0.0 for entry in comparison))
+
+        self.assertListEqual(check_targets(report, {"list_all": 0.0}), [])
+        self.assertEqual(len(check_targets(report, {"list_all": float("inf"), "missing": 1.0})), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
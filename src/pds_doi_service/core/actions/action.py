@@ -72,8 +72,35 @@ class DOICoreAction:
             if callable(add_to_subparser_method):
                 add_to_subparser_method(subparsers)
 
+        # Profiling options are common to all actions
+        for action_parser in subparsers.choices.values():
+            DOICoreAction._add_profiling_arguments(action_parser)
+
         return parser
 
+    @staticmethod
+    def _add_profiling_arguments(action_parser):
+        """Adds the arguments used to profile a run of an action to the provided subparser."""
+        profiling_group = action_parser.add_argument_group("profiling")
+        profiling_group.add_argument(
+            "--profile",
+            required=False,
+            default=None,
+            metavar="PROFILE_FILE",
+            help="If provided, profiles the action with cProfile and writes "
+            "the resulting statistics to the provided path, in the format "
+            "read by the Python pstats module.",
+        )
+        profiling_group.add_argument(
+            "--trace-spans",
+            required=False,
+            default=None,
+            metavar="TRACE_FILE",
+            help="If provided, writes a JSON tree of the time spent in each "
+            "stage of the action (input parsing, validation, rendering, "
+            "submission, transaction logging, etc.) to the provided path.",
+        )
+
     @classmethod
     def add_to_subparser(cls, subparsers):
         """
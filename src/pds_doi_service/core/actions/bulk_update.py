@@ -0,0 +1,442 @@
+#
+#  Copyright 2026, by the California Institute of Technology.  ALL RIGHTS
+#  RESERVED. United States Government Sponsorship acknowledged. Any commercial
+#  use must be negotiated with the Office of Technology Transfer at the
+#  California Institute of Technology.
+#
+"""
+==============
+bulk_update.py
+==============
+
+Contains the definition for the Bulk Update action of the Core PDS DOI Service.
+"""
+import json
+from datetime import datetime
+from datetime import timezone
+from enum import Enum
+
+from pds_doi_service.core.actions import DOICoreAction
+from pds_doi_service.core.actions.update import DOICoreActionUpdate
+from pds_doi_service.core.db.transaction_label_cache import get_transaction_label_cache
+from pds_doi_service.core.db.transaction_on_disk import TransactionOnDisk
+from pds_doi_service.core.entities.doi import Doi
+from pds_doi_service.core.entities.doi import DoiStatus
+from pds_doi_service.core.entities.exceptions import collect_exception_classes_and_messages
+from pds_doi_service.core.entities.exceptions import CriticalDOIException
+from pds_doi_service.core.entities.exceptions import DuplicatedTitleDOIException
+from pds_doi_service.core.entities.exceptions import InputFormatException
+from pds_doi_service.core.entities.exceptions import InvalidIdentifierException
+from pds_doi_service.core.entities.exceptions import raise_or_warn_exceptions
+from pds_doi_service.core.entities.exceptions import TitleDoesNotMatchProductTypeException
+from pds_doi_service.core.entities.exceptions import UnexpectedDOIActionException
+from pds_doi_service.core.entities.exceptions import UnknownDoiException
+from pds_doi_service.core.entities.exceptions import WarningDOIException
+from pds_doi_service.core.input.input_util import DOIInputUtil
+from pds_doi_service.core.outputs.doi_record import CONTENT_TYPE_JSON
+from pds_doi_service.core.outputs.doi_validator import DOIValidator
+from pds_doi_service.core.outputs.service import DOIServiceFactory
+from pds_doi_service.core.util.general_util import get_global_keywords
+from pds_doi_service.core.util.general_util import get_logger
+from pds_doi_service.core.util.node_util import NodeUtil
+from pds_doi_service.core.util.profiling import traced
+
+logger = get_logger(__name__)
+
+PREFETCH_CHUNK_SIZE = 500
+"""Maximum number of DOI values looked up per transaction database query, to stay within SQLite's parameter limit"""
+
+
+class DOICoreActionBulkUpdate(DOICoreAction):
+    _name = "bulk-update"
+    _description = (
+        "Apply a spreadsheet or NDJSON file of metadata changes, keyed by DOI, "
+        "to existing records. All updated records are committed together."
+    )
+    _order = 15
+    _run_arguments = ("input", "node", "submitter", "force", "dry_run")
+
+    def __init__(self, db_name=None):
+        super().__init__(db_name=db_name)
+        self._doi_validator = DOIValidator(db_name=db_name)
+        self._input_util = DOIInputUtil()
+        self._record_service = DOIServiceFactory.get_doi_record_service()
+        self._validator_service = DOIServiceFactory.get_validator_service()
+        self._web_parser = DOIServiceFactory.get_web_parser_service()
+
+        self._input = None
+        self._node = None
+        self._submitter = None
+        self._force = False
+        self._dry_run = False
+
+    @classmethod
+    def add_to_subparser(cls, subparsers):
+        action_parser = subparsers.add_parser(
+            cls._name, description="Update the metadata of many records with DOI's already assigned"
+        )
+
+        node_values = NodeUtil.get_permissible_node_ids()
+        action_parser.add_argument(
+            "-i",
+            "--input",
+            required=True,
+            metavar="INPUT",
+            help="Path to a CSV/XLS spreadsheet or NDJSON file of field changes. "
+            'Each row (or line) MUST define a "doi" value identifying the record '
+            "to update, along with the new values of one or more of the following "
+            f"fields: {', '.join(DOIInputUtil.BULK_UPDATE_FIELDS)}. Empty values "
+            "leave the corresponding field unchanged.",
+        )
+        action_parser.add_argument(
+            "-N",
+            "--node",
+            required=False,
+            default=None,
+            metavar="NODE_ID",
+            help="The PDS Discipline Node to assign to each updated record. If not provided,"
+            "the node(s) currently assigned to each record are maintained. "
+            "Authorized values are: " + ",".join(node_values),
+        )
+        action_parser.add_argument(
+            "-s",
+            "--submitter",
+            required=False,
+            default="pds-operator@jpl.nasa.gov",
+            metavar="EMAIL",
+            help="The email address to associate with the Update request. " "Defaults to pds-operator@jpl.nasa.gov",
+        )
+        action_parser.add_argument(
+            "-f",
+            "--force",
+            required=False,
+            action="store_true",
+            help="If provided, forces the action to proceed even if warnings are "
+            "encountered during validation of the updated records. Without this "
+            "flag, any warnings encountered are treated as fatal exceptions.",
+        )
+        action_parser.add_argument(
+            "--dry-run",
+            required=False,
+            action="store_true",
+            help="If provided, the updated records are validated and a report of "
+            "the changes to each is returned, but nothing is written to the "
+            "transaction database.",
+        )
+
+    @traced("prefetch")
+    def _prefetch_dois(self, doi_values):
+        """
+        Fetches the latest version of the metadata for each of the provided
+        DOI values.
+
+        The transaction records for all DOI's are obtained with as few database
+        queries as possible, rather than one list request per DOI.
+
+        Parameters
+        ----------
+        doi_values : list of str
+            The DOI values to fetch records for.
+
+        Returns
+        -------
+        existing_dois : dict
+            Dictionary mapping each DOI value to a Doi object parsed from the
+            output label of its latest transaction.
+
+        Raises
+        ------
+        UnknownDoiException
+            If one or more of the DOI values has no entry in the transaction
+            database.
+
+        """
+        database = self.m_transaction_builder.m_doi_database
+        transaction_records = {}
+
+        for start in range(0, len(doi_values), PREFETCH_CHUNK_SIZE):
+            chunk = doi_values[start : start + PREFETCH_CHUNK_SIZE]
+
+            for record in database.select_latest_records({"doi": chunk}):
+                transaction_records[record.doi] = record
+
+        unknown_dois = [doi_value for doi_value in doi_values if doi_value not in transaction_records]
+
+        if unknown_dois:
+            raise UnknownDoiException(f"No record(s) could be found for DOI(s) {', '.join(unknown_dois)}.")
+
+        label_cache = get_transaction_label_cache()
+        existing_dois = {}
+
+        for doi_value in doi_values:
+            record = transaction_records[doi_value]
+
+            _, _, dois = label_cache.get_record_for_doi(
+                record.transaction_key, record.identifier, doi_value, self._web_parser
+            )
+
+            existing_dois[doi_value] = dois[0]
+
+        return existing_dois
+
+    @staticmethod
+    def _apply_changes(existing_doi, changes):
+        """
+        Returns a new Doi object with the provided field changes melded into
+        the existing Doi, in the same way the Update action melds the Doi
+        parsed from an input label (see DOICoreActionUpdate._meld_dois()),
+        along with a mapping of each field that was changed to its previous
+        value.
+        """
+        # Leave every other field unset, so only the changed fields are melded
+        change_doi = Doi(**dict.fromkeys(existing_doi.__dict__))
+
+        for field_name, new_value in changes.items():
+            setattr(change_doi, field_name, new_value)
+
+        updated_doi = DOICoreActionUpdate._meld_dois(existing_doi, change_doi)
+        previous_values = {}
+
+        for field_name in changes:
+            old_value = getattr(existing_doi, field_name)
+
+            if getattr(updated_doi, field_name) != old_value:
+                previous_values[field_name] = old_value
+
+        return updated_doi, previous_values
+
+    @traced("complete")
+    def _complete_dois(self, dois):
+        """
+        Ensures the list of updated DOI objects have the requisite fields,
+        such as status or contributor, filled in prior to submission.
+
+        Parameters
+        ----------
+        dois : list of Doi
+            The list of DOI objects to complete
+
+        Returns
+        -------
+        dois : list of Doi
+            The completed list of DOI objects.
+
+        """
+        publisher = self._config.get("OTHER", "doi_publisher")
+        global_keywords = get_global_keywords()
+        timestamp = datetime.now(tz=timezone.utc)
+
+        for doi in dois:
+            if self._node:
+                doi.node_id = self._node
+                doi.contributor = NodeUtil.get_node_long_name(self._node)
+
+            # Only fall back to the configured publisher when the change set
+            # did not provide one
+            doi.publisher = doi.publisher or publisher
+
+            # Store the previous status of this DOI
+            doi.previous_status = doi.status
+
+            doi.keywords = set(doi.keywords) | global_keywords
+
+            # All records updated by this request share a single update time,
+            # which also keys each record's new transaction history entry
+            doi.date_record_updated = timestamp
+
+            # If this DOI has already been released (aka is findable or in review),
+            # then move the status back to the Review step. Otherwise, the record
+            # should still be in draft.
+            if doi.previous_status in (DoiStatus.Findable, DoiStatus.Review):
+                doi.status = DoiStatus.Review
+            else:
+                doi.status = DoiStatus.Draft
+
+        return dois
+
+    @traced("validate")
+    def _validate_dois(self, dois):
+        """
+        Validates the list of updated DOI objects prior to their submission.
+
+        The label representation of all DOI's is validated in a single pass,
+        followed by the internal checks performed by the validator class on
+        each object. Any exceptions or warnings encountered are stored until
+        all DOI's have been checked, then either raised as a single exception,
+        or simply logged, depending on the state of the force flag.
+
+        Parameters
+        ----------
+        dois : list of Doi
+            The DOI objects to validate.
+
+        Returns
+        -------
+        dois : list of Doi
+            The validated list of DOI objects.
+
+        """
+        exception_classes = []
+        exception_messages = []
+
+        # Validate the label representation of all the DOI's at once
+        self._validator_service.validate(self._record_service.create_doi_payload(dois))
+
+        for doi in dois:
+            try:
+                # Validate the object representation of the DOI
+                self._doi_validator.validate_update_request(doi)
+            # Collect all warnings and exceptions so they can be combined into
+            # a single WarningDOIException
+            except (
+                DuplicatedTitleDOIException,
+                InvalidIdentifierException,
+                UnexpectedDOIActionException,
+                TitleDoesNotMatchProductTypeException,
+            ) as err:
+                exception_classes, exception_messages = collect_exception_classes_and_messages(
+                    err, exception_classes, exception_messages
+                )
+
+        if len(exception_classes) > 0:
+            raise_or_warn_exceptions(exception_classes, exception_messages, log=self._force)
+
+        return dois
+
+    @staticmethod
+    def _report_value(value):
+        """Converts a Doi field value to a JSON-serializable form for the change report"""
+        if isinstance(value, datetime):
+            return value.isoformat()
+
+        if isinstance(value, Enum):
+            return value.value
+
+        if isinstance(value, (set, frozenset)):
+            return sorted(value)
+
+        return value
+
+    def _create_report(self, dois, previous_values):
+        """
+        Creates the JSON report of the changes made (or to be made, for a dry
+        run) to each of the provided DOI's.
+
+        Fields are reported with their final values, so any left unchanged
+        once the DOI's were completed (such as keywords already including
+        the global keywords) are omitted.
+        """
+        report = []
+
+        for doi, doi_previous_values in zip(dois, previous_values):
+            changes = {}
+
+            for field_name, old_value in doi_previous_values.items():
+                new_value = getattr(doi, field_name)
+
+                if new_value != old_value:
+                    changes[field_name] = {"old": self._report_value(old_value), "new": self._report_value(new_value)}
+
+            report.append(
+                {
+                    "doi": doi.doi,
+                    "identifier": doi.pds_identifier,
+                    "previous_status": self._report_value(doi.previous_status),
+                    "status": self._report_value(doi.status),
+                    "changes": changes,
+                }
+            )
+
+        return json.dumps(report, indent=4)
+
+    def run(self, **kwargs):
+        """
+        Applies the field changes read from the provided input file to the
+        latest version of each of the referenced DOI records.
+
+        All updated records are validated before any are written, then the
+        transactions for all records are committed to the local database
+        together. The updates are not pushed to the service provider.
+
+        Parameters
+        ----------
+        kwargs : dict
+            Contains the arguments for the Bulk Update action as parsed from
+            the command-line.
+
+        Returns
+        -------
+        output : str
+            For a dry run, a JSON report of the changes to each record.
+            Otherwise, a JSON label containing all the updated records.
+
+        Raises
+        ------
+        ValueError
+            If the provided arguments are invalid.
+
+        """
+        self.parse_arguments(kwargs)
+
+        try:
+            field_changes = self._input_util.parse_field_changes_from_file(self._input)
+
+            existing_dois = self._prefetch_dois(list(field_changes.keys()))
+
+            dois = []
+            previous_values = []
+
+            for doi_value, changes in field_changes.items():
+                updated_doi, doi_previous_values = self._apply_changes(existing_dois[doi_value], changes)
+
+                dois.append(updated_doi)
+                previous_values.append(doi_previous_values)
+
+            dois = self._complete_dois(dois)
+            dois = self._validate_dois(dois)
+
+            if self._dry_run:
+                return self._create_report(dois, previous_values)
+
+            transactions = []
+
+            try:
+                with self.m_transaction_builder.m_doi_database.batch_writes():
+                    for doi in dois:
+                        transaction = self.m_transaction_builder.prepare_transaction(
+                            self._submitter,
+                            doi,
+                            input_path=self._input,
+                            output_content_type=CONTENT_TYPE_JSON,
+                        )
+                        transactions.append(transaction)
+
+                        transaction.log()
+            except BaseException:
+                # The database rows were rolled back, so remove the transaction
+                # history written for them as well
+                for transaction in transactions:
+                    if transaction.transaction_key:
+                        TransactionOnDisk.remove(transaction.transaction_key)
+
+                raise
+        # Propagate input format and unknown DOI exceptions, force flag should
+        # not affect these being raised and certain callers (such as the API)
+        # look for these exceptions specifically
+        except (InputFormatException, UnknownDoiException) as err:
+            raise err
+        # If we catch this exception, it means validation produced a warning
+        # and the --force flag is not set, so log the error and exit without
+        # committing any of the updates
+        except WarningDOIException as err:
+            logger.error(str(err))
+            raise err
+        # Convert all other errors into a CriticalDOIException to report back
+        except Exception as err:
+            raise CriticalDOIException(str(err))
+
+        logger.info("Updated %d record(s) from %s", len(dois), self._input)
+
+        # Note this action always returns JSON format to ensure interoperability
+        # between the potential service providers
+        return self._record_service.create_doi_record(dois, content_type=CONTENT_TYPE_JSON)
@@ -22,12 +22,13 @@ from email.mime.multipart import MIMEMultipart
 from importlib import resources
 from os.path import exists
 
-import jinja2
 from pds_doi_service.core.actions import DOICoreAction
 from pds_doi_service.core.actions.list import DOICoreActionList
 from pds_doi_service.core.entities.doi import DoiStatus
 from pds_doi_service.core.outputs.doi_record import CONTENT_TYPE_JSON
 from pds_doi_service.core.outputs.service import DOIServiceFactory
+from pds_doi_service.core.outputs.web_client import DEFAULT_QUERY_BATCH_SIZE
+from pds_doi_service.core.outputs.web_client import DEFAULT_QUERY_MAX_WORKERS
 from pds_doi_service.core.util.emailer import Emailer
 from pds_doi_service.core.util.general_util import get_logger
 
@@ -52,6 +53,8 @@ class DOICoreActionCheck(DOICoreAction):
         self._web_parser = DOIServiceFactory.get_web_parser_service()
 
         self._submitter = self._config.get("OTHER", "emailer_sender")
+        self._batch_size = int(self._config.get("OTHER", "check_batch_size", fallback=DEFAULT_QUERY_BATCH_SIZE))
+        self._max_workers = int(self._config.get("OTHER", "check_max_workers", fallback=DEFAULT_QUERY_MAX_WORKERS))
         self._email = True
         self._attachment = True
 
@@ -73,6 +76,8 @@ class DOICoreActionCheck(DOICoreAction):
         with open(self.email_body_template_file, "r") as infile:
             self.email_body_template = infile.read().strip()
 
+        import jinja2
+
         with open(self.email_header_template_file, "r") as infile:
             self.email_header_template = jinja2.Template(infile.read())
 
@@ -103,9 +108,72 @@ class DOICoreActionCheck(DOICoreAction):
             help="The email address of the user to register as author of the check action.",
         )
 
-    def _update_transaction_db(self, pending_record):
+    def _query_pending_dois(self, pending_records):
         """
-        Processes the result from the one 'check' query to DOI service provider.
+        Queries the DOI service provider for the current state of all the
+        provided pending records, grouping the DOIs into as few requests as
+        the provider allows.
+
+        DOIs whose state was mirrored from the provider recently enough (see
+        ProviderMirror.get_dois()) are read from the mirror instead, and the
+        responses to the queries made are written to the mirror.
+
+        Parameters
+        ----------
+        pending_records : list of dict
+            The pending records to query for. Key names correspond to the
+            column names of the transaction database.
+
+        Returns
+        -------
+        query_results : dict
+            Dictionary mapping each (lower-cased) DOI found at the service
+            provider to a tuple of the Doi object parsed from the provider
+            response and the list of errors reported for it (if any).
+
+        """
+        provider_mirror = self.m_transaction_builder.m_provider_mirror
+        pending_dois = [pending_record["doi"] for pending_record in pending_records]
+
+        query_results = {doi_value: (doi, None) for doi_value, doi in provider_mirror.get_dois(pending_dois).items()}
+
+        if query_results:
+            logger.info("Using mirrored provider state for %d of %d DOI(s)", len(query_results), len(pending_dois))
+
+        batch_responses = self._web_client.query_dois(
+            [doi_value for doi_value in pending_dois if doi_value.lower() not in query_results],
+            batch_size=self._batch_size,
+            max_workers=self._max_workers,
+        )
+
+        for batch_dois, doi_label in batch_responses:
+            provider_mirror.mirror_label(doi_label)
+
+            dois, errors = self._web_parser.parse_dois_from_label(doi_label)
+
+            batch_dois = {doi_value.lower() for doi_value in batch_dois}
+
+            for index, doi in enumerate(dois):
+                # Errors are reported by the index of the record they belong to,
+                # either as a dictionary or list depending on the provider
+                doi_errors = errors.get(index) if isinstance(errors, dict) else None
+
+                if doi.doi and doi.doi.lower() in batch_dois:
+                    query_results.setdefault(doi.doi.lower(), (doi, doi_errors))
+
+            # Queries for a single DOI are assumed to only ever return the
+            # requested entry
+            if len(batch_dois) == 1 and dois:
+                doi_errors = errors.get(0) if isinstance(errors, dict) else None
+
+                query_results.setdefault(batch_dois.pop(), (dois[0], doi_errors))
+
+        return query_results
+
+    def _update_transaction_db(self, pending_record, doi, errors=None):
+        """
+        Processes the result from the 'check' query to DOI service provider
+        for a single pending record.
 
         If the status has changed from initial status, update the old record in
         the database and write a new record to the database and return DOI just
@@ -116,6 +184,11 @@ class DOICoreActionCheck(DOICoreAction):
         pending_record : dict
             Contains details of the checked DOI entry. Key names correspond
             to the column names of the transaction database.
+        doi : Doi
+            The Doi object parsed from the service provider response for
+            the pending record, or None if no record was found at the provider.
+        errors : list of str, optional
+            Any errors reported by the service provider for the record.
 
         """
         doi_value = pending_record["doi"]
@@ -123,15 +196,7 @@ class DOICoreActionCheck(DOICoreAction):
 
         logger.info("Checking release status for DOI %s (Identifier %s)", doi_value, identifier)
 
-        query_dict = {"doi": doi_value}
-
-        doi_label = self._web_client.query_doi(query=query_dict)
-        dois, errors = self._web_parser.parse_dois_from_label(doi_label)
-
-        if dois:
-            # Should only ever be one entry returned
-            doi = dois[0]
-
+        if doi:
             if doi.status != DoiStatus.Pending:
                 logger.info("DOI has changed from status %s to %s", DoiStatus.Pending, doi.status)
 
@@ -145,10 +210,8 @@ class DOICoreActionCheck(DOICoreAction):
                 pending_record["date_updated"] = doi.date_record_updated.isoformat()
 
                 # If there was a submission error, include the details.
-                # Since we only check one DOI at a time, should be safe
-                # to index by 0 here
                 if errors:
-                    doi.message = "\n".join(errors[0])
+                    doi.message = "\n".join(errors)
 
                 # Log the update to the DOI entry
                 transaction_obj = self.m_transaction_builder.prepare_transaction(
@@ -428,8 +491,14 @@ class DOICoreActionCheck(DOICoreAction):
         logger.info("Found %d %s record(s) to check" % (len(pending_state_list), DoiStatus.Pending))
 
         if len(pending_state_list) > 0:
-            for pending_record in pending_state_list:
-                self._update_transaction_db(pending_record)
+            query_results = self._query_pending_dois(pending_state_list)
+
+            # Log all status changes within a single database transaction
+            with self.m_transaction_builder.m_doi_database.batch_writes():
+                for pending_record in pending_state_list:
+                    doi, errors = query_results.get(pending_record["doi"].lower(), (None, None))
+
+                    self._update_transaction_db(pending_record, doi, errors)
 
             if self._email:
                 self._group_updated_doi_records_and_email(pending_state_list)
@@ -11,16 +11,14 @@ list.py
 
 Contains the definition for the List action of the Core PDS DOI Service.
 """
-import glob
 import json
-from os.path import exists
-from os.path import join
 
 from dateutil.parser import isoparse
 from pds_doi_service.core.actions.action import DOICoreAction
 from pds_doi_service.core.db.doi_database import DOIDataBase
+from pds_doi_service.core.db.transaction_label_cache import get_transaction_label_cache
+from pds_doi_service.core.db.transaction_on_disk import TransactionOnDisk
 from pds_doi_service.core.entities.doi import DoiStatus
-from pds_doi_service.core.entities.exceptions import NoTransactionHistoryForIdentifierException
 from pds_doi_service.core.entities.exceptions import UnknownDoiException
 from pds_doi_service.core.entities.exceptions import UnknownIdentifierException
 from pds_doi_service.core.outputs.service import DOIServiceFactory
@@ -38,7 +36,19 @@ class DOICoreActionList(DOICoreAction):
     _name = "list"
     _description = "List DOI entries within the transaction database that match the provided search criteria"
     _order = 40
-    _run_arguments = ("format", "doi", "ids", "node", "status", "start_update", "end_update", "submitter")
+    _run_arguments = (
+        "format",
+        "doi",
+        "ids",
+        "node",
+        "status",
+        "start_update",
+        "end_update",
+        "submitter",
+        "query",
+        "limit",
+        "offset",
+    )
 
     def __init__(self, db_name=None):
         super().__init__(db_name=db_name)
@@ -62,6 +72,9 @@ class DOICoreActionList(DOICoreAction):
         self._start_update = None
         self._end_update = None
         self._submitter = None
+        self._query = None
+        self._limit = None
+        self._offset = None
 
     @classmethod
     def add_to_subparser(cls, subparsers):
@@ -147,6 +160,31 @@ class DOICoreActionList(DOICoreAction):
             "with the database query. Only entries containing the one of "
             "the provided addresses as the submitter will be returned.",
         )
+        action_parser.add_argument(
+            "-q",
+            "--query",
+            required=False,
+            metavar="TEXT",
+            help="Free text to search for within the title, description, keywords "
+            "and authors of each DOI. Only entries matching all words of the text "
+            "are returned, ordered by relevance. Words ending with a wildcard (*) "
+            "match any word they prefix.",
+        )
+        action_parser.add_argument(
+            "--limit",
+            required=False,
+            type=int,
+            metavar="N",
+            help="The maximum number of entries to return.",
+        )
+        action_parser.add_argument(
+            "--offset",
+            required=False,
+            type=int,
+            metavar="N",
+            help="The number of matching entries to skip before those returned. "
+            "Use with --limit to page through results.",
+        )
 
     def parse_criteria(self, kwargs):
         """
@@ -217,20 +255,9 @@ class DOICoreActionList(DOICoreAction):
             on local disk.
 
         """
-        # Make sure we can locate the output label associated with this
-        # transaction
-        transaction_location = transaction_record["transaction_key"]
-        label_files = glob.glob(join(transaction_location, "output.*"))
-
-        if not label_files or not exists(label_files[0]):
-            raise NoTransactionHistoryForIdentifierException(
-                f"Could not find a DOI label associated with identifier {transaction_record['identifier']}. "
-                "The database and transaction history location may be out of sync."
-            )
-
-        label_file = label_files[0]
-
-        return label_file
+        return TransactionOnDisk.output_label_for_transaction_key(
+            transaction_record["transaction_key"], transaction_record["identifier"]
+        )
 
     def transaction_for_doi(self, doi):
         """
@@ -296,6 +323,35 @@ class DOICoreActionList(DOICoreAction):
 
         return record
 
+    def select_rows(self, **kwargs):
+        """
+        Selects the latest records in the named database matching the
+        provided criteria, without any formatting of the results. Used by
+        callers which serialize the rows themselves, such as the API.
+
+        Parameters
+        ----------
+        kwargs : dict
+            Dictionary containing the list action argument names mapped
+            to the criteria to filter results by.
+
+        Returns
+        -------
+        columns : list of str
+            The names of the columns of each row.
+        rows : list of list
+            The selected rows, with date columns as datetime objects.
+
+        """
+        query_criteria = self.parse_criteria(kwargs)
+
+        if self._query:
+            return self._database_obj.search_latest_rows(
+                self._query, query_criteria, limit=self._limit, offset=self._offset
+            )
+
+        return self._database_obj.select_latest_rows(query_criteria, limit=self._limit, offset=self._offset)
+
     def run(self, **kwargs):
         """
         Lists all the latest records in the named database, returning the
@@ -314,9 +370,7 @@ class DOICoreActionList(DOICoreAction):
             provided criteria dictionary.
 
         """
-        query_criteria = self.parse_criteria(kwargs)
-
-        columns, rows = self._database_obj.select_latest_rows(query_criteria)
+        columns, rows = self.select_rows(**kwargs)
 
         transaction_records = []
 
@@ -332,13 +386,13 @@ class DOICoreActionList(DOICoreAction):
         if self._format == FORMAT_LABEL:
             queried_dois = []
 
-            for transaction_record in transaction_records:
-                label_file = self.output_label_for_transaction(transaction_record)
+            label_cache = get_transaction_label_cache()
 
-                with open(label_file, "r") as infile:
-                    label_contents = infile.read()
-                    dois, _ = self._web_parser.parse_dois_from_label(label_contents)
-                    queried_dois.extend(dois)
+            for transaction_record in transaction_records:
+                dois = label_cache.get_dois(
+                    transaction_record["transaction_key"], transaction_record["identifier"], self._web_parser
+                )
+                queried_dois.extend(dois)
 
             if queried_dois:
                 o_query_result = self._record_service.create_doi_record(queried_dois)
@@ -12,6 +12,8 @@ release.py
 Contains the definition for the Release action of the Core PDS DOI Service.
 """
 from pds_doi_service.core.actions.action import DOICoreAction
+from pds_doi_service.core.db.outbox import is_transient_error
+from pds_doi_service.core.db.outbox import ProviderOutbox
 from pds_doi_service.core.entities.doi import DoiEvent
 from pds_doi_service.core.entities.doi import DoiStatus
 from pds_doi_service.core.entities.exceptions import collect_exception_classes_and_messages
@@ -33,6 +35,7 @@ from pds_doi_service.core.util.general_util import create_landing_page_url
 from pds_doi_service.core.util.general_util import get_global_keywords
 from pds_doi_service.core.util.general_util import get_logger
 from pds_doi_service.core.util.node_util import NodeUtil
+from pds_doi_service.core.util.profiling import traced
 
 logger = get_logger(__name__)
 
@@ -50,6 +53,8 @@ class DOICoreActionRelease(DOICoreAction):
         self._record_service = DOIServiceFactory.get_doi_record_service()
         self._validator_service = DOIServiceFactory.get_validator_service()
         self._web_client = DOIServiceFactory.get_web_client_service()
+        self._outbox = ProviderOutbox(self.m_transaction_builder, web_client=self._web_client)
+        self._queued_dois = []
 
         self._input = None
         self._node = None
@@ -128,6 +133,7 @@ class DOICoreActionRelease(DOICoreAction):
         """
         return self._input_util.parse_dois_from_input_file(input_file)
 
+    @traced("complete")
     def _complete_dois(self, dois):
         """
         Ensures the list of DOI objects to reserve have the requisite fields,
@@ -171,6 +177,7 @@ class DOICoreActionRelease(DOICoreAction):
 
         return dois
 
+    @traced("validate")
     def _validate_dois(self, dois):
         """
         Validates the list of DOI objects prior to their submission.
@@ -198,6 +205,10 @@ class DOICoreActionRelease(DOICoreAction):
         exception_classes = []
         exception_messages = []
 
+        # Request the landing pages of all the DOIs at once, rather than one
+        # at a time as each DOI is validated
+        self._doi_validator.check_site_urls(dois)
+
         for doi in dois:
             try:
                 # If user is attempting to move a record with no DOI to review,
@@ -208,10 +219,10 @@ class DOICoreActionRelease(DOICoreAction):
                         f"A DOI must be reserved for the record before it can be moved to Review."
                     )
 
-                single_doi_label = self._record_service.create_doi_record(doi)
+                single_doi_payload = self._record_service.create_doi_payload(doi)
 
                 # Validate the label representation of the DOI
-                self._validator_service.validate(single_doi_label)
+                self._validator_service.validate(single_doi_payload)
 
                 # Validate the object representation of the DOI
                 self._doi_validator.validate_release_request(doi)
@@ -234,6 +245,14 @@ class DOICoreActionRelease(DOICoreAction):
 
         return dois
 
+    @property
+    def queued_dois(self):
+        """
+        Returns the Doi objects of the last run whose submissions were queued
+        in the provider outbox, as the service provider was unavailable.
+        """
+        return self._queued_dois
+
     def run(self, **kwargs):
         """
         Performs a release of a DOI that has been previously reserved.
@@ -263,6 +282,7 @@ class DOICoreActionRelease(DOICoreAction):
 
         """
         output_dois = []
+        self._queued_dois = []
 
         self.parse_arguments(kwargs)
 
@@ -283,9 +303,28 @@ class DOICoreActionRelease(DOICoreAction):
                     # Determine the correct HTTP verb and URL for submission of this DOI
                     method, url = self._web_client.endpoint_for_doi(input_doi, self._name)
 
-                    output_doi, o_doi_label = self._web_client.submit_content(
-                        url=url, method=method, payload=io_doi_label, content_type=CONTENT_TYPE_JSON
-                    )
+                    try:
+                        output_doi, o_doi_label = self._web_client.submit_content(
+                            url=url, method=method, payload=io_doi_label, content_type=CONTENT_TYPE_JSON
+                        )
+                    except Exception as err:
+                        if not (self._outbox.enabled and is_transient_error(err, method)):
+                            raise
+
+                        # Queue the submission for replay once the provider
+                        # recovers. The transaction of the release is only
+                        # logged once the replayed submission is accepted
+                        self._outbox.enqueue(
+                            self._name, self._submitter, input_doi, method, url, io_doi_label, CONTENT_TYPE_JSON
+                        )
+
+                        input_doi.message = f"Queued for submission once the service provider is available: {err}"
+                        self._queued_dois.append(input_doi)
+                        output_dois.append(input_doi)
+                        continue
+
+                    # Keep the local mirror of the provider's state current
+                    self.m_transaction_builder.m_provider_mirror.mirror_label(o_doi_label)
                 # Otherwise, DOI object is ready to be logged
                 else:
                     output_doi = input_doi
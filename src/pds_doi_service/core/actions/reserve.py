@@ -12,6 +12,8 @@ reserve.py
 Contains the definition for the Reserve action of the Core PDS DOI Service.
 """
 from pds_doi_service.core.actions.action import DOICoreAction
+from pds_doi_service.core.db.outbox import is_transient_error
+from pds_doi_service.core.db.outbox import ProviderOutbox
 from pds_doi_service.core.entities.doi import DoiEvent
 from pds_doi_service.core.entities.doi import DoiStatus
 from pds_doi_service.core.entities.exceptions import collect_exception_classes_and_messages
@@ -31,6 +33,7 @@ from pds_doi_service.core.outputs.service import DOIServiceFactory
 from pds_doi_service.core.util.general_util import get_global_keywords
 from pds_doi_service.core.util.general_util import get_logger
 from pds_doi_service.core.util.node_util import NodeUtil
+from pds_doi_service.core.util.profiling import traced
 
 logger = get_logger(__name__)
 
@@ -51,6 +54,8 @@ class DOICoreActionReserve(DOICoreAction):
         self._record_service = DOIServiceFactory.get_doi_record_service()
         self._validator_service = DOIServiceFactory.get_validator_service()
         self._web_client = DOIServiceFactory.get_web_client_service()
+        self._outbox = ProviderOutbox(self.m_transaction_builder, web_client=self._web_client)
+        self._queued_dois = []
 
         self._input = None
         self._node = None
@@ -117,6 +122,7 @@ class DOICoreActionReserve(DOICoreAction):
         """
         return self._input_util.parse_dois_from_input_file(input_file)
 
+    @traced("complete")
     def _complete_dois(self, dois):
         """
         Ensures the list of DOI objects to reserve have the requisite fields,
@@ -153,6 +159,7 @@ class DOICoreActionReserve(DOICoreAction):
 
         return dois
 
+    @traced("validate")
     def _validate_dois(self, dois):
         """
         Validates the list of DOI objects prior to their submission.
@@ -211,6 +218,14 @@ class DOICoreActionReserve(DOICoreAction):
 
         return dois
 
+    @property
+    def queued_dois(self):
+        """
+        Returns the Doi objects of the last run whose submissions were queued
+        in the provider outbox, as the service provider was unavailable.
+        """
+        return self._queued_dois
+
     def run(self, **kwargs):
         """
         Performs a reserve of a new DOI.
@@ -234,6 +249,7 @@ class DOICoreActionReserve(DOICoreAction):
 
         """
         output_dois = []
+        self._queued_dois = []
 
         self.parse_arguments(kwargs)
 
@@ -251,9 +267,26 @@ class DOICoreActionReserve(DOICoreAction):
                 # Determine the correct HTTP verb and URL for submission of this DOI
                 method, url = self._web_client.endpoint_for_doi(input_doi, self._name)
 
-                output_doi, o_doi_label = self._web_client.submit_content(
-                    method=method, url=url, payload=io_doi_label, content_type=CONTENT_TYPE_JSON
-                )
+                try:
+                    output_doi, o_doi_label = self._web_client.submit_content(
+                        method=method, url=url, payload=io_doi_label, content_type=CONTENT_TYPE_JSON
+                    )
+                except Exception as err:
+                    if not (self._outbox.enabled and is_transient_error(err, method)):
+                        raise
+
+                    # Queue the submission for replay once the provider recovers
+                    self._outbox.enqueue(
+                        self._name, self._submitter, input_doi, method, url, io_doi_label, CONTENT_TYPE_JSON
+                    )
+
+                    input_doi.message = f"Queued for submission once the service provider is available: {err}"
+                    self._queued_dois.append(input_doi)
+                    output_dois.append(input_doi)
+                    continue
+
+                # Keep the local mirror of the provider's state current
+                self.m_transaction_builder.m_provider_mirror.mirror_label(o_doi_label)
 
                 # Log the inputs and outputs of this transaction
                 transaction = self.m_transaction_builder.prepare_transaction(
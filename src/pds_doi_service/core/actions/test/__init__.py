@@ -4,6 +4,7 @@ Planetary Data System's Digital Object Identifier service — tests for core act
 """
 import unittest
 
+from . import bulk_update_test
 from . import check_test
 from . import list_test
 from . import release_test
@@ -13,6 +14,7 @@ from . import update_test
 
 def suite():
     suite = unittest.TestSuite()
+    suite.addTests(unittest.defaultTestLoader.loadTestsFromModule(bulk_update_test))
     suite.addTests(unittest.defaultTestLoader.loadTestsFromModule(check_test))
     suite.addTests(unittest.defaultTestLoader.loadTestsFromModule(list_test))
     suite.addTests(unittest.defaultTestLoader.loadTestsFromModule(release_test))
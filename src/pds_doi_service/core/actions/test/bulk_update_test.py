@@ -0,0 +1,286 @@
+#!/usr/bin/env python
+import csv
+import json
+import os
+import sqlite3
+import tempfile
+import unittest
+from datetime import datetime
+from importlib import resources
+from os.path import abspath
+from os.path import join
+from unittest.mock import patch
+
+import pds_doi_service.core.outputs.datacite.datacite_web_client
+from pds_doi_service.core.actions.bulk_update import DOICoreActionBulkUpdate
+from pds_doi_service.core.actions.list import DOICoreActionList
+from pds_doi_service.core.actions.reserve import DOICoreActionReserve
+from pds_doi_service.core.db.doi_database import DOIDataBase
+from pds_doi_service.core.entities.doi import DoiStatus
+from pds_doi_service.core.entities.exceptions import CriticalDOIException
+from pds_doi_service.core.entities.exceptions import InputFormatException
+from pds_doi_service.core.entities.exceptions import UnknownDoiException
+from pds_doi_service.core.outputs.doi_record import CONTENT_TYPE_JSON
+from pds_doi_service.core.outputs.doi_record import CONTENT_TYPE_XML
+from pds_doi_service.core.outputs.service import DOIServiceFactory
+from pds_doi_service.core.outputs.web_client import WEB_METHOD_POST
+from pds_doi_service.core.test_utils import close_all_database_connections
+from pds_doi_service.core.test_utils import safe_remove_file
+from pds_doi_service.core.util.config_parser import DOIConfigUtil
+from pds_doi_service.core.util.general_util import get_global_keywords
+
+
+class BulkUpdateActionTestCase(unittest.TestCase):
+    _record_service = None
+    _web_parser = None
+    _doi_counter = 1
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.test_dir = str(resources.files(__name__))
+        cls.input_dir = abspath(join(cls.test_dir, "data"))
+        cls.db_name = join(cls.test_dir, "doi_bulk_update_temp.db")
+
+        cls._record_service = DOIServiceFactory.get_doi_record_service()
+        cls._web_parser = DOIServiceFactory.get_web_parser_service()
+
+    def setUp(self) -> None:
+        safe_remove_file(self.db_name)
+
+        self._bulk_update_action = DOICoreActionBulkUpdate(db_name=self.db_name)
+        self._reserve_action = DOICoreActionReserve(db_name=self.db_name)
+        self._list_action = DOICoreActionList(db_name=self.db_name)
+
+    def tearDown(self) -> None:
+        for action in (self._bulk_update_action, self._reserve_action, self._list_action):
+            close_all_database_connections(action)
+            close_all_database_connections(action.m_transaction_builder)
+
+        close_all_database_connections(self._bulk_update_action._doi_validator)
+
+        safe_remove_file(self.db_name)
+
+    def webclient_submit_patch(
+        self, payload, url=None, username=None, password=None, method=WEB_METHOD_POST, content_type=CONTENT_TYPE_XML
+    ):
+        """
+        Patch for DOIWebClient.submit_content().
+
+        Allows a request to occur without actually submitting anything to the
+        service provider's test server.
+        """
+        dois, _ = BulkUpdateActionTestCase._web_parser.parse_dois_from_label(payload, content_type=CONTENT_TYPE_JSON)
+
+        doi = dois[0]
+
+        if not doi.doi:
+            doi.doi = f"10.17189/{BulkUpdateActionTestCase._doi_counter}"
+            BulkUpdateActionTestCase._doi_counter += 1
+
+        doi.status = DoiStatus.Draft
+        doi.date_record_added = datetime.now()
+        doi.date_record_updated = datetime.now()
+
+        o_doi_label = BulkUpdateActionTestCase._record_service.create_doi_record(doi, content_type=CONTENT_TYPE_JSON)
+
+        return doi, o_doi_label
+
+    def _reserve_dois(self):
+        """Reserves the records of the test spreadsheet, returning the resulting Doi objects"""
+        kwargs = {
+            "input": join(self.input_dir, "spreadsheet_with_pds4_identifiers.csv"),
+            "node": "img",
+            "submitter": "my_user@my_node.gov",
+            "force": True,
+        }
+
+        with patch.object(
+            pds_doi_service.core.outputs.datacite.datacite_web_client.DOIDataCiteWebClient,
+            "submit_content",
+            BulkUpdateActionTestCase.webclient_submit_patch,
+        ):
+            doi_label = self._reserve_action.run(**kwargs)
+
+        dois, errors = self._web_parser.parse_dois_from_label(doi_label)
+
+        self.assertEqual(len(errors), 0)
+
+        return dois
+
+    def _write_changes(self, suffix, write_function):
+        """Writes a temporary file of field changes with the provided function, returning its path"""
+        with tempfile.NamedTemporaryFile(mode="w", dir=self.test_dir, suffix=suffix, delete=False) as outfile:
+            write_function(outfile)
+            outfile_path = outfile.name
+
+        self.addCleanup(safe_remove_file, outfile_path)
+
+        return outfile_path
+
+    def test_bulk_update_from_csv(self):
+        """Test a bulk update of several records from a CSV of field changes"""
+        dois = self._reserve_dois()
+
+        def write_csv(outfile):
+            writer = csv.DictWriter(outfile, fieldnames=["doi", "description", "keywords", "title"])
+            writer.writeheader()
+
+            for doi in dois:
+                writer.writerow(
+                    {"doi": doi.doi, "description": f"Updated description for {doi.doi}", "keywords": "alpha;beta"}
+                )
+
+        input_csv = self._write_changes(".csv", write_csv)
+
+        updated_label = self._bulk_update_action.run(
+            input=input_csv, node="img", submitter="my_user@my_node.gov", force=True
+        )
+
+        updated_dois, errors = self._web_parser.parse_dois_from_label(updated_label)
+
+        self.assertEqual(len(errors), 0)
+        self.assertListEqual([doi.doi for doi in updated_dois], [doi.doi for doi in dois])
+
+        for doi, updated_doi in zip(dois, updated_dois):
+            self.assertEqual(updated_doi.description, f"Updated description for {doi.doi}")
+
+            # Empty cells should leave the corresponding field unchanged
+            self.assertEqual(updated_doi.title, doi.title)
+            self.assertEqual(updated_doi.pds_identifier, doi.pds_identifier)
+
+            self.assertIn("alpha", updated_doi.keywords)
+            self.assertIn("beta", updated_doi.keywords)
+            self.assertTrue(all(keyword in updated_doi.keywords for keyword in get_global_keywords()))
+
+            self.assertEqual(updated_doi.status, DoiStatus.Draft)
+
+        # The latest transaction for each record should reflect the update
+        latest_dois = self._bulk_update_action._prefetch_dois([doi.doi for doi in dois])
+
+        for doi in dois:
+            self.assertEqual(latest_dois[doi.doi].description, f"Updated description for {doi.doi}")
+
+    def test_bulk_update_dry_run(self):
+        """Test that a dry run reports the changes for each record without committing them"""
+        dois = self._reserve_dois()
+
+        def write_ndjson(outfile):
+            for doi in dois:
+                outfile.write(json.dumps({"doi": doi.doi, "title": f"{doi.title} (revised)", "description": ""}) + "\n")
+
+        input_ndjson = self._write_changes(".ndjson", write_ndjson)
+
+        before = json.loads(self._list_action.run())
+
+        report = json.loads(
+            self._bulk_update_action.run(
+                input=input_ndjson, node="img", submitter="my_user@my_node.gov", force=True, dry_run=True
+            )
+        )
+
+        self.assertEqual(len(report), len(dois))
+
+        for doi, entry in zip(dois, report):
+            self.assertEqual(entry["doi"], doi.doi)
+            self.assertEqual(entry["identifier"], doi.pds_identifier)
+            self.assertDictEqual(entry["changes"], {"title": {"old": doi.title, "new": f"{doi.title} (revised)"}})
+
+        # Nothing should have been written to the transaction database
+        self.assertListEqual(json.loads(self._list_action.run()), before)
+
+    def test_bulk_update_rollback(self):
+        """Test that a failed update removes the transaction history written for the records before the failure"""
+        dois = self._reserve_dois()
+
+        def write_ndjson(outfile):
+            for doi in dois:
+                outfile.write(json.dumps({"doi": doi.doi, "description": "Updated"}) + "\n")
+
+        input_ndjson = self._write_changes(".ndjson", write_ndjson)
+
+        transaction_dir = DOIConfigUtil().get_config().get("OTHER", "transaction_dir")
+
+        def transaction_dirs():
+            return {dir_path for dir_path, _, file_names in os.walk(transaction_dir) if file_names}
+
+        before = json.loads(self._list_action.run())
+        dirs_before = transaction_dirs()
+
+        write_doi_info_to_database = DOIDataBase.write_doi_info_to_database
+
+        def fail_on_last_write(database, doi_record, doi=None):
+            if doi_record.doi == dois[-1].doi:
+                raise sqlite3.OperationalError("disk I/O error")
+
+            return write_doi_info_to_database(database, doi_record, doi=doi)
+
+        with patch.object(DOIDataBase, "write_doi_info_to_database", fail_on_last_write):
+            with self.assertRaises(CriticalDOIException):
+                self._bulk_update_action.run(input=input_ndjson, submitter="my_user@my_node.gov", force=True)
+
+        self.assertListEqual(json.loads(self._list_action.run()), before)
+        self.assertSetEqual(transaction_dirs(), dirs_before)
+
+    def test_bulk_update_unknown_doi(self):
+        """Test that no records are updated when any DOI in the input is unknown"""
+        dois = self._reserve_dois()
+
+        def write_ndjson(outfile):
+            outfile.write(json.dumps({"doi": dois[0].doi, "description": "Updated"}) + "\n")
+            outfile.write(json.dumps({"doi": "10.17189/does_not_exist", "description": "Updated"}) + "\n")
+
+        input_ndjson = self._write_changes(".jsonl", write_ndjson)
+
+        before = json.loads(self._list_action.run())
+
+        with self.assertRaises(UnknownDoiException):
+            self._bulk_update_action.run(input=input_ndjson, submitter="my_user@my_node.gov", force=True)
+
+        self.assertListEqual(json.loads(self._list_action.run()), before)
+
+    def test_bulk_update_invalid_input(self):
+        """Test rejection of rows with missing or duplicate DOI's and unsupported fields"""
+
+        def write_csv(outfile):
+            outfile.write("doi,description\n")
+            outfile.write("10.17189/1,Updated\n")
+            outfile.write("10.17189/1,Updated again\n")
+            outfile.write(",Updated\n")
+
+        input_csv = self._write_changes(".csv", write_csv)
+
+        with self.assertRaises(InputFormatException) as context:
+            self._bulk_update_action.run(input=input_csv, submitter="my_user@my_node.gov", force=True)
+
+        self.assertIn("Row 2: DOI 10.17189/1 was already listed by a previous row", str(context.exception))
+        self.assertIn("Row 3: no value provided for the doi column", str(context.exception))
+
+        def write_ndjson(outfile):
+            outfile.write(json.dumps({"doi": "10.17189/1", "status": "findable"}) + "\n")
+
+        input_ndjson = self._write_changes(".ndjson", write_ndjson)
+
+        with self.assertRaises(InputFormatException) as context:
+            self._bulk_update_action.run(input=input_ndjson, submitter="my_user@my_node.gov", force=True)
+
+        self.assertIn('Field "status" may not be modified by a bulk update', str(context.exception))
+
+    def test_bulk_update_invalid_product_type(self):
+        """Test rejection of rows with an unknown product_type, naming the row and the valid product types"""
+
+        def write_ndjson(outfile):
+            outfile.write(json.dumps({"doi": "10.17189/1", "product_type": "Collection"}) + "\n")
+            outfile.write(json.dumps({"doi": "10.17189/2", "product_type": "Spacecraft"}) + "\n")
+
+        input_ndjson = self._write_changes(".ndjson", write_ndjson)
+
+        with self.assertRaises(InputFormatException) as context:
+            self._bulk_update_action.run(input=input_ndjson, submitter="my_user@my_node.gov", force=True)
+
+        self.assertNotIn("Row 1", str(context.exception))
+        self.assertIn('Row 2 (DOI 10.17189/2): Invalid product_type "Spacecraft"', str(context.exception))
+        self.assertIn("must be one of Collection, Bundle, Text, Document", str(context.exception))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,7 +1,10 @@
 #!/usr/bin/env python
 import configparser
+import copy
 import datetime
+import json
 import os
+import shutil
 import signal
 import subprocess
 import tempfile
@@ -201,6 +204,151 @@ class CheckActionTestCase(unittest.TestCase):
         self.assertEqual(pending_record["doi"], "10.17189/29348")
         self.assertEqual(pending_record["identifier"], "urn:nasa:pds:lab_shocked_feldspars::1.0")
 
+    @unittest.skipIf(
+        DOIServiceFactory.get_service_type() == SERVICE_TYPE_OSTI, "OSTI does not support batched DOI queries"
+    )
+    def test_check_batched_pending_entries(self):
+        """Test check action with several pending entries queried in a single batch"""
+        pending_dois = ["10.17189/29348", "10.17189/29349", "10.17189/29350"]
+
+        with open(join(CheckActionTestCase.input_dir, "datacite_record_findable.json"), "r") as infile:
+            findable_label = infile.read()
+            findable_record = json.loads(findable_label)["data"][0]
+
+        transaction_dir = tempfile.mkdtemp(prefix="transaction_history_")
+        self.addCleanup(shutil.rmtree, transaction_dir, ignore_errors=True)
+
+        # Replace the pending record written by setUp with ones backed by
+        # an actual transaction history
+        for index, doi_value in enumerate(pending_dois):
+            transaction_key = join(transaction_dir, "img", f"batched_{index}")
+            os.makedirs(transaction_key)
+
+            with open(join(transaction_key, "output.json"), "w") as outfile:
+                outfile.write(findable_label)
+
+            self._database_obj.write_doi_info_to_database(
+                DoiRecord(
+                    identifier=f"urn:nasa:pds:batched_bundle_{index}::1.0",
+                    status=DoiStatus.Pending,
+                    date_added=datetime.datetime.now(),
+                    date_updated=datetime.datetime.now(),
+                    submitter="img-submitter@jpl.nasa.gov",
+                    title=f"Batched Bundle {index}",
+                    type=ProductType.Bundle,
+                    subtype="PDS4 Bundle",
+                    node_id="img",
+                    doi=doi_value,
+                    transaction_key=transaction_key,
+                    is_latest=True,
+                )
+            )
+
+        # Only the first two pending DOIs are known to the provider
+        records = []
+
+        for doi_value in pending_dois[:2]:
+            record = copy.deepcopy(findable_record)
+            record["id"] = record["attributes"]["doi"] = doi_value
+            records.append(record)
+
+        queries = []
+
+        def webclient_query_patch_batched(query, **kwargs):
+            queries.append(query)
+            return json.dumps({"data": records})
+
+        with patch.object(self._action._web_client, "query_doi", webclient_query_patch_batched), patch.dict(
+            os.environ, {"OTHER_TRANSACTION_DIR": transaction_dir}
+        ):
+            pending_records = self._action.run(email=False)
+
+        # All pending DOIs should have been requested with a single query
+        self.assertEqual(len(queries), 1)
+
+        for doi_value in pending_dois:
+            self.assertIn(f'"{doi_value}"', queries[0])
+
+        self.assertEqual(len(pending_records), 3)
+
+        pending_records = {pending_record["doi"]: pending_record for pending_record in pending_records}
+
+        for doi_value in pending_dois[:2]:
+            self.assertEqual(pending_records[doi_value]["previous_status"], DoiStatus.Pending)
+            self.assertEqual(pending_records[doi_value]["status"], DoiStatus.Findable)
+
+        self.assertEqual(pending_records[pending_dois[2]]["status"], DoiStatus.Pending)
+        self.assertIn("No record for DOI", pending_records[pending_dois[2]]["message"])
+
+        # Only the unknown DOI should still be pending in the database
+        remaining_records = self._database_obj.select_latest_records({"status": [DoiStatus.Pending]})
+
+        self.assertListEqual([record.doi for record in remaining_records], [pending_dois[2]])
+
+    @unittest.skipIf(
+        DOIServiceFactory.get_service_type() == SERVICE_TYPE_OSTI, "The provider mirror is only maintained for DataCite"
+    )
+    def test_check_pending_entries_from_mirror(self):
+        """Test check action that reads recently mirrored provider state in place of a query"""
+        doi_value = "10.17189/29348"
+
+        with open(join(CheckActionTestCase.input_dir, "datacite_record_findable.json"), "r") as infile:
+            findable_label = infile.read()
+            findable_record = json.loads(findable_label)["data"][0]
+
+        transaction_dir = tempfile.mkdtemp(prefix="transaction_history_")
+        self.addCleanup(shutil.rmtree, transaction_dir, ignore_errors=True)
+
+        transaction_key = join(transaction_dir, "img", "mirrored")
+        os.makedirs(transaction_key)
+
+        with open(join(transaction_key, "output.json"), "w") as outfile:
+            outfile.write(findable_label)
+
+        self._database_obj.write_doi_info_to_database(
+            DoiRecord(
+                identifier="urn:nasa:pds:lab_shocked_feldspars::1.0",
+                status=DoiStatus.Pending,
+                date_added=datetime.datetime.now(),
+                date_updated=datetime.datetime.now(),
+                submitter="img-submitter@jpl.nasa.gov",
+                title="Laboratory Shocked Feldspars Bundle",
+                type=ProductType.Collection,
+                subtype="PDS4 Collection",
+                node_id="img",
+                doi=doi_value,
+                transaction_key=transaction_key,
+                is_latest=True,
+            )
+        )
+
+        # Mirror the state of the DOI as if returned by a recent request to DataCite
+        record = copy.deepcopy(findable_record)
+        record["id"] = record["attributes"]["doi"] = doi_value.upper()
+
+        provider_mirror = self._action.m_transaction_builder.m_provider_mirror
+        self.assertEqual(provider_mirror.mirror_label(json.dumps({"data": record})), 1)
+
+        queries = []
+
+        def webclient_query_patch_mirrored(query, **kwargs):
+            queries.append(query)
+            return json.dumps({"data": []})
+
+        with patch.object(self._action._web_client, "query_doi", webclient_query_patch_mirrored), patch.dict(
+            os.environ, {"OTHER_TRANSACTION_DIR": transaction_dir}
+        ):
+            pending_records = self._action.run(email=False)
+
+        # The provider should not have been queried for the mirrored DOI
+        self.assertListEqual(queries, [])
+        self.assertEqual(len(pending_records), 1)
+        self.assertEqual(pending_records[0]["previous_status"], DoiStatus.Pending)
+        self.assertEqual(pending_records[0]["status"], DoiStatus.Findable)
+
+        # Mirrored state older than the maximum age is not used
+        self.assertDictEqual(provider_mirror.get_dois([doi_value], max_age=0), {})
+
     @patch.object(pds_doi_service.core.util.config_parser.DOIConfigUtil, "get_config", get_local_smtp_patched_config)
     @patch.object(
         pds_doi_service.core.outputs.osti.osti_web_client.DOIOstiWebClient, "query_doi", webclient_query_patch_nominal
@@ -25,6 +25,7 @@ from pds_doi_service.core.outputs.service import DOIServiceFactory
 from pds_doi_service.core.outputs.web_client import WEB_METHOD_POST
 from pds_doi_service.core.test_utils import close_all_database_connections
 from pds_doi_service.core.test_utils import safe_remove_file
+from pds_doi_service.core.util.keyword_tokenizer import KeywordTokenizer
 
 
 # TODO: add additional unit tests for other list query parameters
@@ -217,6 +218,49 @@ class ListActionTestCase(unittest.TestCase):
 
         self.assertEqual(len(list_result), 0)
 
+    @patch.object(
+        pds_doi_service.core.outputs.osti.osti_web_client.DOIOstiWebClient, "submit_content", webclient_submit_patch
+    )
+    @patch.object(
+        pds_doi_service.core.outputs.datacite.datacite_web_client.DOIDataCiteWebClient,
+        "submit_content",
+        webclient_submit_patch,
+    )
+    @patch.dict(os.environ, {"OTHER_NLTK_DOWNLOAD": "false"})
+    def test_list_by_query(self):
+        """Test listing of entries, querying by full-text search"""
+        # Keywords are extracted from the PDS4 label with nltk, so skip rather
+        # than download its corpora when they are not available locally
+        try:
+            KeywordTokenizer()
+        except RuntimeError as err:
+            self.skipTest(str(err))
+
+        reserve_kwargs = {
+            "input": join(self.input_dir, "pds4_bundle_with_contributors.xml"),
+            "node": "img",
+            "submitter": "my_user@my_node.gov",
+            "force": True,
+        }
+
+        self._reserve_action.run(**reserve_kwargs)
+
+        # Search terms may match the title, description or authors
+        for query in ("insight camera", "cam* data", "maki"):
+            list_result = json.loads(self._list_action.run(query=query))
+
+            self.assertEqual(len(list_result), 1, query)
+            self.assertEqual(list_result[0]["doi"], "10.17189/abc123")
+
+        list_result = json.loads(self._list_action.run(query="feldspars"))
+
+        self.assertEqual(len(list_result), 0)
+
+        # Pages beyond the results should be empty
+        list_result = json.loads(self._list_action.run(query="insight", limit=1, offset=1))
+
+        self.assertEqual(len(list_result), 0)
+
     @patch.object(
         pds_doi_service.core.outputs.osti.osti_web_client.DOIOstiWebClient, "submit_content", webclient_submit_patch
     )
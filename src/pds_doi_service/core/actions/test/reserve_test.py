@@ -7,14 +7,18 @@ from os.path import abspath
 from os.path import join
 from unittest.mock import patch
 
+import pds_doi_service.core.outputs.circuit_breaker
 import pds_doi_service.core.outputs.datacite.datacite_web_client
 import pds_doi_service.core.outputs.osti.osti_web_client
+from pds_doi_service.benchmark.fake_datacite import FakeDataCiteServer
 from pds_doi_service.core.actions.reserve import DOICoreActionReserve
 from pds_doi_service.core.entities.doi import DoiStatus
 from pds_doi_service.core.entities.doi import ProductType
+from pds_doi_service.core.entities.exceptions import CriticalDOIException
 from pds_doi_service.core.outputs.doi_record import CONTENT_TYPE_JSON
 from pds_doi_service.core.outputs.doi_record import CONTENT_TYPE_XML
 from pds_doi_service.core.outputs.service import DOIServiceFactory
+from pds_doi_service.core.outputs.service import SERVICE_TYPE_DATACITE
 from pds_doi_service.core.outputs.web_client import WEB_METHOD_POST
 from pds_doi_service.core.test_utils import close_all_database_connections
 from pds_doi_service.core.test_utils import safe_remove_file
@@ -427,6 +431,92 @@ class ReserveActionTestCase(unittest.TestCase):
         self.assertIsInstance(doi.publication_date, datetime)
         self.assertIsInstance(doi.date_record_added, datetime)
 
+    @unittest.skipIf(
+        DOIServiceFactory.get_service_type() != SERVICE_TYPE_DATACITE, "The fake server only stands in for DataCite"
+    )
+    def test_reserve_provider_unavailable(self):
+        """
+        Test Reserve action against an unavailable fake DataCite server, which
+        fails fast once the circuit breaker opens, or queues the submissions
+        in the provider outbox when enabled.
+        """
+        reserve_kwargs = {
+            "input": join(self.input_dir, "spreadsheet_with_pds4_identifiers.csv"),
+            "node": "img",
+            "submitter": "my_user@my_node.gov",
+            "force": True,
+        }
+
+        with FakeDataCiteServer() as server, patch.dict(
+            os.environ,
+            {
+                "DATACITE_URL": server.dois_url,
+                "DATACITE_USER": "test",
+                "DATACITE_PASSWORD": "test",
+                "OTHER_PROVIDER_BREAKER_THRESHOLD": "1",
+                "OTHER_PROVIDER_BREAKER_RESET_TIMEOUT": "60",
+            },
+        ), patch.dict(pds_doi_service.core.outputs.circuit_breaker._circuit_breakers, clear=True):
+            server.available = False
+
+            with patch.dict(os.environ, {"OTHER_OUTBOX_ENABLED": "false"}), self.assertRaises(CriticalDOIException):
+                DOICoreActionReserve(db_name=self.db_name).run(**reserve_kwargs)
+
+            with patch.dict(os.environ, {"OTHER_OUTBOX_ENABLED": "true"}):
+                reserve_action = DOICoreActionReserve(db_name=self.db_name)
+                self.addCleanup(close_all_database_connections, reserve_action.m_transaction_builder)
+
+                o_doi_label = reserve_action.run(**reserve_kwargs)
+
+            # The breaker opened on the first failed request, so the rest failed fast
+            self.assertDictEqual(server.request_counts, {"POST": 1})
+
+        dois, errors = self._web_parser.parse_dois_from_label(o_doi_label, content_type=CONTENT_TYPE_JSON)
+
+        self.assertEqual(len(dois), 3)
+        self.assertEqual(len(reserve_action.queued_dois), 3)
+
+        # Nothing is logged until the queued submissions are replayed
+        doi_database = reserve_action.m_transaction_builder.m_doi_database
+        queued = doi_database.select_outbox_entries()
+
+        self.assertListEqual([entry["identifier"] for entry in queued], [doi.pds_identifier for doi in dois])
+        self.assertListEqual(doi_database.select_latest_rows({})[1], [])
+
+    @unittest.skipIf(
+        DOIServiceFactory.get_service_type() != SERVICE_TYPE_DATACITE, "The fake server only stands in for DataCite"
+    )
+    def test_reserve_read_timeout(self):
+        """
+        Test that a reserve request which times out once sent is never queued
+        in the provider outbox, as the provider may have created the DOI
+        regardless, but fails as usual.
+        """
+        with FakeDataCiteServer(latency=0.5) as server, patch.dict(
+            os.environ,
+            {
+                "DATACITE_URL": server.dois_url,
+                "DATACITE_USER": "test",
+                "DATACITE_PASSWORD": "test",
+                "OTHER_OUTBOX_ENABLED": "true",
+                "OTHER_PROVIDER_READ_TIMEOUT": "0.1",
+            },
+        ), patch.dict(pds_doi_service.core.outputs.circuit_breaker._circuit_breakers, clear=True):
+            reserve_action = DOICoreActionReserve(db_name=self.db_name)
+            self.addCleanup(close_all_database_connections, reserve_action.m_transaction_builder)
+
+            with self.assertRaises(CriticalDOIException) as context:
+                reserve_action.run(
+                    input=join(self.input_dir, "spreadsheet_with_pds4_identifiers.csv"),
+                    node="img",
+                    submitter="my_user@my_node.gov",
+                    force=True,
+                )
+
+        self.assertIn("timed out", str(context.exception))
+        self.assertListEqual(reserve_action.queued_dois, [])
+        self.assertListEqual(reserve_action.m_transaction_builder.m_doi_database.select_outbox_entries(), [])
+
 
 if __name__ == "__main__":
     unittest.main()
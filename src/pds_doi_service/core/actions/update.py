@@ -13,6 +13,7 @@ Contains the definition for the Update action of the Core PDS DOI Service.
 """
 from pds_doi_service.core.actions import DOICoreAction
 from pds_doi_service.core.actions.list import DOICoreActionList
+from pds_doi_service.core.db.transaction_label_cache import get_transaction_label_cache
 from pds_doi_service.core.entities.doi import Doi
 from pds_doi_service.core.entities.doi import DoiStatus
 from pds_doi_service.core.entities.exceptions import collect_exception_classes_and_messages
@@ -32,6 +33,7 @@ from pds_doi_service.core.outputs.service import DOIServiceFactory
 from pds_doi_service.core.util.general_util import get_global_keywords
 from pds_doi_service.core.util.general_util import get_logger
 from pds_doi_service.core.util.node_util import NodeUtil
+from pds_doi_service.core.util.profiling import traced
 
 logger = get_logger(__name__)
 
@@ -162,6 +164,7 @@ class DOICoreActionUpdate(DOICoreAction):
 
         return updated_doi
 
+    @traced("complete")
     def _complete_dois(self, dois):
         """
         Ensures the list of DOI objects to reserve have the requisite fields,
@@ -250,16 +253,12 @@ class DOICoreActionUpdate(DOICoreAction):
         # Get the record from the transaction database for the current DOI value
         transaction_record = self._list_action.transaction_for_identifier(pds_identifier)
 
-        # Get the last output label associated with the transaction.
-        # This represents the latest version of the metadata for the DOI.
-        output_label = self._list_action.output_label_for_transaction(transaction_record)
-
-        # Output labels can contain multiple entries, so get only the one for
-        # the current DOI value
-        existing_doi_label, _ = self._web_parser.get_record_for_identifier(output_label, pds_identifier)
-
-        # Parse the existing Doi object, and meld it with the new one
-        existing_dois, _ = self._web_parser.parse_dois_from_label(existing_doi_label)
+        # Get the entry for the current DOI value from the last output label
+        # associated with the transaction. This represents the latest version
+        # of the metadata for the DOI.
+        _, _, existing_dois = get_transaction_label_cache().get_record_for_identifier(
+            transaction_record["transaction_key"], pds_identifier, self._web_parser
+        )
 
         return existing_dois[0]
 
@@ -267,19 +266,16 @@ class DOICoreActionUpdate(DOICoreAction):
         # Get the record from the transaction database for the current DOI value
         transaction_record = self._list_action.transaction_for_doi(doi_identifier)
 
-        # Get the last output label associated with the transaction.
-        # This represents the latest version of the metadata for the DOI.
-        output_label = self._list_action.output_label_for_transaction(transaction_record)
-
-        # Output labels can contain multiple entries, so get only the one for
-        # the current DOI value
-        existing_doi_label, _ = self._web_parser.get_record_for_doi(output_label, doi_identifier)
-
-        # Parse the existing Doi object, and meld it with the new one
-        existing_dois, _ = self._web_parser.parse_dois_from_label(existing_doi_label)
+        # Get the entry for the current DOI value from the last output label
+        # associated with the transaction. This represents the latest version
+        # of the metadata for the DOI.
+        _, _, existing_dois = get_transaction_label_cache().get_record_for_doi(
+            transaction_record["transaction_key"], transaction_record["identifier"], doi_identifier, self._web_parser
+        )
 
         return existing_dois[0]
 
+    @traced("validate")
     def _validate_dois(self, dois):
         """
         Validates the list of DOI objects prior to their submission.
@@ -309,10 +305,10 @@ class DOICoreActionUpdate(DOICoreAction):
 
         for doi in dois:
             try:
-                single_doi_label = self._record_service.create_doi_record(doi)
+                single_doi_payload = self._record_service.create_doi_payload(doi)
 
                 # Validate the label representation of the DOI
-                self._validator_service.validate(single_doi_label)
+                self._validator_service.validate(single_doi_payload)
 
                 # Validate the object representation of the DOI
                 self._doi_validator.validate_update_request(doi)
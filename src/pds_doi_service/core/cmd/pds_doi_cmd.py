@@ -17,6 +17,7 @@ import os
 
 from pds_doi_service.core.actions.action import DOICoreAction
 from pds_doi_service.core.util.general_util import get_logger
+from pds_doi_service.core.util.profiling import profile
 
 logger = get_logger(__name__)
 
@@ -33,10 +34,11 @@ def main():
     1. Creates and parses command-line arguments using DOICoreAction's parser
     2. Dynamically imports the appropriate action module based on the subcommand
     3. Instantiates the corresponding action class
-    4. Executes the action with the provided arguments
+    4. Executes the action with the provided arguments, profiling the run if
+       requested by the --profile or --trace-spans arguments
     5. Prints any output returned by the action
 
-    Supported subcommands include: reserve, release, update, check, list, roundup
+    Supported subcommands include: reserve, release, update, bulk-update, check, list, roundup
 
     Returns
     -------
@@ -50,8 +52,10 @@ def main():
     # Moved many argument parsing to each action class.
     logger.info(f"run_dir {os.getcwd()}")
 
-    module = importlib.import_module(f"pds_doi_service.core.actions.{action_type}")
-    action_class = getattr(module, f"DOICoreAction{action_type.capitalize()}")
+    # Hyphenated subcommands (e.g. bulk-update) map to snake_case modules and
+    # CamelCase class names (e.g. bulk_update.DOICoreActionBulkUpdate)
+    module = importlib.import_module(f"pds_doi_service.core.actions.{action_type.replace('-', '_')}")
+    action_class = getattr(module, f"DOICoreAction{''.join(part.capitalize() for part in action_type.split('-'))}")
     action = action_class()
 
     # Convert the argparse.Namespace to a dictionary that we can feed in as kwargs
@@ -60,7 +64,12 @@ def main():
     # No action subclasses should be expecting subcommand, so remove it here
     kwargs.pop("subcommand", None)
 
-    output = action.run(**kwargs)
+    # Profiling options are handled here rather than by the action itself
+    profile_file = kwargs.pop("profile", None)
+    trace_file = kwargs.pop("trace_spans", None)
+
+    with profile(action_type, profile_file=profile_file, trace_file=trace_file):
+        output = action.run(**kwargs)
 
     if output is not None:
         print(output)
@@ -0,0 +1,13 @@
+# encoding: utf-8
+"""
+Planetary Data System's Digital Object Identifier service — tests for the command-line interface
+"""
+import unittest
+
+from . import pds_doi_cmd_test
+
+
+def suite():
+    suite = unittest.TestSuite()
+    suite.addTests(unittest.defaultTestLoader.loadTestsFromModule(pds_doi_cmd_test))
+    return suite
@@ -0,0 +1,68 @@
+#!/usr/bin/env python
+import json
+import os
+import subprocess
+import sys
+import unittest
+
+IMPORT_TIME_BUDGET = 1.0
+"""Maximum number of seconds allowed to import the CLI and build its argument parser"""
+
+HEAVY_MODULES = ["jinja2", "jsonschema", "nltk", "openpyxl", "pandas", "requests", "xmlschema"]
+"""Modules that should only be imported once an action actually requires them"""
+
+# Run in a fresh interpreter, so modules imported by other tests do not
+# mask what the CLI itself imports
+_IMPORT_SCRIPT = """
+import json
+import sys
+import time
+
+start = time.perf_counter()
+
+from pds_doi_service.core.actions.action import DOICoreAction
+from pds_doi_service.core.cmd import pds_doi_cmd  # noqa: F401
+
+DOICoreAction.create_cmd_parser().parse_args(["list"])
+
+from pds_doi_service.core.actions.list import DOICoreActionList  # noqa: F401
+
+elapsed = time.perf_counter() - start
+
+print(json.dumps({"elapsed": elapsed, "modules": sorted(sys.modules)}))
+"""
+
+
+class PdsDoiCmdImportTestCase(unittest.TestCase):
+    """Tests for the startup cost of the pds-doi-cmd script"""
+
+    @classmethod
+    def setUpClass(cls):
+        env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+
+        result = subprocess.run(
+            [sys.executable, "-c", _IMPORT_SCRIPT], capture_output=True, text=True, check=True, env=env
+        )
+
+        cls.import_report = json.loads(result.stdout.strip().splitlines()[-1])
+
+    def test_heavy_modules_not_imported(self):
+        """Test that building the parser for the list action does not import heavy dependencies"""
+        imported_modules = {module.split(".")[0] for module in self.import_report["modules"]}
+
+        for heavy_module in HEAVY_MODULES:
+            self.assertNotIn(heavy_module, imported_modules, f"{heavy_module} imported at CLI startup")
+
+    def test_provider_modules_not_imported(self):
+        """Test that no service provider implementation is imported until requested"""
+        for module in self.import_report["modules"]:
+            self.assertFalse(module.startswith("pds_doi_service.core.outputs.osti."), module)
+            self.assertFalse(module.startswith("pds_doi_service.core.outputs.datacite."), module)
+
+    def test_import_time_budget(self):
+        """Test that the CLI imports within the startup time budget"""
+        self.assertLess(self.import_report["elapsed"], IMPORT_TIME_BUDGET)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -13,23 +13,79 @@ Contains classes and functions for interfacing with the local transaction
 database (SQLite3).
 """
 import dataclasses
+import hashlib
+import json
 import os
+import re
 import sqlite3
 import stat
+import string
+import sys
+import time
+import uuid
 from collections import OrderedDict
+from contextlib import contextmanager
 from datetime import datetime
 from datetime import timezone
+from pathlib import Path
 from sqlite3 import Error
 
+from dateutil.parser import isoparse
 from pds_doi_service.core.entities.doi import DoiRecord
 from pds_doi_service.core.entities.doi import DoiStatus
 from pds_doi_service.core.entities.doi import ProductType
 from pds_doi_service.core.util.config_parser import DOIConfigUtil
 from pds_doi_service.core.util.general_util import get_logger
+from pds_doi_service.core.util.metrics import DB_QUERY_DURATION
+from pds_doi_service.core.util.metrics import metrics_enabled
+from pds_doi_service.core.util.profiling import traced
+from pds_doi_service.core.util.title_similarity import title_buckets
+from pds_doi_service.core.util.title_similarity import title_similarity
 
 # Get the common logger and set the level for this file.
 logger = get_logger(__name__)
 
+ASCII_LOWERCASE = str.maketrans(string.ascii_uppercase, string.ascii_lowercase)
+"""Translation table which lower-cases only ASCII letters, as does the SQLite lower() function"""
+
+
+class InstrumentedCursor(sqlite3.Cursor):
+    """
+    Cursor which records the number and duration of the statements it executes,
+    labeled by statement type (SELECT, INSERT, etc.).
+    """
+
+    def _timed(self, func, sql, *args):
+        statement = sql.lstrip().split(None, 1)[0].upper() if sql.strip() else "UNKNOWN"
+        start = time.perf_counter()
+
+        try:
+            return func(sql, *args)
+        finally:
+            DB_QUERY_DURATION.observe(time.perf_counter() - start, statement=statement)
+
+    def execute(self, sql, *args):
+        return self._timed(super().execute, sql, *args)
+
+    def executemany(self, sql, *args):
+        return self._timed(super().executemany, sql, *args)
+
+
+class InstrumentedConnection(sqlite3.Connection):
+    """
+    Connection whose cursors, including those created implicitly by the
+    execute() shortcuts, record statement metrics.
+    """
+
+    def cursor(self, factory=InstrumentedCursor):
+        return super().cursor(factory)
+
+    def execute(self, sql, *args):
+        return self.cursor().execute(sql, *args)
+
+    def executemany(self, sql, *args):
+        return self.cursor().executemany(sql, *args)
+
 
 class DOIDataBase:
     """
@@ -62,11 +118,71 @@ class DOIDataBase:
     EXPECTED_NUM_COLS = len(DOI_DB_SCHEMA)
     """"The expected number of columns as defined by the schema."""
 
+    SEARCH_TABLE_SUFFIX = "_search"
+    """Suffix appended to the name of a transaction table to name its full-text search index."""
+
+    SEARCH_COLUMN_WEIGHTS = OrderedDict({"title": 10.0, "description": 5.0, "keywords": 2.0, "authors": 1.0})
+    """
+    The columns of the full-text search index, mapped to the weight given to
+    matches within each when ranking search results.
+    """
+
+    TITLE_TABLE_SUFFIX = "_title"
+    """Suffix appended to the name of a transaction table to name the table of its normalized titles."""
+
+    TITLE_BAND_TABLE_SUFFIX = "_title_band"
+    """Suffix appended to the name of a transaction table to name its near-duplicate title (LSH) index."""
+
+    CHANGES_TABLE_SUFFIX = "_changes"
+    """Suffix appended to the name of a transaction table to name the table holding its change counter."""
+
+    PROVIDER_MIRROR_TABLE_SUFFIX = "_provider_mirror"
+    """Suffix appended to the name of a transaction table to name the table mirroring its records at the provider."""
+
+    IDEMPOTENCY_TABLE_SUFFIX = "_idempotency"
+    """Suffix appended to the name of a transaction table to name the table of API request idempotency keys."""
+
+    OUTBOX_TABLE_SUFFIX = "_outbox"
+    """Suffix appended to the name of a transaction table to name the table of its queued provider submissions."""
+
+    OUTBOX_COLUMNS = (
+        "id",
+        "action",
+        "submitter",
+        "identifier",
+        "doi",
+        "method",
+        "url",
+        "content_type",
+        "payload",
+        "created",
+        "claimed",
+        "attempts",
+        "failed",
+        "last_error",
+    )
+    """Columns of the outbox table, in the order returned by select_outbox_entries()."""
+
+    SCHEMA_VERSION = 1
+    """
+    Version of the tables and indexes supporting the transaction table, stored
+    in the user_version of the database once migrate_schema() has created them.
+    Increment it whenever a migration is added to migrate_schema().
+    """
+
+    PREFIX_INDEX_COLUMNS = ("identifier", "doi")
+    """
+    Columns indexed on their lower-cased values, so that case-insensitive
+    prefix (trailing wildcard) queries on them can be answered from an index.
+    """
+
     def __init__(self, db_file):
         self._config = DOIConfigUtil().get_config()
         self.m_database_name = db_file
         self.m_default_table_name = "doi"
         self.m_my_conn = None
+        self._batch_depth = 0
+        self._search_enabled = None
 
     def get_database_name(self):
         """Returns the name of the SQLite database."""
@@ -93,7 +209,10 @@ class DOIDataBase:
         logger.info("Connecting to SQLite3 (ver %s) database %s", sqlite3.version, self.m_database_name)
 
         try:
-            self.m_my_conn = sqlite3.connect(self.m_database_name)
+            # Only pay for statement instrumentation when metrics are being collected
+            factory = InstrumentedConnection if metrics_enabled() else sqlite3.Connection
+
+            self.m_my_conn = sqlite3.connect(self.m_database_name, factory=factory)
         except Error as my_error:
             logger.error("Failed to connect to database, reason: %s", my_error)
 
@@ -118,11 +237,43 @@ class DOIDataBase:
         if not self.m_my_conn:
             self.create_connection()
 
-            if not self.check_if_table_exists(table_name):
+            table_created = not self.check_if_table_exists(table_name)
+
+            if table_created:
                 self.create_table(table_name)
 
+            # Only migrate databases created before the current schema version,
+            # so that connecting to an up-to-date database never writes to it
+            if table_created or self.read_schema_version() < self.SCHEMA_VERSION:
+                self.migrate_schema(table_name)
+            else:
+                self._search_enabled = self.check_if_table_exists(table_name + self.SEARCH_TABLE_SUFFIX)
+
         return self.m_my_conn
 
+    def read_schema_version(self):
+        """Returns the schema version recorded in the user_version of the database."""
+        return self.m_my_conn.execute("PRAGMA user_version").fetchone()[0]
+
+    def migrate_schema(self, table_name):
+        """
+        Creates the tables and indexes supporting the given transaction table
+        which do not already exist, then records the current SCHEMA_VERSION
+        in the user_version of the database.
+        """
+        logger.info("Migrating database %s to schema version %d", self.m_database_name, self.SCHEMA_VERSION)
+
+        self.create_changes_table(table_name)
+        self.create_prefix_indexes(table_name)
+        self.create_search_table(table_name)
+        self.create_title_index(table_name)
+        self.create_provider_mirror_table(table_name)
+        self.create_idempotency_table(table_name)
+        self.create_outbox_table(table_name)
+
+        self.m_my_conn.execute(f"PRAGMA user_version = {self.SCHEMA_VERSION}")
+        self._commit()
+
     def check_if_table_exists(self, table_name):
         """
         Check if the expected default table exists in the current database.
@@ -266,15 +417,792 @@ class DOIDataBase:
 
         logger.info("Table created successfully")
 
-    def write_doi_info_to_database(self, doi_record):
+    def create_changes_table(self, table_name):
+        """
+        Creates the table holding the change counter of the given transaction
+        table, if it does not already exist.
+
+        The table holds a single row, with a counter incremented by each write
+        to the transaction table, and a random identifier assigned when the
+        counter is created. Together these identify a version of the contents
+        of the transaction table, even when a database is deleted and recreated.
+        """
+        changes_table_name = table_name + self.CHANGES_TABLE_SUFFIX
+
+        self.m_my_conn.execute(
+            f"CREATE TABLE IF NOT EXISTS {changes_table_name} "
+            f"(id INTEGER PRIMARY KEY CHECK (id = 0), instance TEXT NOT NULL, counter INTEGER NOT NULL)"
+        )
+        self.m_my_conn.execute(
+            f"INSERT OR IGNORE INTO {changes_table_name} (id, instance, counter) VALUES (0, ?, 0)",
+            (uuid.uuid4().hex,),
+        )
+
+        self._commit()
+
+    def _increment_change_counter(self, table_name):
+        """Increments the change counter of the given transaction table, as part of the current transaction."""
+        self.m_my_conn.execute(f"UPDATE {table_name}{self.CHANGES_TABLE_SUFFIX} SET counter = counter + 1")
+
+    @classmethod
+    def read_change_counter(cls, db_file, table_name="doi"):
+        """
+        Returns the change counter of a transaction table, reading it through a
+        short-lived, read-only connection to the database so the check is cheap
+        enough to make on every request.
+
+        Parameters
+        ----------
+        db_file : str
+            Path to the SQLite database.
+        table_name : str, optional
+            Name of the transaction table. Defaults to "doi".
+
+        Returns
+        -------
+        change_counter : tuple of (str, int) or None
+            The random identifier of the counter and its current value, or None
+            if the database or its change counter does not exist yet.
+
+        """
+        try:
+            connection = sqlite3.connect(f"{Path(db_file).absolute().as_uri()}?mode=ro", uri=True)
+        except sqlite3.Error:
+            return None
+
+        try:
+            return connection.execute(
+                f"SELECT instance, counter FROM {table_name}{cls.CHANGES_TABLE_SUFFIX} WHERE id = 0"
+            ).fetchone()
+        except sqlite3.Error:
+            return None
+        finally:
+            connection.close()
+
+    def create_prefix_indexes(self, table_name):
+        """
+        Creates the indexes on the lower-cased values of each of the
+        PREFIX_INDEX_COLUMNS of the given transaction table, if they do not
+        already exist.
+        """
+        for column in self.PREFIX_INDEX_COLUMNS:
+            self.m_my_conn.execute(
+                f"CREATE INDEX IF NOT EXISTS {table_name}_{column}_lower_idx ON {table_name} (lower({column}))"
+            )
+
+        self._commit()
+
+    def create_search_table(self, table_name):
+        """
+        Creates the full-text search index for the given transaction table,
+        if it does not already exist.
+
+        The index holds one row per DOI, sharing the rowid of the latest
+        transaction row for the DOI. When the index is first created for an
+        existing table, it is populated from the latest rows (see
+        backfill_search_table()).
+
+        If the SQLite library does not provide the FTS5 extension, full-text
+        search is disabled, and search queries fall back to matching titles.
+        """
+        search_table_name = table_name + self.SEARCH_TABLE_SUFFIX
+
+        if self.check_if_table_exists(search_table_name):
+            self._search_enabled = True
+            return
+
+        columns = ", ".join(self.SEARCH_COLUMN_WEIGHTS)
+
+        try:
+            self.m_my_conn.execute(
+                f"CREATE VIRTUAL TABLE {search_table_name} USING fts5({columns}, tokenize='porter unicode61')"
+            )
+        except sqlite3.OperationalError as err:
+            logger.warning("Full-text search is unavailable for database %s, reason: %s", self.m_database_name, err)
+            self._search_enabled = False
+        else:
+            logger.info('Created full-text search table "%s"', search_table_name)
+            self._search_enabled = True
+
+            self.backfill_search_table(table_name)
+
+    def backfill_search_table(self, table_name):
+        """
+        Populates the full-text search index of the given transaction table
+        from its latest rows.
+
+        As with write_doi_info_to_database(), the description, keywords and
+        authors of each DOI are indexed along with its title. These are read
+        from the output label of the latest transaction for the DOI, falling
+        back to just the title of the row when the label cannot be read.
+
+        Parameters
+        ----------
+        table_name : str
+            Name of the transaction table to index.
+
+        Returns
+        -------
+        count : int
+            The number of DOIs indexed.
+
+        """
+        rows = self.m_my_conn.execute(
+            f"SELECT rowid, doi, identifier, title, transaction_key FROM {table_name} WHERE is_latest=1"
+        ).fetchall()
+
+        if not rows:
+            return 0
+
+        # Imported here to avoid circular imports with the transaction and output modules
+        from pds_doi_service.core.db.transaction_label_cache import TransactionLabelCache
+        from pds_doi_service.core.outputs.service import DOIServiceFactory
+
+        # Each label is only read once, so there is no use in caching them
+        label_cache = TransactionLabelCache(max_size=0)
+        web_parser = DOIServiceFactory.get_web_parser_service()
+
+        search_rows = []
+        num_titles_only = 0
+
+        for rowid, doi, identifier, title, transaction_key in rows:
+            try:
+                _, _, dois = label_cache.get_record_for_doi(transaction_key, identifier, doi, web_parser)
+                search_fields = self.search_fields_for_doi(dois[0])
+            except Exception as err:
+                logger.debug("Indexing only the title of DOI %s, reason: %s", doi, err)
+                search_fields = {"title": title or ""}
+                num_titles_only += 1
+
+            search_rows.append((rowid, *(search_fields.get(column, "") for column in self.SEARCH_COLUMN_WEIGHTS)))
+
+        self.m_my_conn.executemany(
+            f"INSERT INTO {table_name}{self.SEARCH_TABLE_SUFFIX} (rowid, {', '.join(self.SEARCH_COLUMN_WEIGHTS)}) "
+            f"VALUES (?, {', '.join(['?'] * len(self.SEARCH_COLUMN_WEIGHTS))})",
+            search_rows,
+        )
+
+        self._commit()
+
+        if num_titles_only:
+            logger.warning(
+                "Indexed only the titles of %d DOI(s) whose transaction label could not be read", num_titles_only
+            )
+
+        logger.info("Indexed %d DOI(s) for full-text search", len(search_rows))
+
+        return len(search_rows)
+
+    def create_title_index(self, table_name):
+        """
+        Creates the near-duplicate title index for the given transaction table,
+        if it does not already exist.
+
+        The index consists of a table holding the normalized title of the
+        latest transaction row for each DOI, and a table of the LSH buckets
+        of each title (see title_similarity.py), both keyed by the rowid of
+        the transaction row. When the index is first created for an existing
+        table, it is populated from the latest rows.
+        """
+        title_table_name = table_name + self.TITLE_TABLE_SUFFIX
+        band_table_name = table_name + self.TITLE_BAND_TABLE_SUFFIX
+
+        if self.check_if_table_exists(title_table_name) and self.check_if_table_exists(band_table_name):
+            return
+
+        self.m_my_conn.execute(
+            f"CREATE TABLE IF NOT EXISTS {title_table_name} "
+            f"(row_id INTEGER PRIMARY KEY, normalized_title TEXT NOT NULL)"
+        )
+        self.m_my_conn.execute(
+            f"CREATE INDEX IF NOT EXISTS {title_table_name}_normalized_idx ON {title_table_name} (normalized_title)"
+        )
+        self.m_my_conn.execute(
+            f"CREATE TABLE IF NOT EXISTS {band_table_name} "
+            f"(band INTEGER NOT NULL, bucket INTEGER NOT NULL, row_id INTEGER NOT NULL, "
+            f"PRIMARY KEY (band, bucket, row_id)) WITHOUT ROWID"
+        )
+        self.m_my_conn.execute(f"CREATE INDEX IF NOT EXISTS {band_table_name}_row_idx ON {band_table_name} (row_id)")
+
+        logger.info('Created near-duplicate title index "%s"', band_table_name)
+
+        self.rebuild_title_index(table_name)
+
+    def rebuild_title_index(self, table_name=None):
+        """
+        Rebuilds the near-duplicate title index of the given transaction table
+        from the titles of the latest transaction row for each DOI.
+
+        Parameters
+        ----------
+        table_name : str, optional
+            Name of the transaction table to rebuild the index for. Defaults
+            to the default table.
+
+        Returns
+        -------
+        count : int
+            The number of titles indexed.
+
+        """
+        if not table_name:
+            table_name = self.m_default_table_name
+
+        self.m_my_conn = self.get_connection(table_name)
+
+        title_rows = []
+        band_rows = []
+
+        for rowid, title in self.m_my_conn.execute(f"SELECT rowid, title FROM {table_name} WHERE is_latest=1"):
+            normalized_title, buckets = title_buckets(title)
+
+            title_rows.append((rowid, normalized_title))
+            band_rows.extend((band, bucket, rowid) for band, bucket in buckets)
+
+        self.m_my_conn.execute(f"DELETE FROM {table_name}{self.TITLE_TABLE_SUFFIX}")
+        self.m_my_conn.execute(f"DELETE FROM {table_name}{self.TITLE_BAND_TABLE_SUFFIX}")
+
+        self.m_my_conn.executemany(
+            f"INSERT INTO {table_name}{self.TITLE_TABLE_SUFFIX} (row_id, normalized_title) VALUES (?, ?)", title_rows
+        )
+        self.m_my_conn.executemany(
+            f"INSERT INTO {table_name}{self.TITLE_BAND_TABLE_SUFFIX} (band, bucket, row_id) VALUES (?, ?, ?)",
+            band_rows,
+        )
+
+        self._commit()
+
+        logger.info("Indexed %d title(s) for near-duplicate detection", len(title_rows))
+
+        return len(title_rows)
+
+    @staticmethod
+    def search_fields_for_doi(doi):
+        """
+        Returns the text of the fields of the provided Doi object which are
+        indexed for full-text search, keyed by search index column.
+        """
+        authors = []
+
+        for author in doi.authors or []:
+            name = author.get("name") or " ".join(
+                filter(None, (author.get("first_name"), author.get("middle_name"), author.get("last_name")))
+            )
+            authors.append(name)
+
+        return {
+            "title": doi.title or "",
+            "description": doi.description or "",
+            "keywords": " ".join(sorted(doi.keywords or [])),
+            "authors": "; ".join(filter(None, authors)),
+        }
+
+    def _commit(self):
+        """Commits the current transaction, unless writes are being batched."""
+        if not self._batch_depth:
+            self.m_my_conn.commit()
+
+    @contextmanager
+    def batch_writes(self):
+        """
+        Context manager which groups all rows written within it into a single
+        database transaction, committed once the context exits. If an
+        exception is raised within the context, all writes are rolled back.
+        Nested contexts are committed by the outermost context.
+        """
+        connection = self.get_connection()
+
+        self._batch_depth += 1
+
+        try:
+            yield
+        except BaseException:
+            if self._batch_depth == 1:
+                logger.error("Rolling back batched writes to database %s", self.m_database_name)
+                connection.rollback()
+            raise
+        else:
+            if self._batch_depth == 1:
+                connection.commit()
+        finally:
+            self._batch_depth -= 1
+
+    def create_provider_mirror_table(self, table_name):
+        """
+        Creates the table mirroring the latest state of the records of the
+        given transaction table at the DOI service provider, if it does not
+        already exist.
+
+        The table holds one row per DOI, with the attributes of the record as
+        last returned by the provider (as JSON text), the time the provider
+        last updated the record, a hash of the attributes (so changes can be
+        detected without comparing them) and the time the row was written.
+        """
+        mirror_table_name = table_name + self.PROVIDER_MIRROR_TABLE_SUFFIX
+
+        self.m_my_conn.execute(
+            f"CREATE TABLE IF NOT EXISTS {mirror_table_name} "
+            f"(doi TEXT PRIMARY KEY, attributes TEXT NOT NULL, updated INT, etag TEXT NOT NULL, mirrored INT NOT NULL)"
+        )
+
+        self._commit()
+
+    @staticmethod
+    def provider_attributes_etag(attributes):
+        """Returns the hash used to identify the content of the provided provider record attributes."""
+        encoded = json.dumps(attributes, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+
+        return hashlib.sha256(encoded.encode("utf-8")).hexdigest()[:32]
+
+    def write_provider_records(self, attributes_list, table_name=None):
+        """
+        Writes the provided provider record attributes to the provider mirror
+        table, replacing the mirrored state of each DOI unless the mirror holds
+        a more recently updated state.
+
+        Parameters
+        ----------
+        attributes_list : iterable of dict
+            The attributes of each record, as returned by the provider (e.g.
+            the "attributes" object of a DataCite record). Attributes without
+            a "doi" value are ignored.
+        table_name : str, optional
+            Name of the transaction table. Defaults to "doi".
+
+        Returns
+        -------
+        num_written : int
+            The number of records provided with a DOI.
+
+        """
+        if not table_name:
+            table_name = self.m_default_table_name
+
+        self.m_my_conn = self.get_connection()
+        mirrored = int(time.time())
+        rows = []
+
+        for attributes in attributes_list:
+            if not attributes.get("doi"):
+                continue
+
+            try:
+                updated = int(isoparse(attributes["updated"]).timestamp())
+            except (KeyError, TypeError, ValueError):
+                updated = None
+
+            rows.append(
+                (
+                    attributes["doi"].translate(ASCII_LOWERCASE),
+                    json.dumps(attributes, ensure_ascii=False),
+                    updated,
+                    self.provider_attributes_etag(attributes),
+                    mirrored,
+                )
+            )
+
+        mirror_table_name = table_name + self.PROVIDER_MIRROR_TABLE_SUFFIX
+
+        try:
+            self.m_my_conn.executemany(
+                f"INSERT INTO {mirror_table_name} (doi, attributes, updated, etag, mirrored) VALUES (?, ?, ?, ?, ?) "
+                f"ON CONFLICT (doi) DO UPDATE SET attributes = excluded.attributes, updated = excluded.updated, "
+                f"etag = excluded.etag, mirrored = excluded.mirrored "
+                f"WHERE excluded.updated IS NULL OR {mirror_table_name}.updated IS NULL "
+                f"OR excluded.updated >= {mirror_table_name}.updated",
+                rows,
+            )
+
+            self._commit()
+        except sqlite3.Error as err:
+            msg = f"Failed to write {len(rows)} record(s) to the provider mirror, reason: {err}"
+            logger.error(msg)
+            raise RuntimeError(msg)
+
+        logger.debug("Mirrored %d provider record(s)", len(rows))
+
+        return len(rows)
+
+    def select_provider_records(self, dois, max_age=None, table_name=None):
+        """
+        Returns the mirrored provider state of each of the provided DOIs.
+
+        Parameters
+        ----------
+        dois : iterable of str
+            The DOIs to return the mirrored state of.
+        max_age : int, optional
+            If provided, the maximum age, in seconds, of the mirrored state of
+            a DOI for it to be returned.
+        table_name : str, optional
+            Name of the transaction table. Defaults to "doi".
+
+        Returns
+        -------
+        provider_records : dict
+            Dictionary mapping each (lower-cased) DOI found in the mirror to a
+            dictionary of its attributes (as decoded from JSON), and the
+            updated, etag and mirrored values of the mirror row.
+
+        """
+        if not table_name:
+            table_name = self.m_default_table_name
+
+        self.m_my_conn = self.get_connection()
+
+        dois = list({doi.translate(ASCII_LOWERCASE) for doi in dois})
+        criteria = []
+        values = []
+
+        if max_age is not None:
+            criteria.append("mirrored >= ?")
+            values.append(int(time.time()) - max_age)
+
+        provider_records = {}
+
+        # Stay within the SQLite limit on the number of host parameters of a query
+        for start in range(0, len(dois), 500):
+            batch = dois[start : start + 500]
+            query_string = (
+                f"SELECT doi, attributes, updated, etag, mirrored FROM {table_name}{self.PROVIDER_MIRROR_TABLE_SUFFIX} "
+                f"WHERE doi IN ({','.join(['?'] * len(batch))})"
+                + "".join(f" AND {criterion}" for criterion in criteria)
+            )
+
+            for doi, attributes, updated, etag, mirrored in self.m_my_conn.execute(query_string, (*batch, *values)):
+                provider_records[doi] = {
+                    "attributes": json.loads(attributes),
+                    "updated": updated,
+                    "etag": etag,
+                    "mirrored": mirrored,
+                }
+
+        return provider_records
+
+    def create_idempotency_table(self, table_name):
+        """
+        Creates the table of the idempotency keys of requests to the API that
+        write to the given transaction table, if it does not already exist
+        (see pds_doi_service.api.idempotency).
+
+        The table holds one row per key, with a fingerprint of the request
+        first made with the key, the time that request began and, once it
+        completed, the time it completed along with a snapshot of its
+        response (the JSON-encoded body, response code and JSON-encoded headers).
+        """
+        idempotency_table_name = table_name + self.IDEMPOTENCY_TABLE_SUFFIX
+
+        self.m_my_conn.execute(
+            f"CREATE TABLE IF NOT EXISTS {idempotency_table_name} "
+            f"(key TEXT PRIMARY KEY, fingerprint TEXT NOT NULL, created INT NOT NULL, completed INT, "
+            f"response TEXT, response_code INT, headers TEXT)"
+        )
+
+        self._commit()
+
+    def begin_idempotent_request(self, key, fingerprint, max_age, lock_timeout, table_name=None):
+        """
+        Records the start of a request made with the provided idempotency key,
+        unless a request with the same key has already been made.
+
+        Keys recorded more than max_age seconds ago, and keys of requests that
+        have not completed within lock_timeout seconds (such as those of a
+        process that exited mid-request), are expired first.
+
+        Parameters
+        ----------
+        key : str
+            The idempotency key of the request.
+        fingerprint : str
+            Hash identifying the content of the request.
+        max_age : int
+            Number of seconds a key is retained for.
+        lock_timeout : int
+            Number of seconds after which an incomplete request is considered
+            abandoned.
+        table_name : str, optional
+            Name of the transaction table. Defaults to "doi".
+
+        Returns
+        -------
+        existing : dict
+            None if the start of the request was recorded. Otherwise, the
+            fingerprint, created and completed times, response, response_code
+            and headers recorded for the earlier request made with the key.
+
+        """
+        if not table_name:
+            table_name = self.m_default_table_name
+
+        self.m_my_conn = self.get_connection()
+        idempotency_table_name = table_name + self.IDEMPOTENCY_TABLE_SUFFIX
+        now = int(time.time())
+
+        while True:
+            try:
+                self.m_my_conn.execute(
+                    f"DELETE FROM {idempotency_table_name} WHERE created < ? OR (completed IS NULL AND created < ?)",
+                    (now - max_age, now - lock_timeout),
+                )
+
+                cursor = self.m_my_conn.execute(
+                    f"INSERT OR IGNORE INTO {idempotency_table_name} (key, fingerprint, created) VALUES (?, ?, ?)",
+                    (key, fingerprint, now),
+                )
+
+                self._commit()
+            except sqlite3.Error as err:
+                msg = f"Failed to record idempotency key {key}, reason: {err}"
+                logger.error(msg)
+                raise RuntimeError(msg)
+
+            if cursor.rowcount == 1:
+                return None
+
+            existing = self.select_idempotent_request(key, table_name=table_name)
+
+            # The key may have been removed by another process (e.g. after its
+            # request failed) since the insert was ignored, in which case None
+            # would be mistaken for the key being recorded, so try again
+            if existing is not None:
+                return existing
+
+    def select_idempotent_request(self, key, table_name=None):
+        """
+        Returns the fingerprint, created and completed times, response,
+        response_code and headers recorded for the request made with the
+        provided idempotency key, or None if no request was recorded.
+        """
+        if not table_name:
+            table_name = self.m_default_table_name
+
+        self.m_my_conn = self.get_connection()
+
+        row = self.m_my_conn.execute(
+            f"SELECT fingerprint, created, completed, response, response_code, headers "
+            f"FROM {table_name}{self.IDEMPOTENCY_TABLE_SUFFIX} WHERE key = ?",
+            (key,),
+        ).fetchone()
+
+        if not row:
+            return None
+
+        return dict(zip(("fingerprint", "created", "completed", "response", "response_code", "headers"), row))
+
+    def complete_idempotent_request(self, key, response, response_code, headers, table_name=None):
+        """
+        Records the snapshot of the response to the request made with the
+        provided idempotency key, for replay to later requests made with the key.
+
+        Parameters
+        ----------
+        key : str
+            The idempotency key of the request.
+        response : str
+            The JSON-encoded body of the response.
+        response_code : int
+            The HTTP response code of the response.
+        headers : str
+            The JSON-encoded headers of the response.
+        table_name : str, optional
+            Name of the transaction table. Defaults to "doi".
+
+        """
+        if not table_name:
+            table_name = self.m_default_table_name
+
+        self.m_my_conn = self.get_connection()
+        self.m_my_conn.execute(
+            f"UPDATE {table_name}{self.IDEMPOTENCY_TABLE_SUFFIX} "
+            f"SET completed = ?, response = ?, response_code = ?, headers = ? WHERE key = ?",
+            (int(time.time()), response, response_code, headers, key),
+        )
+
+        self._commit()
+
+    def remove_idempotent_request(self, key, table_name=None):
+        """Removes the record of the request made with the provided idempotency key, so the key may be reused."""
+        if not table_name:
+            table_name = self.m_default_table_name
+
+        self.m_my_conn = self.get_connection()
+        self.m_my_conn.execute(f"DELETE FROM {table_name}{self.IDEMPOTENCY_TABLE_SUFFIX} WHERE key = ?", (key,))
+
+        self._commit()
+
+    def create_outbox_table(self, table_name):
+        """
+        Creates the table of submissions to the DOI service provider queued
+        while the provider was unavailable, if it does not already exist
+        (see pds_doi_service.core.db.outbox).
+
+        The table holds one row per submission, in the order they were queued,
+        with the action and submitter the submission was made for, the request
+        to replay (method, URL, content type and payload), the time it was
+        queued and, while it is being replayed, the time it was claimed. The
+        number of replay attempts and the reason the last attempt failed are
+        also recorded, along with the time the provider rejected the submission
+        outright (NULL while it is still pending).
+        """
+        outbox_table_name = table_name + self.OUTBOX_TABLE_SUFFIX
+
+        self.m_my_conn.execute(
+            f"CREATE TABLE IF NOT EXISTS {outbox_table_name} "
+            f"(id INTEGER PRIMARY KEY AUTOINCREMENT, action TEXT NOT NULL, submitter TEXT NOT NULL, identifier TEXT, "
+            f"doi TEXT, method TEXT NOT NULL, url TEXT NOT NULL, content_type TEXT NOT NULL, payload TEXT NOT NULL, "
+            f"created INT NOT NULL, claimed INT, attempts INT NOT NULL DEFAULT 0, failed INT, last_error TEXT)"
+        )
+
+        self._commit()
+
+    def add_outbox_entry(self, action, submitter, identifier, doi, method, url, content_type, payload, table_name=None):
+        """
+        Queues a submission to the DOI service provider for replay.
+
+        Returns
+        -------
+        entry_id : int
+            The ID of the queued submission.
+
+        """
+        if not table_name:
+            table_name = self.m_default_table_name
+
+        self.m_my_conn = self.get_connection()
+
+        try:
+            cursor = self.m_my_conn.execute(
+                f"INSERT INTO {table_name}{self.OUTBOX_TABLE_SUFFIX} "
+                f"(action, submitter, identifier, doi, method, url, content_type, payload, created) "
+                f"VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (action, submitter, identifier, doi, method, url, content_type, payload, int(time.time())),
+            )
+
+            self._commit()
+        except sqlite3.Error as err:
+            msg = f"Failed to queue {action} submission for {identifier or doi}, reason: {err}"
+            logger.error(msg)
+            raise RuntimeError(msg)
+
+        return cursor.lastrowid
+
+    def claim_outbox_entries(self, limit, claim_timeout, table_name=None):
+        """
+        Claims the oldest pending submissions of the outbox for replay.
+
+        The submissions are selected and marked as claimed by a single
+        statement, so concurrent drainers (from any process) never claim the
+        same submission. Submissions claimed more than claim_timeout seconds
+        ago, by a drainer that never completed them, may be claimed again.
+
+        Returns
+        -------
+        entries : list of dict
+            The claimed submissions, oldest first, keyed by OUTBOX_COLUMNS.
+
+        """
+        if not table_name:
+            table_name = self.m_default_table_name
+
+        self.m_my_conn = self.get_connection()
+        outbox_table_name = table_name + self.OUTBOX_TABLE_SUFFIX
+        now = int(time.time())
+
+        try:
+            rows = self.m_my_conn.execute(
+                f"UPDATE {outbox_table_name} SET claimed = ? WHERE id IN "
+                f"(SELECT id FROM {outbox_table_name} WHERE failed IS NULL AND (claimed IS NULL OR claimed < ?) "
+                f"ORDER BY id LIMIT ?) RETURNING {', '.join(self.OUTBOX_COLUMNS)}",
+                (now, now - claim_timeout, limit),
+            ).fetchall()
+
+            self._commit()
+        except sqlite3.Error as err:
+            msg = f"Failed to claim queued submissions, reason: {err}"
+            logger.error(msg)
+            raise RuntimeError(msg)
+
+        return sorted((dict(zip(self.OUTBOX_COLUMNS, row)) for row in rows), key=lambda entry: entry["id"])
+
+    def release_outbox_entries(self, entry_ids, error=None, table_name=None):
+        """
+        Returns claimed submissions to the outbox after an attempt to replay
+        them, recording the attempt and the reason it failed.
+        """
+        if not table_name:
+            table_name = self.m_default_table_name
+
+        self.m_my_conn = self.get_connection()
+        self.m_my_conn.executemany(
+            f"UPDATE {table_name}{self.OUTBOX_TABLE_SUFFIX} "
+            f"SET claimed = NULL, attempts = attempts + 1, last_error = ? WHERE id = ?",
+            [(error, entry_id) for entry_id in entry_ids],
+        )
+
+        self._commit()
+
+    def fail_outbox_entry(self, entry_id, error, table_name=None):
+        """Marks a submission rejected by the provider as failed, so it is no longer replayed."""
+        if not table_name:
+            table_name = self.m_default_table_name
+
+        self.m_my_conn = self.get_connection()
+        self.m_my_conn.execute(
+            f"UPDATE {table_name}{self.OUTBOX_TABLE_SUFFIX} "
+            f"SET claimed = NULL, attempts = attempts + 1, failed = ?, last_error = ? WHERE id = ?",
+            (int(time.time()), error, entry_id),
+        )
+
+        self._commit()
+
+    def remove_outbox_entries(self, entry_ids, table_name=None):
+        """Removes the provided submissions from the outbox, once they have been replayed."""
+        if not table_name:
+            table_name = self.m_default_table_name
+
+        self.m_my_conn = self.get_connection()
+        self.m_my_conn.executemany(
+            f"DELETE FROM {table_name}{self.OUTBOX_TABLE_SUFFIX} WHERE id = ?", [(entry_id,) for entry_id in entry_ids]
+        )
+
+        self._commit()
+
+    def select_outbox_entries(self, failed=False, table_name=None):
+        """
+        Returns the submissions of the outbox, oldest first, keyed by
+        OUTBOX_COLUMNS. Only pending submissions are returned, unless failed
+        is True, in which case only the failed submissions are returned.
+        """
+        if not table_name:
+            table_name = self.m_default_table_name
+
+        self.m_my_conn = self.get_connection()
+
+        rows = self.m_my_conn.execute(
+            f"SELECT {', '.join(self.OUTBOX_COLUMNS)} FROM {table_name}{self.OUTBOX_TABLE_SUFFIX} "
+            f"WHERE failed IS {'NOT ' if failed else ''}NULL ORDER BY id"
+        ).fetchall()
+
+        return [dict(zip(self.OUTBOX_COLUMNS, row)) for row in rows]
+
+    @traced("db_write")
+    def write_doi_info_to_database(self, doi_record, doi=None):
         """
         Write a new row to the Sqlite3 transaction database with the provided
         DOI entry information.
 
+        The full-text search index entry for the DOI is replaced as well, using
+        the fields of the provided Doi object, or just the record title if one
+        is not provided, along with its near-duplicate title index entry, and
+        the change counter of the table is incremented.
+
         Parameters
         ----------
         doi_record : DoiRecord
             The DOI record to create a database new entry with.
+        doi : Doi, optional
+            The Doi object the record was created from, used to obtain the
+            description, keywords and authors to index for full-text search.
 
         Raises
         ------
@@ -292,13 +1220,34 @@ class DOIDataBase:
         data["date_added"] = data["date_added"].replace(tzinfo=timezone.utc).timestamp()
         data["date_updated"] = data["date_updated"].replace(tzinfo=timezone.utc).timestamp()
 
+        search_table_name = self.m_default_table_name + self.SEARCH_TABLE_SUFFIX
+        title_table_name = self.m_default_table_name + self.TITLE_TABLE_SUFFIX
+        band_table_name = self.m_default_table_name + self.TITLE_BAND_TABLE_SUFFIX
+
         try:
+            # Remove the search index entry for the current latest row, it is
+            # replaced by one for the new row below
+            if self._search_enabled:
+                self.m_my_conn.execute(
+                    f"DELETE FROM {search_table_name} WHERE rowid IN "
+                    f"(SELECT rowid FROM {self.m_default_table_name} WHERE doi = ? AND is_latest = 1)",
+                    (doi_record.doi,),
+                )
+
+            # Likewise for the near-duplicate title index entries
+            for index_table_name in (title_table_name, band_table_name):
+                self.m_my_conn.execute(
+                    f"DELETE FROM {index_table_name} WHERE row_id IN "
+                    f"(SELECT rowid FROM {self.m_default_table_name} WHERE doi = ? AND is_latest = 1)",
+                    (doi_record.doi,),
+                )
+
             # Create and execute the query to unset the is_latest field for all
             # records with the same identifier field.
             query_string = self.query_string_for_is_latest_update(self.m_default_table_name, primary_key_column="doi")
 
             self.m_my_conn.execute(query_string, (doi_record.doi,))
-            self.m_my_conn.commit()
+            self._commit()
         except sqlite3.Error as err:
             msg = f"Failed to update is_latest field for DOI {doi_record.doi}, reason: {err}"
             logger.error(msg)
@@ -312,8 +1261,30 @@ class DOIDataBase:
             # database schema
             data_tuple = tuple([data[column] for column in self.DOI_DB_SCHEMA])
 
-            self.m_my_conn.execute(query_string, data_tuple)
-            self.m_my_conn.commit()
+            rowid = self.m_my_conn.execute(query_string, data_tuple).lastrowid
+
+            if self._search_enabled:
+                search_fields = self.search_fields_for_doi(doi) if doi else {"title": doi_record.title or ""}
+
+                self.m_my_conn.execute(
+                    f"INSERT INTO {search_table_name} (rowid, {', '.join(search_fields)}) "
+                    f"VALUES (?, {', '.join(['?'] * len(search_fields))})",
+                    (rowid, *search_fields.values()),
+                )
+
+            normalized_title, buckets = title_buckets(doi_record.title)
+
+            self.m_my_conn.execute(
+                f"INSERT INTO {title_table_name} (row_id, normalized_title) VALUES (?, ?)", (rowid, normalized_title)
+            )
+            self.m_my_conn.executemany(
+                f"INSERT INTO {band_table_name} (band, bucket, row_id) VALUES (?, ?, ?)",
+                [(band, bucket, rowid) for band, bucket in buckets],
+            )
+
+            self._increment_change_counter(self.m_default_table_name)
+
+            self._commit()
         except sqlite3.Error as err:
             msg = f"Failed to commit transaction for DOI {doi_record.doi}, " f"reason: {err}"
             logger.error(msg)
@@ -371,16 +1342,38 @@ class DOIDataBase:
 
         return columns, rows
 
-    def select_latest_rows(self, query_criterias, table_name=None):
-        """Select all rows marked as latest (is_latest column = 1)"""
+    @staticmethod
+    def _form_pagination_clause(limit=None, offset=None):
+        """
+        Helper method to form the LIMIT/OFFSET clause used to return a single
+        page of query results, along with its named parameters.
+        """
+        if limit is None and not offset:
+            return "", {}
+
+        return " LIMIT :page_limit OFFSET :page_offset", {
+            "page_limit": -1 if limit is None else int(limit),
+            "page_offset": int(offset or 0),
+        }
+
+    def select_latest_rows(self, query_criterias, table_name=None, limit=None, offset=None):
+        """
+        Select all rows marked as latest (is_latest column = 1), ordered by
+        update time. If a limit or offset is provided, only the requested page
+        of rows is returned.
+        """
         if not table_name:
             table_name = self.m_default_table_name
 
         self.m_my_conn = self.get_connection(table_name)
 
         criterias_str, criteria_dict = DOIDataBase.parse_criteria(query_criterias)
+        pagination_str, pagination_dict = DOIDataBase._form_pagination_clause(limit, offset)
 
         query_string = f"SELECT * from {table_name} WHERE is_latest=1 {criterias_str} ORDER BY date_updated"
+        query_string += pagination_str
+
+        criteria_dict.update(pagination_dict)
 
         logger.debug("SELECT query_string: %s", query_string)
 
@@ -397,6 +1390,195 @@ class DOIDataBase:
 
         return columns, rows
 
+    @staticmethod
+    def _search_terms(search_text):
+        """
+        Splits free text provided for a full-text search into its terms. A
+        trailing wildcard (*) on a term is retained to request a prefix match.
+        """
+        terms = re.findall(r"\w+\*?", search_text or "")
+
+        if not terms:
+            raise ValueError(f'Search query "{search_text}" does not contain any words to search for')
+
+        return terms
+
+    @staticmethod
+    def _form_search_query(search_text):
+        """
+        Forms an FTS5 MATCH expression requiring all the terms of the provided
+        free text. Each term is quoted, so characters in the text which are
+        operators in the FTS5 query syntax are never interpreted as such.
+        """
+        return " ".join(
+            f'"{term.rstrip("*")}"*' if term.endswith("*") else f'"{term}"'
+            for term in DOIDataBase._search_terms(search_text)
+        )
+
+    def search_latest_rows(self, search_text, query_criterias, table_name=None, limit=None, offset=None):
+        """
+        Select the rows marked as latest (is_latest column = 1) which match
+        the provided full-text search, and the provided query criteria.
+
+        Rows are matched against the title, description, keywords and authors
+        of each DOI, and are returned in order of relevance, with matches
+        within titles weighted most heavily. If the SQLite library does not
+        support full-text search, the search terms are matched against titles
+        only, and rows are returned in order of update time.
+
+        Parameters
+        ----------
+        search_text : str
+            Free text to search for. All words within the text must match.
+            Words ending with a wildcard (*) match any word they prefix.
+        query_criterias : dict
+            Dictionary mapping database column names to criteria values to match.
+        table_name : str, optional
+            Name of the database table to query. Defaults to the default table
+            name "doi".
+        limit : int, optional
+            Maximum number of rows to return.
+        offset : int, optional
+            Number of matching rows to skip before those returned.
+
+        Returns
+        -------
+        columns : list of str
+            The names of the columns of the returned rows.
+        rows : list of list
+            The matching rows.
+
+        Raises
+        ------
+        ValueError
+            If the search text does not contain any words.
+
+        """
+        if not table_name:
+            table_name = self.m_default_table_name
+
+        self.m_my_conn = self.get_connection(table_name)
+
+        criterias_str, criteria_dict = DOIDataBase.parse_criteria(query_criterias)
+        pagination_str, pagination_dict = DOIDataBase._form_pagination_clause(limit, offset)
+
+        criteria_dict.update(pagination_dict)
+
+        if self._search_enabled:
+            search_table_name = table_name + self.SEARCH_TABLE_SUFFIX
+            weights = ", ".join(str(weight) for weight in self.SEARCH_COLUMN_WEIGHTS.values())
+
+            query_string = (
+                f"SELECT {table_name}.* FROM {table_name} "
+                f"JOIN (SELECT rowid AS search_rowid, bm25({search_table_name}, {weights}) AS search_rank "
+                f"FROM {search_table_name} WHERE {search_table_name} MATCH :search_query) AS matches "
+                f"ON {table_name}.rowid = matches.search_rowid "
+                f"WHERE is_latest=1 {criterias_str} ORDER BY matches.search_rank"
+            )
+
+            criteria_dict["search_query"] = DOIDataBase._form_search_query(search_text)
+        else:
+            terms = DOIDataBase._search_terms(search_text)
+
+            # Escape the LIKE wildcard characters which may appear in a term
+            search_str = "".join(f" AND title LIKE :search_term_{i} ESCAPE '\\'" for i in range(len(terms)))
+
+            criteria_dict.update(
+                {
+                    f"search_term_{i}": "%" + term.rstrip("*").replace("%", "\\%").replace("_", "\\_") + "%"
+                    for i, term in enumerate(terms)
+                }
+            )
+
+            query_string = (
+                f"SELECT * from {table_name} WHERE is_latest=1 {criterias_str}{search_str} ORDER BY date_updated"
+            )
+
+        query_string += pagination_str
+
+        logger.debug("SELECT query_string: %s", query_string)
+
+        cursor = self.m_my_conn.cursor()
+        cursor.execute(query_string, criteria_dict)
+
+        columns = list(map(lambda x: x[0], cursor.description))
+
+        rows = [list(row) for row in cursor]
+
+        rows = self._normalize_rows(columns, rows)
+
+        logger.debug("Query returned %d result(s)", len(rows))
+
+        return columns, rows
+
+    def select_similar_titles(self, title, threshold, table_name=None):
+        """
+        Select the rows marked as latest whose titles are near-duplicates of
+        the provided title.
+
+        Candidate rows are those with the same normalized title, or sharing an
+        LSH bucket with the title, so only a small fraction of the table is
+        compared. The similarity of each candidate is then computed exactly.
+
+        Parameters
+        ----------
+        title : str
+            The title to find near-duplicates of.
+        threshold : float
+            The minimum similarity, between 0 and 1, of the titles to return.
+        table_name : str, optional
+            Name of the transaction table to query. Defaults to the default table.
+
+        Returns
+        -------
+        columns : list of str
+            The names of the columns of the returned rows.
+        rows : list of tuple
+            The similarity of each near-duplicate title, paired with its
+            (normalized) transaction row, ordered from most to least similar.
+
+        """
+        if not table_name:
+            table_name = self.m_default_table_name
+
+        self.m_my_conn = self.get_connection(table_name)
+
+        normalized_title, buckets = title_buckets(title)
+
+        bucket_criteria = " OR ".join(["(band = ? AND bucket = ?)"] * len(buckets))
+        bucket_values = [value for bucket in buckets for value in bucket]
+
+        query_string = (
+            f"SELECT title_index.normalized_title, {table_name}.* FROM {table_name} "
+            f"JOIN {table_name}{self.TITLE_TABLE_SUFFIX} AS title_index ON title_index.row_id = {table_name}.rowid "
+            f"WHERE title_index.row_id IN ("
+            f"SELECT row_id FROM {table_name}{self.TITLE_TABLE_SUFFIX} WHERE normalized_title = ? "
+            f"UNION SELECT row_id FROM {table_name}{self.TITLE_BAND_TABLE_SUFFIX} WHERE {bucket_criteria})"
+        )
+
+        logger.debug("SELECT query_string: %s", query_string)
+
+        cursor = self.m_my_conn.cursor()
+        cursor.execute(query_string, (normalized_title, *bucket_values))
+
+        columns = list(map(lambda x: x[0], cursor.description))[1:]
+
+        similarities = []
+        rows = []
+
+        for candidate_title, *row in cursor:
+            similarity = title_similarity(normalized_title, candidate_title)
+
+            if similarity >= threshold:
+                similarities.append(similarity)
+                rows.append(row)
+
+        rows = self._normalize_rows(columns, rows)
+
+        logger.debug("Found %d near-duplicate title(s) for %s", len(rows), title)
+
+        return columns, sorted(zip(similarities, rows), key=lambda result: result[0], reverse=True)
+
     def select_latest_records(self, query_criterias, table_name=None):
         """
         Returns the latest set of rows from the database matching the provided
@@ -481,9 +1663,38 @@ class DOIDataBase:
         logger.debug("UPDATE query_string: %s", query_string)
 
         self.m_my_conn.execute(query_string)
+        self._increment_change_counter(table_name)
+
+    @staticmethod
+    def _prefix_range(prefix):
+        """
+        Returns the lower and upper bounds of the range of (lower-cased) values
+        beginning with the provided prefix, for use with a lower(column) >= lower
+        AND lower(column) < upper predicate. The upper bound is None when the
+        range is unbounded.
+
+        Only ASCII characters are lower-cased, matching both the SQLite lower()
+        function and the case-insensitivity of LIKE.
+        """
+        lower = prefix.translate(ASCII_LOWERCASE)
+        upper = lower
+
+        while upper:
+            next_ord = ord(upper[-1]) + 1
+
+            # Skip the surrogate code points, which cannot be encoded to UTF-8
+            if 0xD800 <= next_ord <= 0xDFFF:
+                next_ord = 0xE000
+
+            if next_ord <= sys.maxunicode:
+                return lower, upper[:-1] + chr(next_ord)
+
+            upper = upper[:-1]
+
+        return lower, None
 
     @staticmethod
-    def _form_query_with_wildcards(column_name, search_tokens):
+    def _form_query_with_wildcards(column_name, search_tokens, prefix_ranges=False):
         """
         Helper method to form a portion of an SQL WHERE clause that returns
         matches from the specified column using the provided list of tokens.
@@ -501,6 +1712,11 @@ class DOIDataBase:
         search_tokens : list of str
             List of tokens to search for. Tokens may either be full identifiers,
             or contain one or more wildcards (*).
+        prefix_ranges : bool, optional
+            If True, tokens whose only wildcard is a single trailing * are
+            matched with a range predicate on the lower-cased column values,
+            which (unlike LIKE) SQLite can answer from the index created by
+            create_prefix_indexes(). Defaults to False.
 
         Returns
         -------
@@ -530,6 +1746,30 @@ class DOIDataBase:
         named_parameters = ",".join([f":{named_param_id}_{i}" for i in range(len(full_tokens))])
         named_parameter_values = {f"{named_param_id}_{i}": full_tokens[i] for i in range(len(full_tokens))}
 
+        # Prefix-only globs (such as urn:nasa:pds:bundle:*) are matched to a
+        # range of lower-cased values when requested, rather than with LIKE
+        prefix_tokens = []
+
+        if prefix_ranges:
+            prefix_tokens = [
+                token for token in wildcard_tokens if token.endswith("*") and not any(c in token[:-1] for c in "*?")
+            ]
+            wildcard_tokens = [token for token in wildcard_tokens if token not in prefix_tokens]
+
+        range_parameters = []
+
+        for index, prefix_token in enumerate(prefix_tokens):
+            lower, upper = DOIDataBase._prefix_range(prefix_token[:-1])
+
+            range_parameter = f"lower({column_name}) >= :{named_param_id}_start_{index}"
+            named_parameter_values[f"{named_param_id}_start_{index}"] = lower
+
+            if upper is not None:
+                range_parameter += f" AND lower({column_name}) < :{named_param_id}_end_{index}"
+                named_parameter_values[f"{named_param_id}_end_{index}"] = upper
+
+            range_parameters.append(f"({range_parameter})")
+
         # Next, because we use actually use LIKE and not GLOB (for the case-insensitivity),
         # we need to convert wildcards from Unix style (*,?) to SQLite style (%,_),
         # but we first need to escape any existing characters reserved by LIKE (& and _)
@@ -564,7 +1804,13 @@ class DOIDataBase:
         if full_tokens:
             where_subclause += f"{column_name} IN ({named_parameters}) "
 
-        if full_tokens and wildcard_tokens:
+        if full_tokens and (range_parameters or wildcard_tokens):
+            where_subclause += " OR "
+
+        if range_parameters:
+            where_subclause += " OR ".join(range_parameters)
+
+        if range_parameters and wildcard_tokens:
             where_subclause += " OR "
 
         if wildcard_tokens:
@@ -591,11 +1837,11 @@ class DOIDataBase:
 
     @staticmethod
     def _get_query_criteria_doi(doi_value):
-        return DOIDataBase._form_query_with_wildcards("doi", doi_value)
+        return DOIDataBase._form_query_with_wildcards("doi", doi_value, prefix_ranges=True)
 
     @staticmethod
     def _get_query_criteria_ids(id_value):
-        return DOIDataBase._form_query_with_wildcards("identifier", id_value)
+        return DOIDataBase._form_query_with_wildcards("identifier", id_value, prefix_ranges=True)
 
     @staticmethod
     def _get_query_criteria_submitter(submitter_value):
@@ -0,0 +1,408 @@
+#
+#  Copyright 2026, by the California Institute of Technology.  ALL RIGHTS
+#  RESERVED. United States Government Sponsorship acknowledged. Any commercial
+#  use must be negotiated with the Office of Technology Transfer at the
+#  California Institute of Technology.
+#
+"""
+============
+job_queue.py
+============
+
+Contains the JobQueue class, a persistent (SQLite3) queue of background jobs,
+and the JobWorkerPool class, which runs queued jobs on a pool of worker threads.
+"""
+import json
+import sqlite3
+import threading
+import traceback
+import uuid
+from contextlib import contextmanager
+from datetime import datetime
+from datetime import timezone
+
+from pds_doi_service.core.entities.job import Job
+from pds_doi_service.core.entities.job import JobStatus
+from pds_doi_service.core.util.general_util import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_NUM_WORKERS = 2
+"""Default number of worker threads used to run background jobs"""
+
+DEFAULT_POLL_INTERVAL = 5.0
+"""Default maximum interval, in seconds, between checks of the queue by idle workers"""
+
+
+class JobQueue:
+    """
+    Persistent queue of background jobs, stored within a local SQLite3 database.
+
+    Each method opens its own short-lived connection to the database, so a
+    single JobQueue instance may be safely shared between threads.
+    """
+
+    JOB_DB_SCHEMA = {
+        "job_id": "TEXT PRIMARY KEY",  # unique identifier for the job
+        "operation": "TEXT NOT NULL",  # name of the operation run by the job
+        "status": "TEXT NOT NULL",  # current JobStatus of the job
+        "progress": "REAL NOT NULL",  # fraction of the job completed, from 0 to 1
+        "message": "TEXT",  # description of the current job progress
+        "arguments": "TEXT NOT NULL",  # JSON-encoded arguments to the operation
+        "payload": "BLOB",  # optional raw input data for the operation
+        "result": "TEXT",  # JSON-encoded result of the operation
+        "result_code": "INT",  # HTTP-style status code for the result
+        "date_created": "REAL NOT NULL",  # as Unix epoch seconds
+        "date_updated": "REAL NOT NULL",  # as Unix epoch seconds
+    }
+    """The schema used to define the job table."""
+
+    TABLE_NAME = "jobs"
+
+    def __init__(self, db_file):
+        self._db_file = db_file
+
+        with self._connect() as connection:
+            columns = ",".join(f"{column} {constraint}" for column, constraint in self.JOB_DB_SCHEMA.items())
+            connection.execute(f"CREATE TABLE IF NOT EXISTS {self.TABLE_NAME} ({columns});")
+            connection.execute(
+                f"CREATE INDEX IF NOT EXISTS {self.TABLE_NAME}_status_idx "
+                f"ON {self.TABLE_NAME} (status, date_created);"
+            )
+
+    @property
+    def db_file(self):
+        """Returns the path to the job queue database."""
+        return self._db_file
+
+    @contextmanager
+    def _connect(self):
+        """
+        Yields a new connection to the job queue database. The transaction is
+        committed (or rolled back on error) and the connection closed on exit.
+        """
+        connection = sqlite3.connect(self._db_file, timeout=30)
+
+        try:
+            with connection:
+                yield connection
+        finally:
+            connection.close()
+
+    @staticmethod
+    def _now():
+        return datetime.now(tz=timezone.utc).timestamp()
+
+    @staticmethod
+    def _job_from_row(row):
+        """Converts a row of the job table, as a sqlite3.Row, into a Job object."""
+        return Job(
+            job_id=row["job_id"],
+            operation=row["operation"],
+            status=JobStatus(row["status"]),
+            progress=row["progress"],
+            message=row["message"],
+            arguments=json.loads(row["arguments"]),
+            payload=row["payload"],
+            result=row["result"],
+            result_code=row["result_code"],
+            date_created=datetime.fromtimestamp(row["date_created"], tz=timezone.utc),
+            date_updated=datetime.fromtimestamp(row["date_updated"], tz=timezone.utc),
+        )
+
+    def submit(self, operation, arguments=None, payload=None):
+        """
+        Adds a new job to the queue.
+
+        Parameters
+        ----------
+        operation : str
+            Name of the operation to be run by the job.
+        arguments : dict, optional
+            JSON-serializable arguments to the operation.
+        payload : bytes, optional
+            Raw input data for the operation.
+
+        Returns
+        -------
+        job_id : str
+            The unique identifier assigned to the new job.
+
+        """
+        job_id = uuid.uuid4().hex
+        now = self._now()
+
+        with self._connect() as connection:
+            connection.execute(
+                f"INSERT INTO {self.TABLE_NAME} "
+                f"(job_id, operation, status, progress, message, arguments, payload, date_created, date_updated) "
+                f"VALUES (?, ?, ?, 0.0, ?, ?, ?, ?, ?);",
+                (job_id, operation, JobStatus.Queued.value, "Queued", json.dumps(arguments or {}), payload, now, now),
+            )
+
+        logger.info("Queued job %s for operation %s", job_id, operation)
+
+        return job_id
+
+    def get(self, job_id):
+        """
+        Returns the job with the provided identifier, or None if no such job exists.
+        """
+        with self._connect() as connection:
+            connection.row_factory = sqlite3.Row
+            row = connection.execute(f"SELECT * FROM {self.TABLE_NAME} WHERE job_id = ?;", (job_id,)).fetchone()
+
+        return self._job_from_row(row) if row else None
+
+    def claim_next(self):
+        """
+        Claims the oldest queued job, marking it as running.
+
+        Returns
+        -------
+        job : Job
+            The claimed job, or None if no jobs are queued.
+
+        """
+        with self._connect() as connection:
+            connection.row_factory = sqlite3.Row
+
+            # Take the write lock up front so two workers never claim the same job
+            connection.execute("BEGIN IMMEDIATE;")
+
+            row = connection.execute(
+                f"SELECT * FROM {self.TABLE_NAME} WHERE status = ? ORDER BY date_created LIMIT 1;",
+                (JobStatus.Queued.value,),
+            ).fetchone()
+
+            if not row:
+                return None
+
+            connection.execute(
+                f"UPDATE {self.TABLE_NAME} SET status = ?, message = ?, date_updated = ? WHERE job_id = ?;",
+                (JobStatus.Running.value, "Running", self._now(), row["job_id"]),
+            )
+
+        job = self._job_from_row(row)
+        job.status = JobStatus.Running
+
+        return job
+
+    def update_progress(self, job_id, progress, message=None):
+        """
+        Records the progress of a running job.
+
+        Parameters
+        ----------
+        job_id : str
+            Identifier of the job to update.
+        progress : float
+            Fraction of the job completed, from 0 to 1.
+        message : str, optional
+            Description of the current job progress.
+
+        """
+        progress = min(max(float(progress), 0.0), 1.0)
+
+        with self._connect() as connection:
+            connection.execute(
+                f"UPDATE {self.TABLE_NAME} SET progress = ?, message = COALESCE(?, message), date_updated = ? "
+                f"WHERE job_id = ?;",
+                (progress, message, self._now(), job_id),
+            )
+
+    def complete(self, job_id, status, result=None, result_code=None, message=None):
+        """
+        Records the final state of a job.
+
+        Parameters
+        ----------
+        job_id : str
+            Identifier of the job to update.
+        status : JobStatus
+            The final status of the job. Should be one of Succeeded or Failed.
+        result : str, optional
+            JSON-encoded result of the job's operation.
+        result_code : int, optional
+            HTTP-style status code for the result.
+        message : str, optional
+            Description of the final state of the job.
+
+        """
+        with self._connect() as connection:
+            connection.execute(
+                f"UPDATE {self.TABLE_NAME} SET status = ?, progress = 1.0, message = ?, result = ?, "
+                f"result_code = ?, payload = NULL, date_updated = ? WHERE job_id = ?;",
+                (JobStatus(status).value, message, result, result_code, self._now(), job_id),
+            )
+
+    def requeue_interrupted(self, resumable_operations=None):
+        """
+        Returns any jobs left running (by a previous process that exited before
+        they completed) to the queue.
+
+        Jobs whose operation may not be safely run twice, such as those
+        submitting records to the DOI service provider, are marked as Failed
+        instead, as they may have completed some of their work before the
+        interruption.
+
+        Parameters
+        ----------
+        resumable_operations : iterable of str, optional
+            Names of the operations which may be safely run again. If not
+            provided, all interrupted jobs are returned to the queue.
+
+        Returns
+        -------
+        num_requeued : int
+            The number of jobs returned to the queue.
+
+        """
+        with self._connect() as connection:
+            num_failed = 0
+
+            if resumable_operations is not None:
+                resumable_operations = list(resumable_operations)
+                placeholders = ",".join("?" * len(resumable_operations))
+
+                cursor = connection.execute(
+                    f"UPDATE {self.TABLE_NAME} SET status = ?, progress = 1.0, message = ?, payload = NULL, "
+                    f"date_updated = ? WHERE status = ? AND operation NOT IN ({placeholders});",
+                    (
+                        JobStatus.Failed.value,
+                        "Job interrupted before completion, and not run again as it may have been partially "
+                        "completed. Check the state of the affected records before resubmitting the request.",
+                        self._now(),
+                        JobStatus.Running.value,
+                        *resumable_operations,
+                    ),
+                )
+
+                num_failed = cursor.rowcount
+
+            cursor = connection.execute(
+                f"UPDATE {self.TABLE_NAME} SET status = ?, progress = 0.0, message = ?, date_updated = ? "
+                f"WHERE status = ?;",
+                (JobStatus.Queued.value, "Requeued after interruption", self._now(), JobStatus.Running.value),
+            )
+
+            num_requeued = cursor.rowcount
+
+        if num_failed:
+            logger.warning("Failed %d interrupted job(s) which may not be safely run again", num_failed)
+
+        if num_requeued:
+            logger.warning("Requeued %d interrupted job(s)", num_requeued)
+
+        return num_requeued
+
+
+class JobWorkerPool:
+    """
+    Runs jobs from a JobQueue on a pool of daemon worker threads.
+
+    Jobs are run by the handler callable provided at construction, which is
+    invoked as handler(job, report_progress), where report_progress is a
+    callable accepting a progress fraction and an optional message. The handler
+    should return a tuple of the JSON-encoded result and its result code.
+    Any exception raised by the handler marks the job as Failed.
+
+    Jobs interrupted by the exit of a previous process are run again when the
+    pool starts, unless a list of resumable operations is provided, in which
+    case interrupted jobs of any other operation are marked as Failed (see
+    JobQueue.requeue_interrupted()).
+    """
+
+    def __init__(
+        self,
+        job_queue,
+        handler,
+        num_workers=DEFAULT_NUM_WORKERS,
+        poll_interval=DEFAULT_POLL_INTERVAL,
+        resumable_operations=None,
+    ):
+        self._job_queue = job_queue
+        self._handler = handler
+        self._resumable_operations = resumable_operations
+        self._num_workers = max(1, num_workers)
+        self._poll_interval = poll_interval
+
+        self._wakeup = threading.Event()
+        self._stopped = threading.Event()
+        self._threads = []
+
+    @property
+    def job_queue(self):
+        """Returns the job queue serviced by this pool."""
+        return self._job_queue
+
+    def start(self):
+        """Starts the worker threads, first requeueing any resumable interrupted jobs."""
+        if self._threads:
+            return
+
+        self._job_queue.requeue_interrupted(self._resumable_operations)
+
+        for index in range(self._num_workers):
+            thread = threading.Thread(target=self._work, name=f"doi-job-worker-{index}", daemon=True)
+            thread.start()
+
+            self._threads.append(thread)
+
+        logger.info("Started %d background job worker(s)", self._num_workers)
+
+    def stop(self, timeout=None):
+        """Signals the worker threads to exit once their current job completes, and waits for them."""
+        self._stopped.set()
+        self._wakeup.set()
+
+        for thread in self._threads:
+            thread.join(timeout)
+
+        self._threads = []
+
+    def notify(self):
+        """Wakes an idle worker to check the queue, typically after a job is submitted."""
+        self._wakeup.set()
+
+    def submit(self, operation, arguments=None, payload=None):
+        """Adds a new job to the queue, waking a worker to run it. Returns the job identifier."""
+        job_id = self._job_queue.submit(operation, arguments, payload)
+
+        self.notify()
+
+        return job_id
+
+    def _work(self):
+        while not self._stopped.is_set():
+            try:
+                job = self._job_queue.claim_next()
+            except sqlite3.Error as err:
+                logger.error("Failed to claim next job from queue, reason: %s", err)
+                job = None
+
+            if job is None:
+                self._wakeup.wait(self._poll_interval)
+                self._wakeup.clear()
+                continue
+
+            self._run(job)
+
+    def _run(self, job):
+        logger.info("Running job %s (%s)", job.job_id, job.operation)
+
+        def _report_progress(progress, message=None):
+            self._job_queue.update_progress(job.job_id, progress, message)
+
+        try:
+            result, result_code = self._handler(job, _report_progress)
+        except Exception as err:
+            logger.error("Job %s failed, reason: %s\n%s", job.job_id, err, traceback.format_exc())
+
+            self._job_queue.complete(job.job_id, JobStatus.Failed, message=f"Job failed, reason: {err}")
+        else:
+            logger.info("Job %s completed with result code %s", job.job_id, result_code)
+
+            self._job_queue.complete(
+                job.job_id, JobStatus.Succeeded, result=result, result_code=result_code, message="Completed"
+            )
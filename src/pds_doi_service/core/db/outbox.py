@@ -0,0 +1,368 @@
+#
+#  Copyright 2026, by the California Institute of Technology.  ALL RIGHTS
+#  RESERVED. United States Government Sponsorship acknowledged. Any commercial
+#  use must be negotiated with the Office of Technology Transfer at the
+#  California Institute of Technology.
+#
+"""
+=========
+outbox.py
+=========
+
+Contains the ProviderOutbox class, a persistent queue of the submissions made
+to the DOI service provider while it was unavailable, and the OutboxDrainer
+class, which replays queued submissions from a background thread once the
+provider recovers.
+
+When the provider times out, refuses connections or responds with a 5xx (or
+429) status, or its circuit breaker is open (see circuit_breaker.py), the
+reserve and release actions may queue their submissions within the outbox
+table of the transaction database (see DOIDataBase.create_outbox_table())
+rather than fail. As a POST creates a new DOI each time it is accepted, POST
+submissions are only queued when they were never sent at all, i.e. when the
+breaker is open or no connection to the provider could be made, so a POST the
+provider may have accepted before failing is never replayed. Each queued
+submission is replayed exactly as it would have been sent, and only once the
+provider has accepted it is the resulting transaction logged to the local
+database.
+
+Only the API server runs a drainer (see start_outbox_drainer()), so
+submissions queued by the command-line reserve and release actions stay in the
+outbox until an API server using the same transaction database replays them.
+"""
+import threading
+
+from pds_doi_service.core.db.transaction_builder import TransactionBuilder
+from pds_doi_service.core.entities.exceptions import ProviderUnavailableException
+from pds_doi_service.core.outputs.circuit_breaker import STATE_CLOSED
+from pds_doi_service.core.outputs.service import DOIServiceFactory
+from pds_doi_service.core.outputs.web_client import WEB_METHOD_POST
+from pds_doi_service.core.util.config_parser import DOIConfigUtil
+from pds_doi_service.core.util.general_util import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_BATCH_SIZE = 20
+"""Default number of queued submissions claimed from the outbox at a time"""
+
+DEFAULT_DRAIN_INTERVAL = 30.0
+"""Default maximum interval, in seconds, between attempts by the background drainer to replay the outbox"""
+
+DEFAULT_CLAIM_TIMEOUT = 600
+"""Default time, in seconds, after which a submission claimed by a drainer that never completed it is replayed again"""
+
+
+def _is_unsent_error(err):
+    """
+    Returns True if the provided exception indicates that a request was never
+    sent to the DOI service provider, because its circuit breaker is open or
+    no connection to the provider could be made.
+    """
+    import requests
+    import urllib3
+
+    if isinstance(err, (ProviderUnavailableException, requests.exceptions.ConnectTimeout, ConnectionRefusedError)):
+        return True
+
+    # requests re-raises a failed connection attempt (refused, unresolvable
+    # host) as a ConnectionError wrapping urllib3's MaxRetryError, whereas a
+    # connection lost after the request was sent is wrapped as a ProtocolError
+    if isinstance(err, requests.exceptions.ConnectionError) and err.args:
+        return isinstance(getattr(err.args[0], "reason", None), urllib3.exceptions.ConnectTimeoutError)
+
+    return False
+
+
+def is_transient_error(err, method=None):
+    """
+    Returns True if the provided exception, raised by a request to the DOI
+    service provider, indicates that the provider was unavailable rather than
+    that it rejected the request, so the request may be retried as is.
+
+    Parameters
+    ----------
+    err : Exception
+        The exception raised by the request.
+    method : str, optional
+        The HTTP method of the request. A POST is not idempotent, so a failed
+        POST is only considered transient if it was never sent, as the
+        provider may otherwise have created the DOI despite the error (e.g.
+        a read timeout), which a retry would then duplicate.
+
+    """
+    if method == WEB_METHOD_POST:
+        return _is_unsent_error(err)
+
+    # requests exceptions (connection errors, timeouts) are subclasses of OSError
+    if isinstance(err, (ProviderUnavailableException, OSError)):
+        return True
+
+    # HTTP errors are re-raised as a WebRequestException by the web clients
+    response = getattr(err.__context__, "response", None)
+
+    return response is not None and (response.status_code >= 500 or response.status_code == 429)
+
+
+class ProviderOutbox:
+    """
+    Persistent queue of the submissions made to the DOI service provider while
+    it was unavailable.
+
+    Submissions are only queued when the OTHER.outbox_enabled field of the INI
+    config is set. Otherwise, actions fail fast with the error received from
+    the provider (or its circuit breaker).
+    """
+
+    m_doi_config_util = DOIConfigUtil()
+
+    _drain_requested = threading.Event()
+    """Set whenever a submission is queued, to wake the drainer of this process (if any)"""
+
+    def __init__(self, transaction_builder, web_client=None):
+        self._config = self.m_doi_config_util.get_config()
+        self._transaction_builder = transaction_builder
+        self._database = transaction_builder.m_doi_database
+        self._web_client = web_client
+
+        self._enabled = self._config.getboolean("OTHER", "outbox_enabled", fallback=False)
+        self._batch_size = int(self._config.get("OTHER", "outbox_batch_size", fallback=DEFAULT_BATCH_SIZE))
+        self._claim_timeout = int(self._config.get("OTHER", "outbox_claim_timeout", fallback=DEFAULT_CLAIM_TIMEOUT))
+
+    @property
+    def enabled(self):
+        """Returns True if submissions are queued while the provider is unavailable."""
+        return self._enabled
+
+    @property
+    def web_client(self):
+        """Returns the web client of the configured service provider, used to replay submissions."""
+        if self._web_client is None:
+            self._web_client = DOIServiceFactory.get_web_client_service()
+
+        return self._web_client
+
+    def enqueue(self, action, submitter, doi, method, url, payload, content_type):
+        """
+        Queues a submission to the DOI service provider for replay.
+
+        Parameters
+        ----------
+        action : str
+            Name of the action the submission was made by.
+        submitter : str
+            Email address of the submitter of the action, used for the
+            transaction logged once the submission is replayed.
+        doi : Doi
+            The Doi object the submission was made for.
+        method : str
+            The HTTP method of the submission.
+        url : str
+            The URL the submission was made to.
+        payload : str
+            The label submitted.
+        content_type : str
+            The content type of the label.
+
+        Returns
+        -------
+        entry_id : int
+            The ID of the queued submission.
+
+        """
+        entry_id = self._database.add_outbox_entry(
+            action, submitter, doi.pds_identifier, doi.doi, method, url, content_type, payload
+        )
+
+        logger.warning(
+            "Queued %s submission of %s for replay once the service provider is available",
+            action,
+            doi.doi or doi.pds_identifier,
+        )
+
+        if _outbox_drainer is None:
+            logger.warning(
+                "No outbox drainer runs in this process, the submission will be replayed once an API server "
+                "using the transaction database %s is running",
+                self._database.m_database_name,
+            )
+
+        self._drain_requested.set()
+
+        return entry_id
+
+    def pending(self):
+        """Returns the submissions waiting to be replayed, oldest first."""
+        return self._database.select_outbox_entries()
+
+    def failed(self):
+        """Returns the submissions rejected by the provider when replayed, oldest first."""
+        return self._database.select_outbox_entries(failed=True)
+
+    def _provider_available(self):
+        """
+        Returns True if submissions may be sent to the provider, probing it
+        for recovery when its circuit breaker is due a trial request.
+        """
+        circuit_breaker = self.web_client.circuit_breaker
+
+        if circuit_breaker.state == STATE_CLOSED:
+            return True
+
+        return circuit_breaker.probe_due() and self.web_client.probe()
+
+    def drain(self):
+        """
+        Replays the queued submissions, oldest first. Submissions are claimed
+        from the outbox in batches of the size given by the
+        OTHER.outbox_batch_size field of the INI config, and the provider is
+        probed once per drain (rather than once per submission) while its
+        circuit breaker is open.
+
+        Draining stops, leaving the remaining submissions queued, as soon as
+        the provider is found to be unavailable. Submissions the provider
+        rejects (or whose transaction could not be logged), and POSTs which
+        failed once sent (see is_transient_error()), are marked as failed, and
+        are no longer replayed.
+
+        Returns
+        -------
+        counts : dict
+            The number of submissions "submitted" and "failed".
+
+        """
+        counts = {"submitted": 0, "failed": 0}
+
+        if not self._provider_available():
+            return counts
+
+        while entries := self._database.claim_outbox_entries(self._batch_size, self._claim_timeout):
+            for index, entry in enumerate(entries):
+                try:
+                    # The transaction is logged, and the submission removed, together
+                    with self._database.batch_writes():
+                        self._replay(entry)
+                        self._database.remove_outbox_entries([entry["id"]])
+                except Exception as err:
+                    if is_transient_error(err, entry["method"]):
+                        logger.warning("The service provider is unavailable, replay stopped: %s", err)
+                        self._database.release_outbox_entries([e["id"] for e in entries[index:]], error=str(err))
+                        self._log_counts(counts)
+                        return counts
+
+                    logger.error("Failed to replay queued %s submission %d: %s", entry["action"], entry["id"], err)
+                    self._database.fail_outbox_entry(entry["id"], str(err))
+                    counts["failed"] += 1
+                else:
+                    counts["submitted"] += 1
+
+        self._log_counts(counts)
+
+        return counts
+
+    def _replay(self, entry):
+        """Replays a queued submission, logging the resulting transaction to the local database."""
+        output_doi, output_label = self.web_client.submit_content(
+            payload=entry["payload"], url=entry["url"], method=entry["method"], content_type=entry["content_type"]
+        )
+
+        self._transaction_builder.m_provider_mirror.mirror_label(output_label)
+
+        # The input file of the original action is not retained, so only the
+        # provider's response is recorded with the transaction
+        transaction = self._transaction_builder.prepare_transaction(
+            entry["submitter"], output_doi, output_content_type=entry["content_type"]
+        )
+
+        transaction.log()
+
+        logger.info("Replayed queued %s submission of %s", entry["action"], output_doi.doi)
+
+    @staticmethod
+    def _log_counts(counts):
+        if any(counts.values()):
+            logger.info("Replayed the outbox: %d submitted, %d failed", counts["submitted"], counts["failed"])
+
+
+class OutboxDrainer:
+    """
+    Replays the outbox of a transaction database from a daemon thread, every
+    drain_interval seconds, or as soon as a submission is queued by an action
+    of this process.
+    """
+
+    def __init__(self, db_file, drain_interval=DEFAULT_DRAIN_INTERVAL):
+        self._db_file = db_file
+        self._drain_interval = drain_interval
+
+        self._stopped = threading.Event()
+        self._thread = None
+
+    def start(self):
+        """Starts the drainer thread."""
+        if self._thread:
+            return
+
+        self._stopped.clear()
+        self._thread = threading.Thread(target=self._work, name="outbox-drainer", daemon=True)
+        self._thread.start()
+
+        logger.info("Started the provider outbox drainer")
+
+    def stop(self, timeout=None):
+        """Signals the drainer thread to exit once its current replay completes, and waits for it."""
+        self._stopped.set()
+        ProviderOutbox._drain_requested.set()
+
+        if self._thread:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def _work(self):
+        transaction_builder = TransactionBuilder(self._db_file)
+        outbox = ProviderOutbox(transaction_builder)
+
+        try:
+            while not self._stopped.is_set():
+                try:
+                    outbox.drain()
+                except Exception as err:
+                    logger.error("Failed to replay the provider outbox, reason: %s", err)
+
+                ProviderOutbox._drain_requested.wait(self._drain_interval)
+                ProviderOutbox._drain_requested.clear()
+        finally:
+            transaction_builder.m_doi_database.close_database()
+
+
+_outbox_drainer = None
+_outbox_drainer_lock = threading.Lock()
+
+
+def start_outbox_drainer():
+    """
+    Starts the process-wide OutboxDrainer for the transaction database of the
+    INI config, if the outbox is enabled. The interval between replays is
+    determined by the OTHER.outbox_drain_interval field of the INI config.
+
+    Returns
+    -------
+    drainer : OutboxDrainer
+        The started drainer, or None if the outbox is disabled.
+
+    """
+    global _outbox_drainer
+
+    with _outbox_drainer_lock:
+        if _outbox_drainer is None:
+            config = DOIConfigUtil().get_config()
+
+            if not config.getboolean("OTHER", "outbox_enabled", fallback=False):
+                return None
+
+            _outbox_drainer = OutboxDrainer(
+                config.get("OTHER", "db_file"),
+                drain_interval=float(config.get("OTHER", "outbox_drain_interval", fallback=DEFAULT_DRAIN_INTERVAL)),
+            )
+            _outbox_drainer.start()
+
+    return _outbox_drainer
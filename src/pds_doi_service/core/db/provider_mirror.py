@@ -0,0 +1,179 @@
+#
+#  Copyright 2026, by the California Institute of Technology.  ALL RIGHTS
+#  RESERVED. United States Government Sponsorship acknowledged. Any commercial
+#  use must be negotiated with the Office of Technology Transfer at the
+#  California Institute of Technology.
+#
+"""
+==================
+provider_mirror.py
+==================
+
+Defines the ProviderMirror class, which keeps a local mirror of the state of
+DOI records at the DataCite service provider within the transaction database
+(see DOIDataBase.create_provider_mirror_table()).
+
+The mirror holds the attributes of each record exactly as last returned by
+DataCite, written whenever a response is received from the provider (by the
+reserve, release and check actions, and by pds-doi-init). Readers needing the
+provider state of a record may then use the mirror rather than query DataCite,
+so long as the mirrored state is recent enough for their purposes.
+"""
+import itertools
+import json
+
+from pds_doi_service.core.outputs.service import DOIServiceFactory
+from pds_doi_service.core.outputs.service import SERVICE_TYPE_DATACITE
+from pds_doi_service.core.util.config_parser import DOIConfigUtil
+from pds_doi_service.core.util.general_util import get_logger
+from pds_doi_service.core.util.json_stream import iter_json_items
+
+logger = get_logger(__name__)
+
+DEFAULT_MAX_AGE = 300
+"""Default maximum age, in seconds, of mirrored provider state used in place of a provider query"""
+
+MIRROR_BATCH_SIZE = 1000
+"""Number of records written to the mirror at a time when mirroring a label file"""
+
+
+class ProviderMirror:
+    """
+    Writes the records returned by the DOI service provider to the provider
+    mirror table of a transaction database, and reads them back as Doi objects.
+
+    The mirror is only maintained when DataCite is the configured service
+    provider. Otherwise, all methods of this class are no-ops.
+    """
+
+    m_doi_config_util = DOIConfigUtil()
+
+    def __init__(self, database, service_type=None):
+        self._config = self.m_doi_config_util.get_config()
+        self._database = database
+        self._enabled = (service_type or DOIServiceFactory.get_service_type()) == SERVICE_TYPE_DATACITE
+        self._max_age = int(self._config.get("OTHER", "provider_mirror_max_age", fallback=DEFAULT_MAX_AGE))
+
+    @property
+    def enabled(self):
+        """Returns True if the provider mirror is maintained for the configured service provider."""
+        return self._enabled
+
+    @property
+    def max_age(self):
+        """Returns the maximum age, in seconds, of mirrored state returned by get_dois()."""
+        return self._max_age
+
+    def _write(self, records):
+        """Writes the attributes of the provided DataCite records to the mirror, returning the number written."""
+        try:
+            return self._database.write_provider_records(
+                record["attributes"] for record in records if isinstance(record.get("attributes"), dict)
+            )
+        except RuntimeError as err:
+            # The mirror only saves provider round trips, so failing to update
+            # it should not fail the action that received the records
+            logger.warning("Could not update the provider mirror, reason: %s", str(err))
+            return 0
+
+    def mirror_label(self, label_text):
+        """
+        Mirrors each record of the provided DataCite JSON label, such as the
+        body of a response from the DataCite API.
+
+        Returns
+        -------
+        num_mirrored : int
+            The number of records written to the mirror.
+
+        """
+        if not self._enabled:
+            return 0
+
+        try:
+            records = json.loads(label_text)["data"]
+        except (json.JSONDecodeError, KeyError, TypeError) as err:
+            logger.warning("Could not read records to mirror from provider label, reason: %s", str(err))
+            return 0
+
+        # DataCite returns a single record as a dictionary rather than a list
+        if not isinstance(records, list):
+            records = [records]
+
+        return self._write(records)
+
+    def mirror_label_file(self, label_file):
+        """
+        Mirrors each record of the provided DataCite JSON label file, such as a
+        dump of the records of a DOI prefix. The file is read incrementally,
+        so may be of any size.
+
+        Returns
+        -------
+        num_mirrored : int
+            The number of records written to the mirror.
+
+        """
+        if not self._enabled:
+            return 0
+
+        num_mirrored = 0
+        records = iter_json_items(label_file, key="data")
+
+        try:
+            with self._database.batch_writes():
+                for batch in itertools.batched(records, MIRROR_BATCH_SIZE):
+                    num_mirrored += self._write(batch)
+        except ValueError as err:
+            logger.warning("Could not read records to mirror from %s, reason: %s", label_file, str(err))
+
+        logger.info("Mirrored %d provider record(s) from %s", num_mirrored, label_file)
+
+        return num_mirrored
+
+    def get_dois(self, dois, max_age=None):
+        """
+        Returns the Doi objects parsed from the mirrored provider state of the
+        provided DOIs.
+
+        Parameters
+        ----------
+        dois : iterable of str
+            The DOIs to return the mirrored state of.
+        max_age : int, optional
+            The maximum age, in seconds, of the mirrored state of a DOI for it
+            to be returned. Defaults to the value of the
+            OTHER.provider_mirror_max_age field of the INI config. A value of
+            0 disables reads from the mirror.
+
+        Returns
+        -------
+        dois : dict
+            Dictionary mapping each (lower-cased) DOI with recent enough state
+            in the mirror to the Doi object parsed from that state.
+
+        """
+        max_age = self._max_age if max_age is None else max_age
+
+        if not self._enabled or max_age <= 0:
+            return {}
+
+        provider_records = self._database.select_provider_records(dois, max_age=max_age)
+
+        if not provider_records:
+            return {}
+
+        label = json.dumps(
+            {
+                "data": [
+                    {"id": doi, "type": "dois", "attributes": provider_record["attributes"]}
+                    for doi, provider_record in provider_records.items()
+                ]
+            }
+        )
+        web_parser = DOIServiceFactory.get_web_parser_service(SERVICE_TYPE_DATACITE)
+        parsed_dois, _ = web_parser.parse_dois_from_label(label, processes=1)
+
+        logger.debug("Read %d of %d requested DOI(s) from the provider mirror", len(parsed_dois), len(provider_records))
+
+        return {doi.doi.lower(): doi for doi in parsed_dois if doi.doi}
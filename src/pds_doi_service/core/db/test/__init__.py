@@ -5,11 +5,19 @@ Planetary Data System's Digital Object Identifier service — tests for core dat
 import unittest
 
 from . import doi_database_test
+from . import job_queue_test
+from . import outbox_test
+from . import transaction_blob_store_test
+from . import transaction_label_cache_test
 from . import transaction_test
 
 
 def suite():
     suite = unittest.TestSuite()
     suite.addTests(unittest.defaultTestLoader.loadTestsFromModule(doi_database_test))
+    suite.addTests(unittest.defaultTestLoader.loadTestsFromModule(job_queue_test))
+    suite.addTests(unittest.defaultTestLoader.loadTestsFromModule(outbox_test))
+    suite.addTests(unittest.defaultTestLoader.loadTestsFromModule(transaction_blob_store_test))
+    suite.addTests(unittest.defaultTestLoader.loadTestsFromModule(transaction_label_cache_test))
     suite.addTests(unittest.defaultTestLoader.loadTestsFromModule(transaction_test))
     return suite
@@ -1,15 +1,23 @@
 #!/usr/bin/env python
 import datetime
 import os
+import shutil
+import sqlite3
+import tempfile
 import unittest
 from datetime import timezone
 from importlib import resources
 from os.path import exists
+from unittest.mock import patch
 
 from pds_doi_service.core.db.doi_database import DOIDataBase
+from pds_doi_service.core.db.transaction_on_disk import TransactionOnDisk
+from pds_doi_service.core.entities.doi import Doi
 from pds_doi_service.core.entities.doi import DoiRecord
 from pds_doi_service.core.entities.doi import DoiStatus
 from pds_doi_service.core.entities.doi import ProductType
+from pds_doi_service.core.outputs.doi_record import CONTENT_TYPE_JSON
+from pds_doi_service.core.outputs.service import DOIServiceFactory
 from pds_doi_service.core.test_utils import close_all_database_connections
 from pds_doi_service.core.test_utils import safe_remove_file
 from pds_doi_service.core.util.general_util import get_logger
@@ -248,6 +256,445 @@ class DOIDatabaseTest(unittest.TestCase):
         # Should only match two DOI's
         self.assertEqual(len(o_query_result[-1]), 2)
 
+    def test_query_by_prefix(self):
+        """
+        Test selection of database rows using tokens with only a trailing
+        wildcard, which are matched by a range over the lower-cased values
+        """
+        identifiers = [
+            "urn:nasa:pds:lab_shocked_feldspars::1.0",
+            "urn:nasa:pds:lab_shocked_feldspars:data::1.0",
+            "urn:nasa:pds:labXshocked_feldspars::1.0",
+            "urn:nasa:pds:lab_shocked_feldspar::1.0",
+            "URN:NASA:PDS:INSIGHT_CAMERAS::1.0",
+        ]
+
+        for index, identifier in enumerate(identifiers):
+            doi_record = DoiRecord(
+                identifier=identifier,
+                status=DoiStatus.Draft,
+                date_added=datetime.datetime.now(),
+                date_updated=datetime.datetime.now() + datetime.timedelta(seconds=index),
+                submitter="img-submitter@jpl.nasa.gov",
+                title=f"Prefix Test Bundle {index}",
+                type=ProductType.Bundle,
+                subtype="PDS4 Refereed Data Bundle",
+                node_id="img",
+                doi=f"10.17189/4000{index}",
+                transaction_key=f"img/{index}/2020-06-15T18:42:45.653317",
+                is_latest=True,
+            )
+
+            self._doi_database.write_doi_info_to_database(doi_record)
+
+        def select_identifiers(query_criterias):
+            columns, rows = self._doi_database.select_latest_rows(query_criterias)
+            return [row[columns.index("identifier")] for row in rows]
+
+        # Characters reserved by LIKE (_ and %) should be matched literally
+        self.assertListEqual(
+            select_identifiers({"ids": ["urn:nasa:pds:lab_shocked_feldspars:*"]}),
+            ["urn:nasa:pds:lab_shocked_feldspars::1.0", "urn:nasa:pds:lab_shocked_feldspars:data::1.0"],
+        )
+
+        # Prefixes should match case-insensitively, as LIKE does
+        self.assertListEqual(
+            select_identifiers({"ids": ["Urn:Nasa:Pds:Insight*"]}), ["URN:NASA:PDS:INSIGHT_CAMERAS::1.0"]
+        )
+        self.assertEqual(len(select_identifiers({"ids": ["*"]})), len(identifiers))
+
+        # Prefixes combine with full tokens and infix wildcards
+        self.assertListEqual(
+            select_identifiers(
+                {"ids": ["urn:nasa:pds:lab_shocked_feldspar::1.0", "urn:nasa:pds:insight*", "*:labxshocked_*"]}
+            ),
+            [
+                "urn:nasa:pds:labXshocked_feldspars::1.0",
+                "urn:nasa:pds:lab_shocked_feldspar::1.0",
+                "URN:NASA:PDS:INSIGHT_CAMERAS::1.0",
+            ],
+        )
+
+        self.assertEqual(len(select_identifiers({"doi": ["10.17189/4000*"]})), len(identifiers))
+
+        # The range predicates should be answered from the lower-cased column indexes
+        for column, criteria_key in (("identifier", "ids"), ("doi", "doi")):
+            criterias_str, criteria_dict = DOIDataBase.parse_criteria({criteria_key: ["urn:nasa:pds:lab*"]})
+
+            plan = self._doi_database.get_connection().execute(
+                f"EXPLAIN QUERY PLAN SELECT * FROM doi WHERE is_latest=1 {criterias_str}", criteria_dict
+            )
+
+            self.assertIn(f"doi_{column}_lower_idx", " ".join(row[-1] for row in plan))
+
+    def _write_search_records(self):
+        """Writes a set of records with distinct searchable metadata, returning the Doi objects written"""
+        dois = [
+            Doi(
+                title="InSight Cameras Bundle",
+                publication_date=datetime.datetime.now(),
+                product_type=ProductType.Bundle,
+                product_type_specific="PDS4 Refereed Data Bundle",
+                pds_identifier="urn:nasa:pds:insight_cameras::1.0",
+                description="Images acquired by the lander cameras on the Martian surface",
+                keywords={"mars", "insight"},
+                authors=[{"first_name": "J. N.", "last_name": "Maki"}],
+                doi="10.17189/30001",
+            ),
+            Doi(
+                title="Laboratory Shocked Feldspars Bundle",
+                publication_date=datetime.datetime.now(),
+                product_type=ProductType.Bundle,
+                product_type_specific="PDS4 Refereed Data Bundle",
+                pds_identifier="urn:nasa:pds:lab_shocked_feldspars::1.0",
+                description="Spectra of feldspars shocked in the laboratory, as analogs for Martian meteorites",
+                keywords={"feldspar", "spectroscopy"},
+                authors=[{"first_name": "J. R.", "last_name": "Johnson"}],
+                doi="10.17189/30002",
+            ),
+            Doi(
+                title="Cassini Imaging Science Subsystem Calibration Collection",
+                publication_date=datetime.datetime.now(),
+                product_type=ProductType.Collection,
+                product_type_specific="PDS4 Collection",
+                pds_identifier="urn:nasa:pds:cassini_iss:calibration::1.0",
+                description="Calibration files for the Cassini cameras",
+                keywords={"saturn"},
+                authors=[{"name": "Imaging Team"}],
+                doi="10.17189/30003",
+            ),
+        ]
+
+        for doi in dois:
+            doi_record = DoiRecord(
+                identifier=doi.pds_identifier,
+                status=DoiStatus.Draft,
+                date_added=datetime.datetime.now(tz=timezone.utc),
+                date_updated=datetime.datetime.now(tz=timezone.utc),
+                submitter="img-submitter@jpl.nasa.gov",
+                title=doi.title,
+                type=doi.product_type,
+                subtype=doi.product_type_specific,
+                node_id="img",
+                doi=doi.doi,
+                transaction_key=f"img/{doi.doi}/2020-06-15T18:42:45.653317",
+                is_latest=True,
+            )
+
+            self._doi_database.write_doi_info_to_database(doi_record, doi=doi)
+
+        return dois
+
+    def _search(self, search_text, query_criterias=None, **kwargs):
+        columns, rows = self._doi_database.search_latest_rows(search_text, query_criterias or {}, **kwargs)
+
+        return [row[columns.index("doi")] for row in rows]
+
+    def test_full_text_search(self):
+        """Test full-text search of titles, descriptions, keywords and authors"""
+        self._write_search_records()
+
+        # Title matches should rank ahead of description matches
+        self.assertListEqual(self._search("camera"), ["10.17189/30001", "10.17189/30003"])
+
+        # Descriptions, keywords and authors should all be searchable
+        self.assertListEqual(self._search("martian"), ["10.17189/30001", "10.17189/30002"])
+        self.assertListEqual(self._search("spectroscopy"), ["10.17189/30002"])
+        self.assertListEqual(self._search("johnson"), ["10.17189/30002"])
+        self.assertListEqual(self._search("imaging team"), ["10.17189/30003"])
+
+        # All words must match, and trailing wildcards should match prefixes
+        self.assertListEqual(self._search("martian feldspar"), ["10.17189/30002"])
+        self.assertListEqual(self._search("feld*"), ["10.17189/30002"])
+
+        # Characters which are operators in the FTS5 query syntax should be ignored
+        self.assertListEqual(self._search('"saturn" AND (NOT'), [])
+        self.assertListEqual(self._search("saturn -"), ["10.17189/30003"])
+
+        # Search should combine with the other query criteria
+        self.assertListEqual(self._search("martian", {"ids": ["urn:nasa:pds:lab_*"]}), ["10.17189/30002"])
+
+        with self.assertRaises(ValueError):
+            self._search(" ?! ")
+
+        # Rewriting a record should replace its entry in the search index
+        doi_record = DoiRecord(
+            identifier="urn:nasa:pds:insight_cameras::2.0",
+            status=DoiStatus.Draft,
+            date_added=datetime.datetime.now(tz=timezone.utc),
+            date_updated=datetime.datetime.now(tz=timezone.utc),
+            submitter="img-submitter@jpl.nasa.gov",
+            title="InSight Context Bundle",
+            type=ProductType.Bundle,
+            subtype="PDS4 Refereed Data Bundle",
+            node_id="img",
+            doi="10.17189/30001",
+            transaction_key="img/10.17189/30001/2020-06-16T18:42:45.653317",
+            is_latest=True,
+        )
+
+        self._doi_database.write_doi_info_to_database(doi_record)
+
+        self.assertListEqual(self._search("camera"), ["10.17189/30003"])
+        self.assertListEqual(self._search("context"), ["10.17189/30001"])
+
+        self._doi_database.close_database()
+
+    def test_search_pagination(self):
+        """Test paging through search and select results"""
+        self._write_search_records()
+
+        self.assertListEqual(self._search("bundle", limit=1), ["10.17189/30001"])
+        self.assertListEqual(self._search("bundle", limit=1, offset=1), ["10.17189/30002"])
+        self.assertListEqual(self._search("bundle", offset=2), [])
+
+        columns, rows = self._doi_database.select_latest_rows({}, limit=2, offset=1)
+
+        self.assertListEqual([row[columns.index("doi")] for row in rows], ["10.17189/30002", "10.17189/30003"])
+
+        self._doi_database.close_database()
+
+    def test_search_table_backfill(self):
+        """Test that the search index is populated from transaction labels when added to an existing database"""
+        dois = self._write_search_records()
+
+        # Write output labels for all but the last record to a transaction history
+        transaction_dir = tempfile.mkdtemp(prefix="transaction_history_")
+        self.addCleanup(shutil.rmtree, transaction_dir, ignore_errors=True)
+
+        record_service = DOIServiceFactory.get_doi_record_service()
+
+        with patch.dict(os.environ, {"OTHER_TRANSACTION_DIR": transaction_dir}):
+            for doi in dois[:-1]:
+                transaction_key = TransactionOnDisk.get_transaction_key("img", doi.doi, datetime.datetime.now())
+
+                TransactionOnDisk().write(
+                    transaction_key,
+                    output_content=record_service.create_doi_record(doi, content_type=CONTENT_TYPE_JSON),
+                    output_content_type=CONTENT_TYPE_JSON,
+                )
+
+                self._doi_database.update_rows([f"doi = '{doi.doi}'"], [f"transaction_key = '{transaction_key}'"])
+
+        self._doi_database.m_my_conn.execute("DROP TABLE doi_search")
+        self._doi_database.m_my_conn.execute("PRAGMA user_version = 0")
+        self._doi_database.m_my_conn.commit()
+        self._doi_database.close_database()
+
+        self._doi_database = DOIDataBase(self._db_name)
+
+        self.assertListEqual(self._search("feldspars"), ["10.17189/30002"])
+
+        # Descriptions, keywords and authors are indexed from the transaction labels
+        self.assertListEqual(self._search("spectroscopy"), ["10.17189/30002"])
+        self.assertListEqual(self._search("Maki"), ["10.17189/30001"])
+
+        # Only the title is indexed for a record whose label cannot be read
+        self.assertListEqual(self._search("cassini"), ["10.17189/30003"])
+        self.assertListEqual(self._search("saturn"), [])
+
+        self._doi_database.close_database()
+
+    def _similar_titles(self, title, threshold=0.8):
+        columns, results = self._doi_database.select_similar_titles(title, threshold)
+
+        return [(row[columns.index("doi")], round(similarity, 2)) for similarity, row in results]
+
+    def test_select_similar_titles(self):
+        """Test lookup of near-duplicate titles through the title index"""
+        self._write_search_records()
+
+        self.assertListEqual(self._similar_titles("INSIGHT cameras -- bundle"), [("10.17189/30001", 1.0)])
+        self.assertListEqual(self._similar_titles("Laboratory Shocked Feldspar Bundle"), [("10.17189/30002", 0.86)])
+        self.assertListEqual(self._similar_titles("Laboratory Shocked Feldspar Bundle", threshold=0.9), [])
+        self.assertListEqual(self._similar_titles("Mars Science Laboratory Bundle"), [])
+
+        # Rewriting a record should replace its entry in the title index
+        columns, rows = self._doi_database.select_latest_rows({"doi": ["10.17189/30001"]})
+        doi_record = DoiRecord(**dict(zip(columns, rows[0])))
+        doi_record.title = "InSight Instrument Deployment Camera Bundle"
+
+        self._doi_database.write_doi_info_to_database(doi_record)
+
+        self.assertListEqual(self._similar_titles("InSight Cameras Bundle"), [])
+        self.assertListEqual(
+            self._similar_titles("Insight Instrument Deployment Cameras Bundle"), [("10.17189/30001", 0.88)]
+        )
+
+    def test_rebuild_title_index(self):
+        """Test that the title index is rebuilt from the latest rows, including when added to an existing database"""
+        self._write_search_records()
+
+        self._doi_database.m_my_conn.execute("DROP TABLE doi_title_band")
+        self._doi_database.m_my_conn.execute("PRAGMA user_version = 0")
+        self._doi_database.close_database()
+
+        self._doi_database = DOIDataBase(self._db_name)
+
+        self.assertListEqual(self._similar_titles("Cassini ISS Calibration Collection", threshold=0.5), [])
+        self.assertListEqual(
+            self._similar_titles("Cassini Imaging Science Subsystem Calibration Collections"),
+            [("10.17189/30003", 0.98)],
+        )
+
+        self._doi_database.m_my_conn.execute("DELETE FROM doi_title_band")
+
+        self.assertListEqual(self._similar_titles("InSight Cameras Bundle"), [("10.17189/30001", 1.0)])
+        self.assertListEqual(self._similar_titles("InSight Camera Bundle", threshold=0.7), [])
+
+        self.assertEqual(self._doi_database.rebuild_title_index(), 3)
+        self.assertListEqual(self._similar_titles("InSight Camera Bundle", threshold=0.7), [("10.17189/30001", 0.77)])
+
+        self._doi_database.close_database()
+
+    def test_schema_migration(self):
+        """Test that the supporting tables are only created when the schema of a database is out of date"""
+        self._write_search_records()
+
+        self.assertEqual(self._doi_database.read_schema_version(), DOIDataBase.SCHEMA_VERSION)
+        self._doi_database.close_database()
+
+        # Connecting to an up-to-date database should not write to it
+        with patch.object(DOIDataBase, "migrate_schema") as migrate_schema:
+            self._doi_database = DOIDataBase(self._db_name)
+            self._doi_database.get_connection()
+
+        migrate_schema.assert_not_called()
+        self.assertListEqual(self._search("feldspars"), ["10.17189/30002"])
+        self._doi_database.close_database()
+
+        # A database predating the current schema version is migrated once
+        connection = sqlite3.connect(self._db_name)
+        connection.execute("PRAGMA user_version = 0")
+        connection.close()
+
+        with patch.object(DOIDataBase, "migrate_schema") as migrate_schema:
+            self._doi_database = DOIDataBase(self._db_name)
+            self._doi_database.get_connection()
+
+        migrate_schema.assert_called_once_with("doi")
+        self._doi_database.close_database()
+
+    def test_change_counter(self):
+        """Test that each write to the database increments its change counter"""
+        self._doi_database.get_connection()
+
+        instance, counter = DOIDataBase.read_change_counter(self._db_name)
+
+        self.assertEqual(counter, 0)
+
+        self._write_search_records()
+
+        next_instance, next_counter = DOIDataBase.read_change_counter(self._db_name)
+
+        self.assertEqual(next_instance, instance)
+        self.assertGreater(next_counter, counter)
+
+        self._doi_database.update_rows(["doi = '10.17189/30001'"], ["submitter = 'other@node.gov'"])
+        self._doi_database.m_my_conn.commit()
+
+        self.assertTupleEqual(DOIDataBase.read_change_counter(self._db_name), (instance, next_counter + 1))
+
+        # A database that does not exist (or predates the counter) has no version
+        self.assertIsNone(DOIDataBase.read_change_counter(self._db_name + ".missing"))
+        self.assertFalse(exists(self._db_name + ".missing"))
+
+        self._doi_database.close_database()
+
+    def test_provider_mirror(self):
+        """Test writing and reading back the mirrored state of provider records"""
+        attributes = {"doi": "10.17189/ABC-123", "state": "draft", "updated": "2026-01-01T00:00:00Z"}
+
+        self.assertEqual(self._doi_database.write_provider_records([attributes, {"state": "findable"}]), 1)
+
+        # Mirrored DOIs are matched regardless of case
+        provider_records = self._doi_database.select_provider_records(["10.17189/abc-123", "10.17189/unknown"])
+
+        self.assertListEqual(list(provider_records), ["10.17189/abc-123"])
+        self.assertDictEqual(provider_records["10.17189/abc-123"]["attributes"], attributes)
+
+        etag = provider_records["10.17189/abc-123"]["etag"]
+
+        self.assertEqual(etag, DOIDataBase.provider_attributes_etag(attributes))
+
+        # A newer state replaces the mirrored one, changing its etag
+        newer_attributes = dict(attributes, state="findable", updated="2026-02-01T00:00:00Z")
+        self._doi_database.write_provider_records([newer_attributes])
+
+        provider_record = self._doi_database.select_provider_records(["10.17189/ABC-123"])["10.17189/abc-123"]
+
+        self.assertEqual(provider_record["attributes"]["state"], "findable")
+        self.assertNotEqual(provider_record["etag"], etag)
+
+        # While an older state (e.g. from a stale response) does not
+        self._doi_database.write_provider_records([attributes])
+
+        provider_record = self._doi_database.select_provider_records(["10.17189/ABC-123"])["10.17189/abc-123"]
+
+        self.assertEqual(provider_record["attributes"]["state"], "findable")
+
+        # Only state mirrored within the maximum age is returned when one is provided
+        self._doi_database.m_my_conn.execute(
+            f"UPDATE doi{DOIDataBase.PROVIDER_MIRROR_TABLE_SUFFIX} SET mirrored = mirrored - 600"
+        )
+
+        self.assertDictEqual(self._doi_database.select_provider_records(["10.17189/ABC-123"], max_age=300), {})
+        self.assertEqual(len(self._doi_database.select_provider_records(["10.17189/ABC-123"], max_age=900)), 1)
+
+        self._doi_database.close_database()
+
+    def test_idempotency_keys(self):
+        """Test recording, completing and expiring the idempotency keys of API requests"""
+        self.assertIsNone(self._doi_database.begin_idempotent_request("key-1", "abc", 3600, 60))
+
+        # A key may only be begun once
+        existing = self._doi_database.begin_idempotent_request("key-1", "def", 3600, 60)
+
+        self.assertEqual(existing["fingerprint"], "abc")
+        self.assertIsNone(existing["completed"])
+
+        self._doi_database.complete_idempotent_request("key-1", '{"doi": "10.17189/1"}', 200, "{}")
+
+        existing = self._doi_database.begin_idempotent_request("key-1", "abc", 3600, 60)
+
+        self.assertIsNotNone(existing["completed"])
+        self.assertEqual(existing["response"], '{"doi": "10.17189/1"}')
+        self.assertEqual(existing["response_code"], 200)
+
+        # A removed key may be begun again
+        self.assertIsNone(self._doi_database.begin_idempotent_request("key-2", "abc", 3600, 60))
+        self._doi_database.remove_idempotent_request("key-2")
+        self.assertIsNone(self._doi_database.select_idempotent_request("key-2"))
+        self.assertIsNone(self._doi_database.begin_idempotent_request("key-2", "abc", 3600, 60))
+
+        # A key removed after its insert was ignored, but before it was
+        # selected, is recorded rather than reported as recorded
+        select_idempotent_request = self._doi_database.select_idempotent_request
+
+        def remove_then_select(key, table_name=None):
+            self._doi_database.remove_idempotent_request(key)
+            patched_select.stop()
+
+            return select_idempotent_request(key, table_name=table_name)
+
+        patched_select = patch.object(self._doi_database, "select_idempotent_request", side_effect=remove_then_select)
+        patched_select.start()
+
+        self.assertIsNone(self._doi_database.begin_idempotent_request("key-2", "def", 3600, 60))
+        self.assertEqual(self._doi_database.select_idempotent_request("key-2")["fingerprint"], "def")
+
+        # Incomplete requests older than the lock timeout, and all keys older
+        # than the maximum age, are expired
+        self._doi_database.m_my_conn.execute(
+            f"UPDATE doi{DOIDataBase.IDEMPOTENCY_TABLE_SUFFIX} SET created = created - 600"
+        )
+
+        self.assertIsNotNone(self._doi_database.begin_idempotent_request("key-1", "abc", 3600, 60))
+        self.assertIsNone(self._doi_database.begin_idempotent_request("key-2", "abc", 3600, 60))
+        self.assertIsNone(self._doi_database.begin_idempotent_request("key-1", "abc", 300, 60))
+
+        self._doi_database.close_database()
+
     def test_datapaper_type_roundtrip(self):
         """Test that ProductType.DataPaper can be stored and retrieved without corruption.
 
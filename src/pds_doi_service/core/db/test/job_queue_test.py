@@ -0,0 +1,130 @@
+#!/usr/bin/env python
+import json
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+
+from pds_doi_service.core.db.job_queue import JobQueue
+from pds_doi_service.core.db.job_queue import JobWorkerPool
+from pds_doi_service.core.entities.job import JobStatus
+
+
+class JobQueueTestCase(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp(prefix="job_queue_")
+        self.job_queue = JobQueue(os.path.join(self.temp_dir, "jobs.db"))
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_job_lifecycle(self):
+        """Test submitting, claiming and completing jobs in order"""
+        first_job_id = self.job_queue.submit("first", {"value": 1}, payload=b"<xml/>")
+        second_job_id = self.job_queue.submit("second")
+
+        job = self.job_queue.get(first_job_id)
+
+        self.assertEqual(job.status, JobStatus.Queued)
+        self.assertDictEqual(job.arguments, {"value": 1})
+        self.assertEqual(job.payload, b"<xml/>")
+        self.assertFalse(job.finished)
+
+        # Jobs should be claimed in the order they were submitted
+        claimed_job = self.job_queue.claim_next()
+        self.assertEqual(claimed_job.job_id, first_job_id)
+        self.assertEqual(self.job_queue.get(first_job_id).status, JobStatus.Running)
+
+        self.job_queue.update_progress(first_job_id, 0.5, "Halfway")
+
+        job = self.job_queue.get(first_job_id)
+        self.assertEqual(job.progress, 0.5)
+        self.assertEqual(job.message, "Halfway")
+
+        self.job_queue.complete(first_job_id, JobStatus.Succeeded, result="[]", result_code=200)
+
+        job = self.job_queue.get(first_job_id)
+        self.assertTrue(job.finished)
+        self.assertEqual(job.result_code, 200)
+        self.assertIsNone(job.payload)
+
+        self.assertEqual(self.job_queue.claim_next().job_id, second_job_id)
+        self.assertIsNone(self.job_queue.claim_next())
+
+        self.assertIsNone(self.job_queue.get("not-a-real-job"))
+
+    def test_requeue_interrupted(self):
+        """Test that running jobs are returned to the queue after an interruption"""
+        job_id = self.job_queue.submit("interrupted")
+        self.job_queue.claim_next()
+
+        # Simulate a restart by opening the same queue anew
+        restarted_queue = JobQueue(self.job_queue.db_file)
+
+        self.assertEqual(restarted_queue.requeue_interrupted(), 1)
+        self.assertEqual(restarted_queue.get(job_id).status, JobStatus.Queued)
+        self.assertEqual(restarted_queue.claim_next().job_id, job_id)
+
+    def test_requeue_interrupted_resumable(self):
+        """Test that only interrupted jobs of resumable operations are returned to the queue"""
+        resumed_job_id = self.job_queue.submit("get_check_dois")
+        failed_job_id = self.job_queue.submit("post_dois", payload=b"<label/>")
+        self.job_queue.claim_next()
+        self.job_queue.claim_next()
+
+        restarted_queue = JobQueue(self.job_queue.db_file)
+
+        self.assertEqual(restarted_queue.requeue_interrupted(["get_check_dois"]), 1)
+        self.assertEqual(restarted_queue.get(resumed_job_id).status, JobStatus.Queued)
+
+        failed_job = restarted_queue.get(failed_job_id)
+
+        self.assertEqual(failed_job.status, JobStatus.Failed)
+        self.assertIn("interrupted", failed_job.message)
+        self.assertIsNone(failed_job.payload)
+
+        self.assertEqual(restarted_queue.claim_next().job_id, resumed_job_id)
+        self.assertIsNone(restarted_queue.claim_next())
+
+    def test_worker_pool(self):
+        """Test running of jobs by the worker pool"""
+        finished = threading.Semaphore(0)
+
+        def _handler(job, report_progress):
+            try:
+                report_progress(0.5, "Working")
+
+                if job.operation == "fail":
+                    raise RuntimeError("Failed on purpose")
+
+                return json.dumps({"operation": job.operation}), 200
+            finally:
+                finished.release()
+
+        job_worker_pool = JobWorkerPool(self.job_queue, _handler, num_workers=2)
+        job_worker_pool.start()
+
+        try:
+            success_job_id = job_worker_pool.submit("succeed")
+            failure_job_id = job_worker_pool.submit("fail")
+
+            for _ in range(2):
+                self.assertTrue(finished.acquire(timeout=10))
+        finally:
+            job_worker_pool.stop(timeout=10)
+
+        success_job = self.job_queue.get(success_job_id)
+
+        self.assertEqual(success_job.status, JobStatus.Succeeded)
+        self.assertEqual(success_job.progress, 1.0)
+        self.assertDictEqual(json.loads(success_job.result), {"operation": "succeed"})
+
+        failure_job = self.job_queue.get(failure_job_id)
+
+        self.assertEqual(failure_job.status, JobStatus.Failed)
+        self.assertIn("Failed on purpose", failure_job.message)
+
+
+if __name__ == "__main__":
+    unittest.main()
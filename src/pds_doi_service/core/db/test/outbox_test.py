@@ -0,0 +1,238 @@
+#!/usr/bin/env python
+import os
+import time
+import unittest
+from datetime import datetime
+from importlib import resources
+from os.path import exists
+from unittest.mock import patch
+
+import pds_doi_service.core.outputs.circuit_breaker
+import requests
+from pds_doi_service.benchmark.fake_datacite import FakeDataCiteServer
+from pds_doi_service.core.db.outbox import is_transient_error
+from pds_doi_service.core.db.outbox import ProviderOutbox
+from pds_doi_service.core.db.transaction_builder import TransactionBuilder
+from pds_doi_service.core.entities.doi import Doi
+from pds_doi_service.core.entities.doi import DoiStatus
+from pds_doi_service.core.entities.doi import ProductType
+from pds_doi_service.core.entities.exceptions import ProviderUnavailableException
+from pds_doi_service.core.entities.exceptions import WebRequestException
+from pds_doi_service.core.outputs.circuit_breaker import STATE_CLOSED
+from pds_doi_service.core.outputs.circuit_breaker import STATE_OPEN
+from pds_doi_service.core.outputs.doi_record import CONTENT_TYPE_JSON
+from pds_doi_service.core.outputs.service import DOIServiceFactory
+from pds_doi_service.core.outputs.service import SERVICE_TYPE_DATACITE
+from pds_doi_service.core.outputs.web_client import WEB_METHOD_POST
+from pds_doi_service.core.outputs.web_client import WEB_METHOD_PUT
+from pds_doi_service.core.test_utils import close_all_database_connections
+from pds_doi_service.core.test_utils import safe_remove_file
+
+
+class ProviderOutboxTestCase(unittest.TestCase):
+    """Unit tests for the outbox.py module, run against a fake DataCite server"""
+
+    def setUp(self):
+        self._db_name = str(resources.files(__name__) / "outbox_temp.db")
+
+        if exists(self._db_name):
+            os.remove(self._db_name)
+
+        self._server = FakeDataCiteServer()
+        self._server.start()
+        self.addCleanup(self._server.stop)
+
+        environment = patch.dict(
+            os.environ,
+            {
+                "DATACITE_URL": self._server.dois_url,
+                "DATACITE_USER": "test",
+                "DATACITE_PASSWORD": "test",
+                "OTHER_OUTBOX_ENABLED": "true",
+                "OTHER_OUTBOX_BATCH_SIZE": "2",
+                "OTHER_PROVIDER_BREAKER_THRESHOLD": "2",
+                "OTHER_PROVIDER_BREAKER_RESET_TIMEOUT": "60",
+            },
+        )
+        environment.start()
+        self.addCleanup(environment.stop)
+
+        # Each test starts with new circuit breakers, configured as above
+        circuit_breakers = patch.dict(pds_doi_service.core.outputs.circuit_breaker._circuit_breakers, clear=True)
+        circuit_breakers.start()
+        self.addCleanup(circuit_breakers.stop)
+
+        self._transaction_builder = TransactionBuilder(self._db_name)
+        self._web_client = DOIServiceFactory.get_web_client_service(SERVICE_TYPE_DATACITE)
+        self._outbox = ProviderOutbox(self._transaction_builder, web_client=self._web_client)
+
+    def tearDown(self):
+        close_all_database_connections(self._transaction_builder)
+        safe_remove_file(self._db_name)
+
+    def _enqueue(self, identifier, url=None, method=WEB_METHOD_POST):
+        doi = Doi(
+            title=f"Outbox Test Bundle {identifier}",
+            publication_date=datetime(2026, 1, 1),
+            product_type=ProductType.Bundle,
+            product_type_specific="PDS4 Refereed Data Bundle",
+            pds_identifier=f"urn:nasa:pds:{identifier}::1.0",
+            status=DoiStatus.Reserved,
+            node_id="img",
+            authors=[{"first_name": "A.", "last_name": "Person"}],
+            publisher="NASA Planetary Data System",
+            date_record_added=datetime(2026, 1, 1),
+            date_record_updated=datetime(2026, 1, 1),
+        )
+
+        # Updates (rather than creations) are of an existing draft DOI
+        if method == WEB_METHOD_PUT:
+            doi.doi = f"10.17189/{identifier}"
+            url = url or f"{self._server.dois_url}/{doi.doi}"
+
+        payload = DOIServiceFactory.get_doi_record_service(SERVICE_TYPE_DATACITE).create_doi_record(
+            doi, content_type=CONTENT_TYPE_JSON
+        )
+
+        return self._outbox.enqueue(
+            "reserve",
+            "img-submitter@jpl.nasa.gov",
+            doi,
+            method,
+            url or self._server.dois_url,
+            payload,
+            CONTENT_TYPE_JSON,
+        )
+
+    def test_drain(self):
+        """Test replaying queued submissions, and logging their transactions"""
+        self.assertTrue(self._outbox.enabled)
+
+        for identifier in ("outbox_1", "outbox_2", "outbox_3"):
+            self._enqueue(identifier)
+
+        self.assertEqual(len(self._outbox.pending()), 3)
+
+        self.assertDictEqual(self._outbox.drain(), {"submitted": 3, "failed": 0})
+        self.assertDictEqual(self._server.request_counts, {"POST": 3})
+        self.assertListEqual(self._outbox.pending(), [])
+
+        doi_database = self._transaction_builder.m_doi_database
+        records = doi_database.select_latest_records({"ids": ["urn:nasa:pds:outbox_*"]})
+
+        self.assertEqual(len(records), 3)
+        self.assertTrue(all(record.doi and record.submitter == "img-submitter@jpl.nasa.gov" for record in records))
+
+        # The provider's responses are mirrored as usual
+        self.assertEqual(len(doi_database.select_provider_records([record.doi for record in records])), 3)
+
+    def test_enqueue_without_drainer(self):
+        """Test that queueing from a process without a drainer warns that an API server must replay the submission"""
+        with patch("pds_doi_service.core.db.outbox._outbox_drainer", None):
+            with self.assertLogs("pds_doi_service.core.db.outbox", level="WARNING") as logs:
+                self._enqueue("outbox_1")
+
+        self.assertTrue(any("No outbox drainer runs in this process" in line for line in logs.output))
+
+        with patch("pds_doi_service.core.db.outbox._outbox_drainer", object()):
+            with self.assertLogs("pds_doi_service.core.db.outbox", level="WARNING") as logs:
+                self._enqueue("outbox_2")
+
+        self.assertFalse(any("No outbox drainer runs in this process" in line for line in logs.output))
+
+    def test_drain_provider_unavailable(self):
+        """Test that draining stops as soon as the provider is found to be unavailable"""
+        for identifier in ("outbox_1", "outbox_2", "outbox_3"):
+            self._enqueue(identifier, method=WEB_METHOD_PUT)
+
+        self._server.available = False
+
+        # The first failure stops the drain, and every claimed submission is returned
+        self.assertDictEqual(self._outbox.drain(), {"submitted": 0, "failed": 0})
+        self.assertDictEqual(self._server.request_counts, {"PUT": 1})
+
+        pending = self._outbox.pending()
+
+        self.assertListEqual([entry["attempts"] for entry in pending], [1, 1, 0])
+        self.assertIsNone(pending[0]["claimed"])
+        self.assertIn("503", pending[0]["last_error"])
+
+        # Once the breaker opens, drains send nothing until a health probe is due
+        self._outbox.drain()
+
+        self.assertEqual(self._web_client.circuit_breaker.state, STATE_OPEN)
+        self.assertDictEqual(self._outbox.drain(), {"submitted": 0, "failed": 0})
+        self.assertDictEqual(self._server.request_counts, {"PUT": 2})
+
+        self._server.available = True
+
+        with patch.object(
+            pds_doi_service.core.outputs.circuit_breaker.time, "monotonic", return_value=time.monotonic() + 60
+        ):
+            self.assertDictEqual(self._outbox.drain(), {"submitted": 3, "failed": 0})
+
+        # A single GET probed the provider's recovery, before the submissions were replayed
+        self.assertDictEqual(self._server.request_counts, {"PUT": 5, "GET": 1})
+        self.assertEqual(self._web_client.circuit_breaker.state, STATE_CLOSED)
+
+    def test_drain_post_provider_error(self):
+        """Test that a replayed POST which fails once sent is marked as failed, as the provider may have accepted it"""
+        failed_id = self._enqueue("outbox_1")
+
+        self._server.available = False
+
+        self.assertDictEqual(self._outbox.drain(), {"submitted": 0, "failed": 1})
+        self.assertListEqual(self._outbox.pending(), [])
+        self.assertListEqual([entry["id"] for entry in self._outbox.failed()], [failed_id])
+
+        self._server.available = True
+
+        # The submission is never replayed, so could not create a duplicate DOI
+        self.assertDictEqual(self._outbox.drain(), {"submitted": 0, "failed": 0})
+        self.assertDictEqual(self._server.request_counts, {"POST": 1})
+
+    def test_drain_rejected(self):
+        """Test that submissions rejected by the provider are marked as failed, and no longer replayed"""
+        rejected_id = self._enqueue("outbox_1", url=f"{self._server.url}/elsewhere")
+        self._enqueue("outbox_2")
+
+        self.assertDictEqual(self._outbox.drain(), {"submitted": 1, "failed": 1})
+        self.assertListEqual(self._outbox.pending(), [])
+
+        failed = self._outbox.failed()
+
+        self.assertListEqual([entry["id"] for entry in failed], [rejected_id])
+        self.assertIn("404", failed[0]["last_error"])
+
+        self.assertDictEqual(self._outbox.drain(), {"submitted": 0, "failed": 0})
+
+    def test_is_transient_error(self):
+        """Test the classification of provider errors as transient or rejections"""
+        self.assertTrue(is_transient_error(ProviderUnavailableException("open")))
+        self.assertTrue(is_transient_error(ConnectionRefusedError()))
+        self.assertFalse(is_transient_error(WebRequestException("rejected")))
+        self.assertFalse(is_transient_error(ValueError("invalid")))
+
+        self._server.available = False
+
+        with self.assertRaises(WebRequestException) as context:
+            self._web_client.submit_content("{}", url=self._server.dois_url)
+
+        self.assertTrue(is_transient_error(context.exception))
+
+        # A POST is only retried if it was never sent, as it may otherwise have created a DOI
+        self.assertFalse(is_transient_error(context.exception, WEB_METHOD_POST))
+        self.assertFalse(is_transient_error(requests.exceptions.ReadTimeout(), WEB_METHOD_POST))
+        self.assertTrue(is_transient_error(requests.exceptions.ReadTimeout(), WEB_METHOD_PUT))
+        self.assertTrue(is_transient_error(ProviderUnavailableException("open"), WEB_METHOD_POST))
+        self.assertTrue(is_transient_error(requests.exceptions.ConnectTimeout(), WEB_METHOD_POST))
+
+        # Nothing listens on port 1, so the connection is refused
+        with self.assertRaises(requests.exceptions.ConnectionError) as context:
+            self._web_client.submit_content("{}", url="http://127.0.0.1:1/dois")
+
+        self.assertTrue(is_transient_error(context.exception, WEB_METHOD_POST))
+
+
+if __name__ == "__main__":
+    unittest.main()
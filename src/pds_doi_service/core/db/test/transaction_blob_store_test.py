@@ -0,0 +1,169 @@
+#!/usr/bin/env python
+import os
+import shutil
+import tempfile
+import time
+import unittest
+from datetime import datetime
+from importlib import resources
+from unittest.mock import patch
+
+from pds_doi_service.core.db.transaction_blob_store import BLOB_DIR_NAME
+from pds_doi_service.core.db.transaction_blob_store import CHECKOUT_DIR_NAME
+from pds_doi_service.core.db.transaction_blob_store import MANIFEST_FILE_NAME
+from pds_doi_service.core.db.transaction_blob_store import TransactionBlobStore
+from pds_doi_service.core.db.transaction_on_disk import TransactionOnDisk
+from pds_doi_service.core.outputs.doi_record import CONTENT_TYPE_JSON
+from pds_doi_service.core.util.migrate_transaction_history import migrate_transaction_history
+
+
+class TransactionBlobStoreTestCase(unittest.TestCase):
+    test_dir = ""
+    data_dir = ""
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.test_dir = str(resources.files(__name__))
+        cls.data_dir = os.path.join(cls.test_dir, "data")
+
+    def setUp(self):
+        self.transaction_dir = tempfile.mkdtemp(prefix="transaction_history_")
+
+        # Redirect the transaction history to a temporary location, and enable
+        # the blob store backend
+        self.env_patcher = patch.dict(
+            os.environ, {"OTHER_TRANSACTION_DIR": self.transaction_dir, "OTHER_TRANSACTION_STORE": "blob"}
+        )
+        self.env_patcher.start()
+
+    def tearDown(self):
+        self.env_patcher.stop()
+        shutil.rmtree(self.transaction_dir, ignore_errors=True)
+
+    def test_put_and_get(self):
+        """Test round-tripping and deduplication of blobs"""
+        blob_store = TransactionBlobStore()
+
+        digest = blob_store.put("some label content")
+        self.assertEqual(blob_store.put(b"some label content"), digest)
+        self.assertEqual(blob_store.get(digest), b"some label content")
+
+        # Only a single blob should have been written
+        blob_files = [files for _, _, files in os.walk(blob_store.blob_dir)]
+        self.assertEqual(sum(map(len, blob_files)), 1)
+
+    def test_transaction_write_to_blob_store(self):
+        """Test the TransactionOnDisk.write() method with the blob store backend"""
+        transaction_on_disk = TransactionOnDisk()
+
+        input_label = os.path.join(self.data_dir, "pds4_bundle.xml")
+        output_label = os.path.join(self.data_dir, "datacite_record_draft.json")
+
+        with open(output_label, "r") as infile:
+            output_content = infile.read()
+
+        # Write the same products for two different transactions
+        transaction_keys = [
+            transaction_on_disk.get_transaction_key("eng", "10.0000/abc123", datetime(2026, 1, day)) for day in (1, 2)
+        ]
+
+        for transaction_key in transaction_keys:
+            transaction_on_disk.write(
+                transaction_key,
+                input_ref=input_label,
+                output_content=output_content,
+                output_content_type=CONTENT_TYPE_JSON,
+            )
+
+            # Only the manifest should be written to the transaction directory
+            self.assertListEqual(os.listdir(transaction_key), [MANIFEST_FILE_NAME])
+            self.assertSetEqual(
+                set(TransactionBlobStore.read_manifest(transaction_key).keys()), {"input.xml", "output.json"}
+            )
+
+            # The output label should still be readable through the usual API
+            label_file = TransactionOnDisk.output_label_for_transaction_key(transaction_key, "urn:nasa:pds:fake")
+
+            with open(label_file, "r") as infile:
+                self.assertEqual(infile.read(), output_content)
+
+        # Identical products should only have been stored once
+        blob_dir = os.path.join(self.transaction_dir, BLOB_DIR_NAME)
+        stored_blobs = [name for _, _, files in os.walk(blob_dir) for name in files if name.endswith(".gz")]
+        self.assertEqual(len(stored_blobs), 2)
+
+    def test_evict_checkouts(self):
+        """Test that checkouts of output labels are evicted once unread for the maximum age"""
+        transaction_on_disk = TransactionOnDisk()
+        blob_store = TransactionBlobStore()
+
+        transaction_keys = [
+            transaction_on_disk.get_transaction_key("eng", "10.0000/abc123", datetime(2026, 1, day)) for day in (1, 2)
+        ]
+
+        for day, transaction_key in enumerate(transaction_keys, start=1):
+            transaction_on_disk.write(
+                transaction_key, output_content=f'{{"day": {day}}}', output_content_type=CONTENT_TYPE_JSON
+            )
+
+        checkout_paths = [blob_store.output_label_path(transaction_key) for transaction_key in transaction_keys]
+
+        for checkout_path in checkout_paths:
+            self.assertTrue(checkout_path.startswith(os.path.join(blob_store.blob_dir, CHECKOUT_DIR_NAME)))
+
+        # Age both checkouts past the maximum age, then read the second again
+        stale_time = time.time() - 7200
+
+        for checkout_path in checkout_paths:
+            os.utime(checkout_path, (stale_time, stale_time))
+
+        blob_store.output_label_path(transaction_keys[1])
+
+        # Only the unread checkout is evicted
+        self.assertEqual(blob_store.evict_checkouts(), 1)
+        self.assertFalse(os.path.exists(checkout_paths[0]))
+        self.assertTrue(os.path.exists(checkout_paths[1]))
+
+        # An evicted label is checked out again when next read
+        with open(blob_store.output_label_path(transaction_keys[0]), "r") as infile:
+            self.assertEqual(infile.read(), '{"day": 1}')
+
+        # A maximum age of 0 keeps checkouts indefinitely
+        os.utime(checkout_paths[0], (stale_time, stale_time))
+
+        with patch.dict(os.environ, {"OTHER_TRANSACTION_CHECKOUT_MAX_AGE": "0"}):
+            self.assertEqual(TransactionBlobStore().evict_checkouts(), 0)
+
+        self.assertTrue(os.path.exists(checkout_paths[0]))
+
+    def test_migrate_transaction_history(self):
+        """Test migration of an existing transaction history to the blob store"""
+        transaction_key = TransactionOnDisk.get_transaction_key("eng", "10.0000/abc123", datetime(2026, 1, 1))
+        os.makedirs(os.path.join(transaction_key, "input"))
+
+        shutil.copy(os.path.join(self.data_dir, "pds4_bundle.xml"), os.path.join(transaction_key, "input"))
+        shutil.copy(
+            os.path.join(self.data_dir, "datacite_record_draft.json"), os.path.join(transaction_key, "output.json")
+        )
+
+        num_migrated, num_skipped, num_bytes = migrate_transaction_history(self.transaction_dir)
+
+        self.assertEqual(num_migrated, 1)
+        self.assertEqual(num_skipped, 0)
+        self.assertGreater(num_bytes, 0)
+        self.assertListEqual(os.listdir(transaction_key), [MANIFEST_FILE_NAME])
+
+        label_file = TransactionOnDisk.output_label_for_transaction_key(transaction_key, "urn:nasa:pds:fake")
+
+        with open(label_file, "r") as infile, open(os.path.join(self.data_dir, "datacite_record_draft.json")) as orig:
+            self.assertEqual(infile.read(), orig.read())
+
+        # Re-running the migration should be a no-op
+        num_migrated, num_skipped, _ = migrate_transaction_history(self.transaction_dir)
+
+        self.assertEqual(num_migrated, 0)
+        self.assertEqual(num_skipped, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
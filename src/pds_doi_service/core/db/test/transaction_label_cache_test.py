@@ -0,0 +1,132 @@
+#!/usr/bin/env python
+import os
+import shutil
+import tempfile
+import unittest
+from datetime import datetime
+from importlib import resources
+from unittest.mock import patch
+
+from pds_doi_service.core.db.transaction_label_cache import get_transaction_label_cache
+from pds_doi_service.core.db.transaction_label_cache import TransactionLabelCache
+from pds_doi_service.core.db.transaction_on_disk import TransactionOnDisk
+from pds_doi_service.core.outputs.datacite.datacite_web_parser import DOIDataCiteWebParser
+from pds_doi_service.core.outputs.doi_record import CONTENT_TYPE_JSON
+
+
+class TransactionLabelCacheTestCase(unittest.TestCase):
+    test_dir = ""
+    data_dir = ""
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.test_dir = str(resources.files(__name__))
+        cls.data_dir = os.path.join(cls.test_dir, "data")
+
+        with open(os.path.join(cls.data_dir, "datacite_record_draft.json"), "r") as infile:
+            cls.output_content = infile.read()
+
+    def setUp(self):
+        self.transaction_dir = tempfile.mkdtemp(prefix="transaction_history_")
+
+        self.env_patcher = patch.dict(os.environ, {"OTHER_TRANSACTION_DIR": self.transaction_dir})
+        self.env_patcher.start()
+
+        self.web_parser = DOIDataCiteWebParser()
+
+    def tearDown(self):
+        self.env_patcher.stop()
+        shutil.rmtree(self.transaction_dir, ignore_errors=True)
+
+    def _write_transaction(self, day, output_content=None):
+        transaction_key = TransactionOnDisk.get_transaction_key("eng", "10.0000/abc123", datetime(2026, 1, day))
+
+        TransactionOnDisk().write(
+            transaction_key, output_content=output_content or self.output_content, output_content_type=CONTENT_TYPE_JSON
+        )
+
+        return transaction_key
+
+    def test_hits_and_copies(self):
+        """Test that repeated lookups are served from the cache as independent copies"""
+        cache = TransactionLabelCache(max_size=8)
+        transaction_key = self._write_transaction(1)
+
+        dois = cache.get_dois(transaction_key, "urn:nasa:pds:fake", self.web_parser)
+        self.assertEqual(len(dois), 1)
+
+        # Modifying the returned objects must not affect the cached entry
+        dois[0].title = "modified title"
+        dois[0].keywords.add("modified")
+
+        # Remove the label from disk, subsequent reads should not need it
+        os.remove(os.path.join(transaction_key, "output.json"))
+
+        cached_dois = cache.get_dois(transaction_key, "urn:nasa:pds:fake", self.web_parser)
+        self.assertNotEqual(cached_dois[0].title, "modified title")
+        self.assertNotIn("modified", cached_dois[0].keywords)
+
+        stats = cache.stats()
+        self.assertEqual(stats["hits"], 1)
+        self.assertEqual(stats["misses"], 2)  # parsed Dois plus the raw label
+        self.assertEqual(stats["size"], 2)
+
+    def test_eviction(self):
+        """Test that the least recently used entries are evicted once full"""
+        cache = TransactionLabelCache(max_size=2)
+
+        transaction_keys = [self._write_transaction(day) for day in (1, 2, 3)]
+
+        for transaction_key in transaction_keys:
+            cache.get_label(transaction_key, "urn:nasa:pds:fake")
+
+        stats = cache.stats()
+        self.assertEqual(stats["size"], 2)
+        self.assertEqual(stats["evictions"], 1)
+
+        # The first transaction should have been evicted, requiring a reload
+        cache.get_label(transaction_keys[0], "urn:nasa:pds:fake")
+        self.assertEqual(cache.stats()["misses"], 4)
+
+        # A cache with no capacity should never hold anything
+        disabled_cache = TransactionLabelCache(max_size=0)
+        disabled_cache.get_label(transaction_keys[0], "urn:nasa:pds:fake")
+        disabled_cache.get_label(transaction_keys[0], "urn:nasa:pds:fake")
+        self.assertEqual(disabled_cache.stats()["hits"], 0)
+
+    def test_invalidate_on_write(self):
+        """Test that rewriting a transaction drops its cached entries"""
+        cache = get_transaction_label_cache()
+        transaction_key = self._write_transaction(1)
+
+        self.assertEqual(cache.get_label(transaction_key, "urn:nasa:pds:fake"), self.output_content)
+
+        new_output_content = self.output_content.replace("InSight Cameras Bundle", "Rewritten Bundle")
+        self._write_transaction(1, output_content=new_output_content)
+
+        self.assertEqual(cache.get_label(transaction_key, "urn:nasa:pds:fake"), new_output_content)
+
+    def test_invalidate_during_load(self):
+        """Test that a label loaded before a concurrent rewrite of its transaction is not cached"""
+        cache = TransactionLabelCache(max_size=8)
+        transaction_key = self._write_transaction(1)
+
+        def _load_then_rewrite():
+            # The label is read, then the transaction is rewritten before the read label is cached
+            label = cache.get_label(transaction_key, "urn:nasa:pds:fake")
+            cache.invalidate(transaction_key)
+
+            return label
+
+        key = (transaction_key, "stale")
+
+        self.assertEqual(cache._get_or_load(key, _load_then_rewrite), self.output_content)
+        self.assertNotIn(key, cache._entries)
+
+        # Loads which did not race an invalidation are cached as usual
+        self.assertEqual(cache._get_or_load(key, lambda: "label"), "label")
+        self.assertIn(key, cache._entries)
+
+
+if __name__ == "__main__":
+    unittest.main()
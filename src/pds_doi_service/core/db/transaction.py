@@ -12,15 +12,20 @@ transaction.py
 Defines the Transaction class, which is used to log transactions both to local
 disk and database table.
 """
+import json
 from datetime import datetime
 from datetime import timezone
 
+from pds_doi_service.core.db.transaction_label_cache import get_transaction_label_cache
 from pds_doi_service.core.db.transaction_on_disk import TransactionOnDisk
 from pds_doi_service.core.entities.doi import DoiRecord
+from pds_doi_service.core.outputs.doi_record import CONTENT_TYPE_JSON
 from pds_doi_service.core.outputs.service import DOIServiceFactory
 from pds_doi_service.core.util.config_parser import DOIConfigUtil
+from pds_doi_service.core.util.general_util import canonical_json_dumps
 from pds_doi_service.core.util.general_util import checksum
 from pds_doi_service.core.util.general_util import get_logger
+from pds_doi_service.core.util.profiling import traced
 
 logger = get_logger(__name__)
 
@@ -45,7 +50,44 @@ class Transaction:
         self._record_service = DOIServiceFactory.get_doi_record_service()
         self._transaction_disk = TransactionOnDisk()
         self._transaction_db = transaction_db
+        self._transaction_key = None
 
+    @property
+    def transaction_key(self):
+        """Returns the transaction key (directory) written to by log(), or None if nothing was written."""
+        return self._transaction_key
+
+    def _label_changed(self, output_label, latest_label):
+        """
+        Returns True if the provided output label differs in content from the
+        latest label in the transaction history.
+
+        JSON labels written before records were encoded directly to JSON were
+        rendered from a template with different formatting, so when the
+        checksums of the label text differ, the checksums of the canonical
+        encodings of each label are compared instead. The output side is
+        encoded from the payload of the record service rather than by parsing
+        the output label back.
+        """
+        if latest_label is None:
+            return True
+
+        if checksum(output_label) == checksum(latest_label):
+            return False
+
+        if self._output_content_type != CONTENT_TYPE_JSON:
+            return True
+
+        output_payload = self._record_service.create_doi_payload(self._doi, content_type=self._output_content_type)
+
+        try:
+            return checksum(canonical_json_dumps(output_payload)) != checksum(
+                canonical_json_dumps(json.loads(latest_label))
+            )
+        except json.JSONDecodeError:
+            return True
+
+    @traced("transaction_log")
     def log(self):
         """
         Logs a new record to the transaction database using the provided Doi object.
@@ -82,10 +124,9 @@ class Transaction:
             if not self._doi.pds_identifier and latest_record.identifier:
                 self._doi.pds_identifier = latest_record.identifier
 
-            label_file = self._transaction_disk.output_label_for_transaction(latest_record)
-
-            with open(label_file, "r") as infile:
-                latest_label = infile.read()
+            latest_label = get_transaction_label_cache().get_label(
+                latest_record.transaction_key, latest_record.identifier
+            )
 
         # Create the output label that's written to the local transaction
         # history on disk. This label should represent the most up-to-date
@@ -120,7 +161,7 @@ class Transaction:
         # Before committing the new transaction, check to see if there are any
         # differences between the current commit and latest available record.
         # If not, don't bother committing.
-        if not latest_record or doi_record != latest_record or checksum(output_label) != checksum(latest_label):
+        if not latest_record or doi_record != latest_record or self._label_changed(output_label, latest_label):
             self._transaction_disk.write(
                 transaction_io_dir,
                 input_ref=self._input_ref,
@@ -128,7 +169,9 @@ class Transaction:
                 output_content_type=self._output_content_type,
             )
 
-            self._transaction_db.write_doi_info_to_database(doi_record)
+            self._transaction_key = transaction_io_dir
+
+            self._transaction_db.write_doi_info_to_database(doi_record, doi=self._doi)
 
             doi_logged = True
 
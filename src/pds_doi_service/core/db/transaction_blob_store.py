@@ -0,0 +1,311 @@
+#
+#  Copyright 2026, by the California Institute of Technology.  ALL RIGHTS
+#  RESERVED. United States Government Sponsorship acknowledged. Any commercial
+#  use must be negotiated with the Office of Technology Transfer at the
+#  California Institute of Technology.
+#
+"""
+=========================
+transaction_blob_store.py
+=========================
+
+Defines the TransactionBlobStore class, which provides deduplicated, compressed
+storage for the input and output products of the local transaction history.
+
+Rather than copying full input and output products into each transaction
+directory, a blob store saves each unique file exactly once (keyed by the
+SHA-256 digest of its uncompressed contents), and each transaction directory
+only holds a small manifest mapping the transaction's file names to blob digests::
+
+    <transaction dir>/.blobs/<first 2 digest chars>/<digest>.gz
+    <transaction dir>/<node ID>/<DOI prefix>/<DOI suffix>/<time>/manifest.json
+
+Output labels are decompressed on demand into a checkout directory for reading
+(see TransactionBlobStore.output_label_path()), from which checkouts left
+unread for longer than OTHER.transaction_checkout_max_age are evicted::
+
+    <transaction dir>/.blobs/checkout/<first 2 digest chars>/<digest>.<ext>
+"""
+import gzip
+import hashlib
+import json
+import os
+import tempfile
+import time
+from os.path import exists
+from os.path import join
+
+from pds_doi_service.core.util.config_parser import DOIConfigUtil
+from pds_doi_service.core.util.general_util import get_logger
+
+logger = get_logger(__name__)
+
+MANIFEST_FILE_NAME = "manifest.json"
+"""Name of the manifest file written to each blob-backed transaction directory"""
+
+MANIFEST_VERSION = 1
+"""Version of the manifest format written by this module"""
+
+BLOB_DIR_NAME = ".blobs"
+"""Name of the blob directory created under the transaction history directory"""
+
+CHECKOUT_DIR_NAME = "checkout"
+"""Name of the directory (under the blob directory) used to materialize blobs for reading"""
+
+DEFAULT_CHECKOUT_MAX_AGE = 3600
+"""Default time, in seconds, after its last read that a checked out blob is evicted"""
+
+CHECKOUT_EVICTION_INTERVAL = 300
+"""Minimum time, in seconds, between scans of the checkout directory for checkouts to evict"""
+
+
+class TransactionBlobStore:
+    """
+    Content-addressed, gzip-compressed storage for transaction history files.
+
+    Blobs are written once and never modified, so the same blob may be safely
+    referenced by any number of transaction manifests.
+    """
+
+    m_doi_config_util = DOIConfigUtil()
+
+    _last_eviction = None
+    """Time (per time.monotonic()) of the last scan of this process for checkouts to evict"""
+
+    def __init__(self, blob_dir=None):
+        config = self.m_doi_config_util.get_config()
+
+        self._blob_dir = blob_dir or join(config.get("OTHER", "transaction_dir"), BLOB_DIR_NAME)
+        self._checkout_max_age = int(
+            config.get("OTHER", "transaction_checkout_max_age", fallback=DEFAULT_CHECKOUT_MAX_AGE)
+        )
+
+    @property
+    def blob_dir(self):
+        """Returns the root directory of the blob store."""
+        return self._blob_dir
+
+    @staticmethod
+    def digest(content):
+        """
+        Returns the SHA-256 hex digest used to address the provided content.
+
+        Parameters
+        ----------
+        content : bytes
+            The uncompressed content to compute the digest for.
+
+        Returns
+        -------
+        hex_digest : str
+            The hex digest of the content.
+
+        """
+        return hashlib.sha256(content).hexdigest()
+
+    @staticmethod
+    def has_manifest(transaction_dir):
+        """Returns True if the provided transaction directory is backed by the blob store."""
+        return exists(join(transaction_dir, MANIFEST_FILE_NAME))
+
+    def blob_path(self, digest):
+        """Returns the path to the compressed blob for the provided digest."""
+        return join(self._blob_dir, digest[:2], f"{digest}.gz")
+
+    def put(self, content):
+        """
+        Stores the provided content in the blob store, if it is not already
+        present.
+
+        Parameters
+        ----------
+        content : bytes or str
+            The content to store. Strings are encoded as UTF-8.
+
+        Returns
+        -------
+        digest : str
+            The digest the content may be retrieved with.
+
+        """
+        if isinstance(content, str):
+            content = content.encode()
+
+        digest = self.digest(content)
+        blob_path = self.blob_path(digest)
+
+        if exists(blob_path):
+            logger.debug("Blob %s already stored, skipping write", digest)
+            return digest
+
+        blob_parent = os.path.dirname(blob_path)
+        os.makedirs(blob_parent, exist_ok=True, mode=0o0775)
+
+        # Write to a temporary file first, then move it into place, so a
+        # concurrent reader never observes a partially written blob. Setting
+        # mtime keeps the compressed bytes deterministic for identical content.
+        with tempfile.NamedTemporaryFile(dir=blob_parent, delete=False) as temp_file:
+            with gzip.GzipFile(fileobj=temp_file, mode="wb", mtime=0) as gzip_file:
+                gzip_file.write(content)
+
+        os.chmod(temp_file.name, 0o0664)
+        os.replace(temp_file.name, blob_path)
+
+        logger.debug("Stored blob %s (%d bytes uncompressed)", digest, len(content))
+
+        return digest
+
+    def put_file(self, path):
+        """Stores the contents of the file at the provided path, returning its digest."""
+        with open(path, "rb") as infile:
+            return self.put(infile.read())
+
+    def get(self, digest):
+        """
+        Returns the uncompressed content for the provided digest.
+
+        Raises
+        ------
+        FileNotFoundError
+            If no blob exists for the provided digest.
+
+        """
+        with gzip.open(self.blob_path(digest), "rb") as infile:
+            return infile.read()
+
+    @staticmethod
+    def read_manifest(transaction_dir):
+        """
+        Reads the manifest from the provided transaction directory.
+
+        Returns
+        -------
+        files : dict
+            Mapping of transaction file names (relative to the transaction
+            directory) to blob digests.
+
+        """
+        with open(join(transaction_dir, MANIFEST_FILE_NAME), "r") as infile:
+            manifest = json.load(infile)
+
+        return manifest["files"]
+
+    @staticmethod
+    def write_manifest(transaction_dir, files):
+        """
+        Writes (or merges into) the manifest of the provided transaction directory.
+
+        Parameters
+        ----------
+        transaction_dir : str
+            The transaction directory to write the manifest to. Must already exist.
+        files : dict
+            Mapping of transaction file names to blob digests. Entries are
+            merged with those of any existing manifest.
+
+        """
+        manifest_files = {}
+
+        if TransactionBlobStore.has_manifest(transaction_dir):
+            manifest_files = TransactionBlobStore.read_manifest(transaction_dir)
+
+        manifest_files.update(files)
+
+        manifest_path = join(transaction_dir, MANIFEST_FILE_NAME)
+
+        with open(manifest_path, "w") as outfile:
+            json.dump({"version": MANIFEST_VERSION, "files": manifest_files}, outfile, indent=4, sort_keys=True)
+
+        os.chmod(manifest_path, 0o0664)
+
+    def output_label_path(self, transaction_dir):
+        """
+        Returns a readable path to the output label referenced by the manifest
+        of the provided transaction directory.
+
+        The label is decompressed into a content-addressed checkout directory
+        on first access, so repeated (and deduplicated) reads share one file.
+        Each read refreshes the modification time of the checkout, which is
+        evicted once left unread for OTHER.transaction_checkout_max_age
+        seconds (see evict_checkouts()).
+
+        Returns
+        -------
+        label_file : str
+            Path to the output label, or None if the manifest references no
+            output label.
+
+        """
+        manifest_files = self.read_manifest(transaction_dir)
+
+        output_names = sorted(name for name in manifest_files if name.startswith("output."))
+
+        if not output_names:
+            return None
+
+        output_name = output_names[0]
+        digest = manifest_files[output_name]
+        extension = os.path.splitext(output_name)[-1]
+
+        checkout_dir = join(self._blob_dir, CHECKOUT_DIR_NAME, digest[:2])
+        checkout_path = join(checkout_dir, f"{digest}{extension}")
+
+        try:
+            # Refresh the checkout, so it is not evicted while still being read
+            os.utime(checkout_path)
+        except FileNotFoundError:
+            os.makedirs(checkout_dir, exist_ok=True, mode=0o0775)
+
+            with tempfile.NamedTemporaryFile(dir=checkout_dir, delete=False) as temp_file:
+                temp_file.write(self.get(digest))
+
+            os.chmod(temp_file.name, 0o0664)
+            os.replace(temp_file.name, checkout_path)
+
+            # Only new checkouts grow the checkout directory, so only these
+            # trigger a (periodic) scan for checkouts to evict
+            now = time.monotonic()
+
+            if self._last_eviction is None or now - self._last_eviction >= CHECKOUT_EVICTION_INTERVAL:
+                TransactionBlobStore._last_eviction = now
+                self.evict_checkouts()
+        except OSError as err:
+            # The checkout may be owned by another user, it is still readable
+            logger.debug("Could not refresh checkout %s: %s", checkout_path, str(err))
+
+        return checkout_path
+
+    def evict_checkouts(self):
+        """
+        Removes the files of the checkout directory which have not been read
+        for longer than OTHER.transaction_checkout_max_age seconds. Evicted
+        labels are decompressed again from the blob store when next read.
+
+        Returns
+        -------
+        num_evicted : int
+            The number of checkouts removed.
+
+        """
+        if self._checkout_max_age <= 0:
+            return 0
+
+        oldest_mtime = time.time() - self._checkout_max_age
+        num_evicted = 0
+
+        for dirpath, _, filenames in os.walk(join(self._blob_dir, CHECKOUT_DIR_NAME)):
+            for filename in filenames:
+                checkout_path = join(dirpath, filename)
+
+                try:
+                    if os.stat(checkout_path).st_mtime < oldest_mtime:
+                        os.remove(checkout_path)
+                        num_evicted += 1
+                except OSError as err:
+                    # Removed by another process, or owned by another user
+                    logger.debug("Could not evict checkout %s: %s", checkout_path, str(err))
+
+        if num_evicted:
+            logger.info("Evicted %d checkout(s) from %s", num_evicted, self._blob_dir)
+
+        return num_evicted
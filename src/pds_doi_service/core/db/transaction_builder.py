@@ -13,6 +13,7 @@ Contains the TransactionBuilder class, which is used to manage transactions
 with the local database.
 """
 from pds_doi_service.core.db.doi_database import DOIDataBase
+from pds_doi_service.core.db.provider_mirror import ProviderMirror
 from pds_doi_service.core.db.transaction import Transaction
 from pds_doi_service.core.outputs.doi_record import CONTENT_TYPE_XML
 from pds_doi_service.core.outputs.doi_record import VALID_CONTENT_TYPES
@@ -38,6 +39,8 @@ class TransactionBuilder:
         else:
             self.m_doi_database = DOIDataBase(self._config.get("OTHER", "db_file"))
 
+        self.m_provider_mirror = ProviderMirror(self.m_doi_database)
+
     def prepare_transaction(self, submitter_email, doi, input_path=None, output_content_type=CONTENT_TYPE_XML):
         """
         Build a Transaction from the inputs and outputs to a reserve, update
@@ -0,0 +1,291 @@
+#
+#  Copyright 2026, by the California Institute of Technology.  ALL RIGHTS
+#  RESERVED. United States Government Sponsorship acknowledged. Any commercial
+#  use must be negotiated with the Office of Technology Transfer at the
+#  California Institute of Technology.
+#
+"""
+==========================
+transaction_label_cache.py
+==========================
+
+Defines the TransactionLabelCache class, a bounded, thread-safe LRU cache of
+the output labels (and the Doi objects parsed from them) stored in the local
+transaction history.
+
+Transaction directories are keyed by a microsecond-resolution timestamp and
+are rarely modified once written, so entries keyed by transaction key can be
+served from memory without re-reading or re-parsing the label on disk. Any
+write to a transaction directory made through TransactionOnDisk invalidates
+the cached entries for that directory.
+"""
+import copy
+import threading
+from collections import OrderedDict
+
+from pds_doi_service.core.util.config_parser import DOIConfigUtil
+from pds_doi_service.core.util.general_util import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_CACHE_SIZE = 1024
+"""Default maximum number of entries held by the cache"""
+
+
+class TransactionLabelCache:
+    """
+    Bounded LRU cache of transaction output labels and their parsed Doi objects.
+
+    Doi objects are deep-copied on the way out of the cache, so callers are
+    free to modify the objects they receive.
+    """
+
+    def __init__(self, max_size=DEFAULT_CACHE_SIZE):
+        self._max_size = max_size
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+        # Incremented by each invalidation, so loads racing one are not cached
+        self._generation = 0
+
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @property
+    def max_size(self):
+        """Returns the maximum number of entries held by the cache."""
+        return self._max_size
+
+    def stats(self):
+        """
+        Returns the current cache metrics.
+
+        Returns
+        -------
+        stats : dict
+            Dictionary containing the hits, misses, evictions, current size
+            and maximum size of the cache.
+
+        """
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "size": len(self._entries),
+                "max_size": self._max_size,
+            }
+
+    def clear(self):
+        """Removes all entries from the cache and resets its metrics."""
+        with self._lock:
+            self._entries.clear()
+            self._generation += 1
+            self._hits = self._misses = self._evictions = 0
+
+    def invalidate(self, transaction_key):
+        """Removes all cached entries associated with the provided transaction key."""
+        with self._lock:
+            for key in [key for key in self._entries if key[0] == transaction_key]:
+                del self._entries[key]
+
+            self._generation += 1
+
+    def _get_or_load(self, key, loader):
+        """
+        Returns the value cached for the provided key, calling loader() to
+        produce (and cache) it on a miss.
+
+        The loader is invoked outside the lock, so a slow load never blocks
+        readers of other keys. Concurrent misses on the same key may load it
+        more than once, each load reading the label as currently on disk. A
+        value loaded while the cache was invalidated may predate the write
+        that invalidated it, so it is returned but not cached.
+        """
+        with self._lock:
+            if key in self._entries:
+                self._hits += 1
+                self._entries.move_to_end(key)
+                return self._entries[key]
+
+            self._misses += 1
+            generation = self._generation
+
+        value = loader()
+
+        if self._max_size > 0:
+            with self._lock:
+                if generation != self._generation:
+                    return value
+
+                self._entries[key] = value
+                self._entries.move_to_end(key)
+
+                while len(self._entries) > self._max_size:
+                    self._entries.popitem(last=False)
+                    self._evictions += 1
+
+        return value
+
+    def get_label(self, transaction_key, identifier):
+        """
+        Returns the text of the output label stored under the provided
+        transaction key.
+
+        Parameters
+        ----------
+        transaction_key : str
+            The transaction key (directory) to read the output label from.
+        identifier : str
+            The PDS identifier associated with the transaction. Only used for
+            error reporting.
+
+        Returns
+        -------
+        label_text : str
+            The contents of the output label.
+
+        Raises
+        ------
+        NoTransactionHistoryForIdentifierException
+            If the output label cannot be found on local disk.
+
+        """
+
+        def _load_label():
+            # Imported here to avoid a circular import with transaction_on_disk
+            from pds_doi_service.core.db.transaction_on_disk import TransactionOnDisk
+
+            label_file = TransactionOnDisk.output_label_for_transaction_key(transaction_key, identifier)
+
+            with open(label_file, "r") as infile:
+                return infile.read()
+
+        return self._get_or_load((transaction_key, "label"), _load_label)
+
+    def get_dois(self, transaction_key, identifier, web_parser):
+        """
+        Returns the Doi objects parsed from the output label stored under the
+        provided transaction key.
+
+        Parameters
+        ----------
+        transaction_key : str
+            The transaction key (directory) to read the output label from.
+        identifier : str
+            The PDS identifier associated with the transaction. Only used for
+            error reporting.
+        web_parser : DOIWebParser
+            The parser used to parse Doi objects from the output label.
+
+        Returns
+        -------
+        dois : list of Doi
+            Copies of the Doi objects parsed from the output label.
+
+        """
+
+        def _load_dois():
+            dois, _ = web_parser.parse_dois_from_label(self.get_label(transaction_key, identifier))
+            return dois
+
+        key = (transaction_key, "dois", type(web_parser).__name__)
+
+        return copy.deepcopy(self._get_or_load(key, _load_dois))
+
+    def _get_record(self, transaction_key, identifier, record_type, record_value, web_parser):
+        """
+        Returns the single-record label for the requested DOI or PDS identifier
+        extracted from the output label stored under the provided transaction
+        key, along with the Doi objects parsed from it.
+        """
+
+        def _load_record():
+            # Imported here to avoid a circular import with transaction_on_disk
+            from pds_doi_service.core.db.transaction_on_disk import TransactionOnDisk
+
+            label_file = TransactionOnDisk.output_label_for_transaction_key(transaction_key, identifier)
+
+            record_getter = getattr(web_parser, f"get_record_for_{record_type}")
+            record, content_type = record_getter(label_file, record_value)
+
+            dois, _ = web_parser.parse_dois_from_label(record, content_type)
+
+            return record, content_type, dois
+
+        key = (transaction_key, record_type, record_value, type(web_parser).__name__)
+
+        record, content_type, dois = self._get_or_load(key, _load_record)
+
+        return record, content_type, copy.deepcopy(dois)
+
+    def get_record_for_identifier(self, transaction_key, identifier, web_parser):
+        """
+        Returns the single-record label for the provided PDS identifier from the
+        output label stored under the provided transaction key.
+
+        Returns
+        -------
+        record : str
+            The single found record, as returned by the web parser's
+            get_record_for_identifier().
+        content_type : str
+            The content type of the record.
+        dois : list of Doi
+            Copies of the Doi objects parsed from the record.
+
+        Raises
+        ------
+        UnknownIdentifierException
+            If there is no record for the PDS identifier in the output label.
+
+        """
+        return self._get_record(transaction_key, identifier, "identifier", identifier, web_parser)
+
+    def get_record_for_doi(self, transaction_key, identifier, doi, web_parser):
+        """
+        Returns the single-record label for the provided DOI from the output
+        label stored under the provided transaction key.
+
+        Returns
+        -------
+        record : str
+            The single found record, as returned by the web parser's
+            get_record_for_doi().
+        content_type : str
+            The content type of the record.
+        dois : list of Doi
+            Copies of the Doi objects parsed from the record.
+
+        Raises
+        ------
+        UnknownDoiException
+            If there is no record for the DOI in the output label.
+
+        """
+        return self._get_record(transaction_key, identifier, "doi", doi, web_parser)
+
+
+_transaction_label_cache = None
+_transaction_label_cache_lock = threading.Lock()
+
+
+def get_transaction_label_cache():
+    """
+    Returns the process-wide TransactionLabelCache, creating it on first use.
+    The size of the cache is determined by the OTHER.transaction_cache_size
+    field of the INI config. A size of 0 disables caching.
+    """
+    global _transaction_label_cache
+
+    with _transaction_label_cache_lock:
+        if _transaction_label_cache is None:
+            config = DOIConfigUtil().get_config()
+            max_size = int(config.get("OTHER", "transaction_cache_size", fallback=DEFAULT_CACHE_SIZE))
+
+            logger.debug("Creating transaction label cache with maximum size %d", max_size)
+
+            _transaction_label_cache = TransactionLabelCache(max_size)
+
+    return _transaction_label_cache
@@ -18,13 +18,21 @@ import shutil
 from os.path import exists
 from os.path import join
 
-import requests
+from pds_doi_service.core.db.transaction_blob_store import TransactionBlobStore
+from pds_doi_service.core.db.transaction_label_cache import get_transaction_label_cache
 from pds_doi_service.core.entities.exceptions import NoTransactionHistoryForIdentifierException
 from pds_doi_service.core.util.config_parser import DOIConfigUtil
 from pds_doi_service.core.util.general_util import get_logger
 
 logger = get_logger(__name__)
 
+TRANSACTION_STORE_DIRECTORY = "directory"
+TRANSACTION_STORE_BLOB = "blob"
+"""Constants for the available transaction history storage backends"""
+
+VALID_TRANSACTION_STORES = [TRANSACTION_STORE_DIRECTORY, TRANSACTION_STORE_BLOB]
+"""The list of expected transaction history storage backends"""
+
 
 class TransactionOnDisk:
     """
@@ -37,6 +45,14 @@ class TransactionOnDisk:
     def __init__(self):
         self._config = self.m_doi_config_util.get_config()
 
+        self._store_type = self._config.get("OTHER", "transaction_store", fallback=TRANSACTION_STORE_DIRECTORY).lower()
+
+        if self._store_type not in VALID_TRANSACTION_STORES:
+            raise ValueError(
+                f'Unsupported transaction store "{self._store_type}" provided.\n'
+                f"The OTHER.transaction_store field of the INI config should be one of {VALID_TRANSACTION_STORES}"
+            )
+
     @staticmethod
     def get_transaction_key(node_id, doi, transaction_time):
         """
@@ -98,20 +114,56 @@ class TransactionOnDisk:
             If the output label associated to the transaction cannot be found
             on local disk.
         """
-        # TODO: reconcile this method with the version in the list action
-        # Make sure we can locate the output label associated with this
-        # transaction
-        transaction_location = transaction_record.transaction_key
-        label_files = glob.glob(join(transaction_location, "output.*"))
+        return TransactionOnDisk.output_label_for_transaction_key(
+            transaction_record.transaction_key, transaction_record.identifier
+        )
+
+    @staticmethod
+    def output_label_for_transaction_key(transaction_key, identifier):
+        """
+        Returns a path to the output label stored under the provided transaction
+        key. Both plain transaction directories and those backed by the blob
+        store (see TransactionBlobStore) are supported.
+
+        Parameters
+        ----------
+        transaction_key : str
+            The transaction key (directory) to locate the output label within.
+        identifier : str
+            The PDS identifier associated with the transaction. Only used for
+            error reporting.
+
+        Returns
+        -------
+        label_file : str
+            Path to the output label associated to the provided transaction key.
+
+        Raises
+        ------
+        NoTransactionHistoryForIdentifierException
+            If the output label associated to the transaction cannot be found
+            on local disk.
+
+        """
+        label_file = None
+
+        if TransactionBlobStore.has_manifest(transaction_key):
+            try:
+                label_file = TransactionBlobStore().output_label_path(transaction_key)
+            except FileNotFoundError as err:
+                logger.error("Blob referenced by transaction %s is missing: %s", transaction_key, str(err))
+        else:
+            label_files = glob.glob(join(transaction_key, "output.*"))
+
+            if label_files and exists(label_files[0]):
+                label_file = label_files[0]
 
-        if not label_files or not exists(label_files[0]):
+        if not label_file:
             raise NoTransactionHistoryForIdentifierException(
-                f"Could not find a DOI label associated with identifier {transaction_record.identifier}. "
+                f"Could not find a DOI label associated with identifier {identifier}. "
                 "The database and transaction history location may be out of sync."
             )
 
-        label_file = label_files[0]
-
         return label_file
 
     def write(self, transaction_dir, input_ref=None, output_content=None, output_content_type=None):
@@ -143,6 +195,42 @@ class TransactionOnDisk:
         # Create the new transaction history directory with group-rw enabled
         os.makedirs(transaction_dir, exist_ok=True, mode=0o0775)
 
+        if self._store_type == TRANSACTION_STORE_BLOB:
+            self._write_to_blob_store(transaction_dir, input_ref, output_content, output_content_type)
+        else:
+            self._write_to_directory(transaction_dir, input_ref, output_content, output_content_type)
+
+        # Drop anything cached for this transaction, in case it was rewritten
+        get_transaction_label_cache().invalidate(transaction_dir)
+
+        logger.info(f"Transaction files saved to {transaction_dir}")
+
+        # Restore the previous umask
+        os.umask(prev_umask)
+
+    @staticmethod
+    def remove(transaction_dir):
+        """
+        Removes a transaction directory written by write(), such as when the
+        database rows referencing it were rolled back. Any products stored in
+        the blob store are left in place, as they may be shared with other
+        transactions.
+
+        Parameters
+        ----------
+        transaction_dir : str
+            Location on disk of the transaction to remove.
+
+        """
+        shutil.rmtree(transaction_dir, ignore_errors=True)
+
+        get_transaction_label_cache().invalidate(transaction_dir)
+
+        logger.info(f"Transaction files removed from {transaction_dir}")
+
+    @staticmethod
+    def _write_to_directory(transaction_dir, input_ref, output_content, output_content_type):
+        """Writes full copies of the transaction input and output products to the transaction directory."""
         if input_ref:
             if os.path.isdir(input_ref):
                 # Copy the input files, but do not preserve their permissions so
@@ -163,6 +251,8 @@ class TransactionOnDisk:
                 if os.path.isfile(input_ref):
                     shutil.copy2(input_ref, full_input_name)
                 else:  # remote resource
+                    import requests
+
                     r = requests.get(input_ref, allow_redirects=True)
 
                     with open(full_input_name, "wb") as outfile:
@@ -184,7 +274,38 @@ class TransactionOnDisk:
             # Set up permissions for copied output
             os.chmod(full_output_name, 0o0664)
 
-        logger.info(f"Transaction files saved to {transaction_dir}")
+    @staticmethod
+    def _write_to_blob_store(transaction_dir, input_ref, output_content, output_content_type):
+        """
+        Stores the transaction input and output products in the blob store,
+        writing only a manifest referencing them to the transaction directory.
+        """
+        blob_store = TransactionBlobStore()
+        files = {}
 
-        # Restore the previous umask
-        os.umask(prev_umask)
+        if input_ref:
+            if os.path.isdir(input_ref):
+                for dir_path, _, file_names in os.walk(input_ref):
+                    for file_name in file_names:
+                        file_path = os.path.join(dir_path, file_name)
+                        relative_name = os.path.relpath(file_path, input_ref).replace(os.sep, "/")
+
+                        files[f"input/{relative_name}"] = blob_store.put_file(file_path)
+            else:
+                full_input_name = "input" + os.path.splitext(input_ref)[-1]
+
+                if os.path.isfile(input_ref):
+                    files[full_input_name] = blob_store.put_file(input_ref)
+                else:  # remote resource
+                    import requests
+
+                    r = requests.get(input_ref, allow_redirects=True)
+
+                    files[full_input_name] = blob_store.put(r.content)
+
+                    r.close()
+
+        if output_content and output_content_type:
+            files[".".join(["output", output_content_type])] = blob_store.put(output_content)
+
+        TransactionBlobStore.write_manifest(transaction_dir, files)
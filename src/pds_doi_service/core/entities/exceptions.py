@@ -106,6 +106,14 @@ class WebRequestException(Exception):
     """Raised when a request to the DOI endpoint service fails."""
 
 
+class ProviderUnavailableException(WebRequestException):
+    """Raised without sending a request when the DOI endpoint service is known to be unavailable."""
+
+
+class IdempotencyKeyException(Exception):
+    """Raised when an Idempotency-Key is reused for a different request, or its original request is still running."""
+
+
 def collect_exception_classes_and_messages(single_exception, io_exception_classes, io_exception_messages):
     """
     Given a single exception, collect the exception class name and message.
@@ -0,0 +1,60 @@
+#
+#  Copyright 2026, by the California Institute of Technology.  ALL RIGHTS
+#  RESERVED. United States Government Sponsorship acknowledged. Any commercial
+#  use must be negotiated with the Office of Technology Transfer at the
+#  California Institute of Technology.
+#
+"""
+======
+job.py
+======
+
+Contains the dataclass and enumeration definitions for background Job objects.
+"""
+from dataclasses import dataclass
+from dataclasses import field
+from datetime import datetime
+from enum import Enum
+from enum import unique
+from typing import Dict
+from typing import Optional
+
+
+@unique
+class JobStatus(str, Enum):
+    """
+    Enumerates the possible states of a background job.
+
+    Jobs start out as Queued, move to Running once claimed by a worker, and
+    finish as either Succeeded or Failed. A job is considered Failed only when
+    it could not be run to completion; a job whose operation returned an error
+    response (such as an invalid argument) still Succeeds, with the error
+    response recorded as its result.
+    """
+
+    Queued = "queued"
+    Running = "running"
+    Succeeded = "succeeded"
+    Failed = "failed"
+
+
+@dataclass
+class Job:
+    """Dataclass for a background job's representation within the job queue database"""
+
+    job_id: str
+    operation: str
+    status: JobStatus
+    date_created: datetime
+    date_updated: datetime
+    arguments: Dict = field(default_factory=dict)
+    payload: Optional[bytes] = None
+    progress: float = 0.0
+    message: Optional[str] = None
+    result: Optional[str] = None
+    result_code: Optional[int] = None
+
+    @property
+    def finished(self):
+        """Returns True if the job has run to completion, successfully or otherwise."""
+        return self.status in (JobStatus.Succeeded, JobStatus.Failed)
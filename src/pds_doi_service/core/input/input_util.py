@@ -5,15 +5,15 @@ input_util.py
 
 Contains classes for working with input label files, be they local or remote.
 """
+import json
 import os
+import re
 import tempfile
 import urllib.parse
 from datetime import datetime
 from datetime import timezone
 from os.path import basename
 
-import pandas as pd
-import requests
 from lxml import etree
 from pds_doi_service.core.entities.doi import Doi
 from pds_doi_service.core.entities.doi import DoiStatus
@@ -21,13 +21,11 @@ from pds_doi_service.core.entities.doi import ProductType
 from pds_doi_service.core.entities.exceptions import InputFormatException
 from pds_doi_service.core.input.pds4_util import DOIPDS4LabelUtil
 from pds_doi_service.core.outputs.doi_record import CONTENT_TYPE_JSON
-from pds_doi_service.core.outputs.osti.osti_validator import DOIOstiValidator
-from pds_doi_service.core.outputs.osti.osti_web_parser import DOIOstiXmlWebParser
 from pds_doi_service.core.outputs.service import DOIServiceFactory
 from pds_doi_service.core.outputs.service import SERVICE_TYPE_DATACITE
 from pds_doi_service.core.util.config_parser import DOIConfigUtil
 from pds_doi_service.core.util.general_util import get_logger
-from xmlschema import XMLSchemaValidationError  # type: ignore
+from pds_doi_service.core.util.profiling import traced
 
 # Get the common logger
 logger = get_logger(__name__)
@@ -57,6 +55,27 @@ class DOIInputUtil:
     DEFAULT_VALID_EXTENSIONS = [".lblx", ".xml", ".csv", ".xlsx", ".xls", ".json"]
     """The default list of valid input file extensions this module can read."""
 
+    BULK_UPDATE_FIELDS = (
+        "title",
+        "description",
+        "site_url",
+        "product_type",
+        "product_type_specific",
+        "publication_date",
+        "publisher",
+        "keywords",
+        "authors",
+        "editors",
+        "related_identifiers",
+    )
+    """The Doi fields which may be modified by a file of bulk field changes."""
+
+    BULK_UPDATE_LIST_FIELDS = ("authors", "editors", "related_identifiers")
+    """The bulk update fields which are provided as JSON-encoded lists of dictionaries."""
+
+    BULK_UPDATE_EXTENSIONS = [".csv", ".xlsx", ".xls", ".ndjson", ".jsonl"]
+    """The list of file extensions supported for files of bulk field changes."""
+
     def __init__(self, valid_extensions=None):
         """
         Creates a new DOIInputUtil instance.
@@ -187,7 +206,13 @@ class DOIInputUtil:
                 raise InputFormatException(f"Could not parse the provided xml file as a PDS4 label.\nReason: {err}")
 
         else:
-            # Otherwise, assume OSTI format
+            # Otherwise, assume OSTI format. The OSTI modules (and xmlschema)
+            # are only imported once an OSTI label is actually encountered,
+            # since they are slow to import and unused by most invocations
+            from pds_doi_service.core.outputs.osti.osti_validator import DOIOstiValidator
+            from pds_doi_service.core.outputs.osti.osti_web_parser import DOIOstiXmlWebParser
+            from xmlschema import XMLSchemaValidationError  # type: ignore
+
             logger.info("Parsing xml file %s as an OSTI label", basename(xml_path))
 
             try:
@@ -305,6 +330,8 @@ class DOIInputUtil:
                 raise InputFormatException(f"No value provided for {column_name} column")
 
         # Make sure we got a valid publication date
+        import pandas as pd
+
         if not isinstance(row["publication_date"], (datetime, pd.Timestamp)):
             try:
                 row["publication_date"] = datetime.strptime(row["publication_date"], "%Y-%m-%d")
@@ -337,6 +364,9 @@ class DOIInputUtil:
         """
         logger.info("Parsing xls file %s", basename(xls_path))
 
+        # pandas is slow to import, so defer until a spreadsheet is actually parsed
+        import pandas as pd
+
         xl_wb = pd.ExcelFile(xls_path, engine="openpyxl")
 
         # We only want the first sheet.
@@ -475,6 +505,9 @@ class DOIInputUtil:
         """
         logger.info("Parsing csv file %s", basename(csv_path))
 
+        # pandas is slow to import, so defer until a spreadsheet is actually parsed
+        import pandas as pd
+
         """
         Read the CSV file into memory
 
@@ -635,6 +668,8 @@ class DOIInputUtil:
                 f'operation, must be one of {",".join(self._valid_extensions)}'
             )
 
+        import requests
+
         response = requests.get(input_url)
 
         try:
@@ -665,6 +700,7 @@ class DOIInputUtil:
 
         return dois
 
+    @traced("parse_input")
     def parse_dois_from_input_file(self, input_file):
         """
         Parses one or more Doi objects from the provided input file location.
@@ -712,3 +748,181 @@ class DOIInputUtil:
             )
 
         return dois
+
+    def _read_field_change_rows(self, input_file):
+        """
+        Reads the rows of a file of bulk field changes into a list of
+        dictionaries mapping column (field) names to values.
+
+        Spreadsheets (CSV or Excel) contribute one dictionary per row, while
+        newline-delimited JSON files contribute one per (non-blank) line.
+        """
+        extension = os.path.splitext(input_file)[-1].lower()
+
+        if extension not in self.BULK_UPDATE_EXTENSIONS:
+            raise InputFormatException(
+                f'File extension type "{extension}" is not supported for bulk updates, '
+                f'must be one of {",".join(self.BULK_UPDATE_EXTENSIONS)}'
+            )
+
+        if extension in (".ndjson", ".jsonl"):
+            rows = []
+
+            with open(input_file, "rb") as infile:
+                for line_number, line in enumerate(self.detect_and_decode_utf(infile.read()).splitlines(), start=1):
+                    if not line.strip():
+                        continue
+
+                    try:
+                        row = json.loads(line)
+                    except json.JSONDecodeError as err:
+                        raise InputFormatException(f"Could not parse line {line_number} of {input_file}: {str(err)}")
+
+                    if not isinstance(row, dict):
+                        raise InputFormatException(f"Line {line_number} of {input_file} is not a JSON object")
+
+                    rows.append({str(key).strip().lower(): value for key, value in row.items()})
+
+            return rows
+
+        # pandas is slow to import, so defer until a spreadsheet is actually parsed
+        import pandas as pd
+
+        if extension == ".csv":
+            pd_sheet = pd.read_csv(input_file, dtype=str, na_filter=False, skip_blank_lines=True)
+        else:
+            xl_wb = pd.ExcelFile(input_file, engine="openpyxl")
+            pd_sheet = pd.read_excel(input_file, xl_wb.sheet_names[0], na_filter=False)
+
+        pd_sheet = pd_sheet.rename(columns=lambda column: str(column).strip().lower())
+
+        return pd_sheet.to_dict(orient="records")
+
+    def _parse_field_change(self, field_name, value):
+        """
+        Converts a single value read from a file of bulk field changes to the
+        type expected by the corresponding field of a Doi object.
+
+        Returns None if the value is empty, meaning the field should be left
+        unchanged.
+        """
+        if field_name not in self.BULK_UPDATE_FIELDS:
+            raise InputFormatException(
+                f'Field "{field_name}" may not be modified by a bulk update, '
+                f"must be one of {', '.join(self.BULK_UPDATE_FIELDS)}"
+            )
+
+        if value is None or (isinstance(value, str) and not value.strip()):
+            return None
+
+        if field_name == "product_type":
+            # ProductType accepts any value (see ProductType._missing_), so
+            # check against the defined product types explicitly
+            product_types = [product_type.value for product_type in ProductType]
+
+            if str(value).strip() not in product_types:
+                raise InputFormatException(
+                    f'Invalid product_type "{str(value).strip()}", must be one of {", ".join(product_types)}'
+                )
+
+            return ProductType(str(value).strip())
+
+        if field_name == "publication_date":
+            if isinstance(value, datetime):
+                return value
+
+            try:
+                return datetime.strptime(str(value).strip(), "%Y-%m-%d")
+            except ValueError:
+                raise InputFormatException("Incorrect publication_date format, should be YYYY-MM-DD")
+
+        if field_name == "keywords":
+            if isinstance(value, str):
+                value = re.split(r"[;,]", value)
+
+            return {str(keyword).strip() for keyword in value if str(keyword).strip()}
+
+        if field_name in self.BULK_UPDATE_LIST_FIELDS:
+            if isinstance(value, str):
+                try:
+                    value = json.loads(value)
+                except json.JSONDecodeError as err:
+                    raise InputFormatException(f"Could not parse {field_name} as a JSON list: {str(err)}")
+
+            if not isinstance(value, list) or not all(isinstance(entry, dict) for entry in value):
+                raise InputFormatException(f"Value for {field_name} must be a list of JSON objects")
+
+            return value
+
+        return str(value).strip()
+
+    @traced("parse_input")
+    def parse_field_changes_from_file(self, input_file):
+        """
+        Parses a file of bulk field changes, keyed by DOI, from the provided
+        local path.
+
+        The file may be a CSV or Excel spreadsheet, or newline-delimited JSON.
+        Each row must provide a "doi" column (key), along with one or more of
+        the columns listed in BULK_UPDATE_FIELDS. Empty values indicate the
+        corresponding field should be left unchanged. Keywords may be provided
+        as a comma or semicolon separated list, while authors, editors and
+        related identifiers must be JSON-encoded lists.
+
+        Parameters
+        ----------
+        input_file : str
+            Path to the file of field changes to parse.
+
+        Returns
+        -------
+        field_changes : dict
+            Dictionary mapping each DOI value to a dictionary of the Doi fields
+            to modify and their new values, in the order read from the file.
+
+        Raises
+        ------
+        InputFormatException
+            If the file has an unsupported extension, any row is missing a DOI
+            or lists the same DOI as a previous row, or any value cannot be
+            parsed.
+
+        """
+        logger.info("Parsing field changes from %s", basename(input_file))
+
+        if not os.path.isfile(input_file):
+            raise InputFormatException(f"Error reading file {input_file}, path does not correspond to a local file.")
+
+        field_changes = {}
+        errors = []
+
+        for index, row in enumerate(self._read_field_change_rows(input_file), start=1):
+            doi = str(row.get("doi") or "").strip()
+
+            if not doi:
+                errors.append(f"Row {index}: no value provided for the doi column")
+                continue
+
+            if doi in field_changes:
+                errors.append(f"Row {index}: DOI {doi} was already listed by a previous row")
+                continue
+
+            try:
+                changes = {
+                    field_name: self._parse_field_change(field_name, value)
+                    for field_name, value in row.items()
+                    if field_name != "doi"
+                }
+            except InputFormatException as err:
+                errors.append(f"Row {index} (DOI {doi}): {str(err)}")
+                continue
+
+            field_changes[doi] = {field_name: value for field_name, value in changes.items() if value is not None}
+
+        if errors:
+            raise InputFormatException("\n" + "\n".join(errors))
+
+        if not field_changes:
+            raise InputFormatException(f"No field changes could be parsed from {input_file}")
+
+        return field_changes
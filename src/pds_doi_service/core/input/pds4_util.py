@@ -799,9 +799,9 @@ class DOIPDS4LabelUtil:
 
         keyword_tokenizer = KeywordTokenizer()
 
-        for keyword_src in keyword_fields:
-            if keyword_src in pds4_fields.keys():
-                keyword_tokenizer.process_text(pds4_fields[keyword_src])
+        keyword_tokenizer.process_texts(
+            pds4_fields[keyword_src] for keyword_src in keyword_fields if keyword_src in pds4_fields.keys()
+        )
 
         logger.debug(": keyword_tokenizer.get_keywords() %s", keyword_tokenizer.get_keywords())
 
@@ -0,0 +1,163 @@
+#
+#  Copyright 2026, by the California Institute of Technology.  ALL RIGHTS
+#  RESERVED. United States Government Sponsorship acknowledged. Any commercial
+#  use must be negotiated with the Office of Technology Transfer at the
+#  California Institute of Technology.
+#
+"""
+==================
+circuit_breaker.py
+==================
+
+Contains the CircuitBreaker class, which guards the requests sent to a DOI
+service provider by DOIWebClient.
+
+Once a number of consecutive requests fail (by timing out, failing to connect,
+or receiving a 5xx or 429 response), the breaker opens, and further requests
+fail immediately with a ProviderUnavailableException rather than wait on an
+unresponsive provider. After the reset timeout, a single trial request (the
+health probe) is let through: the breaker closes again if it succeeds, or
+re-opens for another reset timeout if it fails. A trial request whose outcome
+is never recorded expires after the reset timeout, so another may be sent.
+"""
+import threading
+import time
+
+from pds_doi_service.core.entities.exceptions import ProviderUnavailableException
+from pds_doi_service.core.util.config_parser import DOIConfigUtil
+from pds_doi_service.core.util.general_util import get_logger
+
+logger = get_logger(__name__)
+
+STATE_CLOSED = "closed"
+STATE_OPEN = "open"
+STATE_HALF_OPEN = "half_open"
+"""Constants for the states of a circuit breaker"""
+
+DEFAULT_FAILURE_THRESHOLD = 5
+"""Default number of consecutive failed requests which opens the breaker (0 disables the breaker)"""
+
+DEFAULT_RESET_TIMEOUT = 30.0
+"""Default number of seconds the breaker stays open before a trial request is let through"""
+
+
+class CircuitBreaker:
+    """
+    Thread-safe circuit breaker for the requests sent to a single DOI service
+    provider.
+
+    Callers should call before_request() prior to each request, then one of
+    record_success() or record_failure() once its outcome is known.
+    """
+
+    def __init__(self, name, failure_threshold=DEFAULT_FAILURE_THRESHOLD, reset_timeout=DEFAULT_RESET_TIMEOUT):
+        self._name = name
+        self._failure_threshold = failure_threshold
+        self._reset_timeout = reset_timeout
+
+        self._lock = threading.Lock()
+        self._state = STATE_CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._trial_started_at = 0.0
+
+    @property
+    def state(self):
+        """Returns the current state of the breaker."""
+        with self._lock:
+            return self._state
+
+    def probe_due(self):
+        """Returns True if the breaker is open, and the next request would be let through as its trial request."""
+        with self._lock:
+            return self._state == STATE_OPEN and time.monotonic() - self._opened_at >= self._reset_timeout
+
+    def before_request(self):
+        """
+        Checks that a request may be sent to the provider.
+
+        Raises
+        ------
+        ProviderUnavailableException
+            If the breaker is open, or its trial request is still in progress
+            (and has not yet expired).
+
+        """
+        with self._lock:
+            if self._state == STATE_CLOSED:
+                return
+
+            now = time.monotonic()
+
+            if (self._state == STATE_OPEN and now - self._opened_at >= self._reset_timeout) or (
+                self._state == STATE_HALF_OPEN and now - self._trial_started_at >= self._reset_timeout
+            ):
+                logger.info("Sending trial request to the %s service", self._name)
+                self._state = STATE_HALF_OPEN
+                self._trial_started_at = now
+                return
+
+            since = self._opened_at if self._state == STATE_OPEN else self._trial_started_at
+            retry_after = max(0.0, self._reset_timeout - (now - since))
+
+        raise ProviderUnavailableException(
+            f"The {self._name} service is unavailable after repeated request failures, "
+            f"retry in {retry_after:.0f} second(s)"
+        )
+
+    def record_success(self):
+        """Records a successful request, closing the breaker."""
+        with self._lock:
+            if self._state != STATE_CLOSED:
+                logger.info("The %s service has recovered", self._name)
+
+            self._state = STATE_CLOSED
+            self._failures = 0
+
+    def record_failure(self):
+        """Records a failed request, opening the breaker once the failure threshold is reached."""
+        with self._lock:
+            self._failures += 1
+
+            if self._failure_threshold <= 0:
+                return
+
+            if self._state == STATE_HALF_OPEN or self._failures >= self._failure_threshold:
+                if self._state == STATE_CLOSED:
+                    logger.warning(
+                        "Failing %s requests fast for %.0f second(s) after %d consecutive failure(s)",
+                        self._name,
+                        self._reset_timeout,
+                        self._failures,
+                    )
+
+                self._state = STATE_OPEN
+                self._opened_at = time.monotonic()
+
+
+_circuit_breakers = {}
+_circuit_breakers_lock = threading.Lock()
+
+
+def get_circuit_breaker(service_name):
+    """
+    Returns the process-wide CircuitBreaker of the provided service, creating
+    it on first use. The breaker is configured by the
+    OTHER.provider_breaker_threshold and OTHER.provider_breaker_reset_timeout
+    fields of the INI config.
+    """
+    with _circuit_breakers_lock:
+        if service_name not in _circuit_breakers:
+            config = DOIConfigUtil().get_config()
+
+            _circuit_breakers[service_name] = CircuitBreaker(
+                service_name,
+                failure_threshold=int(
+                    config.get("OTHER", "provider_breaker_threshold", fallback=DEFAULT_FAILURE_THRESHOLD)
+                ),
+                reset_timeout=float(
+                    config.get("OTHER", "provider_breaker_reset_timeout", fallback=DEFAULT_RESET_TIMEOUT)
+                ),
+            )
+
+        return _circuit_breakers[service_name]
@@ -5,10 +5,25 @@ DataCite
 
 This package contains the DataCite-specific implementations for the abstract
 classes of the outputs package.
+
+The implementation classes are imported on first access, so that using one
+of them does not pull in the dependencies of the others.
 """
+import importlib
+
+_EXPORTS = {
+    "DOIDataCiteRecord": ".datacite_record",
+    "DOIDataCiteValidator": ".datacite_validator",
+    "DOIDataCiteWebClient": ".datacite_web_client",
+    "DOIDataCiteWebParser": ".datacite_web_parser",
+}
+"""The classes exported by this package, mapped to the module defining each"""
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        return getattr(importlib.import_module(_EXPORTS[name], __name__), name)
 
-# noreorder
-from .datacite_record import DOIDataCiteRecord  # noqa: F401
-from .datacite_validator import DOIDataCiteValidator  # noqa: F401
-from .datacite_web_client import DOIDataCiteWebClient  # noqa: F401
-from .datacite_web_parser import DOIDataCiteWebParser  # noqa: F401
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
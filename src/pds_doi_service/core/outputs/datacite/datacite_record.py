@@ -16,17 +16,27 @@ import json
 from importlib import resources
 from os.path import exists
 
-import jinja2
 from pds_doi_service.core.entities.doi import Doi
+from pds_doi_service.core.entities.doi import ProductType
 from pds_doi_service.core.outputs.datacite.schemaentities.datacite_rights import DOIDataCiteRights
 from pds_doi_service.core.outputs.doi_record import CONTENT_TYPE_JSON
 from pds_doi_service.core.outputs.doi_record import DOIRecord
 from pds_doi_service.core.util.config_parser import DOIConfigUtil
+from pds_doi_service.core.util.general_util import canonical_json_dumps
+from pds_doi_service.core.util.general_util import collapse_whitespace
 from pds_doi_service.core.util.general_util import get_logger
 from pds_doi_service.core.util.general_util import sanitize_json_string
+from pds_doi_service.core.util.metrics import timed_operation
+from pds_doi_service.core.util.profiling import traced
 
 logger = get_logger(__name__)
 
+DATACITE_DATE_FORMAT = "%Y-%m-%dT%H:%M:%S.%fZ"
+"""The format used for the created/updated timestamps of a DataCite record"""
+
+RESOURCE_TYPE_GENERAL_MAP = {ProductType.Bundle: "Collection", ProductType.Document: "Text"}
+"""Product types which map to a different DataCite resourceTypeGeneral value"""
+
 
 class DOIDataCiteRecord(DOIRecord):
     """
@@ -34,24 +44,47 @@ class DOIDataCiteRecord(DOIRecord):
     DOI service.
 
     This class only supports output of DOI records in JSON format.
+
+    Records are built as Python dicts and encoded directly to JSON in the
+    canonical form returned by canonical_json_dumps(). The legacy Jinja template
+    may be used instead by setting DATACITE.use_jinja_template in the INI config.
     """
 
-    def __init__(self):
-        """Creates a new instance of DOIDataCiteRecord"""
+    def __init__(self, use_template=None):
+        """
+        Creates a new instance of DOIDataCiteRecord
+
+        Parameters
+        ----------
+        use_template : bool, optional
+            Whether to render records with the legacy Jinja template. If not
+            provided, the DATACITE.use_jinja_template value of the INI config
+            is used.
+
+        """
         self._config = DOIConfigUtil().get_config()
+        self._template = None
 
-        # Locate the jinja template
-        self._json_template_path = str(resources.files(__name__) / "DOI_DataCite_template_20210520-jinja2.json")
+        if use_template is None:
+            use_template = self._config.getboolean("DATACITE", "use_jinja_template", fallback=False)
 
-        if not exists(self._json_template_path):
-            raise RuntimeError(
-                "Could not find the DOI template needed by this module\n"
-                f"Expected JSON template: {self._json_template_path}"
-            )
+        if use_template:
+            import jinja2
 
-        with open(self._json_template_path, "r") as infile:
-            self._template = jinja2.Template(infile.read(), lstrip_blocks=True, trim_blocks=True)
+            # Locate the jinja template
+            self._json_template_path = str(resources.files(__name__) / "DOI_DataCite_template_20210520-jinja2.json")
 
+            if not exists(self._json_template_path):
+                raise RuntimeError(
+                    "Could not find the DOI template needed by this module\n"
+                    f"Expected JSON template: {self._json_template_path}"
+                )
+
+            with open(self._json_template_path, "r") as infile:
+                self._template = jinja2.Template(infile.read(), lstrip_blocks=True, trim_blocks=True)
+
+    @traced("render")
+    @timed_operation("render_template", service="DataCite")
     def create_doi_record(self, dois, content_type=CONTENT_TYPE_JSON):
         """
         Creates a DataCite format DOI record from the provided list of Doi
@@ -73,6 +106,208 @@ class DOIDataCiteRecord(DOIRecord):
         if content_type != CONTENT_TYPE_JSON:
             raise ValueError(f"Only {CONTENT_TYPE_JSON} is supported for records created " f"from {__name__}")
 
+        if self._template is not None:
+            return self._render_template(dois)
+
+        return canonical_json_dumps(self.create_doi_payload(dois))
+
+    def create_doi_payload(self, dois, content_type=CONTENT_TYPE_JSON):
+        """
+        Creates the DataCite JSON payload for the provided list of Doi objects
+        as Python objects, for callers that would otherwise immediately parse
+        the text returned by create_doi_record().
+
+        Parameters
+        ----------
+        dois : Doi or list of Doi
+            The Doi object(s) to format into the returned payload.
+        content_type : str, optional
+            The type of record to create the payload for. Only 'json' is
+            supported.
+
+        Returns
+        -------
+        payload : dict
+            The DataCite payload, with a single record under the "data" key
+            if a single Doi was provided, or a list of records otherwise.
+
+        """
+        if content_type != CONTENT_TYPE_JSON:
+            raise ValueError(f"Only {CONTENT_TYPE_JSON} is supported for records created " f"from {__name__}")
+
+        # Templated records may differ from the native encoding, so parse the
+        # rendered text to return exactly what create_doi_record() would
+        if self._template is not None:
+            return json.loads(self._render_template(dois))
+
+        # If a single DOI was provided, wrap it in a list so the iteration
+        # below still works
+        if isinstance(dois, Doi):
+            dois = [dois]
+
+        records = [self._create_record(doi) for doi in dois]
+
+        return {"data": records[0] if len(records) == 1 else records}
+
+    @staticmethod
+    def _create_name_identifiers(person):
+        """Returns the nameIdentifiers entries for the provided author or editor dictionary"""
+        name_identifiers = []
+
+        if person.get("rorid"):
+            name_identifiers.append(
+                {"nameIdentifier": person["rorid"], "nameIdentifierScheme": "ROR", "schemeUri": "https://ror.org"}
+            )
+        elif person.get("orcid"):
+            name_identifiers.append(
+                {"nameIdentifier": person["orcid"], "nameIdentifierScheme": "ORCID", "schemeUri": "https://orcid.org"}
+            )
+
+        for name_identifier in person.get("name_identifiers") or []:
+            name_identifiers.append({str(key): str(value) for key, value in name_identifier.items()})
+
+        return name_identifiers
+
+    def _create_creator(self, author):
+        """Returns the creators entry for the provided author dictionary"""
+        if author.get("first_name") and author.get("last_name"):
+            name = f"{collapse_whitespace(author['first_name'])} {collapse_whitespace(author['last_name'])}"
+        else:
+            if "name" not in author:
+                logger.warning(f"Author entry missing required name fields, skipping: {author}")
+
+            name = collapse_whitespace(author.get("name") or "")
+
+        creator = {"nameType": author.get("name_type") or "Personal", "name": name}
+
+        if author.get("affiliation"):
+            creator["affiliation"] = [{"name": str(affiliation)} for affiliation in author["affiliation"]]
+
+        creator["nameIdentifiers"] = self._create_name_identifiers(author)
+
+        return creator
+
+    def _create_contributor(self, editor):
+        """Returns the contributors entry for the provided editor dictionary"""
+        if editor.get("first_name") and editor.get("last_name"):
+            name = f"{editor['first_name']} {editor['last_name']}"
+        else:
+            name = editor.get("name") or ""
+
+        contributor = {
+            "nameType": "Personal",
+            "name": name,
+            "nameIdentifiers": self._create_name_identifiers(editor),
+        }
+
+        if editor.get("affiliation"):
+            contributor["affiliation"] = [{"name": str(affiliation)} for affiliation in editor["affiliation"]]
+
+        contributor["contributorType"] = "Editor"
+
+        return contributor
+
+    def _create_record(self, doi):
+        """
+        Returns the DataCite record for a single Doi object, with the same
+        content and key order as the legacy Jinja template.
+        """
+        record = {}
+
+        if doi.doi:
+            record["id"] = doi.doi
+
+        record["type"] = "dois"
+
+        attributes = {}
+
+        if doi.event:
+            attributes["event"] = doi.event.value
+
+        # If this entry does not have a DOI assigned (i.e. reserve request),
+        # DataCite wants to know our assigned prefix instead
+        if doi.doi:
+            attributes["doi"] = doi.doi
+        else:
+            attributes["prefix"] = self._config.get("DATACITE", "doi_prefix")
+
+        if doi.id:
+            attributes["suffix"] = doi.id
+
+        identifiers = [
+            {"identifier": identifier["identifier"].strip(), "identifierType": identifier["identifierType"]}
+            for identifier in doi.identifiers
+        ]
+
+        # Make sure the PDS identifier is included as a "identifier"
+        # this is a rolling list that captures all previous identifiers used for the current record
+        existing_identifiers = {identifier["identifier"] for identifier in doi.identifiers}
+
+        if doi.pds_identifier and doi.pds_identifier not in existing_identifiers:
+            identifiers.append({"identifier": doi.pds_identifier.strip(), "identifierType": "Site ID"})
+
+        attributes["identifiers"] = identifiers
+        attributes["creators"] = [self._create_creator(author) for author in doi.authors or []]
+        attributes["titles"] = [{"title": collapse_whitespace(doi.title) if doi.title else "", "lang": "en"}]
+        attributes["publisher"] = doi.publisher or ""
+
+        # Publication year is a must-have
+        attributes["publicationYear"] = doi.publication_date.strftime("%Y")
+
+        attributes["rightsList"] = [
+            rights.convert(DOIDataCiteRights).to_endpoint_dict(escape_quotes=False) for rights in doi.rights_list
+        ]
+
+        # Sort keywords so we can output them in the same order each time
+        attributes["subjects"] = [{"subject": keyword} for keyword in sorted(map(collapse_whitespace, doi.keywords))]
+
+        attributes["contributors"] = [self._create_contributor(editor) for editor in doi.editors or []]
+        attributes["contributors"].append(
+            {
+                "nameType": "Organizational",
+                "name": f"Planetary Data System: {doi.contributor or ''} Node",
+                "contributorType": "DataCurator",
+            }
+        )
+
+        attributes["types"] = {
+            "resourceTypeGeneral": RESOURCE_TYPE_GENERAL_MAP.get(doi.product_type, doi.product_type.value),
+            "resourceType": doi.product_type_specific or "",
+        }
+
+        attributes["relatedIdentifiers"] = [
+            {
+                "relatedIdentifier": related_identifier["relatedIdentifier"].strip(),
+                "relatedIdentifierType": related_identifier["relatedIdentifierType"],
+                "relationType": related_identifier["relationType"],
+            }
+            for related_identifier in doi.related_identifiers
+        ]
+
+        if doi.description:
+            attributes["descriptions"] = [
+                {"description": collapse_whitespace(doi.description), "descriptionType": "Abstract", "lang": "en"}
+            ]
+
+        if doi.site_url:
+            attributes["url"] = doi.site_url
+
+        if doi.date_record_added:
+            attributes["created"] = doi.date_record_added.strftime(DATACITE_DATE_FORMAT)
+
+        if doi.date_record_updated:
+            attributes["updated"] = doi.date_record_updated.strftime(DATACITE_DATE_FORMAT)
+
+        attributes["state"] = doi.status.value
+        attributes["language"] = "en"
+        attributes["schemaVersion"] = "http://datacite.org/schema/kernel-4"
+
+        record["attributes"] = attributes
+
+        return record
+
+    def _render_template(self, dois):
+        """Renders the provided Doi object(s) to a DataCite record with the legacy Jinja template"""
         # If a single DOI was provided, wrap it in a list so the iteration
         # below still works
         if isinstance(dois, Doi):
@@ -95,10 +330,10 @@ class DOIDataCiteRecord(DOIRecord):
 
             # Convert datetime objects to isoformat strings
             if doi.date_record_added:
-                doi_fields["date_record_added"] = doi.date_record_added.strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+                doi_fields["date_record_added"] = doi.date_record_added.strftime(DATACITE_DATE_FORMAT)
 
             if doi.date_record_updated:
-                doi_fields["date_record_updated"] = doi.date_record_updated.strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+                doi_fields["date_record_updated"] = doi.date_record_updated.strftime(DATACITE_DATE_FORMAT)
 
             # Cleanup extra whitespace that could break JSON format from title,
             # description and author names
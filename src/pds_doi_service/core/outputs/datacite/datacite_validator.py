@@ -20,6 +20,8 @@ from pds_doi_service.core.entities.exceptions import InputFormatException
 from pds_doi_service.core.outputs.service_validator import DOIServiceValidator
 from pds_doi_service.core.util.general_util import get_logger
 from pds_doi_service.core.util.general_util import str_to_bool
+from pds_doi_service.core.util.metrics import timed_operation
+from pds_doi_service.core.util.profiling import traced
 
 logger = get_logger(__name__)
 
@@ -56,6 +58,8 @@ class DOIDataCiteValidator(DOIServiceValidator):
 
         self._schema_validator = jsonschema.Draft7Validator(schema)
 
+    @traced("validate_schema")
+    @timed_operation("validate_schema", service="DataCite")
     def validate(self, label_contents):
         """
         Validates contents of a DataCite JSON label against their JSON schema
@@ -63,8 +67,9 @@ class DOIDataCiteValidator(DOIServiceValidator):
 
         Parameters
         ----------
-        label_contents : str
-            Contents of the DataCite JSON label.
+        label_contents : str or dict
+            Contents of the DataCite JSON label, either as text or as the
+            payload returned by DOIDataCiteRecord.create_doi_payload().
 
         Raises
         ------
@@ -80,7 +85,10 @@ class DOIDataCiteValidator(DOIServiceValidator):
         # Check the label contents against the DataCite JSON schema
         if str_to_bool(validate_against_schema):
             try:
-                json_contents = json.loads(label_contents)
+                if isinstance(label_contents, dict):
+                    json_contents = label_contents
+                else:
+                    json_contents = json.loads(label_contents)
 
                 if "data" in json_contents:
                     # Strip off the stuff that is not covered by the JSON schema
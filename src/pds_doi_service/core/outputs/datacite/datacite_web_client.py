@@ -18,12 +18,15 @@ import requests
 from pds_doi_service.core.entities.exceptions import WebRequestException
 from pds_doi_service.core.outputs.datacite.datacite_web_parser import DOIDataCiteWebParser
 from pds_doi_service.core.outputs.doi_record import CONTENT_TYPE_JSON
+from pds_doi_service.core.outputs.web_client import DEFAULT_QUERY_BATCH_SIZE
+from pds_doi_service.core.outputs.web_client import DEFAULT_QUERY_MAX_WORKERS
 from pds_doi_service.core.outputs.web_client import DOIWebClient
 from pds_doi_service.core.outputs.web_client import WEB_METHOD_GET
 from pds_doi_service.core.outputs.web_client import WEB_METHOD_POST
 from pds_doi_service.core.outputs.web_client import WEB_METHOD_PUT
 from pds_doi_service.core.util.config_parser import DOIConfigParser
 from pds_doi_service.core.util.general_util import get_logger
+from pds_doi_service.core.util.profiling import traced
 from requests.auth import HTTPBasicAuth
 
 logger = get_logger(__name__)
@@ -38,6 +41,7 @@ class DOIDataCiteWebClient(DOIWebClient):
     _web_parser = DOIDataCiteWebParser()
     _content_type_map = {CONTENT_TYPE_JSON: "application/vnd.api+json"}
 
+    @traced("submit")
     def submit_content(
         self, payload, url=None, username=None, password=None, method=WEB_METHOD_POST, content_type=CONTENT_TYPE_JSON
     ):
@@ -168,7 +172,7 @@ class DOIDataCiteWebClient(DOIWebClient):
         try:
             # Submit the request, specifying that we would like up to 1000
             # results returned for each page
-            datacite_response = requests.request(
+            datacite_response = self._send_request(
                 WEB_METHOD_GET,
                 url=url,
                 auth=auth,
@@ -192,7 +196,7 @@ class DOIDataCiteWebClient(DOIWebClient):
             while pages_returned < total_pages:
                 url = result["links"]["next"]
 
-                datacite_response = requests.request(WEB_METHOD_GET, url=url, auth=auth, headers=headers)
+                datacite_response = self._send_request(WEB_METHOD_GET, url=url, auth=auth, headers=headers)
 
                 datacite_response.raise_for_status()
 
@@ -214,6 +218,43 @@ class DOIDataCiteWebClient(DOIWebClient):
         # expected by the DataCite parser
         return json.dumps({"data": data})
 
+    def query_dois(self, dois, batch_size=DEFAULT_QUERY_BATCH_SIZE, max_workers=DEFAULT_QUERY_MAX_WORKERS):
+        """
+        Queries the DataCite DOI endpoint for the status of several DOI
+        submissions, requesting up to batch_size DOIs with each query by
+        OR-ing them together into a single search term.
+
+        Parameters
+        ----------
+        dois : iterable of str
+            The DOIs to query for.
+        batch_size : int, optional
+            Maximum number of DOIs to request with a single query.
+        max_workers : int, optional
+            Maximum number of queries to submit concurrently.
+
+        Returns
+        -------
+        results : list of tuple
+            One (batch_dois, response_text) tuple per query submitted, where
+            batch_dois is the list of DOIs requested by the query and
+            response_text is the JSON response, combined across all pages.
+
+        """
+        dois = list(dois)
+        batch_size = max(1, batch_size)
+        batches = [dois[start : start + batch_size] for start in range(0, len(dois), batch_size)]
+
+        def _query_batch(batch):
+            if len(batch) == 1:
+                return self.query_doi(query={"doi": batch[0]})
+
+            # Quote each DOI, since the slash is reserved by the DataCite
+            # (Elasticsearch) query syntax
+            return self.query_doi(query="doi:(" + " OR ".join(f'"{doi}"' for doi in batch) + ")")
+
+        return self._query_batches(batches, _query_batch, max_workers)
+
     def endpoint_for_doi(self, doi, action):
         """
         Returns the proper HTTP verb and URL that form a request endpoint for
@@ -11,8 +11,14 @@ datacite_web_parser.py
 
 Contains classes used to parse response labels from DataCite DOI service requests.
 """
+import functools
 import html
+import itertools
 import json
+import logging
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from typing import List
 
@@ -30,13 +36,64 @@ from pds_doi_service.core.entities.exceptions import UnknownNodeException
 from pds_doi_service.core.outputs.datacite.schemaentities.datacite_rights import DOIDataCiteRights
 from pds_doi_service.core.outputs.doi_record import CONTENT_TYPE_JSON
 from pds_doi_service.core.outputs.web_parser import DOIWebParser
+from pds_doi_service.core.util.config_parser import DOIConfigUtil
 from pds_doi_service.core.util.general_util import get_logger
 from pds_doi_service.core.util.general_util import is_pds4_identifier
 from pds_doi_service.core.util.general_util import parse_identifier_from_site_url
+from pds_doi_service.core.util.json_stream import iter_json_items
+from pds_doi_service.core.util.metrics import timed_operation
 from pds_doi_service.core.util.node_util import NodeUtil
 
 logger = get_logger(__name__)
 
+PARSE_CHUNK_SIZE = 256
+"""Number of records parsed by each task submitted to the process pool of a parallel parse"""
+
+
+@functools.lru_cache(maxsize=1024)
+def _version(vid):
+    """Returns the (memoized) Version of the provided PDS4 VID, used to order the identifiers of a record."""
+    return Version(vid)
+
+
+class _LogRecorder(logging.Handler):
+    """
+    Logging handler which records the level and message of each log record,
+    used to relay the messages logged while parsing records in a worker
+    process back to the parent process.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.messages = []
+
+    def emit(self, record):
+        self.messages.append((record.levelno, record.getMessage()))
+
+
+def _parse_record_chunk(start_index, datacite_records):
+    """
+    Parses a chunk of DataCite records within a worker process of a parallel
+    parse, returning the result of DOIDataCiteWebParser._parse_record() for each
+    record, along with the (level, message) of each message logged while doing so.
+    """
+    recorder = _LogRecorder()
+    propagate = logger.propagate
+
+    logger.addHandler(recorder)
+    logger.propagate = False
+
+    try:
+        results = [
+            DOIDataCiteWebParser._parse_record(index, datacite_record)
+            for index, datacite_record in enumerate(datacite_records, start_index)
+        ]
+    finally:
+        logger.removeHandler(recorder)
+        logger.propagate = propagate
+
+    return results, recorder.messages
+
 
 class DOIDataCiteWebParser(DOIWebParser):
     """
@@ -80,6 +137,15 @@ class DOIDataCiteWebParser(DOIWebParser):
     _pds4_identifier_types = ["PDS4 LIDVID", "PDS4 Product ID", "PDS4 Bundle LIDVID", "PDS4 Bundle ID", "PDS4 Bundle LID", "PDS4 Collection ID", "Site ID", "URN"]
     """The set of identifier types which indicate a PDS4 dataset"""
 
+    _pds3_identifier_set = frozenset(_pds3_identifier_types)
+    _pds4_identifier_set = frozenset(_pds4_identifier_types)
+
+    _field_plan = None
+    """
+    The (field, parser, mandatory) tuple of each field parsed from a record,
+    resolved once from the _mandatory_fields and _optional_fields lists on first use
+    """
+
     @staticmethod
     def _parse_id(record):
         try:
@@ -266,64 +332,61 @@ class DOIDataCiteWebParser(DOIWebParser):
     @staticmethod
     def _parse_pds_identifier(record):
         identifier = None
-        all_recognized_types = (
-            DOIDataCiteWebParser._pds3_identifier_types + DOIDataCiteWebParser._pds4_identifier_types
-        )
+        pds3_identifier_types = DOIDataCiteWebParser._pds3_identifier_set
+        pds4_identifier_types = DOIDataCiteWebParser._pds4_identifier_set
+
+        # Check identifiers for a PDS ID in a single pass, giving preference
+        # to the first PDS3 dataset ID, if present, and otherwise collecting
+        # any PDS4 URNs
+        pds4_identifiers = []
 
-        # First, check identifiers for a PDS ID, giving preference
-        # to a PDS3 dataset ID, if present
         for identifier_record in record.get("identifiers", []):
             # Strip whitespace from identifierType to handle malformed data
             # Use "or ''" to handle None values
             identifier_type = (identifier_record.get("identifierType") or "").strip()
-            if identifier_type in DOIDataCiteWebParser._pds3_identifier_types and not is_pds4_identifier(
-                identifier_record.get("identifier", "")
-            ):
+
+            if identifier_type not in pds3_identifier_types and identifier_type not in pds4_identifier_types:
+                continue
+
+            if is_pds4_identifier(identifier_record.get("identifier", "")):
+                if identifier_type in pds4_identifier_types:
+                    pds4_identifiers.append(identifier_record["identifier"])
+            elif identifier_type in pds3_identifier_types:
                 identifier = identifier_record["identifier"]
                 break
 
-        # Next, try another pass on identifiers, looking for PDS4 URN this time
-        if not identifier:
-            pds4_identifiers = []
-            for identifier_record in record.get("identifiers", []):
-                # Strip whitespace from identifierType to handle malformed data
-                # Use "or ''" to handle None values
-                identifier_type = (identifier_record.get("identifierType") or "").strip()
-                if identifier_type in DOIDataCiteWebParser._pds4_identifier_types and is_pds4_identifier(
-                    identifier_record.get("identifier", "")
-                ):
-                    pds4_identifiers.append(identifier_record["identifier"])
+        # There could be multiple PDS4 ID's with the same LID but different
+        # VIDs, so take the newest one. The Version class is used to
+        # sort VIDs by semantic versioning rules (1.9.0 < 1.10.0)
+        # For LID's only, assign a version 0.0 so they're always superseded by
+        # a LIDVID
+        if not identifier and len(pds4_identifiers) == 1:
+            identifier = pds4_identifiers[0]
+        elif not identifier and pds4_identifiers:
+            vids = [
+                pds4_identifier.split("::")[-1] if "::" in pds4_identifier else "0.0"
+                for pds4_identifier in pds4_identifiers
+            ]
 
-            # There could be multiple PDS4 ID's with the same LID but different
-            # VIDs, so take the newest one. The Version class is used to
-            # sort VIDs by semantic versioning rules (1.9.0 < 1.10.0)
-            # For LID's only, assign a version 0.0 so they're always superseded by
-            # a LIDVID
-            if pds4_identifiers:
-                vids = [
-                    pds4_identifier.split("::")[-1] if "::" in pds4_identifier else "0.0"
-                    for pds4_identifier in pds4_identifiers
-                ]
-
-                # Try to sort by Version, but handle invalid version strings
-                try:
-                    sorted_vids = list(sorted(vids, key=Version))
-                    identifier = pds4_identifiers[vids.index(sorted_vids[-1])]
-                except InvalidVersion as e:
-                    # If Version sorting fails (e.g., invalid version strings),
-                    # log a warning and just use the first identifier
-                    doi_value = record.get("doi", "unknown")
-                    logger.warning(
-                        "Failed to sort identifiers by version for DOI %s (%s). "
-                        "Identifiers: %s, VIDs: %s. Using first identifier: %s",
-                        doi_value,
-                        str(e),
-                        pds4_identifiers,
-                        vids,
-                        pds4_identifiers[0] if pds4_identifiers else None
-                    )
-                    if pds4_identifiers:
-                        identifier = pds4_identifiers[0]
+            # Take the newest VID, preferring the last of any equal versions as
+            # a stable sort would, but handle invalid version strings
+            try:
+                newest_vid = max(reversed(vids), key=_version)
+                identifier = pds4_identifiers[vids.index(newest_vid)]
+            except InvalidVersion as e:
+                # If Version sorting fails (e.g., invalid version strings),
+                # log a warning and just use the first identifier
+                doi_value = record.get("doi", "unknown")
+                logger.warning(
+                    "Failed to sort identifiers by version for DOI %s (%s). "
+                    "Identifiers: %s, VIDs: %s. Using first identifier: %s",
+                    doi_value,
+                    str(e),
+                    pds4_identifiers,
+                    vids,
+                    pds4_identifiers[0],
+                )
+                identifier = pds4_identifiers[0]
 
         # Lastly, try to parse an ID from the site URL
         if not identifier and "url" in record:
@@ -334,6 +397,8 @@ class DOIDataCiteWebParser(DOIWebParser):
         # that look like PDS identifiers (URN patterns), check if the issue is
         # unrecognized identifier types
         if identifier is None and record.get("identifiers"):
+            all_recognized_types = pds3_identifier_types | pds4_identifier_types
+
             # Find identifiers that look like PDS identifiers but have unrecognized types
             # Use "or ''" to handle None values
             pds_like_with_unrecognized_types = [
@@ -392,8 +457,161 @@ class DOIDataCiteWebParser(DOIWebParser):
         except KeyError:
             raise InputFormatException('Failed to parse mandatory field "product_type_specific"')
 
+    @classmethod
+    def _get_field_plan(cls):
+        """
+        Returns the (field, parser, mandatory) tuple of each field parsed from
+        a record, resolving the _parse_<field> method of each field on first use.
+        """
+        if cls._field_plan is None:
+            cls._field_plan = tuple(
+                (field, getattr(cls, f"_parse_{field}"), mandatory)
+                for fields, mandatory in ((cls._mandatory_fields, True), (cls._optional_fields, False))
+                for field in fields
+            )
+
+        return cls._field_plan
+
+    @staticmethod
+    def _parse_record(index, datacite_record):
+        """
+        Parses a Doi object from a single record of a DataCite JSON label.
+
+        Returns
+        -------
+        doi : Doi
+            The Doi object parsed from the record, or None if the record could
+            not be parsed and was skipped.
+
+        """
+        # Extract DOI and state early for better error messages
+        attributes = datacite_record.get("attributes", {})
+        doi_value = attributes.get("doi", "unknown")
+        doi_state = attributes.get("state", "unknown")
+
+        try:
+            doi_fields = {}
+
+            # Everything we care about in a DataCite response is under attributes
+            datacite_record = datacite_record["attributes"]
+
+            for field, parser, mandatory in DOIDataCiteWebParser._get_field_plan():
+                if mandatory:
+                    doi_fields[field] = parser(datacite_record)
+                    continue
+
+                try:
+                    parsed_value = parser(datacite_record)
+
+                    if parsed_value is not None:
+                        doi_fields[field] = parsed_value
+                except UserWarning as warning:
+                    logger.warning("DOI %s (record %d): %s", doi_value, index, str(warning))
+
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Parsed record index %d (DOI: %s): %s", index, doi_value, doi_fields)
+
+            return Doi(**doi_fields)
+        except InputFormatException as err:
+            # Check if the DOI state is "findable" - if so, this is a serious error
+            # For non-findable states (draft, registered), bad metadata is less concerning
+            if doi_state == DoiStatus.Findable.value:
+                logger.error(
+                    "DOI %s (record %d): Failed to parse - record skipped. Reason: %s",
+                    doi_value,
+                    index,
+                    str(err),
+                )
+            else:
+                logger.warning(
+                    "DOI %s (record %d, state=%s): Failed to parse - record skipped. "
+                    "This is expected for non-findable DOIs with incomplete metadata. Reason: %s",
+                    doi_value,
+                    index,
+                    doi_state,
+                    str(err),
+                )
+
+            return None
+
+    @staticmethod
+    def _get_parse_processes(processes=None):
+        """
+        Returns the number of processes to parse records with, taken from the
+        OTHER.parse_processes field of the INI config when not provided. A
+        value of 0 uses all available cores.
+        """
+        if processes is None:
+            config = DOIConfigUtil().get_config()
+            processes = int(config.get("OTHER", "parse_processes", fallback=1))
+
+        if processes <= 0:
+            processes = len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else os.cpu_count() or 1
+
+        return processes
+
     @staticmethod
-    def parse_dois_from_label(label_text, content_type=CONTENT_TYPE_JSON):
+    def _iter_parsed_records(datacite_records, processes=None):
+        """
+        Yields the result of _parse_record() (a Doi, or None for a skipped
+        record) for each of the provided records, in order.
+
+        When more than one process is requested, and there are more records
+        than fit within a single chunk of PARSE_CHUNK_SIZE records, chunks are
+        parsed in parallel by a pool of worker processes. Only a bounded number
+        of chunks are in flight at a time, so records may be provided by an
+        iterator over a label of any size. Messages logged by the workers are
+        re-logged by this process as each chunk is consumed, so are reported in
+        the same order as for a serial parse.
+
+        Parameters
+        ----------
+        datacite_records : iterable of dict
+            The records to parse, as decoded from the "data" member of a
+            DataCite JSON label.
+        processes : int, optional
+            Number of processes to parse with. Defaults to the value of the
+            OTHER.parse_processes field of the INI config.
+
+        """
+        processes = DOIDataCiteWebParser._get_parse_processes(processes)
+        chunks = itertools.batched(datacite_records, PARSE_CHUNK_SIZE)
+        first_chunk = next(chunks, ())
+
+        if processes <= 1 or len(first_chunk) < PARSE_CHUNK_SIZE:
+            for index, datacite_record in enumerate(itertools.chain(first_chunk, *chunks)):
+                yield DOIDataCiteWebParser._parse_record(index, datacite_record)
+
+            return
+
+        logger.info("Parsing records with %d processes", processes)
+
+        with ProcessPoolExecutor(max_workers=processes) as executor:
+            pending = deque()
+
+            for chunk_index, chunk in enumerate(itertools.chain((first_chunk,), chunks)):
+                pending.append(executor.submit(_parse_record_chunk, chunk_index * PARSE_CHUNK_SIZE, chunk))
+
+                # Keep every worker busy, without reading ahead of the consumer indefinitely
+                while len(pending) > 2 * processes or (pending and pending[0].done()):
+                    yield from DOIDataCiteWebParser._relay_chunk_results(pending.popleft())
+
+            while pending:
+                yield from DOIDataCiteWebParser._relay_chunk_results(pending.popleft())
+
+    @staticmethod
+    def _relay_chunk_results(future):
+        """Re-logs the messages of a chunk parsed by a worker process, then yields the results of the chunk."""
+        results, messages = future.result()
+
+        for level, message in messages:
+            logger.log(level, message)
+
+        yield from results
+
+    @staticmethod
+    @timed_operation("parse_label", service="DataCite", format="json")
+    def parse_dois_from_label(label_text, content_type=CONTENT_TYPE_JSON, processes=None):
         """
         Parses one or more Doi objects from the provided DataCite label.
 
@@ -403,6 +621,10 @@ class DOIDataCiteWebParser(DOIWebParser):
             Text body of the label to parse.
         content_type : str
             The format of the label's content.
+        processes : int, optional
+            Number of processes to parse the records of the label with (see
+            _iter_parsed_records()). Defaults to the value of the
+            OTHER.parse_processes field of the INI config.
 
         Returns
         -------
@@ -427,62 +649,54 @@ class DOIDataCiteWebParser(DOIWebParser):
         if not isinstance(datacite_records, list):
             datacite_records = [datacite_records]
 
-        for index, datacite_record in enumerate(datacite_records):
-            # Extract DOI and state early for better error messages
-            doi_value = datacite_record.get("attributes", {}).get("doi", "unknown")
-            doi_state = datacite_record.get("attributes", {}).get("state", "unknown")
+        for doi in DOIDataCiteWebParser._iter_parsed_records(datacite_records, processes):
+            if doi is not None:
+                dois.append(doi)
 
-            try:
-                logger.info("Parsing record index %d (DOI: %s)", index, doi_value)
-                doi_fields = {}
+        logger.info("Parsed %d DOI objects from %d records", len(dois), len(datacite_records))
 
-                # Everything we care about in a DataCite response is under attributes
-                datacite_record = datacite_record["attributes"]
+        return dois, errors
 
-                for mandatory_field in DOIDataCiteWebParser._mandatory_fields:
-                    doi_fields[mandatory_field] = getattr(DOIDataCiteWebParser, f"_parse_{mandatory_field}")(
-                        datacite_record
-                    )
-                    logger.debug("Parsed value %s for mandatory field %s", doi_fields[mandatory_field], mandatory_field)
+    @staticmethod
+    def iter_dois_from_label(label_file, processes=None):
+        """
+        Incrementally parses a DataCite JSON label file, yielding a Doi object
+        for each record of its "data" array as soon as the record is read.
+        Only a single record is decoded at a time, so labels of any size (such
+        as a dump of a full DOI catalogue) are parsed in constant memory.
+        Records that cannot be parsed are logged and skipped.
+
+        Parameters
+        ----------
+        label_file : str
+            Path to the label file to parse.
+        processes : int, optional
+            Number of processes to parse the records of the label with (see
+            _iter_parsed_records()). Defaults to the value of the
+            OTHER.parse_processes field of the INI config.
 
-                for optional_field in DOIDataCiteWebParser._optional_fields:
-                    try:
-                        parser = getattr(DOIDataCiteWebParser, f"_parse_{optional_field}")
-                        parsed_value = parser(datacite_record)
+        Yields
+        ------
+        doi : Doi
+            The Doi object parsed from each record of the label, in order.
 
-                        if parsed_value is not None:
-                            doi_fields[optional_field] = parsed_value
-                            logger.debug("Parsed value %s for optional field %s", parsed_value, optional_field)
-                    except UserWarning as warning:
-                        logger.warning("DOI %s (record %d): %s", doi_value, index, str(warning))
+        Raises
+        ------
+        ValueError
+            If the label is not well-formed JSON, or has no "data" member.
 
-                doi = Doi(**doi_fields)
+        """
+        num_records = 0
+        num_dois = 0
 
-                dois.append(doi)
-            except InputFormatException as err:
-                # Check if the DOI state is "findable" - if so, this is a serious error
-                # For non-findable states (draft, registered), bad metadata is less concerning
-                if doi_state == DoiStatus.Findable.value:
-                    logger.error(
-                        "DOI %s (record %d): Failed to parse - record skipped. Reason: %s",
-                        doi_value,
-                        index,
-                        str(err),
-                    )
-                else:
-                    logger.warning(
-                        "DOI %s (record %d, state=%s): Failed to parse - record skipped. "
-                        "This is expected for non-findable DOIs with incomplete metadata. Reason: %s",
-                        doi_value,
-                        index,
-                        doi_state,
-                        str(err),
-                    )
-                continue
+        for doi in DOIDataCiteWebParser._iter_parsed_records(iter_json_items(label_file, key="data"), processes):
+            num_records += 1
 
-        logger.info("Parsed %d DOI objects from %d records", len(dois), len(datacite_records))
+            if doi is not None:
+                num_dois += 1
+                yield doi
 
-        return dois, errors
+        logger.info("Parsed %d DOI objects from %d records", num_dois, num_records)
 
     @staticmethod
     def get_record_for_identifier(label_file, identifier):
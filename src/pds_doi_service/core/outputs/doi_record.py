@@ -11,6 +11,7 @@ doi_record.py
 
 Contains the base class for creating a record from DOI objects.
 """
+import json
 
 CONTENT_TYPE_XML = "xml"
 CONTENT_TYPE_JSON = "json"
@@ -44,3 +45,32 @@ class DOIRecord:
         raise NotImplementedError(
             f"Subclasses of {self.__class__.__name__} must provide an " f"implementation for create_doi_record()"
         )
+
+    def create_doi_payload(self, dois, content_type=CONTENT_TYPE_XML):
+        """
+        Creates the payload for the provided list of Doi objects in the form
+        accepted by the validator of the same service. Services that encode
+        records directly from Python objects return those objects, avoiding
+        a round trip through the text returned by create_doi_record().
+
+        Parameters
+        ----------
+        dois : Doi or list of Doi
+            The Doi object(s) to format into the returned payload.
+        content_type : str
+            The type of record to create the payload for.
+
+        Returns
+        -------
+        payload : object
+            The payload created from the provided Doi objects. By default,
+            the text body returned by create_doi_record(), parsed into Python
+            objects for JSON records.
+
+        """
+        record = self.create_doi_record(dois, content_type=content_type)
+
+        if content_type == CONTENT_TYPE_JSON:
+            return json.loads(record)
+
+        return record
@@ -15,7 +15,6 @@ DOI workflow.
 import re
 from typing import Optional
 
-import requests
 from pds_doi_service.core.db.doi_database import DOIDataBase
 from pds_doi_service.core.entities.doi import Doi
 from pds_doi_service.core.entities.doi import DoiStatus
@@ -30,6 +29,11 @@ from pds_doi_service.core.entities.exceptions import UnknownNodeException
 from pds_doi_service.core.util.config_parser import DOIConfigUtil
 from pds_doi_service.core.util.general_util import get_logger
 from pds_doi_service.core.util.node_util import NodeUtil
+from pds_doi_service.core.util.profiling import traced
+from pds_doi_service.core.util.title_similarity import distinct_acronyms
+from pds_doi_service.core.util.url_checker import check_urls
+from pds_doi_service.core.util.url_checker import DEFAULT_URL_CHECK_CONCURRENCY
+from pds_doi_service.core.util.url_checker import DEFAULT_URL_CHECK_TIMEOUT
 
 
 # Get the common logger and set the level for this file.
@@ -64,6 +68,10 @@ class DOIValidator:
 
         self._database_obj = DOIDataBase(default_db_file)
 
+        # Results of landing page checks made ahead of validation by check_site_urls()
+        self._site_url_results = {}
+
+    @traced("check_node_id")
     def _check_node_id(self, doi: Doi):
         """
         Checks if the provided Doi object has a valid node ID assigned.
@@ -94,12 +102,49 @@ class DOIValidator:
 
             raise UnknownNodeException(msg)
 
+    @traced("check_site_urls")
+    def check_site_urls(self, dois):
+        """
+        Checks the landing pages of all the provided Doi objects concurrently
+        (see url_checker.py), so the results are available to the site URL
+        check of each Doi when it is validated, rather than the landing pages
+        being requested one at a time.
+
+        The number of seconds to wait on each landing page, and the number of
+        landing pages requested at once, are set by the OTHER.url_check_timeout
+        and OTHER.url_check_concurrency fields of the INI config.
+
+        Parameters
+        ----------
+        dois : list of Doi
+            The Doi objects whose site URLs should be checked.
+
+        """
+        site_urls = [doi.site_url for doi in dois if doi.site_url and doi.site_url not in self._site_url_results]
+
+        if not site_urls:
+            return
+
+        self._site_url_results.update(
+            check_urls(
+                site_urls,
+                timeout=float(self._config.get("OTHER", "url_check_timeout", fallback=DEFAULT_URL_CHECK_TIMEOUT)),
+                max_concurrency=int(
+                    self._config.get("OTHER", "url_check_concurrency", fallback=DEFAULT_URL_CHECK_CONCURRENCY)
+                ),
+            )
+        )
+
+    @traced("check_field_site_url")
     def _check_field_site_url(self, doi: Doi):
         """
         If the site_url field is defined for the provided Doi object, check to
         see if it is online. This check is typically only made for release
         requests, which require a URL field to be set.
 
+        The result of a check made ahead of time by check_site_urls() is used
+        if available, otherwise the landing page is requested now.
+
         Parameters
         ----------
         doi : Doi
@@ -114,19 +159,15 @@ class DOIValidator:
         logger.debug("doi,site_url: %s,%s", doi.doi, doi.site_url)
 
         if doi.site_url:
-            try:
-                response = requests.get(doi.site_url, timeout=10)
-                status_code = response.status_code
-                logger.debug("from_request status_code,site_url: %s,%s", status_code, doi.site_url)
-
-                # Handle cases when a connection can be made to the server but
-                # the status is greater than or equal to 400.
-                if status_code >= 400:
-                    # Need to check its an 404, 503, 500, 403 etc.
-                    raise requests.HTTPError(f"status_code,site_url {status_code, doi.site_url}")
-                else:
-                    logger.info("Landing page URL %s is reachable", doi.site_url)
-            except (requests.exceptions.ConnectionError, Exception):
+            if doi.site_url not in self._site_url_results:
+                self.check_site_urls([doi])
+
+            result = self._site_url_results.pop(doi.site_url)
+            logger.debug("from_request status_code,site_url: %s,%s", result, doi.site_url)
+
+            # Handle cases when a connection can be made to the server but
+            # the status is greater than or equal to 400.
+            if isinstance(result, Exception) or result >= 400:
                 raise SiteURLNotExistException(
                     f"Landing page URL {doi.site_url} is not reachable. Request "
                     f"should have a valid URL assigned prior to release.\n"
@@ -134,6 +175,9 @@ class DOIValidator:
                     f"flag provided."
                 )
 
+            logger.info("Landing page URL %s is reachable", doi.site_url)
+
+    @traced("check_field_title_duplicate")
     def _check_field_title_duplicate(self, doi: Doi):
         """
         Check the provided Doi object's title to see if the same title has
@@ -172,6 +216,76 @@ class DOIValidator:
 
             raise DuplicatedTitleDOIException(msg)
 
+        self._check_field_title_near_duplicate(doi)
+
+    @traced("check_field_title_near_duplicate")
+    def _check_field_title_near_duplicate(self, doi: Doi):
+        """
+        Check the provided Doi object's title to see if a title differing only
+        slightly (by case, whitespace, punctuation or a few characters) has
+        already been used with a different DOI record. Records of other
+        versions of the same LID are not considered, as new versions commonly
+        share the title of the previous version, bar its version number. Nor
+        are titles differing by an acronym, as the titles of sibling products
+        (such as the collections of two instruments of a mission) commonly
+        differ only by the name of the instrument.
+
+        The minimum similarity of titles considered near-duplicates is set by
+        OTHER.title_similarity_threshold of the INI config. A threshold of 0
+        disables the check.
+
+        Parameters
+        ----------
+        doi : Doi
+            The Doi object to check.
+
+        Raises
+        ------
+        DuplicatedTitleDOIException
+            If a near-duplicate of the title for the provided Doi object is in
+            use for another record. The message includes the similarity of
+            each near-duplicate title.
+
+        """
+        threshold = self._config.getfloat("OTHER", "title_similarity_threshold", fallback=0.0)
+
+        if threshold <= 0.0:
+            return
+
+        columns, results = self._database_obj.select_similar_titles(doi.title, threshold)
+
+        lid = doi.pds_identifier.split("::")[0] if doi.pds_identifier else None
+
+        near_duplicates = []
+
+        for similarity, row in results:
+            record = dict(zip(columns, row))
+
+            # Records lacking an identifier cannot be other versions of the same LID
+            if lid and record["identifier"] and record["identifier"].split("::")[0] == lid:
+                continue
+
+            if distinct_acronyms(doi.title, record["title"]):
+                continue
+
+            near_duplicates.append((similarity, record))
+
+        if near_duplicates:
+            records = "\n".join(
+                f"    {record['identifier']} (doi: {record['doi']}, status: {record['status'].value}, "
+                f"title: '{record['title']}', similarity: {similarity:.2f})"
+                for similarity, record in near_duplicates
+            )
+
+            msg = (
+                f"The title '{doi.title}' is a near-duplicate of the titles of records:\n{records}\n"
+                "A more distinct title should be used.\nIf you want to bypass this "
+                "check, rerun the command with the --force flag provided."
+            )
+
+            raise DuplicatedTitleDOIException(msg)
+
+    @traced("check_field_title_content")
     def _check_field_title_content(self, doi: Doi):
         """
         Check that the title of the provided Doi object contains the type of
@@ -210,6 +324,7 @@ class DOIValidator:
 
             raise TitleDoesNotMatchProductTypeException(msg)
 
+    @traced("check_for_preexisting_identifier")
     def _check_for_preexisting_identifier(self, doi: Doi):
         """
         For the identifier assigned to the provided Doi object, check that
@@ -246,6 +361,7 @@ class DOIValidator:
                     f"You cannot modify a DOI for an existing PDS identifier."
                 )
 
+    @traced("check_for_preexisting_doi")
     def _check_for_preexisting_doi(self, doi: Doi):
         """
         For Doi objects with DOI already assigned, this check ensures the DOI
@@ -287,6 +403,7 @@ class DOIValidator:
                     f"If so, use the --force flag to bypass this check."
                 )
 
+    @traced("check_identifier_fields")
     def _check_identifier_fields(self, doi: Doi):
         """
         Checks the fields of a Doi object used for identification for consistency
@@ -322,6 +439,7 @@ class DOIValidator:
                     "the inconsistency and resubmit the request."
                 )
 
+    @traced("check_lidvid_field")
     def _check_lidvid_field(self, doi: Doi):
         """
         Checks the pds_identifier field of a Doi to ensure it conforms
@@ -402,6 +520,7 @@ class DOIValidator:
                 "--force option to bypass the results of this check."
             )
 
+    @traced("check_field_workflow")
     def _check_field_workflow(self, doi: Doi):
         """
         Check that there is not a record in the Sqlite database with same
@@ -5,12 +5,27 @@ OSTI
 
 This package contains the OSTI-specific implementations for the abstract
 classes of the outputs package.
+
+The implementation classes are imported on first access, so that using one
+of them does not pull in the dependencies of the others.
 """
+import importlib
+
+_EXPORTS = {
+    "DOIOstiRecord": ".osti_record",
+    "DOIOstiValidator": ".osti_validator",
+    "DOIOstiWebClient": ".osti_web_client",
+    "DOIOstiJsonWebParser": ".osti_web_parser",
+    "DOIOstiWebParser": ".osti_web_parser",
+    "DOIOstiXmlWebParser": ".osti_web_parser",
+}
+"""The classes exported by this package, mapped to the module defining each"""
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        return getattr(importlib.import_module(_EXPORTS[name], __name__), name)
 
-# noreorder
-from .osti_record import DOIOstiRecord  # noqa: F401
-from .osti_validator import DOIOstiValidator  # noqa: F401
-from .osti_web_client import DOIOstiWebClient  # noqa: F401
-from .osti_web_parser import DOIOstiJsonWebParser  # noqa: F401
-from .osti_web_parser import DOIOstiWebParser  # noqa: F401
-from .osti_web_parser import DOIOstiXmlWebParser  # noqa: F401
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -24,6 +24,8 @@ from pds_doi_service.core.outputs.doi_record import DOIRecord
 from pds_doi_service.core.outputs.doi_record import VALID_CONTENT_TYPES
 from pds_doi_service.core.util.general_util import get_logger
 from pds_doi_service.core.util.general_util import sanitize_json_string
+from pds_doi_service.core.util.metrics import timed_operation
+from pds_doi_service.core.util.profiling import traced
 
 logger = get_logger(__name__)
 
@@ -57,6 +59,8 @@ class DOIOstiRecord(DOIRecord):
 
         self._template_map = {CONTENT_TYPE_XML: xml_template, CONTENT_TYPE_JSON: json_template}
 
+    @traced("render")
+    @timed_operation("render_template", service="OSTI")
     def create_doi_record(self, dois, content_type=CONTENT_TYPE_XML):
         """
         Creates a DOI record from the provided list of Doi objects in the
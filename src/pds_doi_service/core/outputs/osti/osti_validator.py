@@ -24,6 +24,8 @@ from pds_doi_service.core.entities.exceptions import InputFormatException
 from pds_doi_service.core.outputs.service_validator import DOIServiceValidator
 from pds_doi_service.core.util.general_util import get_logger
 from pds_doi_service.core.util.general_util import str_to_bool
+from pds_doi_service.core.util.metrics import timed_operation
+from pds_doi_service.core.util.profiling import traced
 
 # Note that in the ↑ list of imports, the ``lxml`` module does have the ``isoschematron``
 # member, but the typing stub does not so set just it to ``type: ignore``.
@@ -120,6 +122,8 @@ class DOIOstiValidator(DOIServiceValidator):
                     # Ignore cleanup errors on Windows
                     pass
 
+    @traced("validate_schema")
+    @timed_operation("validate_schema", service="OSTI")
     def validate(self, label_contents):
         """
         Validates an OSTI XML label using all available means. Any validation
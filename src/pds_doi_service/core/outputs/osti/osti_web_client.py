@@ -19,9 +19,12 @@ from pds_doi_service.core.entities.exceptions import WebRequestException
 from pds_doi_service.core.outputs.doi_record import CONTENT_TYPE_JSON
 from pds_doi_service.core.outputs.doi_record import CONTENT_TYPE_XML
 from pds_doi_service.core.outputs.osti.osti_web_parser import DOIOstiWebParser
+from pds_doi_service.core.outputs.osti.osti_web_parser import DOIOstiXmlWebParser
 from pds_doi_service.core.outputs.web_client import DOIWebClient
+from pds_doi_service.core.outputs.web_client import WEB_METHOD_GET
 from pds_doi_service.core.outputs.web_client import WEB_METHOD_POST
 from pds_doi_service.core.util.general_util import get_logger
+from pds_doi_service.core.util.profiling import traced
 from requests.auth import HTTPBasicAuth
 
 logger = get_logger(__name__)
@@ -60,6 +63,7 @@ class DOIOstiWebClient(DOIWebClient):
     MAX_TOTAL_ROWS_RETRIEVE = 1000000000
     """Maximum numbers of rows to request from a query to OSTI"""
 
+    @traced("submit")
     def submit_content(
         self, payload, url=None, username=None, password=None, method=WEB_METHOD_POST, content_type=CONTENT_TYPE_XML
     ):
@@ -139,35 +143,11 @@ class DOIOstiWebClient(DOIWebClient):
 
         return o_validated_dict
 
-    def query_doi(self, query, url=None, username=None, password=None, content_type=CONTENT_TYPE_XML):
+    def _query_request(self, query, url, username, password, content_type, stream=False):
         """
-        Queries the status of a DOI from the OSTI server and returns the
-        response text.
-
-        Parameters
-        ----------
-        query : dict
-            Key/value pairs to append as parameters to the URL for the GET
-            endpoint.
-        url : str, optional
-            The URL to submit the request to. If not submitted, it is pulled
-            from the INI config for the appropriate service provider.
-        username : str, optional
-            The username to authenticate the request as. If not submitted, it
-            is pulled from the INI config OSTI user field.
-        password : str, optional
-            The password to authenticate the request with. If not submitted, it
-            is pulled from the INI config OSTI password field.
-        content_type : str, optional
-            The content type to specify the format of the payload, as well as
-            the format of the response from OSTI. Currently, 'xml' and 'json'
-            are supported. Defaults to xml.
-
-        Returns
-        -------
-        response_text : str
-            Body of the response text from the endpoint.
-
+        Submits a query to the OSTI server, returning the response once its
+        status has been checked. If stream is True, the body of the response
+        is not read until requested.
         """
         config = self._config_util.get_config()
 
@@ -197,7 +177,9 @@ class DOIOstiWebClient(DOIWebClient):
         logger.debug("query_dict: %s", query)
         logger.debug("url: %s", url)
 
-        osti_response = requests.get(url=url, auth=auth, params=query, headers=headers)
+        osti_response = self._send_request(
+            WEB_METHOD_GET, url=url, auth=auth, params=query, headers=headers, stream=stream
+        )
 
         try:
             osti_response.raise_for_status()
@@ -210,7 +192,72 @@ class DOIOstiWebClient(DOIWebClient):
                 "DOI submission request to OSTI service failed, " f"reason: {str(http_err)}\n{details}"
             )
 
-        return osti_response.text
+        return osti_response
+
+    def query_doi(self, query, url=None, username=None, password=None, content_type=CONTENT_TYPE_XML):
+        """
+        Queries the status of a DOI from the OSTI server and returns the
+        response text.
+
+        Parameters
+        ----------
+        query : dict
+            Key/value pairs to append as parameters to the URL for the GET
+            endpoint.
+        url : str, optional
+            The URL to submit the request to. If not submitted, it is pulled
+            from the INI config for the appropriate service provider.
+        username : str, optional
+            The username to authenticate the request as. If not submitted, it
+            is pulled from the INI config OSTI user field.
+        password : str, optional
+            The password to authenticate the request with. If not submitted, it
+            is pulled from the INI config OSTI password field.
+        content_type : str, optional
+            The content type to specify the format of the payload, as well as
+            the format of the response from OSTI. Currently, 'xml' and 'json'
+            are supported. Defaults to xml.
+
+        Returns
+        -------
+        response_text : str
+            Body of the response text from the endpoint.
+
+        """
+        return self._query_request(query, url, username, password, content_type).text
+
+    def iter_query_doi(self, query, url=None, username=None, password=None):
+        """
+        Queries OSTI as with query_doi(), streaming the XML response through
+        DOIOstiXmlWebParser.iter_dois_from_label() so that the response is
+        never held in memory as a whole, however many records it contains.
+
+        Parameters
+        ----------
+        query : dict
+            Key/value pairs to append as parameters to the URL for the GET
+            endpoint.
+        url : str, optional
+            The URL to submit the request to. If not submitted, it is pulled
+            from the INI config for the appropriate service provider.
+        username : str, optional
+            The username to authenticate the request as. If not submitted, it
+            is pulled from the INI config OSTI user field.
+        password : str, optional
+            The password to authenticate the request with. If not submitted, it
+            is pulled from the INI config OSTI password field.
+
+        Yields
+        ------
+        doi : Doi
+            The Doi object parsed from each record of the response.
+
+        """
+        with self._query_request(query, url, username, password, CONTENT_TYPE_XML, stream=True) as osti_response:
+            # Have urllib3 undo any Content-Encoding (e.g. gzip) as the body is read
+            osti_response.raw.decode_content = True
+
+            yield from DOIOstiXmlWebParser.iter_dois_from_label(osti_response.raw)
 
     def endpoint_for_doi(self, doi):
         """
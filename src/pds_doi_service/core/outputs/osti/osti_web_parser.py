@@ -27,6 +27,7 @@ from pds_doi_service.core.outputs.doi_record import CONTENT_TYPE_XML
 from pds_doi_service.core.outputs.web_parser import DOIWebParser
 from pds_doi_service.core.util.general_util import get_logger
 from pds_doi_service.core.util.general_util import parse_identifier_from_site_url
+from pds_doi_service.core.util.metrics import timed_operation
 
 logger = get_logger(__name__)
 
@@ -288,6 +289,71 @@ class DOIOstiXmlWebParser(DOIOstiWebParser):
         return io_doi
 
     @staticmethod
+    def _parse_record(index, record_element):
+        """
+        Parses a Doi object from a single record element of an OSTI XML label.
+
+        Returns
+        -------
+        doi : Doi
+            The Doi object parsed from the record.
+        errors : list of str or None
+            The errors reported by OSTI for the record, or None if the record
+            does not have an error status.
+
+        """
+        status = record_element.get("status")
+        cur_errors = None
+
+        if status is None:
+            raise InputFormatException(f"Could not parse a status for record {index + 1} from the provided OSTI XML.")
+
+        if status.lower() == "error":
+            # The 'error' record is parsed differently and does not have all
+            # the attributes we desire.
+            logger.error(f"Errors reported for record index {index + 1}")
+
+            # Check for any errors reported back from OSTI and save
+            # them off to be returned
+            errors_element = record_element.xpath("errors")
+            doi_message = record_element.xpath("doi_message")
+
+            cur_errors = []
+
+            if len(errors_element):
+                for error_element in errors_element[0]:
+                    cur_errors.append(error_element.text)
+
+            if len(doi_message):
+                cur_errors.append(doi_message[0].text)
+
+        identifier = DOIOstiXmlWebParser._get_identifier(record_element)
+
+        timestamp = datetime.now()
+
+        publication_date = record_element.xpath("publication_date")[0].text
+        product_type = record_element.xpath("product_type")[0].text
+        product_type_specific = record_element.xpath("product_type_specific")[0].text
+
+        doi = Doi(
+            title=record_element.xpath("title")[0].text,
+            publication_date=datetime.strptime(publication_date, "%Y-%m-%d"),
+            product_type=ProductType(product_type),
+            product_type_specific=product_type_specific,
+            pds_identifier=identifier,
+            status=DoiStatus(status.lower()),
+            date_record_added=timestamp,
+            date_record_updated=timestamp,
+        )
+
+        # Parse for some optional fields that may not be present in
+        # every record from OSTI.
+        doi = DOIOstiXmlWebParser._parse_optional_fields(doi, record_element)
+
+        return doi, cur_errors
+
+    @staticmethod
+    @timed_operation("parse_label", service="OSTI", format="xml")
     def parse_dois_from_label(label_text, content_type=CONTENT_TYPE_XML):
         """
         Parses a response from a GET (query) or a PUT to the OSTI server
@@ -306,60 +372,50 @@ class DOIOstiXmlWebParser(DOIOstiWebParser):
 
         # Trim down input to just fields we want.
         for index, record_element in enumerate(my_root.findall("record")):
-            status = record_element.get("status")
-
-            if status is None:
-                raise InputFormatException(
-                    f"Could not parse a status for record {index + 1} from the " f"provided OSTI XML."
-                )
+            doi, record_errors = DOIOstiXmlWebParser._parse_record(index, record_element)
 
-            if status.lower() == "error":
-                # The 'error' record is parsed differently and does not have all
-                # the attributes we desire.
-                logger.error(f"Errors reported for record index {index + 1}")
+            if record_errors is not None:
+                errors[index] = record_errors
 
-                # Check for any errors reported back from OSTI and save
-                # them off to be returned
-                errors_element = record_element.xpath("errors")
-                doi_message = record_element.xpath("doi_message")
-
-                cur_errors = []
-
-                if len(errors_element):
-                    for error_element in errors_element[0]:
-                        cur_errors.append(error_element.text)
+            dois.append(doi)
 
-                if len(doi_message):
-                    cur_errors.append(doi_message[0].text)
+        return dois, errors
 
-                errors[index] = cur_errors
+    @staticmethod
+    def iter_dois_from_label(source):
+        """
+        Incrementally parses an OSTI XML label, yielding a Doi object for each
+        record as soon as its closing tag is read. Each record element is
+        discarded once parsed, so labels of any size are parsed in constant
+        memory. Errors reported by OSTI for a record are logged rather than
+        returned.
 
-            identifier = DOIOstiXmlWebParser._get_identifier(record_element)
+        Parameters
+        ----------
+        source : str or file-like
+            Path to the label to parse, or a binary file-like object (such as
+            the raw stream of an HTTP response) to read it from.
 
-            timestamp = datetime.now()
+        Yields
+        ------
+        doi : Doi
+            The Doi object parsed from each record of the label, in order.
 
-            publication_date = record_element.xpath("publication_date")[0].text
-            product_type = record_element.xpath("product_type")[0].text
-            product_type_specific = record_element.xpath("product_type_specific")[0].text
+        """
+        for index, (_, record_element) in enumerate(etree.iterparse(source, events=("end",), tag="record")):
+            doi, record_errors = DOIOstiXmlWebParser._parse_record(index, record_element)
 
-            doi = Doi(
-                title=record_element.xpath("title")[0].text,
-                publication_date=datetime.strptime(publication_date, "%Y-%m-%d"),
-                product_type=ProductType(product_type),
-                product_type_specific=product_type_specific,
-                pds_identifier=identifier,
-                status=DoiStatus(status.lower()),
-                date_record_added=timestamp,
-                date_record_updated=timestamp,
-            )
+            if record_errors:
+                logger.error("Record index %d: %s", index + 1, "; ".join(map(str, record_errors)))
 
-            # Parse for some optional fields that may not be present in
-            # every record from OSTI.
-            doi = DOIOstiXmlWebParser._parse_optional_fields(doi, record_element)
+            # Release the parsed record, along with any preceding siblings
+            # still referenced by the root element
+            record_element.clear(keep_tail=True)
 
-            dois.append(doi)
+            while record_element.getprevious() is not None:
+                del record_element.getparent()[0]
 
-        return dois, errors
+            yield doi
 
     @staticmethod
     def get_record_for_identifier(label_file, identifier):
@@ -506,6 +562,7 @@ class DOIOstiJsonWebParser(DOIOstiWebParser):
         return identifier
 
     @staticmethod
+    @timed_operation("parse_label", service="OSTI", format="json")
     def parse_dois_from_label(label_text, content_type=CONTENT_TYPE_JSON):
         """
         Parses a response from a query to the OSTI server (in JSON format) and
@@ -4,6 +4,7 @@ from typing import Dict
 from typing import Optional
 from typing import Type
 
+from pds_doi_service.core.util.general_util import collapse_whitespace
 from pds_doi_service.core.util.general_util import sanitize_json_string
 
 
@@ -40,13 +41,17 @@ class Rights:
         """Given a Rights class field name, return the corresponding endpoint rights-management attribute name"""
         return cls.get_label_mappings()[fieldname]
 
-    def to_endpoint_dict(self) -> Dict[str, str]:
-        """Return this object in the appropriate form for submission to endpoint as dict"""
+    def to_endpoint_dict(self, escape_quotes: bool = True) -> Dict[str, str]:
+        """
+        Return this object in the appropriate form for submission to endpoint as dict.
+        Quotation marks are escaped unless escape_quotes is False, for when the dict is encoded with a JSON encoder.
+        """
+        sanitize = sanitize_json_string if escape_quotes else collapse_whitespace
         output = {}
         for fieldname, value in asdict(self).items():
             if value != "":
                 datacite_attribute_name = self.get_label_mappings()[fieldname]
-                output[datacite_attribute_name] = sanitize_json_string(value)
+                output[datacite_attribute_name] = sanitize(value)
 
         return output
 
@@ -60,9 +65,12 @@ class Rights:
     @classmethod
     def from_endpoint_data(cls, data: Dict[str, str]):
         """Parse a Rights object from endpoint rights data"""
+        fieldnames = {v: k for k, v in cls.get_label_mappings().items()}
         output_kwargs = {}
         for datacite_attribute_name, value in data.items():
-            rights_class_fieldname = cls.fieldname_from_endpoint_attribute_name(datacite_attribute_name)
+            rights_class_fieldname = fieldnames.get(datacite_attribute_name)
+            if rights_class_fieldname is None:
+                rights_class_fieldname = cls.fieldname_from_endpoint_attribute_name(datacite_attribute_name)
             output_kwargs[rights_class_fieldname] = value
         return cls(**output_kwargs)
 
@@ -11,15 +11,15 @@ service.py
 
 Contains the factory class for providing the appropriate objects based on the
 configured DOI service provider (OSTI, DataCite, etc...)
+
+Service providers are registered by the import path of their implementation
+classes, rather than the classes themselves, so that only the modules of the
+provider actually in use (and their dependencies, such as lxml and xmlschema
+for OSTI, or jsonschema for DataCite) are imported, and only once an object
+for that provider is first requested.
 """
-from pds_doi_service.core.outputs.datacite import DOIDataCiteRecord
-from pds_doi_service.core.outputs.datacite import DOIDataCiteValidator
-from pds_doi_service.core.outputs.datacite import DOIDataCiteWebClient
-from pds_doi_service.core.outputs.datacite import DOIDataCiteWebParser
-from pds_doi_service.core.outputs.osti import DOIOstiRecord
-from pds_doi_service.core.outputs.osti import DOIOstiValidator
-from pds_doi_service.core.outputs.osti import DOIOstiWebClient
-from pds_doi_service.core.outputs.osti import DOIOstiWebParser
+import importlib
+
 from pds_doi_service.core.util.config_parser import DOIConfigUtil
 from pds_doi_service.core.util.general_util import get_logger
 
@@ -33,6 +33,60 @@ SERVICE_TYPE_DATACITE = "datacite"
 VALID_SERVICE_TYPES = [SERVICE_TYPE_OSTI, SERVICE_TYPE_DATACITE]
 """The list of expected service types"""
 
+SERVICE_ROLE_RECORD = "record"
+SERVICE_ROLE_VALIDATOR = "validator"
+SERVICE_ROLE_WEB_CLIENT = "web_client"
+SERVICE_ROLE_WEB_PARSER = "web_parser"
+"""Constants for the roles of the classes implemented by each service provider"""
+
+_SERVICE_REGISTRY = {
+    SERVICE_TYPE_OSTI: {
+        SERVICE_ROLE_RECORD: "pds_doi_service.core.outputs.osti.osti_record:DOIOstiRecord",
+        SERVICE_ROLE_VALIDATOR: "pds_doi_service.core.outputs.osti.osti_validator:DOIOstiValidator",
+        SERVICE_ROLE_WEB_CLIENT: "pds_doi_service.core.outputs.osti.osti_web_client:DOIOstiWebClient",
+        SERVICE_ROLE_WEB_PARSER: "pds_doi_service.core.outputs.osti.osti_web_parser:DOIOstiWebParser",
+    },
+    SERVICE_TYPE_DATACITE: {
+        SERVICE_ROLE_RECORD: "pds_doi_service.core.outputs.datacite.datacite_record:DOIDataCiteRecord",
+        SERVICE_ROLE_VALIDATOR: "pds_doi_service.core.outputs.datacite.datacite_validator:DOIDataCiteValidator",
+        SERVICE_ROLE_WEB_CLIENT: "pds_doi_service.core.outputs.datacite.datacite_web_client:DOIDataCiteWebClient",
+        SERVICE_ROLE_WEB_PARSER: "pds_doi_service.core.outputs.datacite.datacite_web_parser:DOIDataCiteWebParser",
+    },
+}
+"""The import paths, in module:class form, of the classes implementing each role of each service type"""
+
+
+def register_service(service_type, record, validator, web_client, web_parser):
+    """
+    Registers a DOI service provider with the DOIServiceFactory.
+
+    Parameters
+    ----------
+    service_type : str
+        The service type, as it would be assigned to the SERVICE.provider
+        field of the INI config. Converted to lowercase.
+    record : str
+        Import path of the provider's DOIRecord subclass, in module:class form.
+    validator : str
+        Import path of the provider's DOIValidator subclass, in module:class form.
+    web_client : str
+        Import path of the provider's DOIWebClient subclass, in module:class form.
+    web_parser : str
+        Import path of the provider's DOIWebParser subclass, in module:class form.
+
+    """
+    service_type = service_type.lower()
+
+    _SERVICE_REGISTRY[service_type] = {
+        SERVICE_ROLE_RECORD: record,
+        SERVICE_ROLE_VALIDATOR: validator,
+        SERVICE_ROLE_WEB_CLIENT: web_client,
+        SERVICE_ROLE_WEB_PARSER: web_parser,
+    }
+
+    if service_type not in VALID_SERVICE_TYPES:
+        VALID_SERVICE_TYPES.append(service_type)
+
 
 class DOIServiceFactory:
     """
@@ -49,18 +103,6 @@ class DOIServiceFactory:
 
     """
 
-    _DOI_RECORD_MAP = {SERVICE_TYPE_OSTI: DOIOstiRecord, SERVICE_TYPE_DATACITE: DOIDataCiteRecord}
-    """The available DOIRecord subclasses mapped to the corresponding service types"""
-
-    _SERVICE_VALIDATOR_MAP = {SERVICE_TYPE_OSTI: DOIOstiValidator, SERVICE_TYPE_DATACITE: DOIDataCiteValidator}
-    """The available DOIValidator subclasses mapped to the corresponding service types"""
-
-    _WEB_CLIENT_MAP = {SERVICE_TYPE_OSTI: DOIOstiWebClient, SERVICE_TYPE_DATACITE: DOIDataCiteWebClient}
-    """The available DOIWebClient subclasses mapped to the corresponding service types"""
-
-    _WEB_PARSER_MAP = {SERVICE_TYPE_OSTI: DOIOstiWebParser, SERVICE_TYPE_DATACITE: DOIDataCiteWebParser}
-    """The available DOIWebParser subclasses mapped to the corresponding service types"""
-
     _config = DOIConfigUtil().get_config()
 
     @staticmethod
@@ -88,6 +130,30 @@ class DOIServiceFactory:
                 f"the INI config with one of the following values: {VALID_SERVICE_TYPES}"
             )
 
+    @staticmethod
+    def _get_service_class(service_type, role):
+        """
+        Returns the class implementing the provided role for the provided
+        service type, importing its module on first use.
+
+        Parameters
+        ----------
+        service_type : str
+            The service type to return a class for. Must already have been
+            checked with _check_service_type().
+        role : str
+            The role of the class to return, one of the SERVICE_ROLE_* constants.
+
+        Returns
+        -------
+        service_class : type
+            The implementation class.
+
+        """
+        module_name, class_name = _SERVICE_REGISTRY[service_type.lower()][role].split(":")
+
+        return getattr(importlib.import_module(module_name), class_name)
+
     @staticmethod
     def get_service_type():
         """
@@ -127,7 +193,7 @@ class DOIServiceFactory:
 
         DOIServiceFactory._check_service_type(service_type)
 
-        doi_record_class = DOIServiceFactory._DOI_RECORD_MAP[service_type]
+        doi_record_class = DOIServiceFactory._get_service_class(service_type, SERVICE_ROLE_RECORD)
         logger.debug("Returning instance of %s for service type %s", doi_record_class.__name__, service_type)
 
         return doi_record_class()
@@ -155,7 +221,7 @@ class DOIServiceFactory:
 
         DOIServiceFactory._check_service_type(service_type)
 
-        doi_validator_class = DOIServiceFactory._SERVICE_VALIDATOR_MAP[service_type]
+        doi_validator_class = DOIServiceFactory._get_service_class(service_type, SERVICE_ROLE_VALIDATOR)
         logger.debug("Returning instance of %s for service type %s", doi_validator_class.__name__, service_type)
 
         return doi_validator_class()
@@ -183,7 +249,7 @@ class DOIServiceFactory:
 
         DOIServiceFactory._check_service_type(service_type)
 
-        web_client_class = DOIServiceFactory._WEB_CLIENT_MAP[service_type]
+        web_client_class = DOIServiceFactory._get_service_class(service_type, SERVICE_ROLE_WEB_CLIENT)
         logger.debug("Returning instance of %s for service type %s", web_client_class.__name__, service_type)
 
         return web_client_class()
@@ -211,7 +277,7 @@ class DOIServiceFactory:
 
         DOIServiceFactory._check_service_type(service_type)
 
-        web_parser_class = DOIServiceFactory._WEB_PARSER_MAP[service_type]
+        web_parser_class = DOIServiceFactory._get_service_class(service_type, SERVICE_ROLE_WEB_PARSER)
         logger.debug("Returning instance of %s for service type %s", web_parser_class.__name__, service_type)
 
         return web_parser_class()
@@ -4,6 +4,7 @@ Planetary Data System's Digital Object Identifier service — tests for core out
 """
 import unittest
 
+from . import circuit_breaker_test
 from . import datacite_test
 from . import doi_validator_test
 from . import osti_test
@@ -11,6 +12,7 @@ from . import osti_test
 
 def suite():
     suite = unittest.TestSuite()
+    suite.addTests(unittest.defaultTestLoader.loadTestsFromModule(circuit_breaker_test))
     suite.addTests(unittest.defaultTestLoader.loadTestsFromModule(datacite_test))
     suite.addTests(unittest.defaultTestLoader.loadTestsFromModule(doi_validator_test))
     suite.addTests(unittest.defaultTestLoader.loadTestsFromModule(osti_test))
@@ -0,0 +1,143 @@
+#!/usr/bin/env python
+import unittest
+from unittest.mock import Mock
+from unittest.mock import patch
+
+import pds_doi_service.core.outputs.circuit_breaker
+import requests
+from pds_doi_service.core.entities.exceptions import ProviderUnavailableException
+from pds_doi_service.core.entities.exceptions import WebRequestException
+from pds_doi_service.core.outputs.circuit_breaker import CircuitBreaker
+from pds_doi_service.core.outputs.circuit_breaker import STATE_CLOSED
+from pds_doi_service.core.outputs.circuit_breaker import STATE_HALF_OPEN
+from pds_doi_service.core.outputs.circuit_breaker import STATE_OPEN
+from pds_doi_service.core.outputs.datacite.datacite_web_client import DOIDataCiteWebClient
+
+
+class CircuitBreakerTestCase(unittest.TestCase):
+    """Unit tests for the circuit_breaker.py module"""
+
+    def setUp(self):
+        self.now = 1000.0
+
+        monotonic = patch.object(
+            pds_doi_service.core.outputs.circuit_breaker.time, "monotonic", side_effect=lambda: self.now
+        )
+        monotonic.start()
+        self.addCleanup(monotonic.stop)
+
+        self.circuit_breaker = CircuitBreaker("Test", failure_threshold=3, reset_timeout=30)
+
+    def test_open_after_consecutive_failures(self):
+        """Test that the breaker only opens after the threshold of consecutive failures"""
+        self.circuit_breaker.record_failure()
+        self.circuit_breaker.record_failure()
+        self.circuit_breaker.record_success()
+        self.circuit_breaker.record_failure()
+        self.circuit_breaker.record_failure()
+
+        self.assertEqual(self.circuit_breaker.state, STATE_CLOSED)
+        self.circuit_breaker.before_request()
+
+        self.circuit_breaker.record_failure()
+
+        self.assertEqual(self.circuit_breaker.state, STATE_OPEN)
+        self.assertFalse(self.circuit_breaker.probe_due())
+
+        # Requests fail fast, with an exception callers already handle
+        with self.assertRaises(ProviderUnavailableException) as context:
+            self.circuit_breaker.before_request()
+
+        self.assertIsInstance(context.exception, WebRequestException)
+        self.assertIn("retry in 30 second(s)", str(context.exception))
+
+    def test_trial_request(self):
+        """Test that a single trial request is let through after the reset timeout"""
+        for _ in range(3):
+            self.circuit_breaker.record_failure()
+
+        self.now += 30
+
+        self.assertTrue(self.circuit_breaker.probe_due())
+
+        self.circuit_breaker.before_request()
+
+        self.assertEqual(self.circuit_breaker.state, STATE_HALF_OPEN)
+
+        # Other requests still fail fast while the trial is in progress
+        with self.assertRaises(ProviderUnavailableException):
+            self.circuit_breaker.before_request()
+
+        # A failed trial re-opens the breaker for another reset timeout
+        self.circuit_breaker.record_failure()
+
+        self.assertEqual(self.circuit_breaker.state, STATE_OPEN)
+        self.assertFalse(self.circuit_breaker.probe_due())
+
+        self.now += 30
+        self.circuit_breaker.before_request()
+        self.circuit_breaker.record_success()
+
+        self.assertEqual(self.circuit_breaker.state, STATE_CLOSED)
+        self.circuit_breaker.before_request()
+
+    def test_trial_request_expiry(self):
+        """Test that a trial request whose outcome is never recorded expires after the reset timeout"""
+        for _ in range(3):
+            self.circuit_breaker.record_failure()
+
+        self.now += 30
+        self.circuit_breaker.before_request()
+
+        self.now += 29
+
+        with self.assertRaises(ProviderUnavailableException):
+            self.circuit_breaker.before_request()
+
+        self.now += 1
+        self.circuit_breaker.before_request()
+
+        self.assertEqual(self.circuit_breaker.state, STATE_HALF_OPEN)
+
+    def test_trial_request_error(self):
+        """Test that a trial request failing with any exception re-opens the breaker, rather than leaving it half-open"""
+        web_client = DOIDataCiteWebClient()
+
+        circuit_breakers = {web_client._service_name: self.circuit_breaker}
+
+        with patch.dict(pds_doi_service.core.outputs.circuit_breaker._circuit_breakers, circuit_breakers):
+            for _ in range(3):
+                self.circuit_breaker.record_failure()
+
+            self.now += 30
+
+            with patch.object(requests, "request", side_effect=requests.exceptions.ChunkedEncodingError("truncated")):
+                with self.assertRaises(requests.exceptions.ChunkedEncodingError):
+                    web_client._send_request("GET", "http://localhost/dois")
+
+            self.assertEqual(self.circuit_breaker.state, STATE_OPEN)
+
+            with self.assertRaises(ProviderUnavailableException):
+                web_client._send_request("GET", "http://localhost/dois")
+
+            # The next trial request is let through once the reset timeout elapses again
+            self.now += 30
+
+            with patch.object(requests, "request", return_value=Mock(status_code=200)):
+                web_client._send_request("GET", "http://localhost/dois")
+
+            self.assertEqual(self.circuit_breaker.state, STATE_CLOSED)
+
+    def test_disabled(self):
+        """Test that a failure threshold of 0 disables the breaker"""
+        circuit_breaker = CircuitBreaker("Test", failure_threshold=0)
+
+        for _ in range(100):
+            circuit_breaker.record_failure()
+
+        self.assertEqual(circuit_breaker.state, STATE_CLOSED)
+        circuit_breaker.before_request()
+
+
+if __name__ == "__main__":
+    unittest.main()
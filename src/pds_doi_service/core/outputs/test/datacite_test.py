@@ -132,6 +132,56 @@ class DOIDataCiteRecordTestCase(unittest.TestCase):
         except KeyError as e:
             self.fail(f"KeyError raised for missing author field: {e}")
 
+    def test_native_json_matches_template(self):
+        """Test that directly encoded records have the same content as those rendered from the Jinja template"""
+        label_files = (
+            "datacite_record_draft.json",
+            "datacite_record_findable.json",
+            "datacite_record_multi_entry.json",
+        )
+
+        for label_file in label_files:
+            with open(join(self.input_dir, label_file), "r") as infile:
+                input_dois, _ = DOIDataCiteWebParser.parse_dois_from_label(infile.read())
+
+            template_json = DOIDataCiteRecord(use_template=True).create_doi_record(input_dois)
+            native_json = DOIDataCiteRecord(use_template=False).create_doi_record(input_dois)
+
+            self.assertEqual(json.loads(template_json), json.loads(native_json), label_file)
+            self.assertEqual(json.loads(native_json), DOIDataCiteRecord().create_doi_payload(input_dois))
+            self.assertEqual(
+                json.loads(template_json), DOIDataCiteRecord(use_template=True).create_doi_payload(input_dois)
+            )
+
+    def test_native_json_escaping(self):
+        """Test that directly encoded records escape and normalize the strings of a Doi"""
+        doi = Doi(
+            title='  A "quoted"\ttitle with\n a \\ backslash ',
+            description="Résumé of\r\n\tthe 𝄞 data",
+            pds_identifier="urn:nasa:pds:test::1.0",
+            publication_date=datetime(2025, 1, 1),
+            product_type=ProductType.Dataset,
+            product_type_specific="PDS4 Refereed Data Bundle",
+            authors=[{"first_name": ' John "JD" ', "last_name": "Doe\n"}],
+            keywords={"  spaced   keyword ", 'keyword "quoted"'},
+        )
+
+        record = DOIDataCiteRecord(use_template=False).create_doi_record(doi)
+        attributes = json.loads(record)["data"]["attributes"]
+
+        self.assertEqual(attributes["titles"][0]["title"], 'A "quoted" title with a \\ backslash')
+        self.assertEqual(attributes["descriptions"][0]["description"], "Résumé of the 𝄞 data")
+        self.assertEqual(attributes["creators"][0]["name"], 'John "JD" Doe')
+        self.assertEqual(
+            [subject["subject"] for subject in attributes["subjects"]], ['keyword "quoted"', "spaced keyword"]
+        )
+
+        # The same Doi should always produce byte-identical output
+        self.assertEqual(record, DOIDataCiteRecord(use_template=False).create_doi_record(doi))
+
+        # The input Doi should not be modified
+        self.assertEqual(doi.authors[0]["first_name"], ' John "JD" ')
+
 
 def requests_valid_request_patch(method, url, **kwargs):
     response = Response()
@@ -408,6 +458,47 @@ class DOIDataCiteWebParserTestCase(unittest.TestCase):
         self.assertIn("urn:nasa:pds:insight_cameras::1.0", identifiers)
         self.assertIn("urn:nasa:pds:insight_cameras", identifiers)
 
+    def test_iter_datacite_response_json(self):
+        """Test incremental parsing of a DataCite label file in JSON format"""
+        for label_name in ("datacite_record_draft_with_affiliation.json", "datacite_record_multi_entry.json"):
+            input_json_file = join(self.input_dir, label_name)
+
+            with open(input_json_file, "r") as infile:
+                expected_dois, _ = DOIDataCiteWebParser.parse_dois_from_label(infile.read())
+
+            dois = list(DOIDataCiteWebParser.iter_dois_from_label(input_json_file))
+
+            self.assertGreater(len(dois), 0)
+            self.assertListEqual([doi.doi for doi in dois], [doi.doi for doi in expected_dois])
+            self.assertListEqual([doi.pds_identifier for doi in dois], [doi.pds_identifier for doi in expected_dois])
+
+    def test_parse_datacite_response_json_parallel(self):
+        """Test that parsing records with a pool of processes preserves their order and reported errors"""
+        with open(join(self.input_dir, "datacite_record_multi_entry.json"), "r") as infile:
+            records = json.load(infile)["data"]
+
+        with open(join(self.input_dir, "datacite_record_unrecognized_id_type.json"), "r") as infile:
+            unrecognized_record = json.load(infile)["data"]
+
+        # Interleave records which fail to parse with those which do not
+        label = json.dumps({"data": (records + [unrecognized_record]) * 3})
+
+        serial_dois, _ = DOIDataCiteWebParser.parse_dois_from_label(label, processes=1)
+
+        with patch("pds_doi_service.core.outputs.datacite.datacite_web_parser.PARSE_CHUNK_SIZE", 2):
+            with self.assertLogs("pds_doi_service.core.outputs.datacite.datacite_web_parser", "WARNING") as logs:
+                parallel_dois, errors = DOIDataCiteWebParser.parse_dois_from_label(label, processes=2)
+
+        self.assertEqual(len(errors), 0)
+        self.assertEqual(len(parallel_dois), len(records) * 3)
+        self.assertListEqual(parallel_dois, serial_dois)
+
+        # Records skipped by the workers should be reported by the parent process, in order
+        skipped = [message for message in logs.output if "Failed to parse - record skipped" in message]
+        self.assertEqual(len(skipped), 3)
+        for index, message in zip((2, 5, 8), skipped):
+            self.assertIn(f"record {index},", message)
+
     def test_get_record_for_identifier(self):
         """Test isolation of specific record based on PDS identifier"""
         input_json_file = join(self.input_dir, "datacite_record_multi_entry.json")
@@ -608,24 +699,26 @@ class DOIDataCiteValidatorTestCase(unittest.TestCase):
 
             output_json = DOIDataCiteRecord().create_doi_record(input_dois[0])
 
-        # Label created from template should pass schema validation
+        # Label created from template should pass schema validation, whether
+        # provided as text or as the payload it was encoded from
         validator.validate(output_json)
+        validator.validate(DOIDataCiteRecord().create_doi_payload(input_dois[0]))
 
         # Now remove some required fields to ensure its caught by validation
-        output_json = json.loads(output_json)
-        output_json["data"]["attributes"].pop("publicationYear")
-        output_json["data"]["attributes"].pop("schemaVersion")
-        output_json = json.dumps(output_json)
-
-        try:
-            validator.validate(output_json)
-
-            # Should never make it here
-            self.fail("Invalid JSON was accepted by DOIDataCiteValidator")
-        except InputFormatException as err:
-            # Make sure the error details the reasons we expect
-            self.assertIn("'publicationYear' is a required property", str(err))
-            self.assertIn("'schemaVersion' is a required property", str(err))
+        output_payload = json.loads(output_json)
+        output_payload["data"]["attributes"].pop("publicationYear")
+        output_payload["data"]["attributes"].pop("schemaVersion")
+
+        for invalid_label in (json.dumps(output_payload), output_payload):
+            try:
+                validator.validate(invalid_label)
+
+                # Should never make it here
+                self.fail("Invalid JSON was accepted by DOIDataCiteValidator")
+            except InputFormatException as err:
+                # Make sure the error details the reasons we expect
+                self.assertIn("'publicationYear' is a required property", str(err))
+                self.assertIn("'schemaVersion' is a required property", str(err))
 
 
 if __name__ == "__main__":
@@ -9,6 +9,7 @@ import datetime
 import os
 import unittest
 
+from pds_doi_service.benchmark.fake_datacite import FakeDataCiteServer
 from pds_doi_service.core.db.doi_database import DOIDataBase
 from pds_doi_service.core.entities.doi import Doi
 from pds_doi_service.core.entities.doi import DoiRecord
@@ -97,6 +98,139 @@ class DoiValidatorTest(unittest.TestCase):
         with self.assertRaises(DuplicatedTitleDOIException):
             self._doi_validator._check_field_title_duplicate(doi_obj)
 
+    def test_near_duplicate_title_new_lid_exception(self):
+        """
+        Test validation of a Doi object with a title differing only slightly
+        from an existing title, but a new LID.
+        Expecting a DuplicatedTitleDOIException reporting the similarity of
+        the existing title.
+        """
+        for title, similarity in (
+            ("laboratory shocked-feldspars  collection", "1.00"),
+            ("Laboratory Shocked Feldspar Collection", "0.87"),
+        ):
+            doi_obj = Doi(
+                title=title,
+                publication_date=self.transaction_date,
+                product_type=self.product_type,
+                product_type_specific=self.product_type_specific,
+                pds_identifier="urn:nasa:pds:lab_shocked_feldspar::1.0",
+                status=self.status,
+            )
+
+            with self.assertRaises(DuplicatedTitleDOIException) as context:
+                self._doi_validator._check_field_title_duplicate(doi_obj)
+
+            self.assertIn(f"{self.identifier} (doi: {self.doi}", str(context.exception))
+            self.assertIn(f"similarity: {similarity}", str(context.exception))
+
+        # A distinct title should pass
+        doi_obj.title = "Laboratory Shocked Plagioclase Spectra Collection"
+        self._doi_validator._check_field_title_duplicate(doi_obj)
+
+    def test_near_duplicate_title_sibling_instrument_nominal(self):
+        """
+        Test validation of Doi objects with titles differing from an existing
+        title only by the name of an instrument, as is common for the
+        collections of sibling instruments of a mission.
+        Expecting no error: the titles are similar, but not near-duplicates.
+        """
+        for existing_title, title in (
+            ("InSight IDC Raw Data Collection", "InSight ICC Raw Data Collection"),
+            ("MAVEN SWEA Calibrated Data Collection", "MAVEN SWIA Calibrated Data Collection"),
+        ):
+            doi_record = DoiRecord(
+                identifier=f"urn:nasa:pds:{existing_title.lower().replace(' ', '_')}::1.0",
+                status=self.status,
+                date_added=self.release_date,
+                date_updated=self.transaction_date,
+                submitter=self.submitter,
+                title=existing_title,
+                type=self.product_type,
+                subtype=self.product_type_specific,
+                node_id=self.discipline_node,
+                doi=f"10.17189/{len(existing_title)}",
+                transaction_key=self.transaction_key,
+                is_latest=True,
+            )
+
+            self._database_obj.write_doi_info_to_database(doi_record)
+
+            doi_obj = Doi(
+                title=title,
+                publication_date=self.transaction_date,
+                product_type=self.product_type,
+                product_type_specific=self.product_type_specific,
+                pds_identifier=f"urn:nasa:pds:{title.lower().replace(' ', '_')}::1.0",
+                status=self.status,
+            )
+
+            self._doi_validator._check_field_title_duplicate(doi_obj)
+
+            # A near-miss of the title of the same instrument is still reported
+            doi_obj.title = existing_title.replace("Collection", "Collections")
+
+            with self.assertRaises(DuplicatedTitleDOIException):
+                self._doi_validator._check_field_title_duplicate(doi_obj)
+
+    def test_near_duplicate_title_without_identifier(self):
+        """
+        Test validation of a Doi object without a PDS identifier, against an
+        existing record without one either.
+        Expecting a DuplicatedTitleDOIException rather than an error comparing
+        the missing identifiers.
+        """
+        doi_record = DoiRecord(
+            identifier=None,
+            status=self.status,
+            date_added=self.release_date,
+            date_updated=self.transaction_date,
+            submitter=self.submitter,
+            title="Lunar Reconnaissance Orbiter LAMP Experiment Data Record Collection",
+            type=self.product_type,
+            subtype=self.product_type_specific,
+            node_id=self.discipline_node,
+            doi="10.17189/21941",
+            transaction_key=self.transaction_key,
+            is_latest=True,
+        )
+
+        self._database_obj.write_doi_info_to_database(doi_record)
+
+        doi_obj = Doi(
+            title="Lunar Reconnaissance Orbiter LAMP Experiment Data Records Collection",
+            publication_date=self.transaction_date,
+            product_type=self.product_type,
+            product_type_specific=self.product_type_specific,
+            pds_identifier=None,
+            status=self.status,
+        )
+
+        with self.assertRaises(DuplicatedTitleDOIException) as context:
+            self._doi_validator._check_field_title_near_duplicate(doi_obj)
+
+        self.assertIn("None (doi: 10.17189/21941", str(context.exception))
+
+    def test_near_duplicate_title_new_vid_nominal(self):
+        """
+        Test validation of a Doi object with a title differing only slightly
+        from the title of an existing version of the same LID, such as by a
+        version number.
+        Expecting no error: new versions of a product are expected to share
+        (near enough) the title of the previous versions.
+        """
+        for title in ("Laboratory Shocked Feldspars Collection 1.1", "Laboratory Shocked Feldspar Collection"):
+            doi_obj = Doi(
+                title=title,
+                publication_date=self.transaction_date,
+                product_type=self.product_type,
+                product_type_specific=self.product_type_specific,
+                pds_identifier=self.lid + "::" + "1.1",
+                status=self.status,
+            )
+
+            self._doi_validator._check_field_title_duplicate(doi_obj)
+
     def test_new_title_existing_doi_and_lidvid_nominal(self):
         """
         Test validation of a Doi object with a new title but an existing DOI
@@ -431,6 +565,43 @@ class DoiValidatorTest(unittest.TestCase):
 
         self._doi_validator._check_field_site_url(doi_obj)
 
+    def test_check_site_urls(self):
+        """
+        Test that landing pages checked ahead of validation are not requested
+        again by the site URL checks.
+        """
+        with FakeDataCiteServer() as server:
+            doi_objs = [
+                Doi(
+                    title=f"{self.title} {index}",
+                    publication_date=self.transaction_date,
+                    product_type=self.product_type,
+                    product_type_specific=self.product_type_specific,
+                    pds_identifier=f"{self.lid}_{index}::{self.vid}",
+                    status=DoiStatus.Draft,
+                    site_url=f"{server.landing_page_url}/{index}",
+                )
+                for index in range(3)
+            ]
+            doi_objs[2].site_url = f"{server.dois_url}/10.17189/missing"
+
+            self._doi_validator.check_site_urls(doi_objs)
+
+            self.assertDictEqual(server.request_counts, {"GET": 3})
+
+            self._doi_validator._check_field_site_url(doi_objs[0])
+            self._doi_validator._check_field_site_url(doi_objs[1])
+
+            with self.assertRaises(SiteURLNotExistException):
+                self._doi_validator._check_field_site_url(doi_objs[2])
+
+            self.assertDictEqual(server.request_counts, {"GET": 3})
+
+            # Landing pages not checked ahead of time are requested when validated
+            self._doi_validator._check_field_site_url(doi_objs[0])
+
+            self.assertDictEqual(server.request_counts, {"GET": 4})
+
 
 if __name__ == "__main__":
     unittest.main()
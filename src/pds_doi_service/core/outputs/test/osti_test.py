@@ -1,18 +1,25 @@
 #!/usr/bin/env python
+import copy
+import io
 import json
 import unittest
 from datetime import datetime
 from importlib import resources
 from os.path import abspath
 from os.path import join
+from unittest.mock import patch
 
+import requests
+from lxml import etree
 from pds_doi_service.core.entities.doi import DoiStatus
 from pds_doi_service.core.entities.doi import ProductType
 from pds_doi_service.core.outputs.doi_record import CONTENT_TYPE_JSON
 from pds_doi_service.core.outputs.doi_record import CONTENT_TYPE_XML
 from pds_doi_service.core.outputs.osti.osti_record import DOIOstiRecord
+from pds_doi_service.core.outputs.osti.osti_web_client import DOIOstiWebClient
 from pds_doi_service.core.outputs.osti.osti_web_parser import DOIOstiJsonWebParser
 from pds_doi_service.core.outputs.osti.osti_web_parser import DOIOstiXmlWebParser
+from requests.models import Response
 
 
 class DOIOstiRecordTestCase(unittest.TestCase):
@@ -73,6 +80,19 @@ class DOIOstiRecordTestCase(unittest.TestCase):
         self.assertDictEqual(input_json, output_json)
 
 
+def requests_streamed_query_patch(method, url, **kwargs):
+    response = Response()
+    response.status_code = 200
+
+    # The response body should only be read as a stream
+    assert kwargs["stream"]
+
+    with open(join(DOIOstiWebParserTestCase.input_dir, "osti_record_pending.xml"), "rb") as infile:
+        response.raw = io.BytesIO(infile.read())
+
+    return response
+
+
 class DOIOstiWebParserTestCase(unittest.TestCase):
     """Unit tests for the osti_web_parser.py module"""
 
@@ -169,6 +189,45 @@ class DOIOstiWebParserTestCase(unittest.TestCase):
         self.assertEqual(len(dois), 1)
         self.assertEqual(len(errors), 1)
 
+    def test_iter_osti_response_xml(self):
+        """Test incremental parsing of an OSTI label in XML format"""
+        input_xml_file = join(self.input_dir, "osti_record_pending.xml")
+
+        dois = list(DOIOstiXmlWebParser.iter_dois_from_label(input_xml_file))
+
+        self.assertEqual(len(dois), 1)
+
+        self._compare_doi_to_expected(dois[0])
+
+        # Records should be yielded in order from a stream of several records
+        with open(input_xml_file, "rb") as infile:
+            record = etree.parse(infile).getroot()[0]
+
+        root = etree.Element("records")
+
+        for title in ("First Bundle", "Second Bundle", "Third Bundle"):
+            record.find("title").text = title
+            root.append(copy.deepcopy(record))
+
+        dois = list(DOIOstiXmlWebParser.iter_dois_from_label(io.BytesIO(etree.tostring(root))))
+
+        self.assertListEqual([doi.title for doi in dois], ["First Bundle", "Second Bundle", "Third Bundle"])
+
+        # Error records are still parsed
+        dois = list(DOIOstiXmlWebParser.iter_dois_from_label(join(self.input_dir, "osti_record_error.xml")))
+
+        self.assertEqual(len(dois), 1)
+        self.assertEqual(dois[0].status, DoiStatus.Error)
+
+    @patch.object(requests, "request", requests_streamed_query_patch)
+    def test_iter_query_doi(self):
+        """Test streaming of query results from the OSTI web client"""
+        dois = list(DOIOstiWebClient().iter_query_doi({"doi": "10.17189"}))
+
+        self.assertEqual(len(dois), 1)
+
+        self._compare_doi_to_expected(dois[0])
+
     def test_parse_osti_response_json(self):
         """Test parsing of an OSTI label in JSON format"""
         # Test with a nominal file containing most of the optional fields
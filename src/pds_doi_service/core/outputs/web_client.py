@@ -13,14 +13,22 @@ Contains the abstract base class for interfacing with a DOI submission service
 endpoint.
 """
 import pprint
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 
-import requests
 from pds_doi_service.core.entities.exceptions import WebRequestException
+from pds_doi_service.core.outputs.circuit_breaker import get_circuit_breaker
+from pds_doi_service.core.outputs.circuit_breaker import STATE_CLOSED
 from pds_doi_service.core.outputs.doi_record import CONTENT_TYPE_XML
 from pds_doi_service.core.outputs.web_parser import DOIWebParser
 from pds_doi_service.core.util.config_parser import DOIConfigUtil
-from requests.auth import HTTPBasicAuth
+from pds_doi_service.core.util.general_util import get_logger
+from pds_doi_service.core.util.metrics import metrics_enabled
+from pds_doi_service.core.util.metrics import PROVIDER_REQUEST_DURATION
+from pds_doi_service.core.util.metrics import PROVIDER_REQUEST_ERRORS
+
+logger = get_logger(__name__)
 
 WEB_METHOD_GET = "GET"
 WEB_METHOD_POST = "POST"
@@ -29,6 +37,21 @@ WEB_METHOD_DELETE = "DELETE"
 VALID_WEB_METHODS = [WEB_METHOD_GET, WEB_METHOD_POST, WEB_METHOD_PUT, WEB_METHOD_DELETE]
 """Constants for HTTP method types"""
 
+DEFAULT_QUERY_BATCH_SIZE = 50
+"""Default maximum number of DOIs requested by a single batched query"""
+
+DEFAULT_QUERY_MAX_WORKERS = 4
+"""Default maximum number of queries submitted concurrently"""
+
+DEFAULT_CONNECT_TIMEOUT = 10.0
+"""Default number of seconds to wait for the DOI service to accept a connection"""
+
+DEFAULT_READ_TIMEOUT = 60.0
+"""Default number of seconds to wait for the DOI service to respond to a request"""
+
+HEALTH_PROBE_DOI = "10.0000/pds-doi-service-health-probe"
+"""DOI queried by health probes, which is not expected to exist"""
+
 
 class DOIWebClient:
     """Abstract base class for clients of an HTTP DOI service endpoint"""
@@ -40,6 +63,101 @@ class DOIWebClient:
     _web_parser = None
     _content_type_map: dict[str, str] = {}
 
+    @property
+    def circuit_breaker(self):
+        """Returns the process-wide circuit breaker guarding the requests sent to the DOI service."""
+        return get_circuit_breaker(self._service_name)
+
+    def _send_request(self, method, url, **kwargs):
+        """
+        Sends an HTTP request to the DOI service via requests.request(),
+        recording the latency and response status of the request when metrics
+        collection is enabled.
+
+        Requests are guarded by the circuit breaker of the service (see
+        circuit_breaker.py), and time out after the number of seconds given by
+        the OTHER.provider_connect_timeout and OTHER.provider_read_timeout
+        fields of the INI config, unless a timeout is provided.
+
+        Parameters
+        ----------
+        method : str
+            The HTTP method type to use with the request.
+        url : str
+            The URL of the DOI service endpoint.
+        kwargs : dict
+            Additional keyword arguments to requests.request().
+
+        Returns
+        -------
+        response : requests.Response
+            The response returned by the DOI service.
+
+        Raises
+        ------
+        ProviderUnavailableException
+            If the circuit breaker of the service is open.
+
+        """
+        # requests is slow to import, so defer until a request is actually sent
+        import requests
+
+        circuit_breaker = self.circuit_breaker
+        circuit_breaker.before_request()
+
+        if "timeout" not in kwargs:
+            config = self._config_util.get_config()
+            kwargs["timeout"] = (
+                float(config.get("OTHER", "provider_connect_timeout", fallback=DEFAULT_CONNECT_TIMEOUT)),
+                float(config.get("OTHER", "provider_read_timeout", fallback=DEFAULT_READ_TIMEOUT)),
+            )
+
+        start = time.perf_counter()
+
+        try:
+            response = requests.request(method, url, **kwargs)
+        except BaseException as err:
+            # Every request which fails to return a response is recorded, so a
+            # trial request of the breaker is always settled (otherwise the
+            # breaker would be left half-open, rejecting all later requests)
+            circuit_breaker.record_failure()
+
+            if isinstance(err, requests.exceptions.RequestException) and metrics_enabled():
+                PROVIDER_REQUEST_ERRORS.inc(service=self._service_name, method=method)
+
+            raise
+
+        if response.status_code >= 500 or response.status_code == 429:
+            circuit_breaker.record_failure()
+        else:
+            circuit_breaker.record_success()
+
+        if metrics_enabled():
+            PROVIDER_REQUEST_DURATION.observe(
+                time.perf_counter() - start, service=self._service_name, method=method, status=response.status_code
+            )
+
+        return response
+
+    def probe(self):
+        """
+        Sends a lightweight query to the DOI service, such as to check whether
+        it has recovered from an outage once its circuit breaker is due a trial
+        request.
+
+        Returns
+        -------
+        healthy : bool
+            True if the service responded, closing its circuit breaker.
+
+        """
+        try:
+            self.query_doi(query={"doi": HEALTH_PROBE_DOI})
+        except (WebRequestException, OSError) as err:
+            logger.debug("Health probe of the %s service failed, reason: %s", self._service_name, err)
+
+        return self.circuit_breaker.state == STATE_CLOSED
+
     def _submit_content(self, payload, url, username, password, method=WEB_METHOD_POST, content_type=CONTENT_TYPE_XML):
         """
         Submits a payload to a DOI service endpoint via the POST action.
@@ -79,11 +197,14 @@ class DOIWebClient:
                 f"Invalid content type requested, must be one of {','.join(list(self._content_type_map.keys()))}"
             )
 
+        import requests
+        from requests.auth import HTTPBasicAuth
+
         auth = HTTPBasicAuth(username, password)
 
         headers = {"Accept": self._content_type_map[content_type], "Content-Type": self._content_type_map[content_type]}
 
-        response = requests.request(method, url, auth=auth, data=payload, headers=headers)
+        response = self._send_request(method, url, auth=auth, data=payload, headers=headers)
 
         try:
             response.raise_for_status()
@@ -183,6 +304,91 @@ class DOIWebClient:
             f"Subclasses of {self.__class__.__name__} must provide an implementation for query_doi()"
         )
 
+    def iter_query_doi(self, query, url=None, username=None, password=None):
+        """
+        Queries the DOI endpoint as with query_doi(), yielding the Doi object
+        parsed from each record of the response.
+
+        This default implementation parses the complete response returned by
+        query_doi() in the default format of the endpoint. Inheritors should
+        override this method to parse the response incrementally where the
+        endpoint may return very large responses.
+
+        Parameters
+        ----------
+        query : dict
+            Key/value pairs to append as parameters to the URL for the GET
+            endpoint.
+        url : str, optional
+            The URL to submit the request to.
+        username : str, optional
+            The username to authenticate the request as.
+        password : str, optional
+            The password to authenticate the request with.
+
+        Yields
+        ------
+        doi : Doi
+            The Doi object parsed from each record of the response.
+
+        """
+        response_text = self.query_doi(query, url=url, username=username, password=password)
+
+        dois, _ = self._web_parser.parse_dois_from_label(response_text)
+
+        yield from dois
+
+    def query_dois(self, dois, batch_size=DEFAULT_QUERY_BATCH_SIZE, max_workers=DEFAULT_QUERY_MAX_WORKERS):
+        """
+        Queries the DOI endpoint for the status of several DOI submissions.
+
+        This default implementation submits one query_doi() request per DOI,
+        with at most max_workers requests in flight at any time. Inheritors
+        whose endpoint supports searching for several DOIs at once should
+        override this method to group the DOIs into batches of up to
+        batch_size entries.
+
+        Notes
+        -----
+        Results are NOT filtered by this method. Callers should be prepared
+        to match the records parsed from each response back to the DOIs
+        requested for it.
+
+        Parameters
+        ----------
+        dois : iterable of str
+            The DOIs to query for.
+        batch_size : int, optional
+            Maximum number of DOIs to request with a single query. Unused by
+            this default implementation.
+        max_workers : int, optional
+            Maximum number of queries to submit concurrently.
+
+        Returns
+        -------
+        results : list of tuple
+            One (batch_dois, response_text) tuple per query submitted, where
+            batch_dois is the list of DOIs requested by the query and
+            response_text is the body of the response from the endpoint.
+
+        """
+        batches = [[doi] for doi in dois]
+
+        return self._query_batches(batches, lambda batch: self.query_doi(query={"doi": batch[0]}), max_workers)
+
+    @staticmethod
+    def _query_batches(batches, query_func, max_workers):
+        """
+        Calls query_func for each of the provided batches, with at most
+        max_workers calls in flight at any time, returning a list of
+        (batch, response_text) tuples in the same order as batches.
+        """
+        if not batches:
+            return []
+
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(batches)))) as executor:
+            return list(zip(batches, executor.map(query_func, batches)))
+
     def endpoint_for_doi(self, doi, action):
         """
         Returns the proper HTTP verb and URL that form a request endpoint for
@@ -7,17 +7,37 @@
 #
 # ------------------------------
 import datetime
+import json
 
 from lxml import etree
 from pds_doi_service.core.entities.exceptions import InputFormatException
+from pds_doi_service.core.outputs.datacite.datacite_web_parser import DOIDataCiteWebParser
+from pds_doi_service.core.outputs.doi_record import CONTENT_TYPE_JSON
+from pds_doi_service.core.outputs.doi_record import CONTENT_TYPE_XML
 from pds_doi_service.core.util.general_util import get_logger
 from pds_doi_service.core.util.node_util import NodeUtil
 
 logger = get_logger("pds_doi_core.util.doi_xml_differ")
 
+# Older labels use the 'product_nos' tag in place of 'accession_number'.
+_FIELD_ALIASES = {"product_nos": "accession_number"}
+
+# Names of the OSTI fields with the same meaning as DataCite JSON fields, so
+# the same rules are used to resolve apparent differences in either format.
+_DATACITE_FIELD_NAMES = {
+    "created": "date_record_added",
+    "givenName": "first_name",
+    "name": "full_name",
+    "relatedIdentifierType": "identifier_type",
+    "relationType": "relation_type",
+    "resourceType": "product_type_specific",
+    "resourceTypeGeneral": "product_type",
+    "subject": "keywords",
+}
+
 
 class DOIDiffer:
-    # This class provide a way to answer the question if two DOIs (XML format) are similar.
+    # This class provide a way to answer the question if two DOIs (OSTI XML or DataCite JSON format) are similar.
 
     def _resolve_special_fields(field_name, historical_value, new_value):
         # Some fields may have different format.  For example:
@@ -26,7 +46,7 @@ class DOIDiffer:
         # The 'full_name' for contributor may have 'Planetary Data System:" preceding the node name.
         # Historical may have keywords that will not be in new code so a list is needed to skip.
         # Use all lowercase for consistency.
-        keywords_to_skip_compare = NodeUtil.get_permissible_node_ids()
+        keywords_to_skip_compare = list(NodeUtil.get_permissible_node_ids())
         keywords_to_skip_compare.append("PDS3".lower())
 
         o_difference_is_acceptable_flag = False
@@ -230,237 +250,235 @@ class DOIDiffer:
 
         return o_difference_is_acceptable_flag
 
-    def _determine_xpath_tag(child_level_1):
-        # Given the field name from historical document, determine the full xpath tag in the new document tree, e.g
-        # Assumes that the parent tag 'record' is a given.
-        #     'title'      in 'title' xpath or
-        #     'first_name' in 'authors/author/first_name' xpath or
-        #     'last_name'  in 'authors/author/last_name' xpath.
-
-        o_xpath_tag = child_level_1.tag
-        original_tag = child_level_1.tag
-
-        # Travel up from child_level_1.tag until no more parent and build the xpath.
-        levels_travelled_up = 0
-        if child_level_1.getparent() is not None:
-            levels_travelled_up += 1  # LEVEL 1
-            if child_level_1.getparent().getparent() is not None:
-                levels_travelled_up += 1  # LEVEL 2
-                o_xpath_tag = original_tag
-                if child_level_1.getparent().getparent().getparent() is not None:
-                    levels_travelled_up += 1  # LEVEL 3
-                    o_xpath_tag = (
-                        child_level_1.getparent().getparent().tag
-                        + "/"
-                        + child_level_1.getparent().tag
-                        + "/"
-                        + original_tag
-                    )
-            else:
-                logger.debug(f"child_level_1.getparent().getparent() is indeed None {child_level_1.tag}")
-
-        if child_level_1.tag == "accession_number":
-            o_xpath_tag = "product_nos"  # The new code uses 'product_nos' tag instead of 'accession_number'
-        if child_level_1.tag == "date_record_added":
-            pass
+    def _read_label(label_output, content_type):
+        # Read the label from a path or open file, and determine its content type from the first
+        # character of the label if not provided.
+        if hasattr(label_output, "read"):
+            label = label_output.read()
+        else:
+            with open(label_output, "rb") as infile:
+                label = infile.read()
 
-        logger.debug(f"FINAL_TAG {o_xpath_tag, original_tag, levels_travelled_up}")
+        if isinstance(label, str):
+            label = label.encode("utf-8")
 
-        return o_xpath_tag
+        if content_type is None:
+            content_type = CONTENT_TYPE_JSON if label.lstrip()[:1] in (b"{", b"[") else CONTENT_TYPE_XML
 
-    def _compare_individual_field(
-        historical_element, child_level_1, new_element, element_index, indices_where_field_occur_dict
-    ):
-        # Given an XML element from a historical document, compare the field in the element with the new document.
+        return label, content_type
 
-        o_field_differ_name = None  # Returning the name of the field that is not similiar.
-        o_values_differ = (
-            None  # Returning a string containing the historical value and the new value to allow the user to inspect.
-        )
+    def _canonical_value(value):
+        # Return the value of a field as compared by the differ, or None if the field has no value.
+        if value is None or isinstance(value, (dict, list)):
+            return None
 
-        historical_has_children = False
-        if len(child_level_1):
-            historical_has_children = True
+        if isinstance(value, bool):
+            value = str(value).lower()
 
-        # It is possible that the element to compare comes from a closing tag, which means there is no .text field.
-        # Which means there is no meaningful work to perform.
-        if child_level_1.text is None:
-            return o_field_differ_name, o_values_differ
+        return str(value).strip()
 
-        if not historical_has_children:
-            o_xpath_tag = DOIDiffer._determine_xpath_tag(child_level_1)
-            # Find the element in the new element with the same same tag as the historical element.
-            new_child = new_element.xpath(o_xpath_tag)
+    def _add_field(fields, occurrences, path, name, value):
+        # Add a field to the canonical fields of a record, keyed by its path and how many times the
+        # path has already occurred within the record (e.g. the second author's first_name).
+        occurrence = occurrences.get(path, 0)
+        occurrences[path] = occurrence + 1
 
-            if new_child is None or len(new_child) == 0:
-                logger.warning(
-                    f"New code does not produced field {child_level_1.tag} in DOI output.  Will skip comparing this field."
-                )
-                return o_field_differ_name, o_values_differ
+        fields[(path, occurrence)] = (name, value)
 
-            field_index = DOIDiffer._get_indices_where_tag_occur(
-                child_level_1.tag, child_level_1.getparent().tag, indices_where_field_occur_dict
-            )
+    def _xml_record_fields(record_element):
+        # Extract the canonical fields of an OSTI XML record, as a dictionary mapping
+        # (path, occurrence) to (field name, value). Only leaf elements with text are included,
+        # and each path is relative to the 'record' element, e.g. 'authors/author/first_name'.
+        fields = {}
+        occurrences = {}
+        paths = {record_element: ""}
 
-            # Because some fields are forced to exist eventhough it is an empty string, check for None-ness otherwise
-            # the lstrip() will failed on None.  e.g <id> </id>
-            logger.info(f"child_level_1.tag,field_index,len(new_child) {child_level_1.tag, field_index, len(new_child)}")
-            if new_child[field_index].text is not None:
-                if child_level_1.text.lstrip().rstrip() == new_child[field_index].text.lstrip().rstrip():
-                    pass  # Field is the same which is good.
-                    logger.debug(
-                        f"FIELD_SAME_TRUE: {child_level_1, child_level_1.text} == {new_child[field_index].text}"
-                    )
-                else:
-                    # Fields are different.  Attempt to resolve the apparent differences.
-                    logger.debug(
-                        f"FIELD_SAME_FALSE: {child_level_1, child_level_1.text} != {new_child[field_index].text}"
-                    )
+        for element in record_element.iterdescendants():
+            if not isinstance(element.tag, str):
+                continue  # Comments and processing instructions are not useful.
 
-                    # It is possible for new_child[0].text to be None so do not perform lstrip() and rstrip()
-                    o_difference_is_acceptable_flag = DOIDiffer._resolve_apparent_differences(
-                        field_name=child_level_1.tag, historical_value=child_level_1.text, new_value=new_child[0].text
-                    )
+            tag = _FIELD_ALIASES.get(element.tag, element.tag)
+            parent_path = paths[element.getparent()]
+            path = f"{parent_path}/{tag}" if parent_path else tag
+            paths[element] = path
 
-                    if not o_difference_is_acceptable_flag:
-                        # The differences are not acceptable between historical and new field, save the field name.
-                        o_field_differ_name = child_level_1.tag
-                        # Save the values different.
-                        o_values_differ = "historical:[" + child_level_1.text + "], new:[" + new_child[0].text + "]"
-                        logger.info(
-                            f"FIELD_SAME_FALSE_FINALLY: {child_level_1, child_level_1.text} != {new_child[field_index].text}"
-                        )
-                    else:
-                        logger.info(
-                            f"FIELD_SAME_TRUE_FINALLY: {child_level_1, child_level_1.text} == {new_child[field_index].text}"
-                        )
+            if len(element) == 0:
+                value = DOIDiffer._canonical_value(element.text)
 
-        return o_field_differ_name, o_values_differ
+                if value is not None:
+                    DOIDiffer._add_field(fields, occurrences, path, element.tag, value)
 
-    def _pre_condition_documents(historical_doc, new_doc):
-        # Pre-condition both documents before comparing so they have the same order.
+        return fields
 
-        new_root = new_doc.getroot()
-        historical_root = historical_doc.getroot()
+    def _json_record_fields(record):
+        # Extract the canonical fields of a DataCite JSON record, in the same form as _xml_record_fields().
+        # Paths are the keys leading to each value, with list indices omitted, e.g. 'creators/name'.
+        fields = {}
+        occurrences = {}
+        stack = [("", None, record.get("attributes", record))]
 
-        identifier_list_from_historical = []
+        while stack:
+            path, name, value = stack.pop()
 
-        # Build a dictionary of all elements in historical_root
-        # using the 'related_identifiers/related_identifier/identifier_value' as key.
-        historical_dict_list = {}
-        for element in historical_root.iter("record"):
-            # Some historical document does not have 'related_identifiers/related_identifier/identifier_value field' so
-            # an alternative one is 'product_nos'
-            if element.xpath("related_identifiers/related_identifier/identifier_value"):
-                sorting_element = element.xpath("related_identifiers/related_identifier/identifier_value")
-            else:
-                sorting_element = element.xpath("accession_number")
-            logger.info(
-                f":related_identifiers/related_identifier/identifier_value:len(sorting_element) {len(sorting_element)}"
-            )
-            if len(sorting_element) == 0:
-                sorting_element = element.xpath("product_nos")
-                logger.info(f":product_nos:len(sorting_element) {len(sorting_element)}")
-            historical_dict_list[sorting_element[0].text] = element
-            # Save each identifier_value so it can be checked when processing new records.
-            identifier_list_from_historical.append(sorting_element[0].text)
-
-        # Build a dictionary of all elements in new_root using the 'identifier_value' as key.
-        new_dict_list = {}
-        for element in new_root.iter("record"):
-            if element.xpath("related_identifiers/related_identifier/identifier_value"):
-                sorting_element = element.xpath("related_identifiers/related_identifier/identifier_value")
+            if isinstance(value, dict):
+                stack.extend(
+                    (f"{path}/{key}" if path else key, key, child) for key, child in reversed(list(value.items()))
+                )
+            elif isinstance(value, list):
+                stack.extend((path, name, child) for child in reversed(value))
             else:
-                sorting_element = element.xpath("accession_number")
+                value = DOIDiffer._canonical_value(value)
 
-            new_dict_list[sorting_element[0].text] = element
+                if value is not None:
+                    DOIDiffer._add_field(fields, occurrences, path, name, value)
 
-        # Rebuilt the historical tree in the order of the 'identifier_value' field.
-        historical_root = etree.Element("records")
-        for key in sorted(historical_dict_list.keys()):
-            historical_root.append(historical_dict_list[key])
+        return fields
 
-        # Rebuilt the new tree in the order of the 'identifier_value' field.
-        new_root = etree.Element("records")
-        for key in sorted(new_dict_list.keys()):
-            # It is possible that the historical doesn't have the record.  Check before adding so both will have the same number of records.
-            if key in identifier_list_from_historical:
-                new_root.append(new_dict_list[key])
+    def _xml_record_keys(record_element):
+        # Return the DOI and PDS identifier of an OSTI XML record, either of which may be None.
+        # Some historical documents do not have the 'related_identifiers/related_identifier/identifier_value'
+        # field, so the 'accession_number' or 'product_nos' fields are used instead.
+        doi = record_element.findtext("doi")
 
-        # Re-parse both documents now with the 'record' elements in the same order.
-        new_doc = etree.fromstring(etree.tostring(new_root))
-        historical_doc = etree.fromstring(etree.tostring(historical_root))
+        for xpath in ("related_identifiers/related_identifier/identifier_value", "accession_number", "product_nos"):
+            identifier = record_element.findtext(xpath)
 
-        return historical_doc, new_doc
+            if identifier and identifier.strip():
+                return doi.strip() if doi else None, identifier.strip()
 
-    def _update_indices_where_tag_occur(tag_name, my_parent_tag, indices_where_field_occur_dict):
-        # Check if 'first_name' of 'author' is in dictionary or not and increment by 1 if found.
-        full_tag = my_parent_tag + "_" + tag_name
-        if full_tag in indices_where_field_occur_dict:
-            indices_where_field_occur_dict[full_tag] += 1
-        else:
-            pass
-        return indices_where_field_occur_dict
-
-    def _get_indices_where_tag_occur(tag_name, my_parent_tag, indices_where_field_occur_dict):
-        # Return where in the tree where the combination of my_parent_tag and tag_name occur, e.g.
-        #    author_first_name
-        #    contributor_contributor_type
-        full_tag = my_parent_tag + "_" + tag_name
-        if full_tag in indices_where_field_occur_dict:
-            return indices_where_field_occur_dict[full_tag]
+        return doi.strip() if doi else None, None
+
+    def _json_record_keys(record):
+        # Return the DOI and PDS identifier of a DataCite JSON record, either of which may be None.
+        attributes = record.get("attributes", record)
+
+        doi = attributes.get("doi") or record.get("id")
+        identifier = DOIDataCiteWebParser._parse_pds_identifier(attributes)
+
+        return doi.strip() if doi else None, identifier.strip() if identifier else None
+
+    def _iter_records(label, content_type):
+        # Yield the ((doi, identifier), fields) of each record of a label, in document order.
+        if content_type == CONTENT_TYPE_JSON:
+            records = json.loads(label)
+
+            if isinstance(records, dict):
+                records = records.get("data", records)
+
+            if isinstance(records, dict):
+                records = [records]
+
+            for record in records:
+                yield DOIDiffer._json_record_keys(record), DOIDiffer._json_record_fields(record)
         else:
-            logger.debug(f"tag_name '{tag_name}' is not in indices_where_field_occur_dict:")
-            return 0
-
-    def _differ_single_record(
-        new_doc,
-        historical_element,
-        element_index,
-        io_fields_differ_list,
-        io_values_differ_list,
-        io_record_index_differ_list,
-    ):
-        # Given a 'record' element, compare all fields within and return info about any fields that differed.
-
-        indices_where_field_occur_dict = DOIDiffer._setup_where_field_occur_dict()
-
-        logger.info(f"element_index,historical_element.tag {element_index, historical_element.tag}")
-        # Get the same 'record' element from the new_doc XML tree.  Assumes the ordering is the same.
-        new_element = new_doc.xpath(historical_element.tag)[element_index]
-
-        # Loop through until cannot find any more elements.  Travel all way to the leaves and then compare the fields.
-        child_index = 0
-
-        for child_level_1 in historical_element.iter():
-            # The element with the tag 'record' is not useful, so it is skipped.
-            # The Comment element is also not useful, so it is skipped.
-            if child_level_1.tag == "record" or child_level_1.tag is etree.Comment:
+            root = etree.fromstring(label)
+
+            for record_element in root.iter("record"):
+                yield DOIDiffer._xml_record_keys(record_element), DOIDiffer._xml_record_fields(record_element)
+
+    def _index_records(label, content_type):
+        # Index the records of the new label by DOI and by PDS identifier, in a single pass of the document.
+        records_by_doi = {}
+        records_by_identifier = {}
+
+        for (doi, identifier), fields in DOIDiffer._iter_records(label, content_type):
+            if doi:
+                records_by_doi.setdefault(doi.lower(), fields)
+            if identifier:
+                records_by_identifier.setdefault(identifier, fields)
+
+        return records_by_doi, records_by_identifier
+
+    def _differ_single_record(historical_fields, new_fields, content_type):
+        # Compare the canonical fields of a historical record with those of its new record, and return
+        # a list of (field name, values) for each field that differed.
+        differences = []
+        field_name_aliases = _DATACITE_FIELD_NAMES if content_type == CONTENT_TYPE_JSON else {}
+
+        for (path, occurrence), (name, historical_value) in historical_fields.items():
+            new_field = new_fields.get((path, occurrence))
+
+            if new_field is None:
+                if (path, 0) not in new_fields:
+                    logger.debug(f"New label does not have field {path}, will skip comparing this field.")
+                    continue
+
+                # The new record has fewer occurrences of the field, e.g. fewer authors.
+                differences.append((name, f"historical:[{historical_value}], new:[]"))
                 continue
 
-            # Do the fields compare and save the field name differ and the two values list.
-            o_field_differ_name, o_values_differ = DOIDiffer._compare_individual_field(
-                historical_element, child_level_1, new_element, element_index, indices_where_field_occur_dict
+            new_value = new_field[1]
+
+            if historical_value == new_value:
+                continue  # Field is the same which is good.
+
+            # Fields are different.  Attempt to resolve the apparent differences.
+            o_difference_is_acceptable_flag = DOIDiffer._resolve_apparent_differences(
+                field_name=field_name_aliases.get(name, name), historical_value=historical_value, new_value=new_value
             )
 
-            my_parent_tag = child_level_1.getparent().tag
-            DOIDiffer._update_indices_where_tag_occur(child_level_1.tag, my_parent_tag, indices_where_field_occur_dict)
+            if not o_difference_is_acceptable_flag:
+                logger.debug(f"FIELD_SAME_FALSE_FINALLY: {path} {historical_value} != {new_value}")
+                differences.append((name, f"historical:[{historical_value}], new:[{new_value}]"))
+
+        return differences
+
+    @staticmethod
+    def doi_label_differ(historical_output, new_output, historical_content_type=None, new_content_type=None):
+        # Function compares two labels, in either OSTI XML or DataCite JSON format, e.g. a historical
+        # submission and the current state of the same records from the service provider.
+        #
+        # Records are aligned by DOI, falling back to the PDS identifier for records that have not been
+        # assigned a DOI, through a single-pass index of the new label. Each record is reduced once to
+        # its canonical fields, keyed by their path within the record and their occurrence (e.g. the
+        # second 'authors/author/first_name'), so comparing two labels of N records is linear in N.
+        # Fields are matched by path, so both labels are expected to use the same format.
+        #
+        # Historical records with no matching record in the new label are skipped, as are fields the
+        # new label does not produce at all.
+        #
+        # Returns three lists: the name of each field that differs, the historical and new values of
+        # the field, and the index within the historical label of the record the field belongs to.
+        o_fields_differ_list = []  # A list of fields that differ between two input files.
+        o_values_differ_list = []  # A list of values that differ between two input files.
+        o_record_index_differ_list = []  # A list of indices where the fields differ.
+
+        historical_label, historical_content_type = DOIDiffer._read_label(historical_output, historical_content_type)
+        new_label, new_content_type = DOIDiffer._read_label(new_output, new_content_type)
+
+        new_records_by_doi, new_records_by_identifier = DOIDiffer._index_records(new_label, new_content_type)
+
+        records_compared = 0
+
+        for element_index, ((doi, identifier), historical_fields) in enumerate(
+            DOIDiffer._iter_records(historical_label, historical_content_type)
+        ):
+            new_fields = new_records_by_doi.get(doi.lower()) if doi else None
+
+            if new_fields is None and identifier:
+                new_fields = new_records_by_identifier.get(identifier)
+
+            if new_fields is None:
+                # Sometimes historical code does not produce the same set of records as the new code.
+                logger.debug(f"No record for DOI {doi}, identifier {identifier} in the new label, skipping.")
+                continue
+
+            for field_name, values in DOIDiffer._differ_single_record(historical_fields, new_fields, new_content_type):
+                o_fields_differ_list.append(field_name)  # Save the field name that differs.
+                o_values_differ_list.append(values)  # Save the values where the fields differ.
+                o_record_index_differ_list.append(element_index)  # Save the index where the fields differ.
 
-            if o_field_differ_name:
-                io_fields_differ_list.append(o_field_differ_name)  # Save the field name that differs.
-                io_values_differ_list.append(o_values_differ)  # Save the values where the fields differ.
-                io_record_index_differ_list.append(element_index)  # Save the index where the fields differ.
+            records_compared += 1
 
-            child_index += 1
-        # end for child_level_1 in historical_element.iter():
+        logger.debug(f"records_compared {records_compared, historical_output, new_output}")
 
-        return io_fields_differ_list, io_values_differ_list, io_record_index_differ_list
+        return o_fields_differ_list, o_values_differ_list, o_record_index_differ_list
 
     @staticmethod
     def doi_xml_differ(historical_xml_output, new_xml_output):
         # Function compares two XML file specifically the output from a 'reserve' or 'draft' action.
         # Assumptions:
-        #    1. The elements in the XML tree may not share the same order, so they will be sorted by title.
+        #    1. The elements in the XML tree may not share the same order, so they are aligned by DOI or PDS identifier.
         #    2. The document uses 'records' as the root element tag and 'record' as element tag for each record.
 
         # The structure of the XML file:
@@ -486,52 +504,12 @@ class DOIDiffer:
         #                 <relation_type>IsIdenticalTo</relation_type>
         #             </related_identifier>
 
-        o_fields_differ_list = []  # A list of fields that differ between two input files.
-        o_values_differ_list = []  # A list of values that differ between two input files.
-        o_record_index_differ_list = []  # A list of indices where the fields differ.
-
-        # Build an XML tree from both input.
-        new_doc = etree.parse(new_xml_output)
-        historical_doc = etree.parse(historical_xml_output)
-
-        # Because the ordering of the 'record' element in the document tree is not known,
-        # the field 'related_identifiers/related_identifier/identifier_value' is picked to be the key to sort the document tree by.
-        # Assumption: the document built by both software uses the same input and it is unlikely
-        #             that the 'identifier_value' field differ.
-        # Pre-condition both documents so they have the same order.
-
-        historical_doc, new_doc = DOIDiffer._pre_condition_documents(historical_doc, new_doc)
-
-        element_index = 0
-
-        # Loop through all elements in historical document and if 'record' is found, compare all fields within 'record' element.
-        records_compared = 0
-
-        for historical_element in historical_doc.iter():
-            if historical_element.tag == "record":
-                # Special logic:
-                # Sometimes historical code does not produce the correct number of records.  One example
-                # was historical only produced 6 and new code produces 8.
-                logger.debug(f"elemet index {element_index}")
-                (
-                    o_fields_differ_list,
-                    o_values_differ_list,
-                    o_record_index_differ_list,
-                ) = DOIDiffer._differ_single_record(
-                    new_doc,
-                    historical_element,
-                    element_index,
-                    o_fields_differ_list,
-                    o_values_differ_list,
-                    o_record_index_differ_list,
-                )
-
-                element_index += 1
-                records_compared += 1
-
-        logger.debug(f"records_compared {records_compared, historical_xml_output, new_xml_output}")
-
-        return o_fields_differ_list, o_values_differ_list, o_record_index_differ_list
+        return DOIDiffer.doi_label_differ(
+            historical_xml_output,
+            new_xml_output,
+            historical_content_type=CONTENT_TYPE_XML,
+            new_content_type=CONTENT_TYPE_XML,
+        )
 
 
 if __name__ == "__main__":
@@ -12,6 +12,7 @@ general_util.py
 General utility functions for things like logging.
 """
 import hashlib
+import json
 import logging
 import re
 from html import escape
@@ -23,6 +24,11 @@ from urllib.parse import urlparse
 from pds_doi_service.core.util.config_parser import DOIConfigUtil
 from pds_doi_service.core.util.logging import get_logger as _get_logger
 
+try:
+    import orjson  # type: ignore
+except ImportError:
+    orjson = None
+
 PDS3_URL_TEMPLATE = "https://pds.nasa.gov/ds-view/pds/viewDataset.jsp?dsid={identifier}"
 """The landing page URL template for PDS3 datasets"""
 
@@ -285,6 +291,55 @@ def get_global_keywords():
     return global_keyword_set
 
 
+def collapse_whitespace(string):
+    """
+    Cleans up extraneous whitespace from the provided string. Extraneous
+    whitespace include any before or after the provided string, as well as
+    between words.
+
+    Parameters
+    ----------
+    string : str
+        The string to clean up.
+
+    Returns
+    -------
+    string : str
+        The provided string, with whitespace (including line breaks) between
+        words collapsed to a single space, and leading/trailing whitespace removed.
+
+    """
+    return re.sub(r"\s+", " ", string, flags=re.UNICODE).strip()
+
+
+def canonical_json_dumps(obj):
+    """
+    Encodes the provided object as JSON text in the canonical form used for
+    DOI labels, namely UTF-8 (non-ASCII characters are not escaped) with keys
+    in insertion order and an indent of two spaces.
+
+    The same object always produces byte-identical text, so the result is
+    suitable for checksumming. orjson is used for the encoding when it is
+    installed, otherwise the standard library encoder is used, with identical
+    output.
+
+    Parameters
+    ----------
+    obj : object
+        The JSON-compatible object to encode.
+
+    Returns
+    -------
+    json_text : str
+        The canonical JSON encoding of the provided object.
+
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+
+    return json.dumps(obj, indent=2, ensure_ascii=False)
+
+
 def sanitize_json_string(string):
     """
     Cleans up extraneous whitespace and escape quotation marks from the provided string so it may
@@ -304,7 +359,7 @@ def sanitize_json_string(string):
     """
     # Clean up whitespace (including line breaks) both between words and
     # at the ends of the string
-    stripped = re.sub(r"\s+", " ", string, flags=re.UNICODE).strip()
+    stripped = collapse_whitespace(string)
 
     # Now escape those quotation marks
     return re.sub(r'"', r"\"", stripped, flags=re.UNICODE)
@@ -63,10 +63,13 @@ import logging
 import os
 from datetime import datetime
 
+from lxml import etree
+from pds_doi_service.core.db.provider_mirror import ProviderMirror
 from pds_doi_service.core.db.transaction_builder import TransactionBuilder
 from pds_doi_service.core.entities.exceptions import CriticalDOIException
 from pds_doi_service.core.entities.exceptions import InputFormatException  # noqa
 from pds_doi_service.core.entities.exceptions import UnknownNodeException  # noqa
+from pds_doi_service.core.outputs.datacite.datacite_web_parser import DOIDataCiteWebParser
 from pds_doi_service.core.outputs.doi_record import CONTENT_TYPE_JSON
 from pds_doi_service.core.outputs.osti.osti_web_parser import DOIOstiXmlWebParser
 from pds_doi_service.core.outputs.service import DOIServiceFactory
@@ -165,28 +168,58 @@ def _read_from_local_xml(path):
     Read from a local xml file containing output from a query.
 
     Note that since the PDS DOI service only supports XML labels from OSTI,
-    that is the default parser used by this function.
+    that is the default parser used by this function. The file is parsed
+    incrementally, one record at a time, so that large exports of historical
+    records may be imported in constant memory.
 
     Parameters
     ----------
     path : str
         Path of the XML file to read and parse.
 
-    Returns
-    -------
-    dois : list of Doi
+    Yields
+    ------
+    doi : Doi
         The DOI objects parsed from the XML label.
 
     """
     try:
-        with open(path, mode="r") as f:
-            doi_xml = f.read()
-    except Exception as e:
+        yield from DOIOstiXmlWebParser.iter_dois_from_label(path)
+    except etree.XMLSyntaxError as e:
+        raise InputFormatException(f"Unable to parse input file {path} as an OSTI XML label: {str(e)}")
+    except OSError as e:
         raise CriticalDOIException(str(e))
 
-    dois, _ = DOIOstiXmlWebParser.parse_dois_from_label(doi_xml)
 
-    return dois
+def _read_from_local_datacite_json(path):
+    """
+    Read from a local DataCite JSON file containing output from a query.
+
+    The file is parsed incrementally, one record of its "data" array at a time,
+    so that large dumps of a full DOI catalogue may be imported in constant
+    memory.
+
+    Parameters
+    ----------
+    path : str
+        Path to the JSON file to read and parse.
+
+    Yields
+    ------
+    doi : Doi
+        The DOI objects parsed from the JSON label.
+
+    """
+    try:
+        yield from DOIDataCiteWebParser.iter_dois_from_label(path)
+    except OSError as e:
+        raise CriticalDOIException(str(e))
+    except Exception as e:
+        raise InputFormatException(
+            f"Unable to parse input file {path} using parser {DOIDataCiteWebParser.__name__}: {str(e)}\n"
+            f"Please ensure the --service flag is set correctly to specify the "
+            f"correct parser type for the format."
+        )
 
 
 def _read_from_local_json(service, path):
@@ -194,7 +227,8 @@ def _read_from_local_json(service, path):
     Read from a local JSON file containing output from a query.
 
     The appropriate JSON parser (OSTI or DataCite) is determined based on
-    the provided service type.
+    the provided service type. DataCite labels are parsed lazily, as the
+    returned iterable is consumed (see _read_from_local_datacite_json()).
 
     Parameters
     ----------
@@ -206,10 +240,13 @@ def _read_from_local_json(service, path):
 
     Returns
     -------
-    dois : list of Doi
+    dois : iterable of Doi
         The DOI objects parsed from the JSON label.
 
     """
+    if service == SERVICE_TYPE_DATACITE:
+        return _read_from_local_datacite_json(path)
+
     try:
         with open(path, mode="r") as f:
             doi_json = f.read()
@@ -246,8 +283,9 @@ def _read_from_path(service, path):
 
     Returns
     -------
-    dois : list of Doi
-        The DOI objects parsed from the label.
+    dois : iterable of Doi
+        The DOI objects parsed from the label. XML and DataCite JSON labels
+        are parsed lazily, as the returned iterable is consumed.
 
     Raises
     ------
@@ -267,7 +305,7 @@ def _read_from_path(service, path):
     raise InputFormatException(f"File {path} is not supported. Only .xml and .json are supported.")
 
 
-def get_dois_from_provider(service, prefix, output_file=None):
+def get_dois_from_provider(service, prefix, output_file=None, provider_mirror=None):
     """
     Queries the service provider for all the current DOI associated with the
     provided prefix.
@@ -281,11 +319,16 @@ def get_dois_from_provider(service, prefix, output_file=None):
     output_file : str, optional
         If provided, path to an output file to write the results of the DOI
         query to.
+    provider_mirror : ProviderMirror, optional
+        If provided, the mirror of provider records to write the results of
+        the DOI query to. Results are then read in full before being parsed.
 
     Returns
     -------
-    dois : list of Doi
-        The DOI objects obtained from the service provider.
+    dois : iterable of Doi
+        The DOI objects obtained from the service provider. Unless an output
+        file is requested, the response is parsed lazily as the returned
+        iterable is consumed (see DOIWebClient.iter_query_doi()).
     server_url : str
         The URL of the service provider endpoint. Helpful for logging purposes.
 
@@ -301,6 +344,11 @@ def get_dois_from_provider(service, prefix, output_file=None):
 
     web_client = DOIServiceFactory.get_web_client_service(service)
 
+    mirror_results = provider_mirror is not None and provider_mirror.enabled
+
+    if not output_file and not mirror_results:
+        return web_client.iter_query_doi(query=query_dict), server_url
+
     doi_json = web_client.query_doi(query=query_dict, content_type=CONTENT_TYPE_JSON)
 
     if output_file:
@@ -309,6 +357,9 @@ def get_dois_from_provider(service, prefix, output_file=None):
         with open(output_file, "w") as outfile:
             json.dump(json.loads(doi_json), outfile, indent=4)
 
+    if mirror_results:
+        provider_mirror.mirror_label(doi_json)
+
     web_parser = DOIServiceFactory.get_web_parser_service(service)
 
     dois, _ = web_parser.parse_dois_from_label(doi_json, content_type=CONTENT_TYPE_JSON)
@@ -371,22 +422,29 @@ def perform_import_to_database(service, prefix, db_name, input_source, dry_run,
 
     transaction_builder = TransactionBuilder(db_name)
 
+    # Records read from DataCite are also written to the local mirror of the
+    # provider's state, unless this is a dry run
+    provider_mirror = None if dry_run else ProviderMirror(transaction_builder.m_doi_database, service_type=service)
+
     # If the input is provided, parse from it. Otherwise query the server.
     if input_source:
         dois = _read_from_path(service, input_source)
         server_url = input_source
+
+        if provider_mirror and input_source.endswith(".json"):
+            provider_mirror.mirror_label_file(input_source)
     else:
         # Get the dois from the server.
         # Note that because the name of the server obtained from the config file,
         # it could be the OPS or TEST server.
-        dois, server_url = get_dois_from_provider(service, prefix, output_file)
+        dois, server_url = get_dois_from_provider(service, prefix, output_file, provider_mirror=provider_mirror)
 
-    o_records_found = len(dois)
-
-    logger.info("Parsed %d DOI(s) from %s", o_records_found, server_url)
+    logger.info("Reading DOI(s) from %s", server_url)
 
     # Write each Doi object as a row into the database.
     for item_index, doi in enumerate(dois):
+        o_records_found += 1
+
         # If the field 'pds_identifier' is None, we cannot proceed since
         # it serves as the primary key for our transaction database.
         if not doi.pds_identifier:
@@ -422,6 +480,8 @@ def perform_import_to_database(service, prefix, db_name, input_source, dry_run,
                 o_records_dois_skipped += 1
                 logger.info(f"Record for DOI {doi.doi} ({doi.pds_identifier}) has not changed, skipping...")
 
+    logger.info("Parsed %d DOI(s) from %s", o_records_found, server_url)
+
     return o_records_found, o_records_processed, o_records_written, o_records_dois_skipped
 
 
@@ -0,0 +1,252 @@
+#
+#  Copyright 2026, by the California Institute of Technology.  ALL RIGHTS
+#  RESERVED. United States Government Sponsorship acknowledged. Any commercial
+#  use must be negotiated with the Office of Technology Transfer at the
+#  California Institute of Technology.
+#
+"""
+==============
+json_stream.py
+==============
+
+Incremental reading of the records within large JSON documents, such as
+DataCite dump files of a full DOI catalogue.
+
+The document is memory-mapped and decoded through a sliding window of text,
+with each item of the array of records decoded in turn by the scanner of the
+standard json module (implemented in C, with a pure Python fallback). Only the
+window and a single item are held in memory at a time, so memory use does not
+depend on the size of the document. Pages of the mapping that have already
+been read are released back to the operating system as the window moves on.
+"""
+import codecs
+import json
+import mmap
+import os
+import re
+
+from pds_doi_service.core.util.general_util import get_logger
+
+logger = get_logger(__name__)
+
+READ_SIZE = 1024 * 1024
+"""Number of bytes of the document decoded into the window at a time"""
+
+RELEASE_INTERVAL = 64 * 1024 * 1024
+"""Number of bytes read between releases of the pages of the mapping that have already been decoded"""
+
+_BOM = "\ufeff"
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_NUMBER_CHARACTERS = re.compile(r"[0-9.eE+-]*")
+_DECODER = json.JSONDecoder()
+
+_TRUNCATION_MARGIN = 64
+"""Number of characters from the end of the window within which a decoding error may be due to a value cut off by the window"""
+
+
+class _JsonReader:
+    """
+    Decodes the values within a JSON document held in a buffer (such as a
+    memory map) through a sliding window of text.
+    """
+
+    def __init__(self, buffer):
+        self._buffer = buffer
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+        self._text = ""
+        self._pos = 0
+        self._offset = 0
+        self._released = 0
+
+    def _fill(self):
+        """
+        Decodes more of the buffer into the window, discarding the text
+        already consumed. Returns False if the end of the buffer was reached.
+        """
+        if self._offset >= len(self._buffer):
+            return False
+
+        # Read at least as much as is left in the window, so a value spanning
+        # many windows is re-scanned a logarithmic number of times
+        size = max(READ_SIZE, len(self._text) - self._pos)
+        chunk = self._buffer[self._offset : self._offset + size]
+        self._offset += len(chunk)
+
+        self._text = self._text[self._pos :] + self._decoder.decode(chunk, final=self._offset >= len(self._buffer))
+        self._pos = 0
+
+        self._release()
+
+        return True
+
+    def _release(self):
+        """
+        Advises the operating system that the pages of the buffer already
+        decoded are no longer needed, once at least RELEASE_INTERVAL bytes
+        have been read since the last release.
+        """
+        if self._offset - self._released < RELEASE_INTERVAL or not hasattr(self._buffer, "madvise"):
+            return
+
+        end = self._offset - self._offset % mmap.PAGESIZE
+
+        self._buffer.madvise(mmap.MADV_DONTNEED, self._released, end - self._released)
+        self._released = end
+
+    def peek(self):
+        """Returns the next non-whitespace character, or an empty string at the end of the document."""
+        while True:
+            self._pos = _WHITESPACE.match(self._text, self._pos).end()
+
+            if self._pos < len(self._text) or not self._fill():
+                return self._text[self._pos : self._pos + 1]
+
+    def expect(self, expected):
+        """Consumes the expected character, following any whitespace."""
+        if self.peek() != expected:
+            raise self.error(f"expected {expected!r}")
+
+        self._pos += 1
+
+    def skip_bom(self):
+        """Consumes any byte order mark at the start of the document."""
+        if self.peek() == _BOM:
+            self._pos += 1
+
+    def value(self):
+        """Decodes and consumes the next value (of any type) of the document."""
+        self.peek()
+
+        while True:
+            try:
+                value, end = _DECODER.raw_decode(self._text, self._pos)
+            except json.JSONDecodeError as err:
+                truncated = err.msg.startswith("Unterminated string") or err.pos >= len(self._text) - _TRUNCATION_MARGIN
+
+                if truncated and self._fill():
+                    continue
+
+                raise self.error(err.msg, err.pos) from err
+
+            # A number cut off by the end of the window (even just after a "."
+            # or "e", where the decoder stops short of the window end) may
+            # continue past it
+            if (
+                type(value) in (int, float)
+                and _NUMBER_CHARACTERS.match(self._text, end).end() == len(self._text)
+                and self._fill()
+            ):
+                continue
+
+            self._pos = end
+
+            return value
+
+    def error(self, message, pos=None):
+        """Returns a ValueError describing a malformed document at the provided (or current) position."""
+        pos = self._pos if pos is None else pos
+        context = self._text[max(pos - 32, 0) : pos + 32]
+
+        return ValueError(f"Malformed JSON near {context!r}: {message}")
+
+    def iter_array(self):
+        """Yields each decoded item of the array at the current position."""
+        self.expect("[")
+
+        if self.peek() == "]":
+            self._pos += 1
+            return
+
+        while True:
+            yield self.value()
+
+            char = self.peek()
+            self._pos += 1
+
+            if char == "]":
+                return
+
+            if char != ",":
+                raise self.error("expected ',' or ']'")
+
+    def find_member(self, key):
+        """
+        Consumes the members of the object at the current position up to the
+        value of the member with the provided key. Returns False if the object
+        has no such member.
+        """
+        self.expect("{")
+
+        if self.peek() == "}":
+            return False
+
+        while True:
+            if self.peek() != '"':
+                raise self.error("expected a property name")
+
+            member_key = self.value()
+            self.expect(":")
+
+            if member_key == key:
+                return True
+
+            self.value()
+
+            char = self.peek()
+            self._pos += 1
+
+            if char == "}":
+                return False
+
+            if char != ",":
+                raise self.error("expected ',' or '}'")
+
+
+def iter_json_items(path, key=None):
+    """
+    Yields the decoded items of an array within a JSON document, one at a time.
+
+    Parameters
+    ----------
+    path : str
+        Path to the JSON document to read.
+    key : str, optional
+        Key of the top-level object member holding the array, e.g. "data" for
+        a DataCite label. If the member holds an object rather than an array,
+        the object is yielded as the only item. If not provided, the document
+        itself must be an array.
+
+    Yields
+    ------
+    item : object
+        Each item of the array, decoded to Python objects.
+
+    Raises
+    ------
+    ValueError
+        If the document is malformed, or does not have the requested member.
+
+    """
+    with open(path, "rb") as infile:
+        if os.fstat(infile.fileno()).st_size == 0:
+            raise ValueError(f"JSON document {path} is empty")
+
+        with mmap.mmap(infile.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            reader = _JsonReader(buffer)
+            reader.skip_bom()
+
+            if key is not None:
+                if not reader.find_member(key):
+                    raise ValueError(f'JSON document {path} has no top-level "{key}" member')
+
+                if reader.peek() == "{":
+                    yield reader.value()
+                    return
+
+            count = 0
+
+            for item in reader.iter_array():
+                yield item
+                count += 1
+
+            logger.debug("Read %d item(s) from JSON document %s", count, path)
@@ -2,60 +2,165 @@ import functools
 import hashlib
 import re
 
-import nltk  # type: ignore
+from pds_doi_service.core.util.config_parser import DOIConfigUtil
+from pds_doi_service.core.util.general_util import get_logger
 
-# Monkeypatch nltk.downloader.md5 to include usedforsecurity=False
-nltk.downloader.md5 = functools.partial(hashlib.md5, usedforsecurity=False)
+logger = get_logger(__name__)
 
-nltk.download("stopwords", quiet=True)
-from nltk.corpus import stopwords  # type: ignore # noqa: E402
+NLTK_RESOURCES = {"stopwords": "corpora/stopwords", "wordnet": "corpora/wordnet"}
+"""The nltk resources used for keyword extraction, mapped to their paths within an nltk data directory"""
 
-nltk.download("wordnet", quiet=True)
-from nltk.stem.wordnet import WordNetLemmatizer  # type: ignore # noqa: E402 # @nutjob4life: 😩
-from pds_doi_service.core.util.general_util import get_logger  # noqa: E402
+LEMMA_CACHE_SIZE = 65536
+"""Maximum number of token to lemma mappings memoized across all tokenizers"""
 
-logger = get_logger(__name__)
+# Fix regex patterns to avoid potential catastrophic backtracking
+# Limit consecutive non-alphanumeric chars to a reasonable maximum (100)
+_LEADING_PUNCTUATION = re.compile("^[^a-zA-Z0-9]{1,100}")
+_TRAILING_PUNCTUATION = re.compile("[^a-zA-Z0-9]{1,100}$")
+_PUNCTUATION_BEFORE_SPACE = re.compile("[^a-zA-Z0-9]{1,100} ")
+_PUNCTUATION_AFTER_SPACE = re.compile(" [^a-zA-Z0-9]{1,100}")
+
+# Replace non-greedy .* pattern with character class and bounded repetition
+_HTML_TAG = re.compile("&lt;/?[^&>]{0,1000}&gt;")
+_SPECIAL_CHARACTERS = re.compile(r"(\|\\W){1,100}")
+
+
+def _ensure_nltk_resource(nltk, name, data_dir, allow_download):
+    """
+    Checks that the named nltk resource is available locally, downloading it
+    only when it is missing and downloads are allowed.
+    """
+    try:
+        nltk.data.find(NLTK_RESOURCES[name])
+    except LookupError:
+        if not allow_download:
+            raise RuntimeError(
+                f"nltk resource '{name}' is not available locally and downloads are disabled.\n"
+                f"Install it to the OTHER.nltk_data_dir directory of the INI config with:\n"
+                f"    python -m nltk.downloader -d {data_dir or '<nltk_data_dir>'} {' '.join(NLTK_RESOURCES)}"
+            )
+
+        logger.info("Downloading nltk resource %s", name)
+
+        if not nltk.download(name, download_dir=data_dir or None, quiet=True):
+            raise RuntimeError(f"Failed to download nltk resource '{name}'")
+
+
+@functools.lru_cache(maxsize=None)
+def _load_nltk_resources():
+    """
+    Imports nltk and loads the corpora used for keyword extraction, shared by
+    all KeywordTokenizer instances.
+
+    This is deferred until keywords are first extracted, since importing nltk
+    is slow, and most uses of the DOI service never parse a PDS4 label.
+
+    Corpora are read from the OTHER.nltk_data_dir directory of the INI config
+    (if set) ahead of the default nltk search paths. A corpus missing from all
+    of these is only downloaded when OTHER.nltk_download is enabled, so hosts
+    without network access can run from a pre-populated data directory.
+
+    Returns
+    -------
+    stop_words : set of str
+        The english stop words to exclude from keywords.
+    lemmatizer : nltk.stem.wordnet.WordNetLemmatizer
+        The lemmatizer used to normalize keywords.
+
+    Raises
+    ------
+    RuntimeError
+        If a corpus is not available locally and cannot be downloaded.
+
+    """
+    import nltk  # type: ignore
+
+    config = DOIConfigUtil().get_config()
+    data_dir = config.get("OTHER", "nltk_data_dir", fallback=None)
+    allow_download = config.getboolean("OTHER", "nltk_download", fallback=True)
+
+    if data_dir and data_dir not in nltk.data.path:
+        nltk.data.path.insert(0, data_dir)
+
+    # Monkeypatch nltk.downloader.md5 to include usedforsecurity=False
+    nltk.downloader.md5 = functools.partial(hashlib.md5, usedforsecurity=False)
+
+    for name in NLTK_RESOURCES:
+        _ensure_nltk_resource(nltk, name, data_dir, allow_download)
+
+    from nltk.corpus import stopwords  # type: ignore
+    from nltk.stem.wordnet import WordNetLemmatizer  # type: ignore # @nutjob4life: 😩
+
+    return frozenset(stopwords.words("english")), WordNetLemmatizer()
+
+
+@functools.lru_cache(maxsize=LEMMA_CACHE_SIZE)
+def _lemmatize(word):
+    """Returns the lemma of the provided token, memoized since labels reuse much of the same vocabulary"""
+    _, lemmatizer = _load_nltk_resources()
+
+    return lemmatizer.lemmatize(word)
 
 
 class KeywordTokenizer:
     def __init__(self):
         logger.debug("initialize keyword tokenizer")
         self.pos_dict = {"pds", "mars"}
-        self._stop_words = set(stopwords.words("english"))
+        self._stop_words, _ = _load_nltk_resources()
         self._keywords = set()
 
-    def process_text(self, text):
+    @staticmethod
+    def _tokenize(text):
         # Remove punctuations
-        logger.debug(f"extract keywords from {text}")
-        # Fix regex patterns to avoid potential catastrophic backtracking
-        # Limit consecutive non-alphanumeric chars to a reasonable maximum (100)
-        text = re.sub("^[^a-zA-Z0-9]{1,100}", " ", text)
-        text = re.sub("[^a-zA-Z0-9]{1,100}$", " ", text)
-        text = re.sub("[^a-zA-Z0-9]{1,100} ", " ", text)
-        text = re.sub(" [^a-zA-Z0-9]{1,100}", " ", text)
+        text = _LEADING_PUNCTUATION.sub(" ", text)
+        text = _TRAILING_PUNCTUATION.sub(" ", text)
+        text = _PUNCTUATION_BEFORE_SPACE.sub(" ", text)
+        text = _PUNCTUATION_AFTER_SPACE.sub(" ", text)
 
         # Convert to lowercase
         text = text.lower()
 
         # Remove tags with bounded repetition
-        # Replace non-greedy .* pattern with character class and bounded repetition
-        text = re.sub("&lt;/?[^&>]{0,1000}&gt;", " &lt;&gt; ", text)
+        text = _HTML_TAG.sub(" &lt;&gt; ", text)
 
         # Remove special characters with bounded repetition
-        text = re.sub(r"(\|\\W){1,100}", " ", text)
+        text = _SPECIAL_CHARACTERS.sub(" ", text)
 
         # Convert to list from string
-        text = text.split()
+        return text.split()
+
+    def process_texts(self, texts):
+        """
+        Extracts keywords from each of the provided texts, adding them to the
+        keywords accumulated by this tokenizer.
+
+        Each distinct token is only lemmatized once per call, so this is
+        preferable to repeated calls to process_text() when extracting keywords
+        from many labels.
+
+        Parameters
+        ----------
+        texts : iterable of str
+            The texts to extract keywords from.
+
+        """
+        tokens = set()
+
+        for text in texts:
+            logger.debug(f"extract keywords from {text}")
+            tokens.update(self._tokenize(text))
 
         # Lemmatisation
-        lem = WordNetLemmatizer()
-        keyword_set = set(
-            [word if word in self.pos_dict else lem.lemmatize(word) for word in text if word not in self._stop_words]
-        )
+        keyword_set = {
+            word if word in self.pos_dict else _lemmatize(word) for word in tokens if word not in self._stop_words
+        }
 
         self._keywords |= keyword_set
 
         logger.debug(f"new keyword list is {self._keywords}")
 
+    def process_text(self, text):
+        self.process_texts([text])
+
     def get_keywords(self):
         return self._keywords
@@ -0,0 +1,291 @@
+#
+#  Copyright 2026, by the California Institute of Technology.  ALL RIGHTS
+#  RESERVED. United States Government Sponsorship acknowledged. Any commercial
+#  use must be negotiated with the Office of Technology Transfer at the
+#  California Institute of Technology.
+#
+"""
+==========
+metrics.py
+==========
+
+Lightweight, in-process collection of service metrics (counters and latency
+histograms), rendered in the Prometheus text exposition format.
+
+Metrics collection is controlled by the OTHER.metrics_enabled field of the INI
+config. When disabled (the default), the instrumentation helpers in this module
+return immediately without recording anything, so instrumented code paths pay
+only the cost of a single flag check.
+"""
+import functools
+import math
+import threading
+import time
+from contextlib import contextmanager
+
+from pds_doi_service.core.util.config_parser import DOIConfigUtil
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+"""Content type of the text exposition format returned by render_metrics()"""
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+"""Default upper bounds, in seconds, of the buckets of a latency histogram"""
+
+
+class _Metric:
+    """Base class for a metric family, holding one value per unique set of label values."""
+
+    metric_type = None
+
+    def __init__(self, name, description):
+        self.name = name
+        self.description = description
+
+        self._lock = threading.Lock()
+        self._values = {}
+
+    @staticmethod
+    def _label_key(labels):
+        return tuple(sorted((key, str(value)) for key, value in labels.items()))
+
+    @staticmethod
+    def _format_labels(label_key, extra=()):
+        pairs = list(label_key) + list(extra)
+
+        if not pairs:
+            return ""
+
+        formatted = ",".join(
+            '{}="{}"'.format(key, value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n"))
+            for key, value in pairs
+        )
+
+        return "{" + formatted + "}"
+
+    @staticmethod
+    def _format_value(value):
+        if math.isinf(value):
+            return "+Inf" if value > 0 else "-Inf"
+
+        return repr(float(value))
+
+    def clear(self):
+        """Removes all recorded values."""
+        with self._lock:
+            self._values.clear()
+
+    def render(self):
+        """Returns the lines of the text exposition format for this metric family."""
+        lines = [f"# HELP {self.name} {self.description}", f"# TYPE {self.name} {self.metric_type}"]
+
+        with self._lock:
+            for label_key in sorted(self._values):
+                lines.extend(self._render_value(label_key, self._values[label_key]))
+
+        return lines
+
+    def _render_value(self, label_key, value):
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    """A monotonically increasing count of events."""
+
+    metric_type = "counter"
+
+    def inc(self, amount=1, **labels):
+        """Increments the count associated with the provided labels."""
+        label_key = self._label_key(labels)
+
+        with self._lock:
+            self._values[label_key] = self._values.get(label_key, 0) + amount
+
+    def value(self, **labels):
+        """Returns the current count associated with the provided labels."""
+        with self._lock:
+            return self._values.get(self._label_key(labels), 0)
+
+    def _render_value(self, label_key, value):
+        return [f"{self.name}_total{self._format_labels(label_key)} {self._format_value(value)}"]
+
+
+class Histogram(_Metric):
+    """A distribution of observed values (typically durations in seconds), grouped into buckets."""
+
+    metric_type = "histogram"
+
+    def __init__(self, name, description, buckets=DEFAULT_BUCKETS):
+        super().__init__(name, description)
+
+        self.buckets = tuple(sorted(buckets)) + (math.inf,)
+
+    def observe(self, value, **labels):
+        """Records an observed value against the provided labels."""
+        label_key = self._label_key(labels)
+
+        with self._lock:
+            if label_key not in self._values:
+                self._values[label_key] = {"buckets": [0] * len(self.buckets), "sum": 0.0, "count": 0}
+
+            entry = self._values[label_key]
+
+            for index, upper_bound in enumerate(self.buckets):
+                if value <= upper_bound:
+                    entry["buckets"][index] += 1
+                    break
+
+            entry["sum"] += value
+            entry["count"] += 1
+
+    def count(self, **labels):
+        """Returns the number of values observed for the provided labels."""
+        with self._lock:
+            entry = self._values.get(self._label_key(labels))
+
+            return entry["count"] if entry else 0
+
+    def _render_value(self, label_key, value):
+        lines = []
+        cumulative = 0
+
+        for upper_bound, bucket_count in zip(self.buckets, value["buckets"]):
+            cumulative += bucket_count
+            bucket_labels = self._format_labels(label_key, extra=(("le", self._format_value(upper_bound)),))
+            lines.append(f"{self.name}_bucket{bucket_labels} {cumulative}")
+
+        lines.append(f"{self.name}_sum{self._format_labels(label_key)} {self._format_value(value['sum'])}")
+        lines.append(f"{self.name}_count{self._format_labels(label_key)} {value['count']}")
+
+        return lines
+
+
+class MetricsRegistry:
+    """Collection of the metric families exposed by the service."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._metrics = {}
+
+    def _get_or_create(self, metric_class, name, description, **kwargs):
+        with self._lock:
+            if name not in self._metrics:
+                self._metrics[name] = metric_class(name, description, **kwargs)
+
+            metric = self._metrics[name]
+
+        if not isinstance(metric, metric_class):
+            raise ValueError(f"Metric {name} is already registered as a {metric.metric_type}")
+
+        return metric
+
+    def counter(self, name, description):
+        """Returns the Counter registered under the provided name, creating it if necessary."""
+        return self._get_or_create(Counter, name, description)
+
+    def histogram(self, name, description, buckets=DEFAULT_BUCKETS):
+        """Returns the Histogram registered under the provided name, creating it if necessary."""
+        return self._get_or_create(Histogram, name, description, buckets=buckets)
+
+    def clear(self):
+        """Removes all values recorded by every registered metric."""
+        with self._lock:
+            metrics = list(self._metrics.values())
+
+        for metric in metrics:
+            metric.clear()
+
+    def render(self):
+        """Returns all registered metrics in the Prometheus text exposition format."""
+        with self._lock:
+            metrics = [self._metrics[name] for name in sorted(self._metrics)]
+
+        lines = []
+
+        for metric in metrics:
+            lines.extend(metric.render())
+
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = MetricsRegistry()
+"""The process-wide metrics registry"""
+
+API_REQUEST_DURATION = REGISTRY.histogram(
+    "pds_doi_api_request_duration_seconds", "Time spent handling API requests, by controller and response status."
+)
+DB_QUERY_DURATION = REGISTRY.histogram(
+    "pds_doi_db_query_duration_seconds", "Time spent executing SQLite statements, by statement type."
+)
+PROVIDER_REQUEST_DURATION = REGISTRY.histogram(
+    "pds_doi_provider_request_duration_seconds",
+    "Latency of requests to the DOI service provider, by service, HTTP method and response status.",
+)
+PROVIDER_REQUEST_ERRORS = REGISTRY.counter(
+    "pds_doi_provider_request_errors",
+    "Requests to the DOI service provider that failed without a response, by service and HTTP method.",
+)
+OPERATION_DURATION = REGISTRY.histogram(
+    "pds_doi_operation_duration_seconds",
+    "Time spent in internal operations such as template rendering, schema validation and label parsing.",
+)
+
+
+@functools.lru_cache()
+def metrics_enabled():
+    """Returns True if metrics collection is enabled by the INI config."""
+    config = DOIConfigUtil().get_config()
+
+    return config.getboolean("OTHER", "metrics_enabled", fallback=False)
+
+
+@contextmanager
+def timed(histogram, **labels):
+    """
+    Context manager which records the time spent within the context as an
+    observation of the provided histogram. Nothing is recorded when metrics
+    collection is disabled.
+
+    Parameters
+    ----------
+    histogram : Histogram
+        The histogram to record the duration with.
+    labels : dict
+        The labels to associate with the observation.
+
+    """
+    if not metrics_enabled():
+        yield
+        return
+
+    start = time.perf_counter()
+
+    try:
+        yield
+    finally:
+        histogram.observe(time.perf_counter() - start, **labels)
+
+
+def timed_operation(operation, **labels):
+    """
+    Decorator which records the duration of each call to the decorated function
+    under the OPERATION_DURATION histogram, labeled with the provided operation
+    name (e.g. "render", "validate" or "parse") and any additional labels.
+    """
+
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not metrics_enabled():
+                return func(*args, **kwargs)
+
+            with timed(OPERATION_DURATION, operation=operation, **labels):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def render_metrics():
+    """Returns all collected metrics in the Prometheus text exposition format."""
+    return REGISTRY.render()
@@ -0,0 +1,215 @@
+#!/usr/bin/env python
+#
+#  Copyright 2026, by the California Institute of Technology.  ALL RIGHTS
+#  RESERVED. United States Government Sponsorship acknowledged. Any commercial
+#  use must be negotiated with the Office of Technology Transfer at the
+#  California Institute of Technology.
+#
+"""
+==============================
+migrate_transaction_history.py
+==============================
+
+Script used to convert an existing local transaction history, where each
+transaction directory holds full copies of its input and output products, to
+the deduplicated blob store layout (see TransactionBlobStore).
+
+Migration is idempotent: transaction directories that already contain a
+manifest are left untouched, so the script may be safely re-run. Once the
+history has been migrated, set OTHER.transaction_store to "blob" in the INI
+config so new transactions are written to the blob store as well.
+"""
+import argparse
+import logging
+import os
+import shutil
+from datetime import datetime
+
+from pds_doi_service.core.db.transaction_blob_store import BLOB_DIR_NAME
+from pds_doi_service.core.db.transaction_blob_store import MANIFEST_FILE_NAME
+from pds_doi_service.core.db.transaction_blob_store import TransactionBlobStore
+from pds_doi_service.core.util.config_parser import DOIConfigUtil
+from pds_doi_service.core.util.general_util import get_logger
+
+# Get the common logger and set the level for this file.
+logger = get_logger(__name__)
+logger.setLevel(logging.INFO)
+
+
+def create_cmd_parser():
+    parser = argparse.ArgumentParser(
+        description="Script to migrate the local transaction history to the deduplicated blob store layout.",
+        epilog="Note: After migrating, set transaction_store = blob in the OTHER "
+        "section of the INI config so new transactions use the blob store.",
+    )
+    parser.add_argument(
+        "-t",
+        "--transaction-dir",
+        required=False,
+        default=None,
+        help="Path to the transaction history directory to migrate. If not "
+        "provided, the OTHER.transaction_dir value of the INI config is used.",
+    )
+    parser.add_argument(
+        "--keep-originals",
+        required=False,
+        action="store_true",
+        help="Flag to keep the original copies of each migrated transaction's files.",
+    )
+    parser.add_argument(
+        "--dry-run",
+        required=False,
+        action="store_true",
+        help="Flag to report what would be migrated without modifying the transaction history.",
+    )
+    parser.add_argument("--debug", required=False, action="store_true", help="Flag to print debug statements.")
+
+    return parser
+
+
+def _find_transaction_dirs(transaction_dir):
+    """
+    Yields each transaction directory (a directory holding an output label or
+    a blob store manifest) found under the provided transaction history root,
+    skipping the blob store itself.
+    """
+    for dir_path, dir_names, file_names in os.walk(transaction_dir):
+        # Never descend into the blob store
+        if BLOB_DIR_NAME in dir_names:
+            dir_names.remove(BLOB_DIR_NAME)
+
+        if MANIFEST_FILE_NAME in file_names or any(file_name.startswith("output.") for file_name in file_names):
+            # Input directories copied into the transaction are migrated along
+            # with it, so there is no need to descend any further
+            dir_names[:] = []
+
+            yield dir_path
+
+
+def migrate_transaction_dir(blob_store, transaction_dir, keep_originals=False, dry_run=False):
+    """
+    Migrates a single transaction directory to the blob store.
+
+    Parameters
+    ----------
+    blob_store : TransactionBlobStore
+        The blob store to migrate files to.
+    transaction_dir : str
+        The transaction directory to migrate.
+    keep_originals : bool, optional
+        If true, the original copies of the migrated files are not removed.
+    dry_run : bool, optional
+        If true, nothing is written or removed.
+
+    Returns
+    -------
+    num_bytes : int
+        Total size in bytes of the original files found within the directory.
+
+    """
+    files = {}
+    original_paths = []
+    num_bytes = 0
+
+    for dir_path, _, file_names in os.walk(transaction_dir):
+        for file_name in file_names:
+            file_path = os.path.join(dir_path, file_name)
+            relative_name = os.path.relpath(file_path, transaction_dir).replace(os.sep, "/")
+
+            num_bytes += os.path.getsize(file_path)
+            original_paths.append(file_path)
+
+            if not dry_run:
+                files[relative_name] = blob_store.put_file(file_path)
+
+    if dry_run:
+        return num_bytes
+
+    # Write the manifest before removing anything, so an interrupted migration
+    # never leaves a transaction without its products
+    TransactionBlobStore.write_manifest(transaction_dir, files)
+
+    if not keep_originals:
+        for original_path in original_paths:
+            os.remove(original_path)
+
+        input_dir = os.path.join(transaction_dir, "input")
+
+        if os.path.isdir(input_dir):
+            shutil.rmtree(input_dir)
+
+    return num_bytes
+
+
+def migrate_transaction_history(transaction_dir, keep_originals=False, dry_run=False):
+    """
+    Migrates all transaction directories under the provided root to the blob
+    store.
+
+    Parameters
+    ----------
+    transaction_dir : str
+        Root of the transaction history to migrate.
+    keep_originals : bool, optional
+        If true, the original copies of the migrated files are not removed.
+    dry_run : bool, optional
+        If true, nothing is written or removed.
+
+    Returns
+    -------
+    num_migrated : int
+        Number of transaction directories migrated.
+    num_skipped : int
+        Number of transaction directories skipped because they were already migrated.
+    num_bytes : int
+        Total size in bytes of the original files that were migrated.
+
+    """
+    blob_store = TransactionBlobStore(os.path.join(transaction_dir, BLOB_DIR_NAME))
+
+    num_migrated = 0
+    num_skipped = 0
+    num_bytes = 0
+
+    for transaction_subdir in _find_transaction_dirs(transaction_dir):
+        if TransactionBlobStore.has_manifest(transaction_subdir):
+            logger.debug("Transaction %s already migrated, skipping...", transaction_subdir)
+            num_skipped += 1
+            continue
+
+        logger.debug("Migrating transaction %s", transaction_subdir)
+
+        num_bytes += migrate_transaction_dir(blob_store, transaction_subdir, keep_originals, dry_run)
+        num_migrated += 1
+
+    return num_migrated, num_skipped, num_bytes
+
+
+def main():
+    """Entry point for migrate_transaction_history.py"""
+    start_time = datetime.now()
+
+    parser = create_cmd_parser()
+    arguments = parser.parse_args()
+
+    if arguments.debug:
+        logger.setLevel(logging.DEBUG)
+
+    transaction_dir = arguments.transaction_dir or DOIConfigUtil().get_config().get("OTHER", "transaction_dir")
+
+    logger.info("Migrating transaction history under %s...", transaction_dir)
+
+    num_migrated, num_skipped, num_bytes = migrate_transaction_history(
+        transaction_dir, keep_originals=arguments.keep_originals, dry_run=arguments.dry_run
+    )
+
+    elapsed_seconds = datetime.now().timestamp() - start_time.timestamp()
+
+    logger.info("Transaction history migration complete in %.2f seconds.", elapsed_seconds)
+    logger.info("Num transactions migrated: %d", num_migrated)
+    logger.info("Num transactions already migrated: %d", num_skipped)
+    logger.info("Num bytes migrated: %d", num_bytes)
+
+
+if __name__ == "__main__":
+    main()
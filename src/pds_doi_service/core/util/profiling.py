@@ -0,0 +1,197 @@
+#
+#  Copyright 2026, by the California Institute of Technology.  ALL RIGHTS
+#  RESERVED. United States Government Sponsorship acknowledged. Any commercial
+#  use must be negotiated with the Office of Technology Transfer at the
+#  California Institute of Technology.
+#
+"""
+============
+profiling.py
+============
+
+Utilities for profiling the stages of a DOI service action.
+
+Stages of interest (parsing input, validation, rendering, submission, etc.)
+are marked with the span() context manager or traced() decorator. While a
+SpanTracer is active, the time spent in each span is accumulated into a tree
+keyed by the path of nested span names, so repeated stages (e.g. one
+validation per DOI) are reported as a single node with a call count. The
+resulting tree is written as JSON which can be compared between releases to
+pin down which stage of an action a change in wall time comes from.
+
+When no tracer is active, spans reduce to a single context variable lookup.
+"""
+import cProfile
+import functools
+import json
+import platform
+import time
+from contextlib import contextmanager
+from contextlib import nullcontext
+from contextvars import ContextVar
+from datetime import datetime
+from datetime import timezone
+
+from pds_doi_service import __version__
+from pds_doi_service.core.util.general_util import get_logger
+
+logger = get_logger(__name__)
+
+_current_span: ContextVar = ContextVar("current_span", default=None)
+
+
+class SpanNode:
+    """Accumulated timings for all calls made to a span at a particular path within the span tree."""
+
+    def __init__(self, name):
+        self.name = name
+        self.calls = 0
+        self.total_seconds = 0.0
+        self.children = {}
+
+    def child(self, name):
+        """Returns the child node with the provided name, creating it if necessary."""
+        if name not in self.children:
+            self.children[name] = SpanNode(name)
+
+        return self.children[name]
+
+    def to_dict(self):
+        """Returns the span tree rooted at this node as a JSON-serializable dictionary."""
+        children_seconds = sum(child.total_seconds for child in self.children.values())
+
+        return {
+            "name": self.name,
+            "calls": self.calls,
+            "total_seconds": round(self.total_seconds, 6),
+            "self_seconds": round(max(self.total_seconds - children_seconds, 0.0), 6),
+            "children": [child.to_dict() for child in self.children.values()],
+        }
+
+
+class SpanTracer:
+    """
+    Records the span tree of everything run within its trace() context.
+
+    Spans are tracked per execution context, so only spans entered by the
+    thread (or task) that started the trace are recorded.
+    """
+
+    def __init__(self, name):
+        self.root = SpanNode(name)
+
+    @contextmanager
+    def trace(self):
+        """Activates the tracer for the duration of the context, timing the context as the root span."""
+        token = _current_span.set(self.root)
+        start = time.perf_counter()
+
+        try:
+            yield self
+        finally:
+            self.root.calls += 1
+            self.root.total_seconds += time.perf_counter() - start
+            _current_span.reset(token)
+
+    def to_dict(self):
+        """Returns the recorded span tree, along with metadata about the run, as a dictionary."""
+        return {
+            "version": __version__,
+            "python_version": platform.python_version(),
+            "date": datetime.now(tz=timezone.utc).isoformat(),
+            "spans": self.root.to_dict(),
+        }
+
+    def write(self, output_file):
+        """Writes the recorded span tree to the provided path as JSON."""
+        with open(output_file, "w") as outfile:
+            json.dump(self.to_dict(), outfile, indent=2)
+
+
+@contextmanager
+def span(name):
+    """
+    Context manager marking a stage to be recorded by the active SpanTracer,
+    if any. Spans entered within the context are recorded as its children.
+
+    Parameters
+    ----------
+    name : str
+        Name of the stage, e.g. "parse_input" or "submit".
+
+    """
+    parent = _current_span.get()
+
+    if parent is None:
+        yield
+        return
+
+    node = parent.child(name)
+    token = _current_span.set(node)
+    start = time.perf_counter()
+
+    try:
+        yield
+    finally:
+        node.calls += 1
+        node.total_seconds += time.perf_counter() - start
+        _current_span.reset(token)
+
+
+def traced(name):
+    """Decorator which records each call to the decorated function as a span with the provided name."""
+
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if _current_span.get() is None:
+                return func(*args, **kwargs)
+
+            with span(name):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+@contextmanager
+def profile(name, profile_file=None, trace_file=None):
+    """
+    Profiles everything run within the context, writing the results on exit.
+
+    Parameters
+    ----------
+    name : str
+        Name of the root span, typically the name of the action being run.
+    profile_file : str, optional
+        Path to write the cProfile statistics to, in the binary format read
+        by the pstats module. No cProfile profiling is performed if not provided.
+    trace_file : str, optional
+        Path to write the JSON span tree to. No span tracing is performed if
+        not provided.
+
+    """
+    profiler = cProfile.Profile() if profile_file else None
+    tracer = SpanTracer(name) if trace_file else None
+
+    # Results are written even if the profiled code fails, since the stage
+    # timings leading up to the failure are often of interest
+    try:
+        with tracer.trace() if tracer else nullcontext():
+            if profiler:
+                profiler.enable()
+
+            try:
+                yield
+            finally:
+                if profiler:
+                    profiler.disable()
+    finally:
+        if profiler:
+            profiler.dump_stats(profile_file)
+            logger.info("Wrote cProfile statistics to %s", profile_file)
+
+        if tracer:
+            tracer.write(trace_file)
+            logger.info("Wrote span trace to %s", trace_file)
@@ -0,0 +1,80 @@
+#!/usr/bin/env python
+#
+#  Copyright 2026, by the California Institute of Technology.  ALL RIGHTS
+#  RESERVED. United States Government Sponsorship acknowledged. Any commercial
+#  use must be negotiated with the Office of Technology Transfer at the
+#  California Institute of Technology.
+#
+"""
+======================
+rebuild_title_index.py
+======================
+
+Script used to rebuild the near-duplicate title index of the local transaction
+database (see DOIDataBase.rebuild_title_index()) from the titles of the latest
+transaction for each DOI.
+
+The index is built automatically when first created, and kept up to date as
+records are written, so rebuilding is only needed after the hash functions of
+title_similarity.py change, or if the index is suspected to be out of sync with
+the transaction table (for instance after rows were edited by hand).
+"""
+import argparse
+import logging
+from datetime import datetime
+
+from pds_doi_service.core.db.doi_database import DOIDataBase
+from pds_doi_service.core.util.config_parser import DOIConfigUtil
+from pds_doi_service.core.util.general_util import get_logger
+
+# Get the common logger and set the level for this file.
+logger = get_logger(__name__)
+logger.setLevel(logging.INFO)
+
+
+def create_cmd_parser():
+    parser = argparse.ArgumentParser(
+        description="Script to rebuild the near-duplicate title index of the local transaction database.",
+    )
+    parser.add_argument(
+        "-d",
+        "--db-file",
+        required=False,
+        default=None,
+        help="Path to the transaction database to rebuild the index of. If not "
+        "provided, the OTHER.db_file value of the INI config is used.",
+    )
+    parser.add_argument("--debug", required=False, action="store_true", help="Flag to print debug statements.")
+
+    return parser
+
+
+def main():
+    """Entry point for rebuild_title_index.py"""
+    start_time = datetime.now()
+
+    parser = create_cmd_parser()
+    arguments = parser.parse_args()
+
+    if arguments.debug:
+        logger.setLevel(logging.DEBUG)
+
+    db_file = arguments.db_file or DOIConfigUtil().get_config().get("OTHER", "db_file")
+
+    logger.info("Rebuilding the near-duplicate title index of %s...", db_file)
+
+    database = DOIDataBase(db_file)
+
+    try:
+        num_titles = database.rebuild_title_index()
+    finally:
+        database.close_database()
+
+    elapsed_seconds = datetime.now().timestamp() - start_time.timestamp()
+
+    logger.info("Title index rebuild complete in %.2f seconds.", elapsed_seconds)
+    logger.info("Num titles indexed: %d", num_titles)
+
+
+if __name__ == "__main__":
+    main()
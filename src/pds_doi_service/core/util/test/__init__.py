@@ -6,12 +6,24 @@ import unittest
 
 from . import config_parser_test
 from . import contributors_util_test
+from . import doi_xml_differ_test
 from . import general_util_test
+from . import json_stream_test
+from . import metrics_test
+from . import profiling_test
+from . import title_similarity_test
+from . import url_checker_test
 
 
 def suite():
     suite = unittest.TestSuite()
     suite.addTests(unittest.defaultTestLoader.loadTestsFromModule(config_parser_test))
     suite.addTests(unittest.defaultTestLoader.loadTestsFromModule(contributors_util_test))
+    suite.addTests(unittest.defaultTestLoader.loadTestsFromModule(doi_xml_differ_test))
     suite.addTests(unittest.defaultTestLoader.loadTestsFromModule(general_util_test))
+    suite.addTests(unittest.defaultTestLoader.loadTestsFromModule(json_stream_test))
+    suite.addTests(unittest.defaultTestLoader.loadTestsFromModule(metrics_test))
+    suite.addTests(unittest.defaultTestLoader.loadTestsFromModule(profiling_test))
+    suite.addTests(unittest.defaultTestLoader.loadTestsFromModule(title_similarity_test))
+    suite.addTests(unittest.defaultTestLoader.loadTestsFromModule(url_checker_test))
     return suite
@@ -0,0 +1,108 @@
+#!/usr/bin/env python
+import copy
+import io
+import unittest
+from datetime import datetime
+
+from pds_doi_service.core.entities.doi import Doi
+from pds_doi_service.core.entities.doi import DoiStatus
+from pds_doi_service.core.entities.doi import ProductType
+from pds_doi_service.core.outputs.datacite.datacite_record import DOIDataCiteRecord
+from pds_doi_service.core.outputs.osti.osti_record import DOIOstiRecord
+from pds_doi_service.core.util.doi_xml_differ import DOIDiffer
+
+
+class DOIDifferTest(unittest.TestCase):
+    """Unit tests for the util/doi_xml_differ.py module"""
+
+    def setUp(self):
+        self.dois = []
+
+        for index, (title, lid) in enumerate(
+            [
+                ("InSight Cameras Bundle", "urn:nasa:pds:insight_cameras"),
+                ("InSight Cameras Raw Data Collection", "urn:nasa:pds:insight_cameras:data_raw"),
+                ("LADEE Neutral Mass Spectrometer Bundle", "urn:nasa:pds:ladee_nms"),
+            ]
+        ):
+            doi = Doi(
+                title=title,
+                publication_date=datetime(2021, 3, 1),
+                product_type=ProductType.Collection,
+                product_type_specific="PDS4 Refereed Data Collection",
+                pds_identifier=f"{lid}::1.0",
+                authors=[
+                    {"first_name": "R.", "last_name": "Deen", "name_type": "Personal"},
+                    {"first_name": "H.", "last_name": "Abarca", "name_type": "Personal"},
+                ],
+                description=f"Description of the {title}",
+                site_url=f"https://pds.nasa.gov/ds-view/{index}",
+                node_id="eng",
+                status=DoiStatus.Draft,
+                doi=f"10.17189/{29569 + index}",
+                id=f"{29569 + index}",
+            )
+            doi.publisher = "NASA Planetary Data System"
+            doi.contributor = "Engineering"
+            doi.identifiers = [{"identifier": doi.pds_identifier, "identifierType": "URN"}]
+
+            self.dois.append(doi)
+
+    def _differ(self, record_service, historical_dois, new_dois):
+        historical_label = record_service.create_doi_record(historical_dois)
+        new_label = record_service.create_doi_record(new_dois)
+
+        return DOIDiffer.doi_label_differ(io.StringIO(historical_label), io.StringIO(new_label))
+
+    def test_differ_identical(self):
+        """Test that identical labels, in either format, have no differences"""
+        for record_service in (DOIOstiRecord(), DOIDataCiteRecord()):
+            self.assertTupleEqual(self._differ(record_service, self.dois, self.dois), ([], [], []))
+
+    def test_differ_reordered_records(self):
+        """Test that records are aligned by DOI regardless of their order within each label"""
+        new_dois = copy.deepcopy(self.dois[::-1])
+        new_dois[0].title = "LADEE Neutral Mass Spectrometer Data Bundle"
+        new_dois[2].authors = new_dois[2].authors[:1]
+
+        # Differences in case and whitespace alone are acceptable for titles
+        new_dois[1].title = "InSight  cameras raw data collection"
+
+        for record_service in (DOIOstiRecord(), DOIDataCiteRecord()):
+            fields, values, indices = self._differ(record_service, self.dois, new_dois)
+
+            self.assertIn("title", fields)
+            self.assertIn(
+                "historical:[LADEE Neutral Mass Spectrometer Bundle], new:[LADEE Neutral Mass Spectrometer Data Bundle]",
+                values,
+            )
+            self.assertEqual(indices[fields.index("title")], 2)
+
+            # The missing author of the first record is reported against that record only
+            self.assertTrue(any(value.startswith("historical:[") and value.endswith("new:[]") for value in values))
+            self.assertSetEqual(set(indices), {0, 2})
+
+    def test_differ_aligns_by_identifier(self):
+        """Test that records without a DOI are aligned by PDS identifier"""
+        new_dois = copy.deepcopy(self.dois[1:])
+        new_dois[0].description = "A different description"
+
+        for doi in new_dois:
+            doi.doi = None
+
+        fields, values, indices = DOIDiffer.doi_xml_differ(
+            io.StringIO(DOIOstiRecord().create_doi_record(self.dois)),
+            io.StringIO(DOIOstiRecord().create_doi_record(new_dois)),
+        )
+
+        # The first historical record has no counterpart, so is skipped
+        self.assertListEqual(fields, ["description"])
+        self.assertListEqual(
+            values,
+            ["historical:[Description of the InSight Cameras Raw Data Collection], new:[A different description]"],
+        )
+        self.assertListEqual(indices, [1])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,106 @@
+#!/usr/bin/env python
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from pds_doi_service.core.util import json_stream
+from pds_doi_service.core.util.json_stream import iter_json_items
+
+
+class JsonStreamTest(unittest.TestCase):
+    """Unit tests for functions defined in the util/json_stream.py module"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def _write(self, content):
+        path = os.path.join(self.temp_dir.name, "label.json")
+
+        with open(path, "wb") as outfile:
+            outfile.write(content.encode("utf-8") if isinstance(content, str) else content)
+
+        return path
+
+    def test_iter_json_items(self):
+        """Test reading each item of the array under a top-level member"""
+        records = [
+            {"id": "10.17189/1", "attributes": {"titles": [{"title": 'A "quoted" title ] with } brackets'}]}},
+            {"id": "10.17189/2", "attributes": {"values": [1, 2.5e3, -3, True, False, None], "empty": {}}},
+            {"id": "10.17189/3", "attributes": {"title": "Escaped \\ back\\slash and unicode é"}},
+        ]
+        document = {"meta": {"total": 3, "nested": [[], {"data": []}]}, "data": records, "links": {}}
+
+        for indent in (None, 4):
+            path = self._write(json.dumps(document, indent=indent))
+
+            self.assertListEqual(list(iter_json_items(path, key="data")), records)
+
+        # Whitespace and a leading byte order mark are accepted
+        path = self._write(b'\xef\xbb\xbf\n { "data" :\t[ {"id": 1} ,\r\n{"id": 2} ] }\n')
+
+        self.assertListEqual(list(iter_json_items(path, key="data")), [{"id": 1}, {"id": 2}])
+
+    def test_iter_json_items_small_window(self):
+        """Test that values, and multibyte characters, cut off by the window of decoded text are read intact"""
+        records = [
+            {"id": index, "value": 12345.678e-3 * index, "title": 'Réseau \\ 𝄞 "data" ü' * index} for index in range(50)
+        ]
+        path = self._write(json.dumps({"meta": {"total": 50}, "data": records}, ensure_ascii=False))
+
+        for read_size in (1, 3, 7, 64):
+            with self.subTest(read_size=read_size), patch.object(json_stream, "READ_SIZE", read_size):
+                self.assertListEqual(list(iter_json_items(path, key="data")), records)
+
+    def test_iter_json_items_split_numbers(self):
+        """Test that numbers split by the window of decoded text, at any position, are read intact"""
+        records = [24472.5, -3.25e-2, 1e10, 6.02E+23, 0, -17, 0.5, 12345678901234567890]
+        content = json.dumps({"data": records})
+
+        for read_size in range(1, len(content) + 1):
+            with self.subTest(read_size=read_size), patch.object(json_stream, "READ_SIZE", read_size):
+                self.assertListEqual(list(iter_json_items(self._write(content), key="data")), records)
+
+    def test_iter_json_items_single_object(self):
+        """Test that an object, rather than an array, under the member is read as a single item"""
+        path = self._write(json.dumps({"data": {"id": "10.17189/1", "attributes": {"doi": "10.17189/1"}}}))
+
+        self.assertListEqual(
+            list(iter_json_items(path, key="data")), [{"id": "10.17189/1", "attributes": {"doi": "10.17189/1"}}]
+        )
+
+    def test_iter_json_items_top_level_array(self):
+        """Test reading the items of a document that is itself an array"""
+        path = self._write('["a", 1, {"b": [2]}, [3, "]"]]')
+
+        self.assertListEqual(list(iter_json_items(path)), ["a", 1, {"b": [2]}, [3, "]"]])
+
+        path = self._write("[ ]")
+
+        self.assertListEqual(list(iter_json_items(path)), [])
+
+    def test_iter_json_items_malformed(self):
+        """Test that empty, malformed or incomplete documents raise a ValueError"""
+        for content in (
+            "",
+            "{}",
+            '{"meta": {}}',
+            '{"data": [{"id": 1}',
+            '{"data": [{"id": 1} {"id": 2}]}',
+            '{"data": [{"id": "unterminated}]}',
+            '{"data": [{"id": tru}]}',
+            "[1, 2]",
+        ):
+            with self.subTest(content=content):
+                path = self._write(content)
+
+                with self.assertRaises(ValueError):
+                    list(iter_json_items(path, key="data"))
+
+
+if __name__ == "__main__":
+    unittest.main()
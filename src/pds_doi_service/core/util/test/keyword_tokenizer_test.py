@@ -1,6 +1,9 @@
 #!/usr/bin/env python
+import os
 import unittest
+from unittest.mock import patch
 
+from pds_doi_service.core.util import keyword_tokenizer
 from pds_doi_service.core.util.keyword_tokenizer import KeywordTokenizer
 
 
@@ -92,5 +95,60 @@ class TestKeywordTokenizer(unittest.TestCase):
         self.assertEqual(expected, result)
 
 
+class TestKeywordTokenizerBatch(unittest.TestCase):
+    """
+    Unit tests for batch keyword extraction by the KeywordTokenizer class,
+    skipped when the nltk corpora are not available locally.
+    """
+
+    def setUp(self):
+        # Never attempt downloads, so these tests also run on hosts without network access
+        with patch.dict(os.environ, {"OTHER_NLTK_DOWNLOAD": "false"}):
+            try:
+                self.tokenizer = KeywordTokenizer()
+            except RuntimeError as err:
+                self.skipTest(str(err))
+
+    def test_process_texts(self):
+        """Test batch extraction matches extraction of each text in turn."""
+        texts = ["The Mars rovers collected samples", "PDS data repositories", "samples of the rovers"]
+
+        for text in texts:
+            self.tokenizer.process_text(text)
+
+        batch_tokenizer = KeywordTokenizer()
+        batch_tokenizer.process_texts(texts)
+
+        self.assertEqual(self.tokenizer.get_keywords(), batch_tokenizer.get_keywords())
+        self.assertIn("sample", batch_tokenizer.get_keywords())
+
+    def test_lemmatizer_shared_and_memoized(self):
+        """Test tokenizers share one lemmatizer and memoize lemmas of repeated tokens."""
+        self.assertIs(keyword_tokenizer._load_nltk_resources(), keyword_tokenizer._load_nltk_resources())
+
+        keyword_tokenizer._lemmatize.cache_clear()
+
+        self.tokenizer.process_texts(["rovers rovers", "rovers"])
+        KeywordTokenizer().process_text("rovers")
+
+        cache_info = keyword_tokenizer._lemmatize.cache_info()
+        self.assertEqual(cache_info.misses, 1)
+        self.assertEqual(cache_info.hits, 1)
+
+
+class TestNltkResources(unittest.TestCase):
+    """Unit tests for loading of the nltk resources used by the KeywordTokenizer class."""
+
+    def test_missing_resources_without_download(self):
+        """Test that missing corpora are reported rather than downloaded when downloads are disabled."""
+        import nltk
+
+        with patch.object(nltk.data, "find", side_effect=LookupError), patch.object(nltk, "download") as download:
+            with self.assertRaises(RuntimeError):
+                keyword_tokenizer._ensure_nltk_resource(nltk, "wordnet", "/tmp/nltk_data", allow_download=False)
+
+            download.assert_not_called()
+
+
 if __name__ == "__main__":
     unittest.main()
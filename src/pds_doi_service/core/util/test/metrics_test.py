@@ -0,0 +1,79 @@
+#!/usr/bin/env python
+import os
+import unittest
+from unittest.mock import patch
+
+from pds_doi_service.core.util.metrics import metrics_enabled
+from pds_doi_service.core.util.metrics import MetricsRegistry
+from pds_doi_service.core.util.metrics import OPERATION_DURATION
+from pds_doi_service.core.util.metrics import timed_operation
+
+
+class MetricsTest(unittest.TestCase):
+    """Unit tests for the util/metrics.py module"""
+
+    def setUp(self):
+        metrics_enabled.cache_clear()
+
+    def tearDown(self):
+        metrics_enabled.cache_clear()
+
+    def test_render_metrics(self):
+        """Test rendering of counters and histograms in the Prometheus text format"""
+        registry = MetricsRegistry()
+
+        counter = registry.counter("test_events", "Test events.")
+        histogram = registry.histogram("test_duration_seconds", "Test durations.", buckets=(0.1, 1.0))
+
+        counter.inc(service="OSTI")
+        counter.inc(2, service="OSTI")
+        histogram.observe(0.05, operation='say "hi"')
+        histogram.observe(0.5, operation='say "hi"')
+        histogram.observe(5.0, operation='say "hi"')
+
+        self.assertEqual(counter.value(service="OSTI"), 3)
+        self.assertEqual(histogram.count(operation='say "hi"'), 3)
+
+        # Re-registering a metric should return the existing instance
+        self.assertIs(registry.counter("test_events", "Test events."), counter)
+
+        with self.assertRaises(ValueError):
+            registry.histogram("test_events", "Test events.")
+
+        lines = registry.render().splitlines()
+
+        self.assertIn("# TYPE test_events counter", lines)
+        self.assertIn('test_events_total{service="OSTI"} 3.0', lines)
+        self.assertIn("# TYPE test_duration_seconds histogram", lines)
+        self.assertIn('test_duration_seconds_bucket{operation="say \\"hi\\"",le="0.1"} 1', lines)
+        self.assertIn('test_duration_seconds_bucket{operation="say \\"hi\\"",le="1.0"} 2', lines)
+        self.assertIn('test_duration_seconds_bucket{operation="say \\"hi\\"",le="+Inf"} 3', lines)
+        self.assertIn('test_duration_seconds_sum{operation="say \\"hi\\""} 5.55', lines)
+        self.assertIn('test_duration_seconds_count{operation="say \\"hi\\""} 3', lines)
+
+        registry.clear()
+
+        self.assertEqual(counter.value(service="OSTI"), 0)
+
+    def test_timed_operation(self):
+        """Test that timed operations are only recorded while metrics are enabled"""
+
+        @timed_operation("metrics_test")
+        def _operation(value):
+            return value * 2
+
+        with patch.dict(os.environ, {"OTHER_METRICS_ENABLED": "false"}):
+            metrics_enabled.cache_clear()
+
+            self.assertEqual(_operation(2), 4)
+            self.assertEqual(OPERATION_DURATION.count(operation="metrics_test"), 0)
+
+        with patch.dict(os.environ, {"OTHER_METRICS_ENABLED": "true"}):
+            metrics_enabled.cache_clear()
+
+            self.assertEqual(_operation(3), 6)
+            self.assertEqual(OPERATION_DURATION.count(operation="metrics_test"), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
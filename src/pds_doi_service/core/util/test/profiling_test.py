@@ -0,0 +1,90 @@
+#!/usr/bin/env python
+import json
+import os
+import pstats
+import shutil
+import tempfile
+import unittest
+
+from pds_doi_service.core.actions.action import DOICoreAction
+from pds_doi_service.core.util.profiling import profile
+from pds_doi_service.core.util.profiling import span
+from pds_doi_service.core.util.profiling import SpanTracer
+from pds_doi_service.core.util.profiling import traced
+
+
+@traced("validate")
+def _validate(value):
+    with span("check_value"):
+        return value > 0
+
+
+class ProfilingTest(unittest.TestCase):
+    """Unit tests for the util/profiling.py module"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp(prefix="profiling_")
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_span_tree(self):
+        """Test accumulation of nested spans into a tree keyed by span path"""
+        # Spans should have no effect without an active tracer
+        self.assertTrue(_validate(1))
+
+        tracer = SpanTracer("reserve")
+
+        with tracer.trace():
+            with span("parse_input"):
+                pass
+
+            for value in range(3):
+                _validate(value)
+
+        spans = tracer.to_dict()["spans"]
+
+        self.assertEqual(spans["name"], "reserve")
+        self.assertEqual(spans["calls"], 1)
+        self.assertListEqual([child["name"] for child in spans["children"]], ["parse_input", "validate"])
+
+        validate_span = spans["children"][1]
+
+        self.assertEqual(validate_span["calls"], 3)
+        self.assertEqual(validate_span["children"][0]["name"], "check_value")
+        self.assertEqual(validate_span["children"][0]["calls"], 3)
+        self.assertGreaterEqual(spans["total_seconds"], validate_span["total_seconds"])
+
+    def test_profile(self):
+        """Test writing of cProfile statistics and span trace by the profile() context manager"""
+        profile_file = os.path.join(self.temp_dir, "release.prof")
+        trace_file = os.path.join(self.temp_dir, "release.json")
+
+        # Results should be written even when the profiled code fails
+        with self.assertRaises(ValueError):
+            with profile("release", profile_file=profile_file, trace_file=trace_file):
+                _validate(1)
+                raise ValueError("Failed on purpose")
+
+        stats = pstats.Stats(profile_file)
+        self.assertTrue(any(func_name == "_validate" for _, _, func_name in stats.stats))
+
+        with open(trace_file, "r") as infile:
+            trace = json.load(infile)
+
+        self.assertIn("version", trace)
+        self.assertEqual(trace["spans"]["name"], "release")
+        self.assertEqual(trace["spans"]["children"][0]["name"], "validate")
+
+    def test_profiling_arguments(self):
+        """Test that the profiling arguments are available to every action"""
+        parser = DOICoreAction.create_cmd_parser()
+
+        arguments = parser.parse_args(["list", "--profile", "list.prof", "--trace-spans", "list.json"])
+
+        self.assertEqual(arguments.profile, "list.prof")
+        self.assertEqual(arguments.trace_spans, "list.json")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,76 @@
+#!/usr/bin/env python
+import unittest
+
+from pds_doi_service.core.util.title_similarity import distinct_acronyms
+from pds_doi_service.core.util.title_similarity import LSH_BANDS
+from pds_doi_service.core.util.title_similarity import minhash_signature
+from pds_doi_service.core.util.title_similarity import normalize_title
+from pds_doi_service.core.util.title_similarity import NUM_PERMUTATIONS
+from pds_doi_service.core.util.title_similarity import title_acronyms
+from pds_doi_service.core.util.title_similarity import title_buckets
+from pds_doi_service.core.util.title_similarity import title_shingles
+from pds_doi_service.core.util.title_similarity import title_similarity
+
+
+class TitleSimilarityTest(unittest.TestCase):
+    """Unit tests for functions defined in the util/title_similarity.py module"""
+
+    def test_normalize_title(self):
+        """Tests for title_similarity.normalize_title()"""
+        self.assertEqual(
+            normalize_title("  InSight  Cameras:\tRaw_Data -- Bundle. "), "insight cameras raw data bundle"
+        )
+        self.assertEqual(normalize_title(""), "")
+        self.assertEqual(normalize_title(None), "")
+
+    def test_title_buckets(self):
+        """Tests for title_similarity.title_buckets()"""
+        normalized_title, buckets = title_buckets("InSight Cameras Bundle")
+
+        self.assertEqual(normalized_title, "insight cameras bundle")
+        self.assertEqual(len(buckets), LSH_BANDS)
+        self.assertListEqual([band for band, _ in buckets], list(range(LSH_BANDS)))
+
+        # Buckets must be stable, and fit within a signed 64-bit integer
+        self.assertListEqual(buckets, title_buckets("insight cameras, bundle")[1])
+        self.assertTrue(all(-(2**63) <= bucket < 2**63 for _, bucket in buckets))
+
+        self.assertEqual(len(minhash_signature(title_shingles(normalized_title))), NUM_PERMUTATIONS)
+        self.assertEqual(len(title_buckets("")[1]), LSH_BANDS)
+
+    def test_title_similarity(self):
+        """Tests for title_similarity.title_similarity()"""
+        title = normalize_title("Laboratory Shocked Feldspars Bundle")
+
+        self.assertEqual(title_similarity(title, normalize_title("LABORATORY shocked-feldspars bundle")), 1.0)
+        self.assertGreater(title_similarity(title, normalize_title("Laboratory Shocked Feldspar Bundle")), 0.8)
+        self.assertLess(title_similarity(title, normalize_title("InSight Cameras Bundle")), 0.2)
+
+        # Titles too short to shingle are only similar when equal
+        self.assertEqual(title_similarity("ab", "ab"), 1.0)
+        self.assertEqual(title_similarity("ab", ""), 0.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
+
+    def test_distinct_acronyms(self):
+        """Tests for title_similarity.title_acronyms() and title_similarity.distinct_acronyms()"""
+        self.assertSetEqual(title_acronyms("MAVEN SWEA Calibrated Data Collection"), {"maven", "swea"})
+        self.assertSetEqual(title_acronyms("Mars 2020 Mastcam-Z Raw Data Collection"), set())
+        self.assertSetEqual(title_acronyms("LABORATORY SHOCKED FELDSPARS COLLECTION"), set())
+        self.assertSetEqual(title_acronyms(None), set())
+
+        # Sibling instruments are similar by construction, but never near-duplicates
+        for first_title, second_title in (
+            ("InSight IDC Raw Data Collection", "InSight ICC Raw Data Collection"),
+            ("MAVEN SWEA Calibrated Data Collection", "MAVEN SWIA Calibrated Data Collection"),
+        ):
+            self.assertGreaterEqual(title_similarity(normalize_title(first_title), normalize_title(second_title)), 0.8)
+            self.assertTrue(distinct_acronyms(first_title, second_title))
+
+        # Acronyms are compared regardless of case
+        self.assertFalse(distinct_acronyms("MAVEN SWEA Calibrated Data Collection", "Maven Swea Calibrated Data"))
+        self.assertFalse(
+            distinct_acronyms("Laboratory Shocked Feldspars Collection", "LABORATORY SHOCKED FELDSPAR COLLECTION")
+        )
@@ -0,0 +1,69 @@
+#!/usr/bin/env python
+import asyncio
+import socket
+import time
+import unittest
+
+from pds_doi_service.benchmark.fake_datacite import FakeDataCiteServer
+from pds_doi_service.core.util.url_checker import check_urls
+
+
+class UrlCheckerTestCase(unittest.TestCase):
+    """Unit tests for the url_checker.py module, run against a fake DataCite server"""
+
+    def setUp(self):
+        self._server = FakeDataCiteServer(latency=0.25)
+        self._server.start()
+        self.addCleanup(self._server.stop)
+
+    @staticmethod
+    def _unused_url():
+        with socket.socket() as sock:
+            sock.bind(("127.0.0.1", 0))
+            port = sock.getsockname()[1]
+
+        return f"http://127.0.0.1:{port}/landing"
+
+    def test_check_urls(self):
+        """Test that landing pages are checked concurrently, and failures reported per URL"""
+        landing_urls = [f"{self._server.landing_page_url}/{index}" for index in range(8)]
+        missing_url = f"{self._server.dois_url}/10.17189/missing"
+        unreachable_url = self._unused_url()
+
+        start = time.perf_counter()
+        results = check_urls(landing_urls + [missing_url, unreachable_url, landing_urls[0]], max_concurrency=16)
+        elapsed = time.perf_counter() - start
+
+        # 9 requests are sent, each taking 0.25 seconds, which would take
+        # over 2 seconds if sent one at a time
+        self.assertLess(elapsed, 1.5)
+        self.assertDictEqual(self._server.request_counts, {"GET": 9})
+
+        self.assertTrue(all(results[url] == 200 for url in landing_urls))
+        self.assertEqual(results[missing_url], 404)
+        self.assertIsInstance(results[unreachable_url], Exception)
+
+        self.assertDictEqual(check_urls([]), {})
+
+    def test_check_urls_max_concurrency(self):
+        """Test that at most max_concurrency landing pages are requested at once"""
+        landing_urls = [f"{self._server.landing_page_url}/{index}" for index in range(4)]
+
+        start = time.perf_counter()
+        results = check_urls(landing_urls, max_concurrency=1)
+
+        self.assertGreaterEqual(time.perf_counter() - start, 1.0)
+        self.assertListEqual(list(results.values()), [200] * 4)
+
+    def test_check_urls_from_event_loop(self):
+        """Test that URLs may be checked by a caller already running within an event loop"""
+        url = f"{self._server.landing_page_url}/0"
+
+        async def _check():
+            return check_urls([url])
+
+        self.assertDictEqual(asyncio.run(_check()), {url: 200})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,155 @@
+#
+#  Copyright 2026, by the California Institute of Technology.  ALL RIGHTS
+#  RESERVED. United States Government Sponsorship acknowledged. Any commercial
+#  use must be negotiated with the Office of Technology Transfer at the
+#  California Institute of Technology.
+#
+"""
+===================
+title_similarity.py
+===================
+
+Functions for finding near-duplicate record titles with MinHash signatures
+and locality-sensitive hashing (LSH).
+
+Titles are normalized (case, whitespace and punctuation are ignored) and
+split into overlapping character shingles. The MinHash signature of a title's
+shingles is divided into bands, and titles sharing the hash of any band are
+candidate near-duplicates, whose similarity is then computed exactly. Titles
+with a Jaccard similarity of s share at least one band with a probability of
+1 - (1 - s ** LSH_ROWS) ** LSH_BANDS, so near-duplicates can be found by
+looking up the buckets of a title's bands rather than comparing it to every
+other title.
+
+Titles of sibling products, such as the collections of a mission's
+instruments, commonly differ only by an acronym ("MAVEN SWEA Calibrated Data
+Collection" and "MAVEN SWIA Calibrated Data Collection"), so are similar by
+construction. Titles with differing acronyms (see distinct_acronyms()) should
+not be reported as near-duplicates, however similar.
+
+Signatures are persisted by the transaction database, so the hash functions
+used here must not change between releases without rebuilding the index
+(see DOIDataBase.rebuild_title_index()).
+"""
+import functools
+import hashlib
+import re
+import struct
+
+SHINGLE_SIZE = 3
+"""Number of characters in each shingle of a normalized title"""
+
+LSH_BANDS = 8
+"""Number of bands the MinHash signature of a title is divided into"""
+
+LSH_ROWS = 4
+"""Number of MinHash values within each band"""
+
+NUM_PERMUTATIONS = LSH_BANDS * LSH_ROWS
+"""Number of MinHash values in the signature of a title"""
+
+SHINGLE_CACHE_SIZE = 65536
+"""Maximum number of shingle to hash value mappings memoized, since titles share much of the same vocabulary"""
+
+_MAX_HASH = (1 << 32) - 1
+_HASH_VALUES = struct.Struct(f"<{NUM_PERMUTATIONS}I")
+
+_NON_WORD_CHARACTERS = re.compile(r"[\W_]+")
+
+
+def normalize_title(title):
+    """
+    Returns the normalized form of the provided title, used to compare titles
+    regardless of case, whitespace and punctuation.
+    """
+    return " ".join(_NON_WORD_CHARACTERS.sub(" ", (title or "").casefold()).split())
+
+
+def title_shingles(normalized_title):
+    """Returns the set of overlapping character shingles of the provided normalized title."""
+    if len(normalized_title) <= SHINGLE_SIZE:
+        return {normalized_title} if normalized_title else set()
+
+    return {normalized_title[i : i + SHINGLE_SIZE] for i in range(len(normalized_title) - SHINGLE_SIZE + 1)}
+
+
+@functools.lru_cache(maxsize=SHINGLE_CACHE_SIZE)
+def _shingle_hashes(shingle):
+    """
+    Returns the NUM_PERMUTATIONS 32-bit hash values of a shingle, taken from
+    a single SHAKE-128 digest, so each value acts as an independent hash function.
+    """
+    return _HASH_VALUES.unpack(hashlib.shake_128(shingle.encode("utf-8")).digest(_HASH_VALUES.size))
+
+
+def minhash_signature(shingles):
+    """Returns the MinHash signature, a list of NUM_PERMUTATIONS integers, of the provided set of shingles."""
+    if not shingles:
+        return [_MAX_HASH] * NUM_PERMUTATIONS
+
+    return list(map(min, zip(*map(_shingle_hashes, shingles))))
+
+
+def lsh_buckets(signature):
+    """
+    Returns the bucket of each band of the provided MinHash signature, as a
+    list of (band, bucket) tuples. Buckets are signed 64-bit integers, so they
+    may be stored within an SQLite INTEGER column.
+    """
+    buckets = []
+
+    for band in range(LSH_BANDS):
+        values = signature[band * LSH_ROWS : (band + 1) * LSH_ROWS]
+        digest = hashlib.blake2b(",".join(map(str, values)).encode("ascii"), digest_size=8).digest()
+
+        buckets.append((band, int.from_bytes(digest, "big", signed=True)))
+
+    return buckets
+
+
+def title_buckets(title):
+    """
+    Returns the normalized form of the provided title, along with the LSH
+    buckets of its MinHash signature (see lsh_buckets()).
+    """
+    normalized_title = normalize_title(title)
+
+    return normalized_title, lsh_buckets(minhash_signature(title_shingles(normalized_title)))
+
+
+def title_similarity(first_normalized_title, second_normalized_title):
+    """Returns the Jaccard similarity, between 0 and 1, of the shingles of two normalized titles."""
+    first_shingles = title_shingles(first_normalized_title)
+    second_shingles = title_shingles(second_normalized_title)
+
+    if not first_shingles or not second_shingles:
+        return float(first_normalized_title == second_normalized_title)
+
+    return len(first_shingles & second_shingles) / len(first_shingles | second_shingles)
+
+
+def title_acronyms(title):
+    """
+    Returns the set of casefolded acronyms of the provided title, i.e. its
+    words of two or more characters written entirely in capitals, such as
+    mission and instrument names. Titles written entirely in capitals have
+    no identifiable acronyms.
+    """
+    title = title or ""
+
+    if title.upper() == title:
+        return set()
+
+    return {word.casefold() for word in _NON_WORD_CHARACTERS.split(title) if len(word) > 1 and word.isupper()}
+
+
+def distinct_acronyms(first_title, second_title):
+    """
+    Returns whether either of the provided titles has an acronym (see
+    title_acronyms()) which is not a word of the other, such as the names of
+    two instruments of the same mission.
+    """
+    first_words = set(normalize_title(first_title).split())
+    second_words = set(normalize_title(second_title).split())
+
+    return bool(title_acronyms(first_title) - second_words or title_acronyms(second_title) - first_words)
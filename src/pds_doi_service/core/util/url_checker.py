@@ -0,0 +1,130 @@
+#
+#  Copyright 2026, by the California Institute of Technology.  ALL RIGHTS
+#  RESERVED. United States Government Sponsorship acknowledged. Any commercial
+#  use must be negotiated with the Office of Technology Transfer at the
+#  California Institute of Technology.
+#
+"""
+==============
+url_checker.py
+==============
+
+Concurrent reachability checks of landing page URLs.
+
+Each landing page check is dominated by waiting on a remote server, so rather
+than checking the site URLs of a request one at a time, check_urls() issues all
+of the checks at once from an asyncio event loop, with at most max_concurrency
+requests in flight at any time. The checks use the async-native httpx client
+when it is installed (see the "asgi" extra of the package), and otherwise fall
+back to running blocking requests calls on the default thread pool of the loop.
+"""
+import asyncio
+import threading
+
+from pds_doi_service.core.util.general_util import get_logger
+
+try:
+    import httpx  # type: ignore
+except ImportError:
+    httpx = None
+
+logger = get_logger(__name__)
+
+DEFAULT_URL_CHECK_TIMEOUT = 10.0
+"""Default number of seconds to wait on a landing page before it is considered unreachable"""
+
+DEFAULT_URL_CHECK_CONCURRENCY = 16
+"""Default maximum number of landing page checks in flight at any time"""
+
+
+async def _check_url_httpx(client, url):
+    response = await client.get(url)
+
+    return response.status_code
+
+
+async def _check_url_requests(url, timeout):
+    # requests is slow to import, so defer until a check is actually made
+    import requests
+
+    response = await asyncio.to_thread(requests.get, url, timeout=timeout)
+
+    return response.status_code
+
+
+async def check_urls_async(urls, timeout=DEFAULT_URL_CHECK_TIMEOUT, max_concurrency=DEFAULT_URL_CHECK_CONCURRENCY):
+    """
+    Coroutine which checks the reachability of the provided URLs concurrently.
+
+    Parameters
+    ----------
+    urls : iterable of str
+        The URLs to check. Duplicate URLs are only checked once.
+    timeout : float, optional
+        Number of seconds to wait on each URL.
+    max_concurrency : int, optional
+        Maximum number of requests in flight at any time.
+
+    Returns
+    -------
+    results : dict
+        Maps each URL to the status code of its response, or to the exception
+        raised when requesting it (such as a connection error or timeout).
+
+    """
+    urls = list(dict.fromkeys(urls))
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+    async def _check(client, url):
+        async with semaphore:
+            try:
+                if client is not None:
+                    return await _check_url_httpx(client, url)
+
+                return await _check_url_requests(url, timeout)
+            except Exception as err:
+                return err
+
+    if httpx is not None:
+        async with httpx.AsyncClient(timeout=timeout, follow_redirects=True) as client:
+            results = await asyncio.gather(*(_check(client, url) for url in urls))
+    else:
+        results = await asyncio.gather(*(_check(None, url) for url in urls))
+
+    logger.debug("Checked %d URL(s) with %s", len(urls), "httpx" if httpx is not None else "requests")
+
+    return dict(zip(urls, results))
+
+
+def check_urls(urls, timeout=DEFAULT_URL_CHECK_TIMEOUT, max_concurrency=DEFAULT_URL_CHECK_CONCURRENCY):
+    """
+    Checks the reachability of the provided URLs concurrently, blocking until
+    all checks complete. See check_urls_async() for the parameters and return
+    value.
+
+    Safe to call from a thread already running an event loop (such as a
+    request handler of the API served in ASGI mode), in which case the checks
+    are run on an event loop of a separate thread.
+    """
+    urls = list(urls)
+
+    if not urls:
+        return {}
+
+    coroutine = check_urls_async(urls, timeout=timeout, max_concurrency=max_concurrency)
+
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coroutine)
+
+    results = {}
+
+    def _run():
+        results.update(asyncio.run(coroutine))
+
+    thread = threading.Thread(target=_run, name="url-checker")
+    thread.start()
+    thread.join()
+
+    return results
@@ -5,7 +5,9 @@ Planetary Data System's Digital Object Identifier service — tests.
 import unittest
 
 import pds_doi_service.api.test
+import pds_doi_service.benchmark.test
 import pds_doi_service.core.actions.test
+import pds_doi_service.core.cmd.test
 import pds_doi_service.core.db.test
 import pds_doi_service.core.input.test
 import pds_doi_service.core.outputs.test
@@ -15,9 +17,11 @@ import pds_doi_service.core.util.test
 def suite():
     suite = unittest.TestSuite()
     suite.addTests(pds_doi_service.core.actions.test.suite())
+    suite.addTests(pds_doi_service.core.cmd.test.suite())
     suite.addTests(pds_doi_service.core.db.test.suite())
     suite.addTests(pds_doi_service.core.input.test.suite())
     suite.addTests(pds_doi_service.core.outputs.test.suite())
     suite.addTests(pds_doi_service.core.util.test.suite())
     suite.addTests(pds_doi_service.api.test.suite())
+    suite.addTests(pds_doi_service.benchmark.test.suite())
     return suite